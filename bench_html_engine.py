@@ -0,0 +1,124 @@
+"""
+본문 후처리 마이크로벤치마크: 기존 정규식 체인 vs HTMLEngine 단일 토크나이저 순회
+
+기존 체인: 펜스 제거 -> 외부 링크 re.sub -> 자리표시자 정규식 5회 -> re.split('</h2>') + += 이미지 삽입
+           -> 검증용 정규식(태그 제거 길이, H2 수, 키워드 수)
+엔진: process_post_html 한 번 - TOKEN_PATTERN.finditer 순회 하나에서
+      정리 + 실패 링크 제거 + 이미지 삽입 + 속성 주입(rel="noopener", 이미지 lazy) + 지표 수집
+      (체인의 각 re.sub는 C 수준에서 돌지만 엔진은 토큰마다 파이썬 분기를 타므로,
+       수 KB 본문에서는 1회 시간이 체인보다 길 수 있습니다. 비율은 출력으로 확인하세요.)
+
+사용법: python bench_html_engine.py [--iterations 2000] [--sections 8] [--rounds 5]
+"""
+import argparse
+import re
+import time
+from src.core.html_engine import PLACEHOLDER_PATTERNS, process_post_html
+
+KEYWORD = "청년도약계좌"
+
+def build_sample(sections: int) -> dict:
+    """생성기 출력과 비슷한 본문(섹션별 H2, 내부/외부 링크, 자리표시자)을 만듭니다."""
+    parts = ["```html", f"<p>{KEYWORD}은 2026년 청년 자산 형성을 돕는 정책 금융 상품입니다. &nbsp;자세히 알아봅니다.</p>"]
+    failures = {}
+    for i in range(sections):
+        ok_url = f"https://www.gov.kr/portal/service/{i}"
+        bad_url = f"https://example.go.kr/missing/{i}"
+        failures[ok_url] = None
+        failures[bad_url] = "Status 404"
+        parts.append(
+            f"<h2>{i+1}. {KEYWORD} 핵심 정리 {i}</h2>\n"
+            f"<p>이 제도는 <strong>월 70만원</strong> 한도로 납입할 수 있으며 정부 기여금이 더해집니다. "
+            f"[이미지 설명: 그래프 {i}]</p>\n"
+            f"<ul><li>가입 조건: 만 19~34세</li><li>소득 기준: 총급여 7,500만원 이하</li></ul>\n"
+            f"<p>자세한 내용은 <a href='https://smart-work-solution.com/post-{i}' target='_blank'>관련 글</a>과 "
+            f"<strong><a href=\"{ok_url}\" target=\"_blank\">[정부24 바로가기]</a></strong>, "
+            f"<a href=\"{bad_url}\" target=\"_blank\">[없는 페이지]</a>를 참고하세요. {KEYWORD} 활용 팁도 있습니다.</p>\n"
+            f"그림 {i} 예시 설명\n"
+        )
+    parts.append("<h2>자주 묻는 질문</h2><details><summary>Q</summary>답변</details>```")
+    images = [
+        f'\n<figure class="wp-block-image size-large"><img src="https://cdn.test/{i}.webp" alt="{KEYWORD} {i}" '
+        f'class="wp-image-body-{i+1}"/><figcaption>{KEYWORD} 캡션 {i}</figcaption></figure>\n'
+        for i in range(3)
+    ]
+    return {"html": "\n".join(parts), "failures": failures, "images": images,
+            "internal_urls": ["https://smart-work-solution.com"]}
+
+def legacy_chain(html: str, failures: dict, images: list, internal_urls: list) -> dict:
+    """기존 코드 경로를 그대로 옮긴 정규식 체인입니다."""
+    content = html.replace("```html", "").replace("```", "").strip()
+
+    pattern = r'<a\s+[^>]*href=["\'](http[s]?://[^"\']+)["\'][^>]*>(.*?)</a>'
+    def replacer(match):
+        url = match.group(1)
+        if any(internal_url in url for internal_url in internal_urls):
+            return match.group(0)
+        return match.group(2) if failures.get(url) else match.group(0)
+    content = re.sub(pattern, replacer, content, flags=re.IGNORECASE | re.DOTALL)
+
+    for p in PLACEHOLDER_PATTERNS:
+        content = re.sub(p, "", content, flags=re.IGNORECASE)
+
+    h2_split = re.split(r'(</h2>)', content)
+    new_content = ""
+    img_idx = 0
+    for part in h2_split:
+        new_content += part
+        if part == "</h2>" and img_idx < len(images):
+            new_content += images[img_idx]
+            img_idx += 1
+    content = new_content
+
+    stats = {
+        "text_length": len(re.sub('<[^<]+?>', '', content)),
+        "h2_count": len(re.findall(r'<h2', content)),
+        "keyword_count": content.count(KEYWORD),
+    }
+    return {"html": content, "stats": stats}
+
+def engine(html: str, failures: dict, images: list, internal_urls: list) -> dict:
+    return process_post_html(html, keyword=KEYWORD, body_image_htmls=images,
+                             link_failures=failures, internal_urls=internal_urls)
+
+def bench(func, sample: dict, iterations: int) -> float:
+    args = (sample["html"], sample["failures"], sample["images"], sample["internal_urls"])
+    func(*args)  # 워밍업
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func(*args)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+def best_of(rounds: int, sample: dict, iterations: int):
+    """두 경로를 번갈아 rounds번 재고 각자 가장 빠른 값을 씁니다. (GC/스케줄링 잡음 제거)"""
+    legacy_us, engine_us = [], []
+    for _ in range(rounds):
+        legacy_us.append(bench(legacy_chain, sample, iterations))
+        engine_us.append(bench(engine, sample, iterations))
+    return min(legacy_us), min(engine_us)
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 후처리 마이크로벤치마크")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--sections", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    sample = build_sample(args.sections)
+    args_tuple = (sample["html"], sample["failures"], sample["images"], sample["internal_urls"])
+    legacy_result = legacy_chain(*args_tuple)
+    engine_result = engine(*args_tuple)
+
+    print(f"입력: {len(sample['html'])}자, 섹션 {args.sections}개, 반복 {args.iterations}회")
+    print(f"{'경로':<12}{'1회(us)':>12}{'H2':>6}{'이미지':>8}{'키워드':>8}{'텍스트 길이':>12}")
+    legacy_us, engine_us = best_of(args.rounds, sample, args.iterations)
+    ls, es = legacy_result["stats"], engine_result["stats"]
+    print(f"{'regex chain':<12}{legacy_us:>12.1f}{ls['h2_count']:>6}{legacy_result['html'].count('<img'):>8}"
+          f"{ls['keyword_count']:>8}{ls['text_length']:>12}")
+    print(f"{'HTMLEngine':<12}{engine_us:>12.1f}{es['h2_count']:>6}{es['img_count']:>8}"
+          f"{es['keyword_count']:>8}{es['text_length']:>12}")
+    print(f"속도 비율 (engine / regex): {engine_us / legacy_us:.2f}x")
+    print("참고: 엔진은 regex chain과 같은 값에 더해 H3/이미지/내부·외부 링크 수와 rel=noopener·이미지 lazy 속성 주입까지 수행합니다.")
+
+if __name__ == "__main__":
+    main()
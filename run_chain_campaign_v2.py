@@ -1,10 +1,10 @@
 import time
-import requests
 import re
 from src.config.settings import Config
 from src.core.generator import ContentGenerator
+from src.core.html_engine import process_post_html, analyze_html
 from src.core.image_processor import ImageProcessor
-from src.core.wp_client import WordPressClient
+from src.core.wp_client import WordPressClient, make_idempotency_key
 from src.utils.logger import get_logger
 
 # Logger setup
@@ -12,8 +12,6 @@ logger = get_logger("ChainCampaignV2")
 
 # Configuration
 Config.validate()
-BASE_URL = f"{Config.WP_URL.rstrip('/')}/wp-json/wp/v2/posts"
-AUTH = (Config.WP_USERNAME, Config.WP_PASSWORD)
 
 def process_images_for_post(post_data, wp_client, image_processor):
     """Generates and uploads images for a post."""
@@ -73,27 +71,11 @@ def process_images_for_post(post_data, wp_client, image_processor):
     return featured_media_id, body_image_htmls
 
 def insert_body_images(content, body_image_htmls):
-    """Inserts body images after H2 tags."""
+    """Inserts body images after H2 tags (single pass: placeholder cleanup + insertion)."""
     if not body_image_htmls: return content
-    
-    # Clean old placeholders
-    cleanup_patterns = [r"\[이미지 설명.*?\]", r"그림 \d+.*?\n", r"\*\*이미지 설명:\*\*.*?\n"]
-    for pattern in cleanup_patterns:
-        content = re.sub(pattern, "", content, flags=re.IGNORECASE)
+    return process_post_html(content, body_image_htmls=body_image_htmls)["html"]
 
-    h2_split = re.split(r'(</h2>)', content)
-    new_content = ""
-    img_idx = 0
-    
-    for part in h2_split:
-        new_content += part
-        if part == "</h2>" and img_idx < len(body_image_htmls):
-            new_content += body_image_htmls[img_idx]
-            img_idx += 1
-            
-    return new_content
-
-def verify_score_draft(post_id):
+def verify_score_draft(post_id, mirror):
     """
     Checks the Rank Math score of a draft post.
     Since we cannot get the computed score via API easily without premium or specific endpoint,
@@ -103,39 +85,42 @@ def verify_score_draft(post_id):
     - Focus Keyword present in Title & Content?
     - Meta Description present?
     - Images present?
+    Reads the post from the local site mirror after a delta sync instead of the live site.
     """
     logger.info(f"🕵️ Verifying Draft [ID: {post_id}]...")
     try:
-        r = requests.get(f"{BASE_URL}/{post_id}", auth=AUTH)
-        if r.status_code != 200: return False
+        mirror.sync(resources=("posts",))
+        post = mirror.get_post(post_id)
+        if not post: return False
         
-        post = r.json()
-        content = post['content']['rendered']
-        title = post['title']['rendered']
+        content = post['content']
+        title = post['title']
         meta = post.get("meta", {})
         fk = meta.get("rank_math_focus_keyword", "")
         
         score_checks = []
         
+        stats = analyze_html(content, keyword=fk)
+        
         # 1. Content Length
-        text_len = len(re.sub('<[^<]+?>', '', content))
+        text_len = stats["text_length"]
         score_checks.append(text_len >= 2000)
         logger.info(f"   - Length: {text_len} chars ({'PASS' if text_len>=2000 else 'FAIL'})")
         
         # 2. H2 Count
-        h2_count = len(re.findall(r'<h2', content))
+        h2_count = stats["h2_count"]
         score_checks.append(h2_count >= 4)
         logger.info(f"   - H2 Count: {h2_count} ({'PASS' if h2_count>=4 else 'FAIL'})")
         
         # 3. Focus Keyword
         kw_in_title = fk in title
-        kw_in_content = content.count(fk) > 0
+        kw_in_content = stats["keyword_count"] > 0
         score_checks.append(bool(fk) and kw_in_title and kw_in_content)
         logger.info(f"   - Keyword '{fk}': Title={kw_in_title}, Content={kw_in_content} ({'PASS' if score_checks[-1] else 'FAIL'})")
         
         # 4. Images
         has_thumbnail = post.get("featured_media", 0) > 0
-        has_body_images = "<img" in content
+        has_body_images = stats["img_count"] > 0
         score_checks.append(has_thumbnail and has_body_images)
         logger.info(f"   - Images: Thumb={has_thumbnail}, Body={has_body_images} ({'PASS' if score_checks[-1] else 'FAIL'})")
 
@@ -161,21 +146,24 @@ def run_chain_v2():
     # --- [RECOVERY MODE] ---
     print("\n🔄 Recovery Mode: Skipping Post 1 & 2 (Already Created)...")
     
-    # Post 2 ID (From previous run log/user notification: 675)
-    post2_id = 675
+    # Post 2 is looked up by slug instead of a hardcoded ID (was 675)
+    post2_slug = "government-funding-business-plan-2026"
     
     try:
         # Fetch Post 2 Info for internal linking
-        print(f"🕵️ Fetching Post 2 Info [ID: {post2_id}]...")
-        r = requests.get(f"{BASE_URL}/{post2_id}", auth=AUTH)
-        if r.status_code != 200:
-            print(f"❌ Failed to fetch Post 2. Status: {r.status_code}")
+        print(f"🕵️ Fetching Post 2 Info [slug: {post2_slug}]...")
+        existing = wp_client.find_existing_post(slug=post2_slug)
+        p2 = wp_client.mirror.get_post(existing["id"]) if existing else None
+        if not p2:
+            wp_client.mirror.sync(resources=("posts",))
+            p2 = wp_client.mirror.get_post(existing["id"]) if existing else None
+        if not p2:
+            print(f"❌ Failed to find Post 2 in site mirror.")
             return
             
-        p2 = r.json()
         post2_info = {
             "id": p2['id'],
-            "title": p2['title']['rendered'],
+            "title": p2['title'],
             "link": p2['link']
         }
         print(f"✅ Found Post 2: {post2_info['title']}")
@@ -201,10 +189,12 @@ def run_chain_v2():
         tags3 = p3_data.get("tags", [])
         tag_ids3 = wp_client.get_or_create_tags(tags3) if tags3 else []
 
-        res = wp_client.create_post(
+        # Idempotent: a rerun after a crash updates the same draft instead of creating a duplicate
+        res = wp_client.upsert_post(
             title=p3_data["title"], content=p3_data["content"], status="draft", slug=slug3,
             featured_media_id=fid3, categories=[2], tags=tag_ids3,
-            meta_input={"rank_math_focus_keyword": p3_data["rank_math_focus_keyword"], "rank_math_description": p3_data["rank_math_description"]}
+            meta_input={"rank_math_focus_keyword": p3_data["rank_math_focus_keyword"], "rank_math_description": p3_data["rank_math_description"]},
+            idempotency_key=make_idempotency_key("chain-v2", topic3)
         )
         
         if res:
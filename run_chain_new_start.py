@@ -4,7 +4,7 @@ import re
 from src.config.settings import Config
 from src.core.generator import ContentGenerator
 from src.core.image_processor import ImageProcessor
-from src.core.wp_client import WordPressClient
+from src.core.wp_client import WordPressClient, make_idempotency_key
 from src.utils.logger import get_logger
 
 # 1. 로거 설정 (Logger Setup)
@@ -145,7 +145,7 @@ def run_new_chain_start():
         tag_ids = wp_client.get_or_create_tags(tags) if tags else []
 
         # 10. 워드프레스 포스트 생성 (Draft)
-        res = wp_client.create_post(
+        res = wp_client.upsert_post(
             title=post_data["title"],
             content=post_data["content"],
             status="draft", # 안전을 위해 Draft로 저장
@@ -156,7 +156,8 @@ def run_new_chain_start():
             meta_input={
                 "rank_math_focus_keyword": post_data["rank_math_focus_keyword"],
                 "rank_math_description": post_data["rank_math_description"]
-            }
+            },
+            idempotency_key=make_idempotency_key("chain-new-start", topic)
         )
         
         if res:
@@ -4,7 +4,7 @@ import re
 from src.config.settings import Config
 from src.core.generator import ContentGenerator
 from src.core.image_processor import ImageProcessor
-from src.core.wp_client import WordPressClient
+from src.core.wp_client import WordPressClient, make_idempotency_key
 from src.utils.logger import get_logger
 
 # Logger setup
@@ -124,7 +124,7 @@ def run_policy_post2():
         tag_ids2 = wp_client.get_or_create_tags(tags2) if tags2 else []
 
         # Create Post
-        res = wp_client.create_post(
+        res = wp_client.upsert_post(
             title=p2_data["title"], 
             content=p2_data["content"], 
             status="draft", 
@@ -135,7 +135,8 @@ def run_policy_post2():
             meta_input={
                 "rank_math_focus_keyword": p2_data["rank_math_focus_keyword"], 
                 "rank_math_description": p2_data["rank_math_description"]
-            }
+            },
+            idempotency_key=make_idempotency_key("policy-post2", topic2)
         )
         
         if res:
@@ -4,7 +4,7 @@ import re
 from src.config.settings import Config
 from src.core.generator import ContentGenerator
 from src.core.image_processor import ImageProcessor
-from src.core.wp_client import WordPressClient
+from src.core.wp_client import WordPressClient, make_idempotency_key
 from src.utils.logger import get_logger
 
 # Logger setup
@@ -129,7 +129,7 @@ def run_policy_post3():
         tag_ids3 = wp_client.get_or_create_tags(tags3) if tags3 else []
 
         # Create Post
-        res = wp_client.create_post(
+        res = wp_client.upsert_post(
             title=p3_data["title"], 
             content=p3_data["content"], 
             status="draft", 
@@ -140,7 +140,8 @@ def run_policy_post3():
             meta_input={
                 "rank_math_focus_keyword": p3_data["rank_math_focus_keyword"], 
                 "rank_math_description": p3_data["rank_math_description"]
-            }
+            },
+            idempotency_key=make_idempotency_key("policy-post3", topic3)
         )
         
         if res:
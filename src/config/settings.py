@@ -10,12 +10,71 @@ class Config:
     """
     # OpenAI 설정
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+    SECTION_CONCURRENCY = int(os.getenv("SECTION_CONCURRENCY", "4"))  # 본문 섹션 동시 생성 수
+    GENERATION_ENGINE = os.getenv("GENERATION_ENGINE", "iterative")  # iterative(파트별 호출) / single_call(본문 전체 1회 호출)
+    SINGLE_CALL_MIN_SECTION_CHARS = int(os.getenv("SINGLE_CALL_MIN_SECTION_CHARS", "300"))  # 단일 호출 섹션 최소 분량 (미달 시 개별 재생성)
+    STRUCTURED_REPAIR_RETRIES = int(os.getenv("STRUCTURED_REPAIR_RETRIES", "1"))  # 개요/이미지 메타 검증 실패 필드만 다시 요청하는 횟수
+    STAGE_TIMEOUT = float(os.getenv("STAGE_TIMEOUT", "120"))  # API 호출이 없는 생성 단계의 시도 1회 제한 시간(초)
+    STAGE_TIMEOUT_MARGIN = float(os.getenv("STAGE_TIMEOUT_MARGIN", "15"))  # 라우팅 timeout 합에 더하는 단계 제한 시간 여유(초)
+    STAGE_RETRIES = int(os.getenv("STAGE_RETRIES", "1"))  # 생성 단계가 예외로 실패했을 때 재시도 횟수 (시간 초과는 재시도 안 함)
+    LLM_STREAM = os.getenv("LLM_STREAM", "false").lower() == "true"  # 본문 스트리밍 생성 (링크 검증을 생성과 병행)
+    POST_LATENCY_BUDGET = float(os.getenv("POST_LATENCY_BUDGET", "900"))  # 포스트 1개 생성의 지연 예산(초), 호출마다 남은 시간을 제한 시간으로 사용 (0: 미사용)
+    HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "true").lower() == "true"  # 단계별 p95를 넘긴 호출에 중복 요청(헤지)
+    HEDGE_STAGES = os.getenv("HEDGE_STAGES", "outline,image_metadata,intro,section,faq")  # 헤지 대상 단계 (single_call 제외)
+    HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "10"))  # p95 계산에 필요한 최소 기록 수 (미만이면 헤지 안 함)
+    HEDGE_WINDOW = int(os.getenv("HEDGE_WINDOW", "100"))  # p95 계산에 쓰는 단계/모델별 최근 기록 수
+    HEDGE_MIN_DELAY = float(os.getenv("HEDGE_MIN_DELAY", "5"))  # 중복 요청을 보내기 전 최소 대기(초)
+    LINK_CHECK_WORKERS = int(os.getenv("LINK_CHECK_WORKERS", "8"))  # 외부 링크 동시 검증 수
+    LINK_CHECK_PER_HOST = int(os.getenv("LINK_CHECK_PER_HOST", "2"))  # 같은 도메인 동시 검증 수
+    LINK_CHECK_TIMEOUT = float(os.getenv("LINK_CHECK_TIMEOUT", "5"))
+    LINK_OK_TTL_HOURS = float(os.getenv("LINK_OK_TTL_HOURS", "168"))  # 정상 링크 재검사 주기 (7일)
+    LINK_FAIL_TTL_HOURS = float(os.getenv("LINK_FAIL_TTL_HOURS", "6"))  # 실패 링크 재검사 주기
+    AUTHORITY_REVALIDATE_HOURS = float(os.getenv("AUTHORITY_REVALIDATE_HOURS", "24"))  # 외부 출처 레지스트리 재검증 주기
+    MODEL_PROFILE = os.getenv("MODEL_PROFILE", "quality")  # 단계별 모델 라우팅 프로필 (src/config/model_routing.json)
+    MODEL_ROUTING_PATH = os.getenv("MODEL_ROUTING_PATH")  # 라우팅 표 경로 (없으면 기본 파일)
 
     # WordPress 설정
     WP_URL = os.getenv("WP_URL")
     WP_USERNAME = os.getenv("WP_USERNAME")
     WP_PASSWORD = os.getenv("WP_PASSWORD")
 
+    # WordPress HTTP 연결 설정 (커넥션 풀 / 타임아웃 / 재시도)
+    WP_POOL_SIZE = int(os.getenv("WP_POOL_SIZE", "10"))
+    WP_TIMEOUT = float(os.getenv("WP_TIMEOUT", "30"))
+    WP_UPLOAD_TIMEOUT = float(os.getenv("WP_UPLOAD_TIMEOUT", "120"))
+    WP_MAX_RETRIES = int(os.getenv("WP_MAX_RETRIES", "3"))
+    WP_BACKOFF_BASE = float(os.getenv("WP_BACKOFF_BASE", "1.0"))
+    WP_BACKOFF_MAX = float(os.getenv("WP_BACKOFF_MAX", "30"))
+    WP_BATCH_SIZE = min(int(os.getenv("WP_BATCH_SIZE", "25")), 25)  # batch/v1 요청당 작업 수 (WP 최대 25)
+    WP_MAX_CONCURRENCY = int(os.getenv("WP_MAX_CONCURRENCY", "4"))  # 호스트당 최대 동시 요청 수
+    WP_MIN_CONCURRENCY = int(os.getenv("WP_MIN_CONCURRENCY", "1"))  # 429/503 발생 시 줄어드는 하한
+    WP_MAX_RPS = float(os.getenv("WP_MAX_RPS", "5"))  # 호스트당 초당 요청 수 상한 (0이면 제한 없음)
+    WP_LATENCY_THRESHOLD = float(os.getenv("WP_LATENCY_THRESHOLD", "20"))  # 이보다 느린 응답은 과부하 신호로 간주 (초)
+    WP_RETRY_AFTER_MAX = float(os.getenv("WP_RETRY_AFTER_MAX", "120"))  # Retry-After 최대 대기 (초)
+
+    # 멱등 발행 키를 저장할 포스트 메타 키 (사이트에서 register_post_meta + show_in_rest 등록 필요)
+    IDEMPOTENCY_META_KEY = os.getenv("IDEMPOTENCY_META_KEY", "wpauto_idempotency_key")
+
+    # 이미지 설정
+    IMAGE_PERSIST = os.getenv("IMAGE_PERSIST", "true").lower() == "true"  # 생성 이미지 로컬 저장 여부 (업로드는 메모리에서 바로 진행)
+    SPECULATIVE_IMAGES = os.getenv("SPECULATIVE_IMAGES", "true").lower() == "true"  # 이미지 메타데이터가 나오면 본문 생성과 겹쳐 이미지 생성/업로드 시작
+    IMAGE_CONCURRENCY = int(os.getenv("IMAGE_CONCURRENCY", "4"))  # 포스트 1개의 이미지 동시 생성 수 (DALL-E 요청 한도에 맞춰 조정)
+
+    # 로컬 캐시 (태그 인덱스 등) 저장 위치
+    CACHE_DIR = os.getenv("CACHE_DIR", ".cache")
+    MEDIA_DEDUPE = os.getenv("MEDIA_DEDUPE", "true").lower() == "true"  # 동일 이미지 재업로드 방지
+    MEDIA_BACKFILL_WORKERS = int(os.getenv("MEDIA_BACKFILL_WORKERS", "8"))
+    MEDIA_DOWNLOAD_TIMEOUT = float(os.getenv("MEDIA_DOWNLOAD_TIMEOUT", "30"))  # 백필 파일 다운로드 제한 시간(초)
+    TAG_FULL_REFRESH_HOURS = float(os.getenv("TAG_FULL_REFRESH_HOURS", "24"))  # 태그 미러 전체 재수집 주기(시간, 0이면 안 함)
+    LLM_CACHE_MODE = os.getenv("LLM_CACHE_MODE", "on")  # on / refresh(새로 받아 덮어쓰기) / off
+    LLM_CACHE_MAX_MB = float(os.getenv("LLM_CACHE_MAX_MB", "200"))
+    LLM_CACHE_MAX_AGE_DAYS = float(os.getenv("LLM_CACHE_MAX_AGE_DAYS", "30"))
+
+    # Batch API 오프라인 생성 (python -m src.core.batch_generation)
+    BATCH_DIR = os.getenv("BATCH_DIR", "batch_jobs")  # 캠페인 상태/입출력 JSONL/조립된 포스트 저장 위치
+    BATCH_POLL_SECONDS = float(os.getenv("BATCH_POLL_SECONDS", "60"))  # run 명령의 배치 상태 확인 주기
+    BATCH_MAX_RETRIES = int(os.getenv("BATCH_MAX_RETRIES", "2"))  # 실패한 요청을 다음 라운드에 다시 보내는 횟수
+
     # 기타 설정
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
@@ -0,0 +1,117 @@
+import asyncio
+from typing import Dict, Any, Optional, List
+from src.config.settings import Config
+from src.core.wp_client import WordPressClient
+from src.utils.logger import get_logger
+
+logger = get_logger("AsyncWP_Client")
+
+class AsyncWordPressClient:
+    """
+    WordPressClient의 asyncio 버전입니다.
+    동기 클라이언트의 커넥션 풀 세션(재시도/백오프 포함)을 그대로 공유하고, 각 호출을 스레드에서 실행하여
+    하나의 이벤트 루프에서 여러 이미지 업로드와 포스트 발행을 동시에 진행할 수 있게 합니다.
+    """
+
+    def __init__(self, client: WordPressClient = None, max_concurrency: int = None):
+        self.max_concurrency = max_concurrency or Config.WP_MAX_CONCURRENCY
+        # 동시 요청 수보다 풀이 작으면 커넥션을 새로 열게 되므로 풀 크기를 맞춰 줌
+        self.client = client or WordPressClient(pool_size=max(Config.WP_POOL_SIZE, self.max_concurrency))
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프에 묶인 동시성 제한 세마포어를 반환합니다. (asyncio.run 반복 호출 대응)"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run(self, func, *args, **kwargs):
+        """동기 클라이언트 메서드를 동시성 제한 안에서 스레드로 실행합니다."""
+        async with self._get_semaphore():
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    def close(self):
+        self.client.close()
+
+    async def upload_image(self, image_path: str, caption: str = "", title: str = "", alt_text: str = "", description: str = "",
+                           dedupe: bool = None) -> Optional[Dict[str, Any]]:
+        """WordPressClient.upload_image의 비동기 버전입니다."""
+        return await self._run(
+            self.client.upload_image, image_path,
+            caption=caption, title=title, alt_text=alt_text, description=description, dedupe=dedupe
+        )
+
+    async def upload_image_data(self, image_bytes: bytes, file_name: str, mime_type: str = None,
+                                caption: str = "", title: str = "", alt_text: str = "", description: str = "",
+                                dedupe: bool = None) -> Optional[Dict[str, Any]]:
+        """WordPressClient.upload_image_data의 비동기 버전입니다."""
+        return await self._run(
+            self.client.upload_image_data, image_bytes, file_name, mime_type=mime_type,
+            caption=caption, title=title, alt_text=alt_text, description=description, dedupe=dedupe
+        )
+
+    async def upload_images(self, images: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        여러 이미지를 최대 max_concurrency개씩 동시에 업로드합니다.
+
+        Args:
+            images (list): upload_image 또는 upload_image_data 인자 딕셔너리 리스트
+                           [{'image_path': str, 'title': str, 'caption': str, 'alt_text': str, 'description': str}, ...]
+                           메모리 이미지는 'image_path' 대신 'image_bytes', 'file_name' (+ 'mime_type')을 넣습니다.
+
+        Returns:
+            list: 입력 순서와 동일한 업로드 결과 리스트 (실패 항목은 None)
+        """
+        if not images:
+            return []
+        logger.info(f"이미지 {len(images)}장 동시 업로드 시작 (동시성: {self.max_concurrency})")
+        results = await asyncio.gather(*(
+            self.upload_image_data(**img) if "image_bytes" in img else self.upload_image(**img)
+            for img in images
+        ))
+        success = sum(1 for r in results if r)
+        logger.info(f"동시 업로드 완료: {success}/{len(images)}장 성공")
+        return list(results)
+
+    async def create_post(self, title: str, content: str, status: str = "draft",
+                          categories: list = None, tags: list = None, featured_media_id: int = None,
+                          meta_input: dict = None, slug: str = None, retry_statuses: set = None) -> Optional[str]:
+        """WordPressClient.create_post의 비동기 버전입니다."""
+        return await self._run(
+            self.client.create_post, title, content, status=status,
+            categories=categories, tags=tags, featured_media_id=featured_media_id,
+            meta_input=meta_input, slug=slug, retry_statuses=retry_statuses
+        )
+
+    async def upsert_post(self, title: str, content: str, status: str = "draft",
+                          categories: list = None, tags: list = None, featured_media_id: int = None,
+                          meta_input: dict = None, slug: str = None, idempotency_key: str = None) -> Optional[str]:
+        """WordPressClient.upsert_post의 비동기 버전입니다."""
+        return await self._run(
+            self.client.upsert_post, title, content, status=status,
+            categories=categories, tags=tags, featured_media_id=featured_media_id,
+            meta_input=meta_input, slug=slug, idempotency_key=idempotency_key
+        )
+
+    async def update_post(self, post_id: int, data: dict, diff: bool = False,
+                          retry_statuses: set = None) -> Optional[Dict[str, Any]]:
+        """WordPressClient.update_post의 비동기 버전입니다."""
+        return await self._run(self.client.update_post, post_id, data, diff=diff, retry_statuses=retry_statuses)
+
+    async def get_post(self, post_id: int) -> Optional[Dict[str, Any]]:
+        """WordPressClient.get_post의 비동기 버전입니다."""
+        return await self._run(self.client.get_post, post_id)
+
+    async def get_recent_posts(self, count: int = 5, use_mirror: bool = False) -> list:
+        """WordPressClient.get_recent_posts의 비동기 버전입니다."""
+        return await self._run(self.client.get_recent_posts, count, use_mirror=use_mirror)
+
+    async def get_or_create_tags(self, tag_names: list) -> list:
+        """
+        WordPressClient.get_or_create_tags의 비동기 버전입니다.
+        이름 매칭은 로컬 태그 인덱스에서 끝나므로 한 번의 스레드 호출로 처리합니다.
+        """
+        return await self._run(self.client.get_or_create_tags, tag_names)
@@ -0,0 +1,187 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, List, Optional
+from src.config.settings import Config
+from src.utils.logger import get_logger
+
+logger = get_logger("AuthorityLinks")
+
+DEFAULT_REGISTRY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "authority_links.json"
+)
+
+# 어떤 키워드와도 맞지 않는 섹션에 배정할 범용 출처 분류
+FALLBACK_CATEGORY = "government"
+
+class AuthorityLinkRegistry:
+    """
+    미리 검증된 공신력 있는 외부 출처(정부 포털, 부처, 금융 당국 등) 목록입니다.
+    섹션 제목/주제의 키워드로 로컬에서 출처를 매칭하므로 LLM 호출이나 URL 추측이 필요 없습니다.
+    각 URL의 접속 상태는 포스트마다가 아니라 주기적으로(AUTHORITY_REVALIDATE_HOURS) 한 번에 재검증합니다.
+    """
+
+    def __init__(self, path: str = None, status_path: str = None):
+        self.path = path or DEFAULT_REGISTRY_PATH
+        self.status_path = status_path or os.path.join(Config.CACHE_DIR, "authority_links_status.json")
+        self.entries: List[Dict[str, Any]] = []
+        self._keyword_index: Dict[str, List[int]] = {}
+        self.status = {"revalidated_at": 0, "links": {}}
+        self._lock = threading.Lock()
+        self._revalidating: Optional[threading.Thread] = None
+        self.load()
+
+    def load(self):
+        """레지스트리와 마지막 재검증 결과를 읽고 키워드 인덱스를 만듭니다."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"외부 출처 레지스트리 로드 실패: {e}")
+            data = {}
+
+        entries = []
+        index: Dict[str, List[int]] = {}
+        for category, items in data.items():
+            for item in items:
+                entry = {"name": item["name"], "url": item["url"], "category": category,
+                         "keywords": item.get("keywords", [])}
+                for keyword in entry["keywords"] + [entry["name"]]:
+                    index.setdefault(keyword.lower(), []).append(len(entries))
+                entries.append(entry)
+
+        status = {"revalidated_at": 0, "links": {}}
+        if os.path.exists(self.status_path):
+            try:
+                with open(self.status_path, "r", encoding="utf-8") as f:
+                    status = json.load(f)
+            except Exception as e:
+                logger.warning(f"외부 출처 검증 기록 로드 실패 (무시): {e}")
+
+        with self._lock:
+            self.entries = entries
+            self._keyword_index = index
+            self.status = status
+        logger.info(f"외부 출처 레지스트리 로드: {len(entries)}개")
+
+    def is_available(self, entry: Dict[str, Any]) -> bool:
+        """마지막 재검증에서 실패하지 않은 출처인지 확인합니다. (검증 전이면 사용 가능)"""
+        result = self.status.get("links", {}).get(entry["url"])
+        return result is None or result.get("ok", True)
+
+    def _scores(self, text: str) -> Dict[int, int]:
+        """텍스트에 포함된 키워드로 출처별 점수를 계산합니다. (긴 키워드일수록 구체적이므로 가중)"""
+        text = text.lower()
+        scores: Dict[int, int] = {}
+        for keyword, ids in self._keyword_index.items():
+            if keyword in text:
+                for i in ids:
+                    scores[i] = scores.get(i, 0) + len(keyword)
+        return scores
+
+    def match(self, text: str, exclude: set = None) -> Optional[Dict[str, Any]]:
+        """텍스트와 가장 잘 맞는 사용 가능한 출처 1개를 반환합니다. (exclude: 제외할 URL 집합)"""
+        exclude = exclude or set()
+        scores = self._scores(text)
+        ranked = sorted(scores, key=lambda i: -scores[i])
+        for i in ranked:
+            entry = self.entries[i]
+            if entry["url"] not in exclude and self.is_available(entry):
+                return entry
+        return None
+
+    def match_sections(self, sections: list, topic: str = "") -> List[Dict[str, Any]]:
+        """
+        섹션마다 서로 다른 출처를 1개씩 배정합니다.
+        섹션 제목 키워드를 우선하고 주제 키워드를 보조 점수로 사용하며, 맞는 출처가 없으면 범용 출처를 배정합니다.
+
+        Returns:
+            list: [{'name', 'url', 'category', 'keywords'}, ...] (섹션 순서)
+        """
+        topic_scores = self._scores(topic) if topic else {}
+        used = set()
+        plans = []
+        for section_title in sections:
+            scores = self._scores(section_title)
+            combined = {i: scores.get(i, 0) * 2 + topic_scores.get(i, 0) for i in set(scores) | set(topic_scores)}
+            candidates = sorted(combined, key=lambda i: -combined[i])
+            candidates += [i for i, e in enumerate(self.entries) if e["category"] == FALLBACK_CATEGORY]
+            # 모든 후보가 이미 쓰였으면 중복을 허용해 레지스트리 전체에서 고름
+            candidates += list(range(len(self.entries)))
+
+            chosen = None
+            for i in candidates:
+                entry = self.entries[i]
+                if entry["url"] not in used and self.is_available(entry):
+                    chosen = entry
+                    break
+            if chosen is None and self.entries:
+                chosen = self.entries[candidates[0]]
+            if chosen:
+                used.add(chosen["url"])
+            plans.append(chosen)
+        return plans
+
+    def needs_revalidation(self) -> bool:
+        return time.time() - self.status.get("revalidated_at", 0) > Config.AUTHORITY_REVALIDATE_HOURS * 3600
+
+    def revalidate(self, validator) -> Dict[str, Any]:
+        """
+        레지스트리의 모든 URL을 캐시 없이 다시 검사하고 결과를 저장합니다.
+
+        Args:
+            validator (LinkValidator): 링크 검증기
+
+        Returns:
+            Dict[str, Any]: {'checked': int, 'failed': [url, ...]}
+        """
+        urls = [entry["url"] for entry in self.entries]
+        results = validator.validate_many(urls, refresh=True)
+        failed = [url for url, reason in results.items() if reason]
+        if len(urls) > 1 and len(failed) == len(urls):
+            # 전부 실패하면 사이트가 아니라 이쪽 네트워크 문제로 보고 기존 결과를 유지
+            logger.warning(f"외부 출처 {len(urls)}개 모두 접속 실패 -> 네트워크 문제로 판단, 검증 결과 미반영")
+            return {"checked": len(urls), "failed": failed}
+
+        now = time.time()
+        status = {
+            "revalidated_at": now,
+            "links": {url: {"ok": reason is None, "reason": reason, "checked_at": now} for url, reason in results.items()},
+        }
+        os.makedirs(os.path.dirname(self.status_path) or ".", exist_ok=True)
+        tmp_path = f"{self.status_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(status, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.status_path)
+        with self._lock:
+            self.status = status
+
+        if failed:
+            logger.warning(f"외부 출처 재검증: {len(failed)}/{len(urls)}개 접속 실패 -> 매칭에서 제외: {', '.join(failed)}")
+        else:
+            logger.info(f"외부 출처 재검증 완료: {len(urls)}개 모두 정상")
+        return {"checked": len(urls), "failed": failed}
+
+    def revalidate_in_background(self, validator) -> Optional[threading.Thread]:
+        """마지막 재검증이 주기보다 오래되었으면 백그라운드 스레드로 재검증을 시작합니다."""
+        if not self.needs_revalidation():
+            return None
+        with self._lock:
+            if self._revalidating and self._revalidating.is_alive():
+                return self._revalidating
+
+            def run():
+                try:
+                    self.revalidate(validator)
+                except Exception as e:
+                    logger.error(f"외부 출처 재검증 실패: {e}")
+
+            self._revalidating = threading.Thread(target=run, name="authority-revalidate", daemon=True)
+            self._revalidating.start()
+            return self._revalidating
+
+if __name__ == "__main__":
+    # 스케줄러(cron 등)에서 주기적으로 실행: python -m src.core.authority_links
+    from src.core.link_validator import LinkValidator
+    print(json.dumps(AuthorityLinkRegistry().revalidate(LinkValidator()), ensure_ascii=False, indent=2))
@@ -0,0 +1,437 @@
+import argparse
+import json
+import os
+import shutil
+import time
+from typing import Dict, Any, List, Optional
+from src.config.settings import Config
+from src.utils.logger import get_logger
+
+logger = get_logger("BatchGeneration")
+
+# Batch API 요금은 실시간 호출의 절반
+BATCH_DISCOUNT = 0.5
+
+# 완료로 간주하는 배치 상태 / 재시도가 필요한 종료 상태
+BATCH_DONE_STATUSES = ("completed",)
+BATCH_FAILED_STATUSES = ("failed", "expired", "cancelled")
+
+def read_jsonl(path: str) -> List[Dict[str, Any]]:
+    if not path or not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def write_jsonl(path: str, rows: List[Dict[str, Any]]):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+class OpenAIBatchBackend:
+    """
+    OpenAI Batch API 백엔드입니다. (입력 파일 업로드 -> 배치 생성 -> 상태 조회 -> 결과 파일 다운로드)
+    결과는 최대 completion_window 안에 도착하며, 요금은 실시간 호출의 절반이고 실시간 rate limit을 쓰지 않습니다.
+    """
+
+    def __init__(self, client=None, completion_window: str = "24h"):
+        if client is None:
+            from openai import OpenAI
+            client = OpenAI(api_key=Config.OPENAI_API_KEY)
+        self.client = client
+        self.completion_window = completion_window
+
+    def submit(self, input_path: str) -> str:
+        with open(input_path, "rb") as f:
+            uploaded = self.client.files.create(file=f, purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window,
+        )
+        return batch.id
+
+    def poll(self, batch_id: str) -> Dict[str, Any]:
+        batch = self.client.batches.retrieve(batch_id)
+        counts = batch.request_counts.model_dump() if batch.request_counts else {}
+        return {
+            "status": batch.status,
+            "output_file_id": batch.output_file_id,
+            "error_file_id": batch.error_file_id,
+            "counts": counts,
+        }
+
+    def download(self, file_id: str, path: str):
+        content = self.client.files.content(file_id)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content.text)
+
+class LocalBatchBackend:
+    """
+    Batch API를 흉내 내는 로컬 대역입니다. (API 키/비용 없이 캠페인 흐름을 점검할 때 사용)
+    제출 즉시 입력 JSONL의 각 요청에 responder(custom_id, body)로 가짜 응답을 만들어 Batch API와 같은 형식의 결과 파일을 씁니다.
+    responder가 None을 반환하면 그 요청은 오류 파일에 기록됩니다. (재시도 경로 점검용)
+    """
+
+    def __init__(self, root: str, responder=None):
+        self.root = root
+        self.responder = responder or fake_batch_response
+
+    def submit(self, input_path: str) -> str:
+        batch_id = f"local_batch_{time.time_ns()}"
+        outputs, errors = [], []
+        for row in read_jsonl(input_path):
+            content = self.responder(row["custom_id"], row["body"])
+            if content is None:
+                errors.append({
+                    "id": f"{batch_id}_{len(errors)}", "custom_id": row["custom_id"], "response": None,
+                    "error": {"code": "local_error", "message": "로컬 대역에서 실패로 지정한 요청"},
+                })
+                continue
+            outputs.append({
+                "id": f"{batch_id}_{len(outputs)}",
+                "custom_id": row["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "request_id": row["custom_id"],
+                    "body": {
+                        "id": f"chatcmpl-{row['custom_id']}",
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": row["body"].get("model"),
+                        "choices": [{"index": 0, "finish_reason": "stop",
+                                     "message": {"role": "assistant", "content": content}}],
+                        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                    },
+                },
+                "error": None,
+            })
+        write_jsonl(os.path.join(self.root, f"{batch_id}_output.jsonl"), outputs)
+        write_jsonl(os.path.join(self.root, f"{batch_id}_errors.jsonl"), errors)
+        return batch_id
+
+    def poll(self, batch_id: str) -> Dict[str, Any]:
+        # 결과 파일 유무로 상태를 판단하므로 step을 별도 프로세스로 반복 실행해도 동작
+        output_path = os.path.join(self.root, f"{batch_id}_output.jsonl")
+        error_path = os.path.join(self.root, f"{batch_id}_errors.jsonl")
+        if not os.path.exists(output_path):
+            return {"status": "failed", "output_file_id": None, "error_file_id": None, "counts": {}}
+        completed, failed = len(read_jsonl(output_path)), len(read_jsonl(error_path))
+        return {
+            "status": "completed",
+            "output_file_id": output_path,
+            "error_file_id": error_path if failed else None,
+            "counts": {"total": completed + failed, "completed": completed, "failed": failed},
+        }
+
+    def download(self, file_id: str, path: str):
+        shutil.copyfile(file_id, path)
+
+def _user_value(body: Dict[str, Any], label: str) -> str:
+    """요청의 user 메시지에서 '라벨: 값' 줄의 값을 꺼냅니다."""
+    for line in body["messages"][-1]["content"].splitlines():
+        if line.startswith(f"{label}: "):
+            return line[len(label) + 2:]
+    return ""
+
+def fake_batch_response(custom_id: str, body: Dict[str, Any]) -> str:
+    """LocalBatchBackend의 기본 응답: 단계 형식(개요/이미지 JSON, 본문 HTML)만 맞춘 가짜 내용"""
+    stage = custom_id.split(":")[1]
+    topic = _user_value(body, "주제")
+    keyword = _user_value(body, "핵심 키워드") or topic
+    if stage == "outline":
+        return json.dumps({
+            "focus_keyword": topic,
+            "title": f"2026 {topic} 총정리",
+            "slug": "batch-local-post",
+            "description": f"{topic} 핵심 내용을 정리했습니다.",
+            "sections": [f"{topic} 핵심 정리 {i + 1}" for i in range(6)],
+            "related_keywords": [f"{topic} {i + 1}" for i in range(8)],
+        }, ensure_ascii=False)
+    if stage == "image_metadata":
+        return json.dumps({"images": [
+            {"type": "featured" if i == 0 else "body", "prompt": f"{topic} infographic {i}",
+             "alt": f"{keyword} 이미지 {i}", "caption": f"{keyword} {i}"}
+            for i in range(4)
+        ]}, ensure_ascii=False)
+    if stage == "intro":
+        return f"<p>{keyword}에 대해 알아봅니다.</p>"
+    if stage == "faq":
+        return f"<h2>자주 묻는 질문</h2><details><summary>{keyword}란?</summary>{keyword} 설명</details>"
+    return f"<h2>{_user_value(body, '섹션 제목')}</h2><p>{keyword} 관련 설명입니다.</p>"
+
+class BatchCampaign:
+    """
+    여러 주제를 OpenAI Batch API로 오프라인 생성하는 캠페인입니다. 상태는 BATCH_DIR/<name>/state.json에 저장되어
+    cron 등에서 step()을 반복 호출해도 이어서 진행됩니다.
+
+    라운드 구성 (단계 의존성을 배치 라운드로 해소):
+    - 1라운드: 모든 주제의 개요
+    - 2라운드: 개요가 나온 주제의 이미지 메타데이터/서론/섹션/FAQ (외부 출처는 로컬 레지스트리에서 배정)
+    - 이후: 실패/누락된 요청만 BATCH_MAX_RETRIES회까지 다시 제출
+    모든 단계 결과가 모이면 generate_post와 같은 경로로 조립해 posts/<번호>.json에 저장합니다.
+    """
+
+    def __init__(self, name: str, generator=None, root: str = None):
+        self.name = name
+        self.dir = os.path.join(root or Config.BATCH_DIR, name)
+        self.state_path = os.path.join(self.dir, "state.json")
+        self._generator = generator
+        self.state = self._load()
+
+    @property
+    def generator(self):
+        # 상태 조회만 할 때는 생성기(API 키/레지스트리)를 만들지 않음
+        if self._generator is None:
+            from src.core.generator import ContentGenerator
+            self._generator = ContentGenerator()
+        return self._generator
+
+    def _load(self) -> Dict[str, Any]:
+        if os.path.exists(self.state_path):
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return {"name": self.name, "created_at": time.time(), "topics": [], "rounds": [],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0}}
+
+    def save(self):
+        os.makedirs(self.dir, exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def add_topics(self, topics: List[str], internal_links: list = None):
+        """캠페인에 주제를 추가합니다. (이미 있는 주제는 건너뜀)"""
+        existing = {t["topic"] for t in self.state["topics"]}
+        for topic in topics:
+            topic = topic.strip()
+            if not topic or topic in existing:
+                continue
+            self.state["topics"].append({
+                "topic": topic, "internal_links": internal_links or [], "status": "pending",
+                "outline": None, "results": {}, "attempts": {}, "post_path": None, "error": None,
+            })
+            existing.add(topic)
+        self.save()
+        logger.info(f"배치 캠페인 [{self.name}] 주제 {len(self.state['topics'])}개")
+
+    def _active_round(self) -> Optional[Dict[str, Any]]:
+        for round_ in self.state["rounds"]:
+            if round_["status"] in ("prepared", "submitted"):
+                return round_
+        return None
+
+    def _pending_requests(self) -> List[Dict[str, Any]]:
+        """아직 결과가 없는 다음 단계 요청을 모읍니다. (재시도 한도를 넘은 주제는 실패 처리)"""
+        requests_ = []
+        for idx, item in enumerate(self.state["topics"]):
+            if item["status"] in ("done", "failed"):
+                continue
+            prefix = f"t{idx:03d}"
+            if item["outline"] is None:
+                candidates = self.generator.outline_batch_requests(prefix, item["topic"])
+            else:
+                candidates = self.generator.body_batch_requests(prefix, item["topic"], item["outline"], item["internal_links"])
+            missing = [r for r in candidates if r["custom_id"].split(":", 1)[1] not in item["results"]]
+            exhausted = [r["custom_id"] for r in missing if item["attempts"].get(r["custom_id"], 0) > Config.BATCH_MAX_RETRIES]
+            if exhausted:
+                item["status"] = "failed"
+                item["error"] = f"재시도 한도 초과: {', '.join(exhausted)}"
+                logger.error(f"[{item['topic']}] {item['error']}")
+                continue
+            for r in missing:
+                item["attempts"][r["custom_id"]] = item["attempts"].get(r["custom_id"], 0) + 1
+            item["status"] = "outline" if item["outline"] is None else "body"
+            requests_.extend(missing)
+        return requests_
+
+    def prepare_round(self) -> Optional[Dict[str, Any]]:
+        """다음 라운드 입력 JSONL을 만듭니다. (진행 중인 라운드가 있거나 보낼 요청이 없으면 None)"""
+        if self._active_round():
+            return None
+        requests_ = self._pending_requests()
+        if not requests_:
+            self.save()
+            return None
+        number = len(self.state["rounds"]) + 1
+        input_path = os.path.join(self.dir, f"round_{number:02d}_input.jsonl")
+        write_jsonl(input_path, requests_)
+        round_ = {"round": number, "status": "prepared", "input": input_path, "requests": len(requests_),
+                  "batch_id": None, "prepared_at": time.time()}
+        self.state["rounds"].append(round_)
+        self.save()
+        logger.info(f"배치 라운드 {number} 준비: 요청 {len(requests_)}건 -> {input_path}")
+        return round_
+
+    def submit_round(self, backend) -> Optional[Dict[str, Any]]:
+        round_ = self._active_round()
+        if not round_ or round_["status"] != "prepared":
+            return None
+        round_["batch_id"] = backend.submit(round_["input"])
+        round_["status"] = "submitted"
+        round_["submitted_at"] = time.time()
+        self.save()
+        logger.info(f"배치 라운드 {round_['round']} 제출: {round_['batch_id']}")
+        return round_
+
+    def poll_round(self, backend) -> Optional[str]:
+        """제출한 라운드의 상태를 확인하고 끝났으면 결과를 받아 반영합니다. (반환: 배치 상태)"""
+        round_ = self._active_round()
+        if not round_ or round_["status"] != "submitted":
+            return None
+        info = backend.poll(round_["batch_id"])
+        status = info["status"]
+        if status in BATCH_DONE_STATUSES or status in BATCH_FAILED_STATUSES:
+            for kind in ("output", "error"):
+                file_id = info.get(f"{kind}_file_id")
+                if file_id:
+                    path = os.path.join(self.dir, f"round_{round_['round']:02d}_{kind}.jsonl")
+                    backend.download(file_id, path)
+                    self.ingest(path)
+            round_["status"] = "ingested" if status in BATCH_DONE_STATUSES else status
+            round_["finished_at"] = time.time()
+            round_["counts"] = info.get("counts", {})
+            self.save()
+            logger.info(f"배치 라운드 {round_['round']} 종료 ({status}): {round_['counts']}")
+        else:
+            logger.info(f"배치 라운드 {round_['round']} 진행 중 ({status}): {info.get('counts', {})}")
+        return status
+
+    def ingest(self, path: str) -> Dict[str, int]:
+        """
+        Batch API 결과(또는 오류) 파일을 읽어 주제별 단계 결과에 반영합니다.
+        잘린 응답(finish_reason=length), 오류, 비정상 상태 코드는 저장하지 않아 다음 라운드에서 다시 요청됩니다.
+        """
+        by_prefix = {f"t{idx:03d}": item for idx, item in enumerate(self.state["topics"])}
+        counts = {"ok": 0, "failed": 0}
+        for row in read_jsonl(path):
+            prefix, _, stage = row["custom_id"].partition(":")
+            item = by_prefix.get(prefix)
+            response = row.get("response") or {}
+            body = response.get("body") or {}
+            choices = body.get("choices") or []
+            content = choices[0]["message"].get("content") if choices else None
+            if item is None or row.get("error") or response.get("status_code") != 200 or not content \
+                    or choices[0].get("finish_reason") == "length":
+                counts["failed"] += 1
+                logger.warning(f"배치 요청 실패 ({row['custom_id']}): {row.get('error') or response.get('status_code')}")
+                continue
+
+            usage = body.get("usage") or {}
+            self._add_usage(body.get("model"), usage)
+            if stage == "outline":
+                item["outline"] = self.generator._outline_fields(self.generator._parse_outline(content, item["topic"]), item["topic"])
+            else:
+                item["results"][stage] = content
+            counts["ok"] += 1
+        self.save()
+        logger.info(f"배치 결과 반영 ({os.path.basename(path)}): 성공 {counts['ok']} / 실패 {counts['failed']}")
+        return counts
+
+    def _add_usage(self, model: str, usage: Dict[str, Any]):
+        prompt = usage.get("prompt_tokens") or 0
+        cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+        completion = usage.get("completion_tokens") or 0
+        total = self.state["usage"]
+        total["prompt_tokens"] += prompt
+        total["completion_tokens"] += completion
+        cost = self.generator.router.estimate_cost(model, prompt, cached, completion)
+        if cost is not None:
+            total["cost_usd"] = round(total["cost_usd"] + cost * BATCH_DISCOUNT, 6)
+
+    def assemble(self) -> List[str]:
+        """모든 단계 결과가 모인 주제를 포스트로 조립해 저장합니다. (반환: 저장한 파일 경로 목록)"""
+        saved = []
+        for idx, item in enumerate(self.state["topics"]):
+            if item["status"] in ("done", "failed") or item["outline"] is None:
+                continue
+            needed = ["image_metadata", "intro", "faq"] + [f"section:{i}" for i in range(len(item["outline"]["sections"]))]
+            if any(stage not in item["results"] for stage in needed):
+                continue
+            try:
+                post = self.generator.assemble_batch_post(item["topic"], item["outline"], item["results"], item["internal_links"])
+            except Exception as e:
+                item["status"] = "failed"
+                item["error"] = f"조립 실패: {e}"
+                logger.error(f"[{item['topic']}] {item['error']}")
+                continue
+            path = os.path.join(self.dir, "posts", f"{idx:03d}.json")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"topic": item["topic"], **post}, f, ensure_ascii=False, indent=2)
+            item["status"] = "done"
+            item["post_path"] = path
+            saved.append(path)
+            logger.info(f"✅ 배치 포스트 조립 완료: {item['topic']} -> {path}")
+        self.save()
+        return saved
+
+    def step(self, backend) -> Dict[str, Any]:
+        """
+        캠페인을 한 단계 진행합니다. (진행 중 라운드 확인 -> 조립 -> 다음 라운드 준비/제출)
+        cron에서 주기적으로 호출하거나 run()으로 반복합니다.
+        """
+        if self._active_round():
+            self.submit_round(backend)
+            self.poll_round(backend)
+        if not self._active_round():
+            self.assemble()
+            if self.prepare_round():
+                self.submit_round(backend)
+        return self.summary()
+
+    def run(self, backend, poll_seconds: float = None) -> Dict[str, Any]:
+        """모든 주제가 완료/실패할 때까지 step()을 반복합니다."""
+        poll_seconds = Config.BATCH_POLL_SECONDS if poll_seconds is None else poll_seconds
+        while True:
+            summary = self.step(backend)
+            if summary["finished"]:
+                return summary
+            time.sleep(poll_seconds)
+
+    def summary(self) -> Dict[str, Any]:
+        statuses: Dict[str, int] = {}
+        for item in self.state["topics"]:
+            statuses[item["status"]] = statuses.get(item["status"], 0) + 1
+        active = self._active_round()
+        return {
+            "name": self.name,
+            "topics": len(self.state["topics"]),
+            "statuses": statuses,
+            "rounds": len(self.state["rounds"]),
+            "active_round": active["round"] if active else None,
+            "usage": self.state["usage"],
+            "finished": bool(self.state["topics"]) and not active
+                        and all(item["status"] in ("done", "failed") for item in self.state["topics"]),
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI Batch API 오프라인 생성 캠페인")
+    parser.add_argument("command", choices=["add", "step", "run", "status", "ingest"])
+    parser.add_argument("--name", required=True, help="캠페인 이름 (BATCH_DIR/<name>에 상태 저장)")
+    parser.add_argument("--topics-file", help="add: 한 줄에 주제 하나인 텍스트 파일")
+    parser.add_argument("--file", help="ingest: 직접 내려받은 Batch 결과 JSONL")
+    parser.add_argument("--local", action="store_true", help="OpenAI 대신 로컬 대역(가짜 결과)으로 실행")
+    parser.add_argument("--poll-seconds", type=float, default=None)
+    args = parser.parse_args()
+
+    campaign = BatchCampaign(args.name)
+    if args.command == "add":
+        with open(args.topics_file, "r", encoding="utf-8") as f:
+            campaign.add_topics(f.readlines())
+    elif args.command == "ingest":
+        campaign.ingest(args.file)
+        campaign.assemble()
+    elif args.command in ("step", "run"):
+        backend = LocalBatchBackend(campaign.dir) if args.local else OpenAIBatchBackend()
+        if args.command == "step":
+            campaign.step(backend)
+        else:
+            campaign.run(backend, 0 if args.local else args.poll_seconds)
+    print(json.dumps(campaign.summary(), ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    # 예: python -m src.core.batch_generation add --name overnight --topics-file topics.txt
+    #     python -m src.core.batch_generation run --name overnight
+    main()
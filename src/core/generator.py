@@ -1,9 +1,30 @@
 import json
 import os
 import re
+import threading
+import time
 import requests
+from html import unescape
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from openai import OpenAI
 from src.config.settings import Config
+from src.core.authority_links import AuthorityLinkRegistry
+from src.core.html_engine import analyze_html, process_post_html
+from src.core.hedging import AttemptCancelled, DeadlineExceeded, LatencyTracker, hedged_call
+from src.core.html_stream import DelimitedStreamSplitter, StreamingHTMLCleaner
+from src.core.link_validator import LinkValidator
+from src.core.llm_cache import LLMCache, cache_key, completion_from_stream
+from src.core.model_routing import DEFAULT_ROUTE, ModelRouter
+from src.core.pipeline import StagePipeline
+from src.core.prompts import (
+    outline_messages, image_metadata_messages, intro_messages, section_messages, faq_messages, single_call_messages,
+    structured_repair_message
+)
+from src.core.structured_output import (
+    MAX_SECTIONS, ImageMetaModel, ImageMetadataModel, OutlineModel, parse_json, response_format_for, subset_model,
+    validate_fields
+)
 from src.utils.logger import get_logger
 
 logger = get_logger("ContentGenerator")
@@ -17,15 +38,324 @@ logger = get_logger("ContentGenerator")
 # 로직 변경 시 주의가 필요합니다.
 # ==============================================================================
 
+GENERATION_ENGINES = ("iterative", "single_call")
+# 단일 호출 모드에서 섹션 1개에 허용하는 키워드 사용 횟수 (섹션 프롬프트: 최대 2~3회)
+SECTION_KEYWORD_MAX = 3
+IMAGE_COUNT = 4  # featured 1 + body 3
+# 파트가 도착하는 즉시 재생성을 시작하는 콜백이 있어 중복 요청(헤지)을 보내면 안 되는 단계
+UNHEDGED_STAGES = ("single_call",)
+
 class ContentGenerator:
     """
     OpenAI API를 사용하여 블로그 콘텐츠를 생성하는 클래스입니다.
     """
-    def __init__(self):
+    def __init__(self, section_concurrency: int = None, cache_mode: str = None, stream: bool = None,
+                 model_profile: str = None, model_routes: dict = None, engine: str = None):
         Config.validate()
         self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
-        self.model = "gpt-4o"  # 최신 모델 사용
+        # 단계별 모델/max_tokens/요청 제한 시간 (model_routes: 이번 실행만 적용할 단계별 덮어쓰기)
+        self.router = ModelRouter(profile=model_profile, overrides=model_routes)
+        self.model = self.router.route("section")["model"]  # 본문 기준 모델 (로그/호환용)
         self.verified_tags = self._load_verified_tags()
+        # 같은 프롬프트 재실행(복구 모드 등)은 저장된 응답을 재사용 (cache_mode: on/refresh/off)
+        self.llm_cache = LLMCache(mode=cache_mode)
+        self.section_concurrency = section_concurrency or Config.SECTION_CONCURRENCY
+        # 본문 생성 방식: iterative(서론/섹션/FAQ 개별 호출) 또는 single_call(한 번의 스트리밍 호출)
+        self.engine = (engine or Config.GENERATION_ENGINE).lower()
+        if self.engine not in GENERATION_ENGINES:
+            raise ValueError(f"알 수 없는 생성 방식: {self.engine} (허용: {', '.join(GENERATION_ENGINES)})")
+        self.last_stage_report = None  # 마지막 generate_post의 단계별 소요 시간/임계 경로
+
+        # 스트리밍 모드: 토큰 단위로 받아 정리하고, 닫힌 외부 링크는 생성 도중 미리 검증
+        self.stream = Config.LLM_STREAM if stream is None else stream
+        self.link_validator = LinkValidator()
+
+        # 외부 출처 레지스트리 (접속 상태는 주기적으로 백그라운드 재검증)
+        self.authority_links = AuthorityLinkRegistry()
+        self.authority_links.revalidate_in_background(self.link_validator)
+        self._state_lock = threading.Lock()
+        self.stream_timings = []  # [{'stage', 'ttft_s', 'ttlt_s', 'cached', 'chars'}, ...]
+        # 공급자 프롬프트 캐시 사용량: 단계 -> {'calls', 'prompt_tokens', 'cached_tokens'} (run: 포스트 1개, totals: 누적)
+        self.prompt_cache_usage = {}
+        self.prompt_cache_totals = {}
+        # 구조화 출력(개요/이미지 메타) 검증 결과: 단계 -> {'calls', 'parse_failures', 'field_failures', 'repairs', 'fallbacks'}
+        self.structured_usage = {}
+        self.structured_totals = {}
+
+        # 지연 꼬리 대응: 호출마다 포스트 지연 예산에서 남은 시간을 제한 시간으로 쓰고,
+        # 단계별 p95를 넘기면 같은 요청을 하나 더 보내 먼저 온 유효한 응답을 사용
+        self.latency = LatencyTracker()
+        self.hedge_stages = {stage.strip() for stage in Config.HEDGE_STAGES.split(",") if stage.strip()} - set(UNHEDGED_STAGES)
+        self._post_deadline = None
+        # 단계 -> {'calls', 'hedged', 'hedge_wins', 'deadline_exceeded', 'saved_s'} (run: 포스트 1개, totals: 누적)
+        self.hedge_usage = {}
+        self.hedge_totals = {}
+
+    def _chat(self, messages: list, stage: str = None, **params):
+        """
+        chat.completions.create 호출을 LLM 응답 캐시를 거쳐 실행합니다.
+        키는 모델/메시지/파라미터의 해시이므로 프롬프트가 조금이라도 달라지면 새로 호출합니다.
+        stage를 주면 라우팅 표의 모델/max_tokens/제한 시간을 적용하고, 실제 API 응답의 토큰 사용량을 단계별로 기록합니다.
+        """
+        model, params, timeout = self._route_params(stage, params)
+        key = cache_key(model, messages, params)
+        cached = self.llm_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self._call_llm(
+            stage, model, timeout,
+            # 일괄 호출은 도중에 끊을 수 없으므로 헤지에서 지면 응답만 버림
+            lambda cancel, progress, timeout: self.client.chat.completions.create(
+                model=model, messages=messages, timeout=timeout, **params
+            ),
+            is_valid=lambda r: bool(r.choices and r.choices[0].message.content and r.choices[0].finish_reason != "length"),
+            measure=lambda r: len(r.choices[0].message.content or "") if r.choices else 0,
+        )
+        if stage:
+            self._record_prompt_usage(stage, response.usage, model)
+        # 잘린 응답이나 빈 응답은 재실행 시 다시 받도록 저장하지 않음
+        choice = response.choices[0] if response.choices else None
+        if choice and choice.message.content and choice.finish_reason != "length":
+            self.llm_cache.put(key, model, response)
+        return response
+
+    def _stage_timeout(self, stage: str, calls: int = 1) -> float:
+        """
+        파이프라인 단계 제한 시간을 단계 안에서 순서대로 기다리는 API 호출들의 라우팅 timeout 합으로 정합니다.
+        호출마다 헤지를 포함해 자기 제한 시간 안에 끝나므로, 단계가 먼저 시간 초과로 버려지지 않도록
+        호출 수만큼 더하고 호출 사이 처리 시간용 여유(STAGE_TIMEOUT_MARGIN)를 붙입니다.
+        """
+        per_call = self.router.route(stage).get("timeout") or DEFAULT_ROUTE["timeout"]
+        return per_call * calls + Config.STAGE_TIMEOUT_MARGIN
+
+    def _route_params(self, stage: Optional[str], params: dict):
+        """단계 라우팅을 호출 파라미터에 반영합니다. (반환: 모델, 파라미터, 요청 제한 시간)"""
+        route = self.router.route(stage)
+        params = dict(params)
+        if route.get("max_tokens"):
+            params.setdefault("max_tokens", route["max_tokens"])
+        return route["model"], params, route.get("timeout")
+
+    def _call_llm(self, stage: Optional[str], model: str, timeout: Optional[float], run, is_valid=None, measure=None):
+        """
+        API 호출 1건에 마감 시각을 붙여 실행합니다.
+        - 제한 시간: 라우팅 표의 단계별 timeout과 포스트 지연 예산(POST_LATENCY_BUDGET)의 남은 시간 중 짧은 쪽
+        - 헤지: 단계/모델의 최근 p95를 넘기면 같은 요청을 한 번 더 보내고 먼저 온 유효한 응답을 사용 (진 쪽은 취소)
+
+        Args:
+            run: run(cancel, progress, timeout) - 호출 1회 (hedging.hedged_call 참고)
+        """
+        key = (stage or "").split(":", 1)[0]
+        timeout = timeout or DEFAULT_ROUTE["timeout"]
+        if self._post_deadline is not None:
+            remaining = self._post_deadline - time.monotonic()
+            if remaining <= 0:
+                self._record_hedge(key, calls=1, deadline_exceeded=1)
+                raise DeadlineExceeded(f"[{stage}] 포스트 지연 예산 {Config.POST_LATENCY_BUDGET:.0f}초 소진")
+            timeout = min(timeout, remaining)
+
+        hedge_after = None
+        if Config.HEDGE_ENABLED and key in self.hedge_stages:
+            p95 = self.latency.p95(key, model)
+            if p95 is not None and max(p95, Config.HEDGE_MIN_DELAY) < timeout:
+                hedge_after = max(p95, Config.HEDGE_MIN_DELAY)
+
+        try:
+            value, info = hedged_call(
+                lambda cancel, progress: run(cancel, progress, timeout), hedge_after, timeout,
+                is_valid=is_valid, measure=measure,
+                on_saved=lambda saved: self._record_hedge(key, saved_s=saved),
+                # 원래 시도의 지연 시간을 기록 (헤지에 졌거나 제한 시간으로 버려진 시도도 포함해 p95가 낮아지지 않게)
+                on_primary_done=lambda seconds: self.latency.record(key, model, seconds)
+            )
+        except DeadlineExceeded:
+            self._record_hedge(key, calls=1, hedged=int(hedge_after is not None), deadline_exceeded=1)
+            logger.warning(f"[{stage}] 호출 제한 시간 {timeout:.0f}초 초과 -> 취소")
+            raise
+
+        self._record_hedge(key, calls=1, hedged=int(info["hedged"]), hedge_wins=int(info["winner"] == "hedge"))
+        if info["hedged"]:
+            logger.info(
+                f"[{stage}] p95 {hedge_after:.1f}초 초과로 중복 요청 -> {'중복 요청' if info['winner'] == 'hedge' else '원래 요청'} "
+                f"응답 사용 ({info['elapsed']:.1f}초)"
+            )
+        return value
+
+    def _record_hedge(self, stage: str, calls: int = 0, hedged: int = 0, hedge_wins: int = 0,
+                      deadline_exceeded: int = 0, saved_s: float = 0.0):
+        with self._state_lock:
+            for table in (self.hedge_usage, self.hedge_totals):
+                entry = table.setdefault(stage, {"calls": 0, "hedged": 0, "hedge_wins": 0, "deadline_exceeded": 0, "saved_s": 0.0})
+                entry["calls"] += calls
+                entry["hedged"] += hedged
+                entry["hedge_wins"] += hedge_wins
+                entry["deadline_exceeded"] += deadline_exceeded
+                entry["saved_s"] += saved_s
+
+    def _log_hedge_usage(self):
+        """이번 포스트의 단계별 헤지 발생/승리 횟수와 절감 시간 추정치, 누적 헤지 비율을 기록합니다."""
+        with self._state_lock:
+            run = {k: dict(v) for k, v in self.hedge_usage.items()}
+            totals = [dict(v) for v in self.hedge_totals.values()]
+        if not any(e["hedged"] or e["deadline_exceeded"] for e in run.values()):
+            return
+        for stage, e in run.items():
+            logger.debug(
+                f"   헤지 [{stage}]: 호출 {e['calls']}회 중 중복 요청 {e['hedged']}회 (중복 쪽 승리 {e['hedge_wins']}), "
+                f"절감 추정 {e['saved_s']:.1f}초, 제한 시간 초과 {e['deadline_exceeded']}회"
+            )
+        calls = sum(e["calls"] for e in totals)
+        hedged = sum(e["hedged"] for e in totals)
+        logger.info(
+            f"헤지 누적: 호출 {calls}회 중 {hedged}회 ({hedged / calls * 100 if calls else 0.0:.1f}%), "
+            f"절감 추정 {sum(e['saved_s'] for e in totals):.1f}초"
+        )
+
+    def _record_timing(self, stage: str, ttft: Optional[float], ttlt: float, cached: bool, chars: int):
+        with self._state_lock:
+            self.stream_timings.append({
+                "stage": stage,
+                "ttft_s": round(ttft, 3) if ttft is not None else None,
+                "ttlt_s": round(ttlt, 3),
+                "cached": cached,
+                "chars": chars,
+            })
+
+    def _record_prompt_usage(self, stage: str, usage, model: str = None):
+        """
+        usage.prompt_tokens_details.cached_tokens와 입출력 토큰을 단계별로 누적합니다.
+        섹션처럼 여러 번 호출되는 단계는 'section:제목'을 'section'으로 묶어 집계합니다.
+        """
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = (getattr(details, "cached_tokens", None) or 0) if details else 0
+        logger.debug(f"   [{stage}] 프롬프트 {usage.prompt_tokens} 토큰 중 캐시 적중 {cached_tokens} 토큰")
+        key = stage.split(":", 1)[0]
+        with self._state_lock:
+            for table in (self.prompt_cache_usage, self.prompt_cache_totals):
+                entry = table.setdefault(key, {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0})
+                entry["calls"] += 1
+                entry["prompt_tokens"] += usage.prompt_tokens or 0
+                entry["cached_tokens"] += cached_tokens
+                entry["completion_tokens"] += usage.completion_tokens or 0
+                entry["model"] = model or entry.get("model")
+
+    def _log_prompt_cache_usage(self):
+        """이번 포스트와 누적 프롬프트 캐시 적중률을 기록합니다."""
+        with self._state_lock:
+            run = {k: dict(v) for k, v in self.prompt_cache_usage.items()}
+            totals = [dict(v) for v in self.prompt_cache_totals.values()]
+        if not run:
+            return
+
+        def ratio(entries):
+            prompt = sum(e["prompt_tokens"] for e in entries)
+            cached = sum(e["cached_tokens"] for e in entries)
+            return cached, prompt, (cached / prompt * 100 if prompt else 0.0)
+
+        for stage, e in run.items():
+            cached, prompt, pct = ratio([e])
+            logger.debug(f"   [{stage}] 호출 {e['calls']}회: 프롬프트 {prompt} 토큰 중 캐시 {cached} ({pct:.0f}%)")
+        cached, prompt, pct = ratio(run.values())
+        total_cached, total_prompt, total_pct = ratio(totals)
+        logger.info(
+            f"프롬프트 캐시: 이번 포스트 {cached}/{prompt} 토큰 ({pct:.0f}%), "
+            f"누적 {total_cached}/{total_prompt} 토큰 ({total_pct:.0f}%)"
+        )
+
+    def _chat_text(self, stage: str, messages: list, **params) -> str:
+        """
+        HTML 본문을 생성하는 단계(서론/섹션/FAQ)의 호출입니다.
+        스트리밍 모드면 토큰 단위로 받아 펜스를 즉시 제거하고, 닫힌 <a> 태그의 URL을 바로 검증 큐에 넣습니다.
+        단계별 첫 토큰 시간(TTFT)과 마지막 토큰 시간(TTLT)을 stream_timings에 기록합니다.
+        """
+        started = time.perf_counter()
+        if not self.stream:
+            response = self._chat(messages, stage=stage, **params)
+            content = response.choices[0].message.content
+            self._record_timing(stage, None, time.perf_counter() - started, False, len(content or ""))
+            return content
+
+        return self._stream_text(stage, messages, lambda: StreamingHTMLCleaner(on_link=self._prefetch_link), **params)
+
+    def _stream_text(self, stage: str, messages: list, make_sink, **params):
+        """
+        스트리밍으로 응답을 받으며 조각을 sink.feed()에 넘기고 sink.close()의 결과를 반환합니다.
+        make_sink: 시도마다 새 sink를 만드는 함수 - StreamingHTMLCleaner(단일 파트) 또는 DelimitedStreamSplitter(구분자로 나뉜 여러 파트)
+        캐시에 있으면 저장된 응답 전체를 한 번에 넘깁니다.
+        헤지에서 진 시도는 취소 신호를 받으면 스트림을 닫고 중단합니다.
+        """
+        started = time.perf_counter()
+        model, params, timeout = self._route_params(stage, params)
+        key = cache_key(model, messages, params)
+        cached = self.llm_cache.get(key)
+        if cached is not None:
+            sink = make_sink()
+            content = cached.choices[0].message.content or ""
+            sink.feed(content)
+            result = sink.close()
+            elapsed = time.perf_counter() - started
+            self._record_timing(stage, elapsed, elapsed, True, len(content))
+            return result
+
+        def attempt(cancel, progress, timeout):
+            sink = make_sink()
+            stream = self.client.chat.completions.create(
+                model=model, messages=messages, stream=True, timeout=timeout,
+                stream_options={"include_usage": True}, **params
+            )
+            progress["close"] = getattr(stream, "close", None)
+            raw_parts = []
+            ttft = None
+            completion_id = finish_reason = usage = None
+            for chunk in stream:
+                if cancel.is_set():
+                    raise AttemptCancelled(stage)
+                completion_id = completion_id or chunk.id
+                if chunk.usage:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                finish_reason = choice.finish_reason or finish_reason
+                delta = choice.delta.content if choice.delta else None
+                if delta:
+                    if ttft is None:
+                        ttft = time.perf_counter() - started
+                        progress["first_token"] = time.monotonic()
+                    raw_parts.append(delta)
+                    progress["chars"] += len(delta)
+                    sink.feed(delta)
+            if cancel.is_set():
+                raise AttemptCancelled(stage)
+            return {
+                "result": sink.close(), "content": "".join(raw_parts), "ttft": ttft,
+                "completion_id": completion_id, "finish_reason": finish_reason, "usage": usage,
+            }
+
+        answer = self._call_llm(
+            stage, model, timeout, attempt,
+            is_valid=lambda a: bool(a["content"]) and a["finish_reason"] != "length",
+            measure=lambda a: len(a["content"]),
+        )
+        content = answer["content"]
+        self._record_timing(stage, answer["ttft"], time.perf_counter() - started, False, len(content))
+        self._record_prompt_usage(stage, answer["usage"], model)
+        if answer["finish_reason"] == "length":
+            logger.warning(f"[{stage}] 응답이 max_tokens에서 잘림 ({len(content)}자)")
+        elif content:
+            self.llm_cache.put(key, model, completion_from_stream(
+                answer["completion_id"], model, content, answer["finish_reason"], answer["usage"]
+            ))
+        return answer["result"]
+
+    def _prefetch_link(self, url: str):
+        """스트리밍 중 닫힌 외부 링크를 백그라운드 검증에 넘깁니다. (내부 링크 제외, 중복은 검증기가 합침)"""
+        if Config.WP_URL and url.startswith(Config.WP_URL.rstrip("/")):
+            return
+        self.link_validator.submit(url)
 
     def _load_verified_tags(self):
         """승인된 태그 리스트를 로드합니다."""
@@ -52,243 +382,570 @@ class ContentGenerator:
         """
         return topic.strip()
 
-    def generate_post(self, topic: str, internal_links: list = None) -> dict:
+    def generate_post(self, topic: str, internal_links: list = None, on_image_metadata=None) -> dict:
         """
         주어진 주제로 SEO 최적화된 블로그 포스트를 생성합니다. (Iterative 방식: 3000자 이상 보장)
         Args:
             topic (str): 주제
             internal_links (list): 내부 링크 리스트 [{'title':..., 'link':...}, ...]
+            on_image_metadata (callable): 이미지 메타데이터가 나오는 즉시 호출할 콜백 on_image_metadata(images, outline)
+                                          (본문 생성과 겹쳐 이미지 생성/업로드를 시작할 때 사용, 예: ImagePipeline.start)
         """
         logger.info(f"콘텐츠 생성 시작 (Iterative V4 - Smart SEO): {topic}")
+        logger.info(f"모델 프로필 [{self.router.profile}]: {self.router.describe()}")
+        with self._state_lock:
+            self.stream_timings = []
+            self.prompt_cache_usage = {}
+            self.structured_usage = {}
+            self.hedge_usage = {}
+        # 포스트 1개의 지연 예산: 이후 모든 호출은 남은 시간 안에서만 기다림
+        if Config.POST_LATENCY_BUDGET > 0:
+            self._post_deadline = time.monotonic() + Config.POST_LATENCY_BUDGET
         
+        internal_links = self._shuffle_internal_links(topic, internal_links)
+
+        # 개요에만 의존하는 단계(이미지 메타/서론/외부 링크 계획/FAQ)는 동시에, 섹션은 링크 계획 이후 실행
+        # 단계 제한 시간은 라우팅 timeout에서 계산 (구조화 출력 단계는 검증 실패 필드 재요청 호출 포함)
+        structured_calls = 1 + Config.STRUCTURED_REPAIR_RETRIES
+        section_waves = -(-MAX_SECTIONS // max(1, self.section_concurrency))
+        pipeline = StagePipeline("generate_post")
+        pipeline.add(
+            "outline", lambda: self._prepare_outline(topic),
+            timeout=self._stage_timeout("outline", structured_calls)
+        )
+        pipeline.add(
+            "image_metadata",
+            lambda outline: self._image_metadata_stage(topic, outline, on_image_metadata),
+            inputs=("outline",), required=False, fallback=[],
+            timeout=self._stage_timeout("image_metadata", structured_calls)
+        )
+        pipeline.add(
+            "external_links",
+            lambda outline: self._plan_external_links(outline["sections"], topic),
+            inputs=("outline",)
+        )
+        if self.engine == "single_call":
+            # 서론/섹션/FAQ를 한 번의 스트리밍 호출로 생성하고 검사에 실패한 파트만 개별 재생성
+            pipeline.add(
+                "body",
+                lambda outline, external_links: self._generate_body_single_call(
+                    topic, outline["focus_keyword"],
+                    self._assign_section_links(outline["sections"], internal_links, external_links)
+                ),
+                inputs=("outline", "external_links"),
+                # 단일 호출 + 실패 파트 재생성(동시성 단위로 최대 섹션 수만큼), 전체를 다시 만드는 비용이 커서 재시도 없음
+                timeout=self._stage_timeout("single_call") + self._stage_timeout("section", section_waves), retries=0
+            )
+        else:
+            pipeline.add(
+                "intro",
+                lambda outline: self._clean_html(self._generate_intro(topic, outline["focus_keyword"])),
+                inputs=("outline",), timeout=self._stage_timeout("intro")
+            )
+            pipeline.add(
+                "sections",
+                lambda outline, external_links: self._generate_sections(
+                    topic, outline["focus_keyword"],
+                    self._assign_section_links(outline["sections"], internal_links, external_links)
+                ),
+                inputs=("outline", "external_links"),
+                # 섹션 전체를 다시 만드는 비용이 크므로 재시도 없음 (최대 섹션 수를 동시성 단위로 나눈 호출 차례만큼 대기)
+                timeout=self._stage_timeout("section", section_waves), retries=0
+            )
+            pipeline.add(
+                "faq",
+                lambda outline: self._clean_html(self._generate_faq(topic, outline["focus_keyword"])),
+                inputs=("outline",), timeout=self._stage_timeout("faq")
+            )
+
         try:
-            # 1. 핵심 키워드 및 개요 생성
-            logger.info("1. 개요 생성 중...")
-            outline_data = self._generate_outline(topic)
-            focus_keyword = outline_data.get("focus_keyword", topic)
-            title = outline_data.get("title", f"{focus_keyword} 가이드")
-            
-            # 슬러그: 영문 (구글 SEO 친화적, 인코딩 이슈 해결)
-            slug = outline_data.get("slug", "post-slug")
-            
-            # [강제 로직] 슬러그 길이 제한 (75자)
-            if len(slug) > 75:
-                slug = slug[:75].rstrip("-")
-            
-            # 만약 개요에서 한글 슬러그가 넘어왔다면 안전하게 변환하거나 그대로 둠 (outline 프롬프트도 수정 필요)
-            if not slug or slug == "post-slug":
-                # 비상시 포커스 키워드를 영문으로 변환하는 로직이 없으므로 일단 한글이라도 넣음 (하지만 outline에서 영문 강제할 것임)
-                 slug = focus_keyword.replace(" ", "-")
-                 if len(slug) > 75: slug = slug[:75]
-            
-            description = outline_data.get("description", "")
-            sections = outline_data.get("sections", [])
-            
-            logger.info(f"개요 완료: {len(sections)} 섹션 / 키워드: {focus_keyword} / 슬러그: {slug}")
-            
-            # 2. 이미지 메타데이터 생성 (신규: 캡션/ALT 정밀화)
-            logger.info("2. 이미지 메타데이터(Alt/Caption) 생성 중...")
-            image_metadata_list = self._generate_image_metadata(topic, title, sections, focus_keyword)
-            # 호환성 유지
-            image_prompts = [item['prompt'] for item in image_metadata_list]
-
-            # 3. 서론 생성
-            logger.info("3. 서론 생성 중...")
-            intro_html = self._clean_html(self._generate_intro(topic, focus_keyword))
-            
-            # 4. 본론 섹션별 상세 생성 (내부 링크 분배)
-            body_html = ""
-            total_sections = len(sections)
-            links_per_section = 1 # 섹션당 1개 정도 배분
-            
-            # [신규] 외부 링크 계획 (각 섹션별 고유 출처)
-            logger.info("4. 외부 링크 및 내부 링크 전략 수립 중...")
-            external_link_plans = self._plan_external_links(sections)
-            
-            import random
-            random.shuffle(internal_links) # 내부 링크 순서 섞기 (중복 방지)
-            
-            body_html = ""
-            total_sections = len(sections)
-            
-            for idx, section_title in enumerate(sections):
-                logger.info(f"5. 섹션 생성 중 [{idx+1}/{total_sections}]: {section_title}")
-                
-                # 내부 링크 1개 할당 (순환)
-                current_internal_link = []
-                if internal_links:
-                    link_idx = idx % len(internal_links)
-                    current_internal_link = [internal_links[link_idx]]
-                
-                # 외부 링크 힌트 1개 할당
-                current_external_hint = None
-                if idx < len(external_link_plans):
-                    current_external_hint = external_link_plans[idx]
-                
-                section_content = self._clean_html(self._generate_section(
-                    topic, section_title, focus_keyword, 
-                    internal_links=current_internal_link, 
-                    external_link_hint=current_external_hint
-                ))
-                body_html += section_content + "\n\n"
-
-            # 5. 결론 및 FAQ 생성
-            logger.info("5. 결론 및 FAQ 생성 중...")
-            faq_html = self._clean_html(self._generate_faq(topic, focus_keyword))
-            
-            # 6. 남은 내부 링크 하단 배치 (보조 수단)
-            # 본문에 삽입되지 못한 나머지 링크들을 하단에 배치하여 연결성 확보
-            remaining_links = internal_links[total_sections * links_per_section:]
-            internal_link_html = ""
-            
-            if remaining_links:
-                internal_link_html = f"""
-                <div class="internal-links" style="margin: 30px 0; padding: 20px; background-color: #f9f9f9; border-left: 5px solid #0073aa;">
-                    <h3>💡 {focus_keyword} 관련 더 보기</h3>
-                    <ul>
-                """
-                for link in remaining_links:
-                    t = link.get('title', '관련 글')
-                    u = link.get('link', '#')
-                    internal_link_html += f"<li><a href='{u}' target='_blank' rel='dofollow'>{t}</a></li>"
-                internal_link_html += "</ul></div>"
-                logger.info(f"하단 보조 링크 섹션 생성 완료 ({len(remaining_links)}개)")
-
-            # 7. 전체 병합
-            full_content = f"{intro_html}\n\n{body_html}\n\n{internal_link_html}\n\n{faq_html}"
-            
-            # [신규] 외부 링크 검증 및 수정
-            logger.info("6. 외부 링크 (404 에러 등) 유효성 검증 중...")
-            internal_urls = [link.get('link', '') for link in internal_links] if internal_links else []
-            full_content = self._validate_and_fix_external_links(full_content, internal_urls)
-            
-            # 태그 선택
-            raw_tags = self.verified_tags.split(", ")
-            import random
-            selected_tags = random.sample(raw_tags, k=min(7, len(raw_tags)))
-            selected_tags.append(focus_keyword)
-
-            result = {
-                "title": title,
-                "slug": slug,
-                "content": full_content,
-                "tags": list(set(selected_tags)),
-                "rank_math_focus_keyword": focus_keyword,
-                "rank_math_description": description,
-                "excerpt": description,
-                "image_prompts": image_prompts,
-                "images": image_metadata_list,
-                "related_keywords": outline_data.get("related_keywords", [])
-            }
-            
-            logger.info(f"콘텐츠 생성 완료 (총 길이: {len(full_content)}자)")
-            return result
+            stages = pipeline.run()
+            return self._assemble_post(stages, internal_links)
 
         except Exception as e:
             logger.error(f"콘텐츠 생성 전체 실패: {e}")
             import traceback
             logger.error(traceback.format_exc())
             return None
+        finally:
+            self.last_stage_report = pipeline.report
+            self._log_stream_timings()
+            self._log_prompt_cache_usage()
+            self._log_structured_usage()
+            self._log_hedge_usage()
+            self._post_deadline = None
+            cache_stats = self.llm_cache.stats()
+            logger.info(
+                f"LLM 캐시 ({cache_stats['mode']}): 적중 {cache_stats['hits']} / 미스 {cache_stats['misses']} "
+                f"(절약 토큰 {cache_stats['saved_tokens']})"
+            )
+
+    def batch_request(self, custom_id: str, stage: str, messages: list, **params) -> dict:
+        """
+        호출 1건을 OpenAI Batch API 입력 JSONL의 한 줄 형식으로 만듭니다. (라우팅 표의 모델/max_tokens 적용)
+        """
+        model, params, _ = self._route_params(stage, params)
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {"model": model, "messages": messages, **params},
+        }
+
+    def outline_batch_requests(self, prefix: str, topic: str) -> list:
+        """배치 1라운드: 개요 요청"""
+        return [self.batch_request(f"{prefix}:outline", "outline", outline_messages(topic),
+                                   response_format=response_format_for(OutlineModel, "outline"))]
+
+    def body_batch_requests(self, prefix: str, topic: str, outline: dict, internal_links: list) -> list:
+        """
+        배치 2라운드: 개요에 의존하는 이미지 메타데이터/서론/섹션/FAQ 요청
+        내부 링크 순서와 외부 출처 배정은 generate_post와 같은 규칙(주제 시드 셔플, 로컬 레지스트리)을 따릅니다.
+        """
+        keyword = outline["focus_keyword"]
+        section_jobs = self._batch_section_jobs(topic, outline, internal_links)
+        requests_ = [
+            self.batch_request(f"{prefix}:image_metadata", "image_metadata",
+                               image_metadata_messages(topic, keyword, outline["sections"]),
+                               response_format=response_format_for(ImageMetadataModel, "image_metadata")),
+            self.batch_request(f"{prefix}:intro", "intro", intro_messages(topic, keyword)),
+        ]
+        for idx, (section_title, section_internal_links, external_hint) in enumerate(section_jobs):
+            internal_link = section_internal_links[0] if section_internal_links else None
+            requests_.append(self.batch_request(
+                f"{prefix}:section:{idx}", "section",
+                section_messages(topic, section_title, keyword, internal_link, external_hint)
+            ))
+        requests_.append(self.batch_request(f"{prefix}:faq", "faq", faq_messages(topic, keyword)))
+        return requests_
+
+    def _shuffle_internal_links(self, topic: str, internal_links: list) -> list:
+        """내부 링크 순서 섞기 (중복 방지) - 주제 기반 시드로 같은 주제 재실행 시 섹션 프롬프트가 같아 캐시 적중"""
+        import random
+        internal_links = list(internal_links or [])
+        random.Random(topic).shuffle(internal_links)
+        return internal_links
+
+    def _batch_section_jobs(self, topic: str, outline: dict, internal_links: list) -> list:
+        external_links = self._plan_external_links(outline["sections"], topic)
+        return self._assign_section_links(outline["sections"], self._shuffle_internal_links(topic, internal_links), external_links)
+
+    def assemble_batch_post(self, topic: str, outline: dict, results: dict, internal_links: list) -> dict:
+        """
+        배치 결과(단계별 응답 원문)로 포스트를 조립합니다. generate_post와 같은 병합/링크 검증 경로를 사용합니다.
+
+        Args:
+            results (dict): {'image_metadata', 'intro', 'section:0'.., 'faq'} -> 응답 content
+        """
+        try:
+            image_metadata = self._parse_image_metadata(results.get("image_metadata", ""), outline["focus_keyword"])
+        except Exception as e:
+            logger.error(f"이미지 메타데이터 파싱 실패: {e}")
+            image_metadata = []
+        stages = {
+            "outline": outline,
+            "image_metadata": image_metadata,
+            "intro": self._clean_html(results["intro"]),
+            "sections": [self._clean_html(results[f"section:{idx}"]) for idx in range(len(outline["sections"]))],
+            "faq": self._clean_html(results["faq"]),
+        }
+        return self._assemble_post(stages, self._shuffle_internal_links(topic, internal_links))
+
+    def _log_stream_timings(self):
+        """본문 단계별 첫 토큰/마지막 토큰 시간을 요약해 기록합니다."""
+        with self._state_lock:
+            timings = list(self.stream_timings)
+        if not timings:
+            return
+        for t in timings:
+            ttft = f"{t['ttft_s']:.2f}초" if t["ttft_s"] is not None else "-"
+            logger.debug(f"   [{t['stage']}] TTFT {ttft} / TTLT {t['ttlt_s']:.2f}초{' (캐시)' if t['cached'] else ''}")
+        ttfts = [t["ttft_s"] for t in timings if t["ttft_s"] is not None]
+        slowest = max(timings, key=lambda t: t["ttlt_s"])
+        avg_ttft = f"평균 TTFT {sum(ttfts) / len(ttfts):.2f}초, " if ttfts else ""
+        logger.info(
+            f"본문 생성 {len(timings)}회 ({'스트리밍' if self.stream else '일괄'}): "
+            f"{avg_ttft}최대 TTLT {slowest['ttlt_s']:.2f}초 ({slowest['stage']})"
+        )
+
+    def _prepare_outline(self, topic: str) -> dict:
+        """
+        개요를 생성하고 슬러그/키워드/제목 등 후속 단계가 쓰는 값을 정리합니다.
+        """
+        logger.info("1. 개요 생성 중...")
+        return self._outline_fields(self._generate_outline(topic), topic)
+
+    def _outline_fields(self, outline_data: dict, topic: str) -> dict:
+        """
+        개요 응답에서 슬러그/키워드/제목 등 후속 단계가 쓰는 값을 정리합니다. (배치 모드와 공용)
+        """
+        focus_keyword = outline_data.get("focus_keyword", topic)
+        title = outline_data.get("title", f"{focus_keyword} 가이드")
+        
+        # 슬러그: 영문 (구글 SEO 친화적, 인코딩 이슈 해결)
+        slug = outline_data.get("slug", "post-slug")
+        
+        # [강제 로직] 슬러그 길이 제한 (75자)
+        if len(slug) > 75:
+            slug = slug[:75].rstrip("-")
+        
+        # 만약 개요에서 한글 슬러그가 넘어왔다면 안전하게 변환하거나 그대로 둠 (outline 프롬프트도 수정 필요)
+        if not slug or slug == "post-slug":
+            # 비상시 포커스 키워드를 영문으로 변환하는 로직이 없으므로 일단 한글이라도 넣음 (하지만 outline에서 영문 강제할 것임)
+             slug = focus_keyword.replace(" ", "-")
+             if len(slug) > 75: slug = slug[:75]
+        
+        sections = outline_data.get("sections", [])
+        logger.info(f"개요 완료: {len(sections)} 섹션 / 키워드: {focus_keyword} / 슬러그: {slug}")
+        return {
+            "title": title,
+            "slug": slug,
+            "focus_keyword": focus_keyword,
+            "description": outline_data.get("description", ""),
+            "sections": sections,
+            "related_keywords": outline_data.get("related_keywords", []),
+        }
+
+    def _assign_section_links(self, sections: list, internal_links: list, external_link_plans: list) -> list:
+        """
+        섹션별로 내부 링크 1개(순환)와 외부 링크 힌트 1개를 배분합니다.
+
+        Returns:
+            list: [(섹션 제목, 내부 링크 리스트, 외부 링크 힌트), ...] (개요 순서)
+        """
+        section_jobs = []
+        for idx, section_title in enumerate(sections):
+            # 내부 링크 1개 할당 (순환)
+            current_internal_link = []
+            if internal_links:
+                link_idx = idx % len(internal_links)
+                current_internal_link = [internal_links[link_idx]]
+            
+            # 외부 링크 힌트 1개 할당
+            current_external_hint = None
+            if idx < len(external_link_plans):
+                current_external_hint = external_link_plans[idx]
+            
+            section_jobs.append((section_title, current_internal_link, current_external_hint))
+        return section_jobs
+
+    def _assemble_post(self, stages: dict, internal_links: list) -> dict:
+        """
+        단계별 결과를 하나의 포스트로 병합하고 링크 검증/태그 선택을 거쳐 결과 딕셔너리를 만듭니다.
+        """
+        outline = stages["outline"]
+        focus_keyword = outline["focus_keyword"]
+        image_metadata_list = stages["image_metadata"]
+        # 호환성 유지
+        image_prompts = [item['prompt'] for item in image_metadata_list]
+        # single_call 모드는 'body' 단계 하나가 서론/섹션/FAQ를 함께 반환
+        body = stages.get("body") or stages
+        body_html = "".join(section_html + "\n\n" for section_html in body["sections"])
+
+        # 남은 내부 링크 하단 배치 (보조 수단)
+        # 본문에 삽입되지 못한 나머지 링크들을 하단에 배치하여 연결성 확보
+        links_per_section = 1 # 섹션당 1개 정도 배분
+        remaining_links = internal_links[len(outline["sections"]) * links_per_section:]
+        internal_link_html = ""
+        
+        if remaining_links:
+            internal_link_html = f"""
+            <div class="internal-links" style="margin: 30px 0; padding: 20px; background-color: #f9f9f9; border-left: 5px solid #0073aa;">
+                <h3>💡 {focus_keyword} 관련 더 보기</h3>
+                <ul>
+            """
+            for link in remaining_links:
+                t = link.get('title', '관련 글')
+                u = link.get('link', '#')
+                internal_link_html += f"<li><a href='{u}' target='_blank' rel='dofollow'>{t}</a></li>"
+            internal_link_html += "</ul></div>"
+            logger.info(f"하단 보조 링크 섹션 생성 완료 ({len(remaining_links)}개)")
+
+        # 전체 병합
+        full_content = f"{body['intro']}\n\n{body_html}\n\n{internal_link_html}\n\n{body['faq']}"
+        
+        # [신규] 외부 링크 검증 및 수정
+        logger.info("외부 링크 (404 에러 등) 유효성 검증 중...")
+        internal_urls = [link.get('link', '') for link in internal_links] if internal_links else []
+        full_content = self._validate_and_fix_external_links(full_content, internal_urls)
+        
+        # 태그 선택
+        raw_tags = self.verified_tags.split(", ")
+        import random
+        selected_tags = random.sample(raw_tags, k=min(7, len(raw_tags)))
+        selected_tags.append(focus_keyword)
+
+        result = {
+            "title": outline["title"],
+            "slug": outline["slug"],
+            "content": full_content,
+            "tags": list(set(selected_tags)),
+            "rank_math_focus_keyword": focus_keyword,
+            "rank_math_description": outline["description"],
+            "excerpt": outline["description"],
+            "image_prompts": image_prompts,
+            "images": image_metadata_list,
+            "related_keywords": outline["related_keywords"]
+        }
+        
+        logger.info(f"콘텐츠 생성 완료 (총 길이: {len(full_content)}자)")
+        return result
+
+    def _generate_sections(self, topic: str, keyword: str, section_jobs: list) -> list:
+        """
+        섹션 본문을 최대 section_concurrency개씩 동시에 생성합니다.
+
+        Args:
+            section_jobs (list): [(섹션 제목, 내부 링크 리스트, 외부 링크 힌트), ...] (개요 순서)
+
+        Returns:
+            list: 정리된 섹션 HTML 리스트 (입력과 같은 개요 순서)
+        """
+        total = len(section_jobs)
+        logger.info(f"섹션 {total}개 동시 생성 중 (동시성: {self.section_concurrency})...")
+
+        def run(idx: int, job: tuple) -> str:
+            section_title, section_internal_links, external_hint = job
+            started = time.perf_counter()
+            section_html = self._clean_html(self._generate_section(
+                topic, section_title, keyword,
+                internal_links=section_internal_links,
+                external_link_hint=external_hint
+            ))
+            logger.info(f"   섹션 완료 [{idx+1}/{total}] {time.perf_counter() - started:.1f}초: {section_title}")
+            return section_html
+
+        started = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=max(1, self.section_concurrency), thread_name_prefix="section")
+        try:
+            futures = [executor.submit(run, idx, job) for idx, job in enumerate(section_jobs)]
+            results = [future.result() for future in futures]
+        finally:
+            # 한 섹션이 실패하면 아직 시작하지 않은 섹션은 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+        logger.info(f"섹션 {total}개 생성 완료 (총 {time.perf_counter() - started:.1f}초)")
+        return results
+
+    def _check_single_call_part(self, part, html: str, keyword: str) -> Optional[str]:
+        """
+        단일 호출로 받은 파트가 분량/키워드 기준을 만족하는지 검사합니다. (반환: 실패 사유, 통과면 None)
+        - 서론: 최소 분량의 절반 이상, 키워드 포함
+        - 섹션: 최소 분량 이상, H2 포함, 키워드 SECTION_KEYWORD_MAX회 이하 (섹션 프롬프트의 남용 금지 규칙)
+        - FAQ: <details> 구조, 키워드 포함
+        """
+        stats = analyze_html(html, keyword=keyword)
+        if part == "intro":
+            if stats["text_length"] < Config.SINGLE_CALL_MIN_SECTION_CHARS // 2:
+                return f"분량 부족 ({stats['text_length']}자)"
+            if not stats["keyword_count"]:
+                return "키워드 누락"
+        elif part == "faq":
+            if "<details" not in html.lower():
+                return "FAQ 구조 누락"
+            if not stats["keyword_count"]:
+                return "키워드 누락"
+        else:
+            if stats["text_length"] < Config.SINGLE_CALL_MIN_SECTION_CHARS:
+                return f"분량 부족 ({stats['text_length']}자)"
+            if not stats["h2_count"]:
+                return "H2 누락"
+            if stats["keyword_count"] > SECTION_KEYWORD_MAX:
+                return f"키워드 과다 ({stats['keyword_count']}회)"
+        return None
+
+    def _generate_body_single_call(self, topic: str, keyword: str, section_jobs: list) -> dict:
+        """
+        서론, 모든 섹션, FAQ를 구분자가 있는 한 번의 스트리밍 응답으로 생성합니다.
+        파트가 완성되는 즉시 검사하고, 실패하거나 응답에서 빠진 파트만 기존 개별 프롬프트로 재생성합니다.
+        (재생성은 스트리밍이 계속되는 동안 병렬로 시작)
+
+        Returns:
+            dict: {'intro': html, 'sections': [html, ...] (개요 순서), 'faq': html}
+        """
+        total = len(section_jobs)
+        expected = ["intro"] + list(range(total)) + ["faq"]
+        parts = {}
+        repairs = {}
+
+        def regenerate(part):
+            if part == "intro":
+                return self._clean_html(self._generate_intro(topic, keyword))
+            if part == "faq":
+                return self._clean_html(self._generate_faq(topic, keyword))
+            section_title, section_internal_links, external_hint = section_jobs[part]
+            return self._clean_html(self._generate_section(
+                topic, section_title, keyword,
+                internal_links=section_internal_links,
+                external_link_hint=external_hint
+            ))
+
+        executor = ThreadPoolExecutor(max_workers=max(1, self.section_concurrency), thread_name_prefix="single-call-repair")
+        # 제한 시간으로 버려진 스트림 스레드가 늦게 넘기는 파트가 결과를 바꾸지 않도록
+        # parts/repairs는 잠금 안에서만 고치고, 스트림 결과를 확정한 뒤에는 더 받지 않음
+        state_lock = threading.Lock()
+        accepting = True
+        splitters = []
+
+        def on_part(part, html):
+            if part not in expected:
+                logger.warning(f"   알 수 없는 파트 무시: {part}")
+                return
+            failure = self._check_single_call_part(part, html, keyword)
+            with state_lock:
+                if not accepting or part in parts or part in repairs:
+                    return
+                if failure:
+                    logger.warning(f"   파트 [{part}] 검사 실패 ({failure}) -> 개별 재생성")
+                    repairs[part] = executor.submit(regenerate, part)
+                else:
+                    parts[part] = html
+
+        def make_splitter():
+            # 시도(헤지 포함)마다 새 분할기 - 두 스트림의 조각이 한 분할기에 섞이지 않도록
+            splitter = DelimitedStreamSplitter(on_part=on_part, on_link=self._prefetch_link)
+            with state_lock:
+                splitters.append(splitter)
+            return splitter
+
+        logger.info(f"본문 단일 호출 생성 중 (서론 + 섹션 {total}개 + FAQ)...")
+        started = time.perf_counter()
+        try:
+            try:
+                self._stream_text("single_call", single_call_messages(topic, keyword, section_jobs), make_splitter)
+            except Exception as e:
+                logger.error(f"단일 호출 생성 실패 -> 받은 파트 외에는 개별 생성: {e}")
+                with state_lock:
+                    received = list(splitters)
+                for splitter in received:
+                    splitter.close()  # 받은 데까지의 마지막 파트도 검사
+            with state_lock:
+                accepting = False
+                received = list(splitters)
+            for splitter in received:
+                splitter.close()  # 아직 도는 시도가 있어도 이후 조각은 무시
+            if not any(splitter.parts for splitter in received) and any(splitter.preamble for splitter in received):
+                logger.warning("응답에서 구분자를 찾지 못했습니다 -> 전체 파트를 개별 생성")
+
+            missing = [part for part in expected if part not in parts and part not in repairs]
+            if missing:
+                logger.warning(f"   응답에 없는 파트 {len(missing)}개 -> 개별 생성: {missing}")
+            for part in missing:
+                repairs[part] = executor.submit(regenerate, part)
+            for part, future in repairs.items():
+                parts[part] = future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        logger.info(
+            f"본문 단일 호출 완료 (총 {time.perf_counter() - started:.1f}초, "
+            f"파트 {len(expected)}개 중 재생성 {len(repairs)}개)"
+        )
+        return {
+            "intro": parts["intro"],
+            "sections": [parts[idx] for idx in range(total)],
+            "faq": parts["faq"],
+        }
 
     def _validate_and_fix_external_links(self, html_content: str, internal_urls: list) -> str:
         """
         HTML 내의 외부 링크 유효성을 검사하고, 404 에러 등 연결 실패 시 
         링크(<a> 태그)를 제거하고 일반 텍스트로 치환합니다.
+        외부 URL을 먼저 모두 뽑아 동시에 검사하며, 최근 검사 결과는 로컬 캐시에서 재사용합니다.
         """
         logger.info("외부 링크 유효성 검증 시작...")
         
         # <a href="...">text</a> 패턴 찾기
-        pattern = r'<a\s+[^>]*href=["\'](http[s]?://[^"\']+)["\'][^>]*>(.*?)</a>'
-        
-        def replacer(match):
-            full_tag = match.group(0)
-            url = match.group(1)
-            text = match.group(2)
-            
-            # 내부 링크는 패스
-            if internal_urls and any(internal_url in url for internal_url in internal_urls):
-                return full_tag
-                
+        pattern = re.compile(r'<a\s+[^>]*href=["\'](http[s]?://[^"\']+)["\'][^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+
+        def is_internal(url):
+            return bool(internal_urls) and any(internal_url in url for internal_url in internal_urls)
+
+        # href 속성값은 엔티티를 풀어 실제 URL로 검증 (HTML 엔진이 보는 값과 동일)
+        external_urls = [unescape(m.group(1)) for m in pattern.finditer(html_content) if not is_internal(m.group(1))]
+        started = time.perf_counter()
+        failures = self.link_validator.validate_many(external_urls)
+        if external_urls:
+            broken = sum(1 for reason in failures.values() if reason)
+            logger.info(f"외부 링크 {len(failures)}개 검증 완료 (실패 {broken}개, {time.perf_counter() - started:.1f}초)")
+        if not any(failures.values()):
+            return html_content
+
+        processed = process_post_html(
+            html_content, link_failures=failures, internal_urls=internal_urls,
+            cleanup=False, inject_attributes=False
+        )
+        for url, failure in processed["removed_links"]:
+            logger.warning(f"⚠️ 외부 링크 연결 에러({failure}): {url} -> 텍스트로 변환")
+        return processed["html"]
+
+    def _image_metadata_stage(self, topic: str, outline: dict, on_image_metadata=None) -> list:
+        """이미지 메타데이터를 생성하고, 콜백이 있으면 본문 생성을 기다리지 않고 바로 넘깁니다."""
+        images = self._generate_image_metadata(topic, outline["title"], outline["sections"], outline["focus_keyword"])
+        if on_image_metadata and images:
             try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-                # GET 요청으로 빠르게 헤더만 받아옴 (stream=True)
-                response = requests.get(url, headers=headers, timeout=5, stream=True)
-                response.close()
-                
-                if response.status_code >= 400:
-                    logger.warning(f"⚠️ 외부 링크 연결 에러(Status {response.status_code}): {url} -> 텍스트로 변환")
-                    return text # <a> 태그 제거
-                return full_tag
+                on_image_metadata(images, outline)
             except Exception as e:
-                logger.warning(f"⚠️ 외부 링크 접속 불가/타임아웃 ({type(e).__name__}): {url} -> 텍스트로 변환")
-                return text
-
-        fixed_html = re.sub(pattern, replacer, html_content, flags=re.IGNORECASE | re.DOTALL)
-        return fixed_html
+                logger.error(f"이미지 메타데이터 콜백 실패 (본문 생성은 계속): {e}")
+        return images
 
     def _generate_image_metadata(self, topic: str, title: str, sections: list, keyword: str) -> list:
         """
         주제와 섹션 정보를 바탕으로 4장의 이미지에 대한 정밀한 메타데이터(Prompt, Alt, Caption)를 생성합니다.
-        """
-        prompt = f"""
-        블로그 포스트의 주제와 섹션 정보를 바탕으로, 본문에 삽입할 4장의 이미지에 대한 메타데이터를 JSON으로 작성하세요.
-        
-        주제: {topic}
-        핵심 키워드: {keyword}
-        섹션 목차: {", ".join(sections)}
-        
-        [필수 요구사항]
-        1. **총 4장**의 이미지 정보를 생성하세요. (1번째: type='featured', 나머지 3개: type='body')
-        2. **프롬프트(Prompt)**: DALL-E 3가 고품질 이미지를 생성할 수 있도록 영어로 구체적으로 작성하세요. (Modern, High quality, Infographic style 등)
-        3. **대체 텍스트(Alt Text)**: 검색 엔진을 위해 '{keyword}'를 반드시 포함하고, 시각 장애인을 위해 이미지를 묘사하세요. (한글)
-        4. **캡션(Caption)**: **반드시** '{keyword}'를 포함하여 **20자 이내**로 간결하게 작성하세요. (예: "AI 수익화의 핵심 전략 그래프")
-        
-        [출력 구조 (JSON)]
-        {{
-            "images": [
-                {{
-                    "type": "featured",
-                    "prompt": "eng prompt...",
-                    "alt": "한글 대체 텍스트",
-                    "caption": "한글 캡션 (간결)"
-                }},
-                {{
-                    "type": "body",
-                    "prompt": "eng prompt...",
-                    "alt": "한글 대체 텍스트",
-                    "caption": "한글 캡션 (간결)"
-                }},
-                ... (총 4개 필수)
-            ]
-        }}
+        스키마를 지정한 구조화 출력으로 받고, 검증에 실패한 이미지만 다시 요청합니다.
         """
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"}
+            messages = image_metadata_messages(topic, keyword, sections)
+            response = self._chat(
+                messages,
+                stage="image_metadata",
+                response_format=response_format_for(ImageMetadataModel, "image_metadata")
             )
-            content = self._clean_html(response.choices[0].message.content)
-            data = json.loads(content)
+            return self._parse_image_metadata(response.choices[0].message.content, keyword, messages)
         except Exception as e:
             logger.error(f"이미지 메타데이터 생성 실패: {e}")
             return []
-            
+
+    def _parse_image_metadata(self, content: str, keyword: str, messages: list = None) -> list:
+        """
+        이미지 메타데이터 응답을 이미지 단위로 검증하고 키워드를 강제합니다. (배치 모드와 공용)
+        messages를 주면 검증에 실패했거나 모자란 이미지 수만큼만 다시 요청합니다. (배치 모드는 재요청 없이 통과한 이미지만 사용)
+        """
+        images, problems = self._valid_images(content)
+        self._record_structured("image_metadata", parse_failed=problems is None, field_failures=len(problems or []))
+
+        retries = Config.STRUCTURED_REPAIR_RETRIES if messages else 0
+        for _ in range(retries):
+            missing = IMAGE_COUNT - len(images)
+            if missing <= 0:
+                break
+            self._record_structured("image_metadata", repairs=1)
+            logger.warning(f"이미지 메타데이터 {missing}장 재요청: {problems or ['JSON 파싱 실패']}")
+            repair_messages = messages + [
+                {"role": "assistant", "content": content or ""},
+                structured_repair_message(
+                    problems or ["응답이 JSON 형식이 아님"],
+                    f"이미지 {missing}장만 (type은 {'featured 1장과 ' if not images else ''}body) 새로 작성하세요."
+                ),
+            ]
+            response = self._chat(
+                repair_messages,
+                stage="image_metadata",
+                response_format=response_format_for(ImageMetadataModel, "image_metadata_repair")
+            )
+            content = response.choices[0].message.content
+            repaired, problems = self._valid_images(content)
+            images.extend(repaired[:missing])
+
+        if len(images) < IMAGE_COUNT:
+            self._record_structured("image_metadata", fallbacks=IMAGE_COUNT - len(images))
+            logger.warning(f"이미지 메타데이터 부족: {len(images)}/{IMAGE_COUNT}장으로 진행")
+
         # [Strict Enforcement] 키워드 누락 시 강제 주입
         final_images = []
-        raw_images = data.get("images", []) if isinstance(data, dict) else data
-        
-        if not isinstance(raw_images, list):
-            raw_images = []
-            
-        for img in raw_images:
-            # 안전장치: 필수 키 확인
-            if "alt" not in img: img["alt"] = keyword
-            if "caption" not in img: img["caption"] = keyword
-            if "prompt" not in img: img["prompt"] = f"{keyword} illustration"
-            
+        for idx, img in enumerate(images[:IMAGE_COUNT]):
+            # 첫 장이 대표 이미지 (재요청으로 순서가 바뀌어도 위치 기준으로 정리)
+            img["type"] = "featured" if idx == 0 else "body"
+
             # 1. Alt Text 강제
             if keyword not in img["alt"]:
                 # 문맥 고려 없이 가장 앞에 '키워드: ' 형태로 붙임 (가장 확실함)
@@ -306,6 +963,32 @@ class ContentGenerator:
             
         return final_images
 
+    def _valid_images(self, content: str):
+        """
+        응답의 이미지 항목을 하나씩 검증합니다.
+
+        Returns:
+            (통과한 이미지 리스트, 실패 사유 리스트) - JSON 파싱 자체가 실패하면 ([], None)
+        """
+        try:
+            data = parse_json(content)
+        except Exception as e:
+            logger.warning(f"이미지 메타데이터 JSON 파싱 실패: {e}")
+            return [], None
+
+        raw_images = data.get("images")
+        if not isinstance(raw_images, list):
+            return [], ["images: 리스트가 아님"]
+
+        images, problems = [], []
+        for idx, item in enumerate(raw_images):
+            valid, failed = validate_fields(ImageMetaModel, item if isinstance(item, dict) else {})
+            if failed:
+                problems.append(f"이미지 {idx + 1}번 " + ", ".join(f"{name}({reason})" for name, reason in failed.items()))
+            else:
+                images.append(valid)
+        return images, problems
+
     def _clean_html(self, text: str) -> str:
         """
         AI 응답에서 불필요한 마크다운 코드 블록(```html, ```)을 제거합니다.
@@ -316,47 +999,22 @@ class ContentGenerator:
         return text.strip()
 
     def _generate_outline(self, topic: str) -> dict:
-        prompt = f"""
-        주제 '{topic}'에 대한 블로그 포스트 개요를 JSON으로 작성하세요.
-        필수 조건:
-        1. 'focus_keyword': **가장 중요한 '검색어' 1~2단어만 추출.** (예: "청년미래적금", "청년도약계좌 비교"). **절대로 문장형이나 긴 복합명사 금지.** (3단어 초과 시 감점). 사람들이 구글에 검색할 법한 짧은 명사형.
-        2. 'title': **매력적이고 클릭을 유도하는 제목.** 핵심 키워드를 포함하되, 문장형으로 자연스럽게 작성. **반드시 '2026'** 포함. (예: "2026 청년미래적금 vs 청년도약계좌: 금리 비교 및 환승 꿀팁")
-        3. 'slug': 주제와 키워드를 반영한 **영문 슬러그** (hyphen-style). **50자 이내로 짧고 간결하게.** (예: youth-future-savings-2026)
-        4. 'description': 160자 이내의 메타 디스크립션. **무조건 문장의 맨 첫 단어를 '{' + focus_keyword + '}'(으)로 시작할 것.** (예: "청년미래적금은 2026년...")
-        5. 'sections': 본론 H2 소제목 6~8개 리스트.
-        6. 'related_keywords': Rank Math SEO 점수를 위한 **연관 키워드(LSI) 8개** 리스트. (예: ["청년 지원금", "2026 적금", "이자 높은 은행", ...])
-        """
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            response_format={"type": "json_object"}
+        messages = outline_messages(topic)
+        response = self._chat(
+            messages,
+            stage="outline",
+            response_format=response_format_for(OutlineModel, "outline")
         )
-        try:
-            outline = json.loads(self._clean_html(response.choices[0].message.content))
-            
-            # [신규 로직] 연관 키워드 8개 추출 (없으면 자동 생성)
-            related_keywords = outline.get("related_keywords", [])
-            if len(related_keywords) < 8:
-                # 부족하면 추가 생성 요청하거나 더미로 채우지 않고 있는대로 씀 (나중에 보완 가능)
-                pass
-            
-            # [강제 로직] 메타 설명이 포커스 키워드로 시작하지 않으면 강제 주입
-            desc = outline.get("description", "")
-            fk = outline.get("focus_keyword", topic)  # 키워드 없으면 주제 사용
-            
-            # 조사 제거된 순수 키워드만 사용 (예: "AI 수익화는..." -> "AI 수익화")
-            clean_fk = fk.split(" ")[0] if " " in fk else fk 
-            
-            if not desc.startswith(fk):
-                # 기존 설명 앞에 키워드 붙임 (문맥 자연스럽게 연결 시도)
-                new_desc = f"{fk}: {desc}"
-                outline["description"] = new_desc[:160] # 160자 제한
-                logger.info(f"메타 설명 키워드 강제 주입: {outline['description']}")
-                
-            return outline
-        except Exception as e:
-            logger.error(f"개요 생성 실패: {e}")
-            return {
+        return self._parse_outline(response.choices[0].message.content, topic, messages)
+
+    def _parse_outline(self, content: str, topic: str, messages: list = None) -> dict:
+        """
+        개요 응답을 필드 단위로 검증하고 메타 설명 키워드를 강제합니다. (배치 모드와 공용)
+        messages를 주면 검증에 실패한 필드만 다시 요청하고, 끝내 실패한 필드는 기본값으로 채웁니다.
+        """
+        outline, failed = self._validate_structured("outline", OutlineModel, content, messages)
+        if failed:
+            defaults = {
                 "title": f"{topic} 가이드 2026",
                 "focus_keyword": topic,
                 "slug": f"{topic}-2026",
@@ -364,136 +1022,112 @@ class ContentGenerator:
                 "sections": ["서론", "주요 내용", "결론"],
                 "related_keywords": []
             }
+            logger.error(f"개요 필드 검증 실패 (기본값 사용): {failed}")
+            self._record_structured("outline", fallbacks=len(failed))
+            for name in failed:
+                outline[name] = defaults[name]
 
-    def _generate_intro(self, topic: str, keyword: str) -> str:
-        prompt = f"""
-        주제 '{topic}'(키워드: '{keyword}')에 대한 서론을 HTML로 작성하세요.
-        - 첫 문장은 반드시 '{keyword}'(으)로 시작할 것.
-        - 독자의 호기심을 자극하고 문제 의식을 제기할 것.
-        - 분량: 300~500자.
-        - 문단: 한 문단은 2~3문장을 넘지 않게 <p> 태그로 자주 나눌 것. (모바일 가독성)
-        - 출력: 순수 HTML (마크다운 ``` 사용 금지).
-        """
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.choices[0].message.content
+        # [강제 로직] 메타 설명이 포커스 키워드로 시작하지 않으면 강제 주입
+        desc = outline["description"]
+        fk = outline["focus_keyword"]
+        if not desc.startswith(fk):
+            # 기존 설명 앞에 키워드 붙임 (문맥 자연스럽게 연결 시도)
+            new_desc = f"{fk}: {desc}"
+            outline["description"] = new_desc[:160] # 160자 제한
+            logger.info(f"메타 설명 키워드 강제 주입: {outline['description']}")
 
-    def _plan_external_links(self, sections: list) -> list:
-        """
-        각 섹션별로 사용할 고유한 외부 링크 주제를 계획합니다. (중복 방지)
+        return outline
+
+    def _validate_structured(self, stage: str, model_cls, content: str, messages: list = None):
         """
-        section_titles = ", ".join(sections)
-        prompt = f"""
-        블로그 포스트의 각 섹션에 삽입할 '외부 링크(External Link)' 주제를 계획하세요.
-        
-        [섹션 목록]
-        {section_titles}
-        
-        [요구사항]
-        1. 각 섹션마다 **서로 다른** 공신력 있는 외부 출처를 1개씩 지정하세요.
-        2. 출처 예시: 
-           - 정부 사이트 (.go.kr), 통계청, 법제처
-           - 대형 언론사 (연합뉴스, KBS 등)
-           - 구글 학술 검색, 네이버 지식백과 (위키백과 제외)
-           - 관련 협회나 공식 기관
-        3. **절대로** 같은 사이트를 반복해서 추천하지 마세요. (예: 모든 섹션에 '복지로' 링크 금지)
-        4. 출력 형식: JSON 리스트 ["섹션1 출처: 통계청(청년고용동향)", "섹션2 출처: 법제처(관련 법령)", ...]
+        구조화 출력 응답을 필드 단위로 검증하고, messages가 있으면 실패한 필드만 골라 다시 요청합니다.
+        재요청은 실패한 필드만 가진 스키마를 지정하므로 이미 통과한 필드는 다시 생성하지 않습니다.
+
+        Returns:
+            (통과한 필드 값 dict, 끝내 실패한 필드 -> 사유 dict)
         """
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"}
-            )
-            data = json.loads(self._clean_html(response.choices[0].message.content))
-            links = data.get("links", [])
-            # 만약 키가 다르면 값만 리스트로 추출
-            if not links:
-                links = list(data.values())[0] if data else []
-            return links
+            data = parse_json(content)
+            parse_failed = False
         except Exception as e:
-            logger.error(f"외부 링크 계획 실패: {e}")
-            return [f"관련 공신력 있는 출처 {i+1}" for i in range(len(sections))]
+            logger.warning(f"[{stage}] JSON 파싱 실패: {e}")
+            data, parse_failed = {}, True
+        valid, failed = validate_fields(model_cls, data)
+        self._record_structured(stage, parse_failed=parse_failed, field_failures=0 if parse_failed else len(failed))
 
-    def _generate_section(self, topic: str, section_title: str, keyword: str, 
-                          internal_links: list = None, external_link_hint: str = None) -> str:
-        
-        # 내부 링크: 오직 검증된 URL만 사용 (404 방지)
-        internal_link_instruction = "[내부 링크 없음]"
-        if internal_links:
-            # 리스트가 들어로면 그 중 하나를 *반드시* 쓰도록 유도
-            l = internal_links[0] # 첫번째 것 사용 (Generator 메인 루프에서 1개씩 잘라서 줌)
-            internal_link_instruction = f"""
-            [내부 링크 - 필수 삽입 (문단 중간)]
-            - 제목: {l['title']}
-            - URL: {l['link']}
-            - **[매우 중요] 위치 규칙**: 
-              - 절대로 섹션의 맨 마지막에 "참고하세요" 식으로 붙이지 마세요.
-              - **반드시** 설명하는 문장의 중간이나 끝에 자연스럽게 녹여내세요.
-              - 예시 (O): "...이때 **<a href='{l['link']}' target='_blank'>{l['title']}</a>**를 활용하면 더 효율적으로..."
-              - 예시 (X): "...입니다. \n\n 관련 글: {l['title']}" (이런 식의 하단 배치는 금지!)
-            - 앵커 텍스트는 유동적으로 변형 가능하나 URL은 절대 변경 금지.
-            """
+        retries = Config.STRUCTURED_REPAIR_RETRIES if messages else 0
+        for _ in range(retries):
+            if not failed:
+                break
+            self._record_structured(stage, repairs=1)
+            logger.warning(f"[{stage}] 검증 실패 필드만 재요청: {', '.join(failed)}")
+            repair_model = subset_model(model_cls, list(failed))
+            repair_messages = messages + [
+                {"role": "assistant", "content": content or ""},
+                structured_repair_message(
+                    [f"{name}: {reason}" for name, reason in failed.items()],
+                    f"{', '.join(failed)} 필드만"
+                ),
+            ]
+            response = self._chat(
+                repair_messages,
+                stage=stage,
+                response_format=response_format_for(repair_model, f"{stage}_repair")
+            )
+            content = response.choices[0].message.content
+            try:
+                data = parse_json(content)
+            except Exception as e:
+                logger.warning(f"[{stage}] 재요청 응답 JSON 파싱 실패: {e}")
+                continue
+            repaired, failed = validate_fields(repair_model, data)
+            valid.update(repaired)
+        return valid, failed
 
-        # 외부 링크 힌트
-        ext_link_msg = ""
-        if external_link_hint:
-            ext_link_msg = f"""
-            - **권장 외부 링크 출처**: {external_link_hint}
-            - 해당 주제와 관련된 구체적인 페이지를 찾아 링크를 거세요. (예: '{external_link_hint}' 검색 결과 또는 메인 페이지)
-            - 형식: <strong><a href="https://..." target="_blank">[{external_link_hint} 바로가기]</a></strong>
-            """
+    def _record_structured(self, stage: str, parse_failed: bool = None, field_failures: int = 0,
+                           repairs: int = 0, fallbacks: int = 0):
+        """구조화 출력 검증 결과를 단계별로 누적합니다. (parse_failed를 주면 응답 1건으로 집계)"""
+        with self._state_lock:
+            for table in (self.structured_usage, self.structured_totals):
+                entry = table.setdefault(stage, {"calls": 0, "parse_failures": 0, "field_failures": 0, "repairs": 0, "fallbacks": 0})
+                if parse_failed is not None:
+                    entry["calls"] += 1
+                    entry["parse_failures"] += int(parse_failed)
+                entry["field_failures"] += field_failures
+                entry["repairs"] += repairs
+                entry["fallbacks"] += fallbacks
 
-        prompt = f"""
-        블로그 포스트 '{topic}'의 챕터 '{section_title}' 내용을 상세히 작성하세요.
-        
-        [기본 규칙]
-        - 형식: HTML (H2 태그로 제목 시작, 이후 p, ul/ol, strong 등 사용)
-        - 내용: 구체적인 정보, 예시, 데이터 포함. 모호한 표현 금지.
-        - **[중요] 키워드 '{keyword}' 남용 금지**:
-          - 전체 섹션에서 키워드는 **최대 2~3회**만 자연스럽게 사용하세요. (밀도 2.5% 미만 유지)
-          - 같은 단어 반복 대신 **'이 제도', '동 상품', '본 적금'** 등의 대명사나 **'청년 도약 지원책'** 같은 유의어를 적극 활용하세요.
-          - 문맥에 맞지 않는 억지스러운 키워드 삽입은 절대 금지합니다.
-        
-        [링크 전략 - 가두리(Walled Garden) 전략]
-        1. **외부 링크 (이 섹션 전용)**:
-           {ext_link_msg}
-           - 다른 섹션과 중복되지 않는 **고유한 출처**를 사용하세요.
-           - ⚠️ 위키백과 금지! 산만하고 집중을 방해함.
-           - 존재하지 않는 URL 사용 금지! 확실한 URL만 사용할 것.
-        
-        2. **내부 링크 (이 섹션 전용)**:
-           {internal_link_instruction}
-        
-        [가독성 (Mobile Optimized)]
-        - 한 문단은 2~3문장 이내로 짧게 끊어서 작성할 것.
-        - 중요한 핵심 문장이나 키워드는 `<strong>` 태그로 **볼드 처리**하여 강조할 것.
+    def _log_structured_usage(self):
+        """이번 포스트의 단계별 구조화 출력 파싱 실패율/필드 재요청 수와 누적 파싱 실패율을 기록합니다."""
+        with self._state_lock:
+            run = {k: dict(v) for k, v in self.structured_usage.items()}
+            totals = {k: dict(v) for k, v in self.structured_totals.items()}
+        for stage, e in run.items():
+            total = totals[stage]
+            rate = total["parse_failures"] / total["calls"] * 100 if total["calls"] else 0.0
+            logger.info(
+                f"구조화 출력 [{stage}]: 파싱 실패 {e['parse_failures']}/{e['calls']}, 필드 실패 {e['field_failures']}, "
+                f"재요청 {e['repairs']}, 기본값 {e['fallbacks']} (누적 파싱 실패율 {rate:.1f}%)"
+            )
+
+    def _generate_intro(self, topic: str, keyword: str) -> str:
+        return self._chat_text("intro", intro_messages(topic, keyword))
+
+    def _plan_external_links(self, sections: list, topic: str = "") -> list:
+        """
+        각 섹션별로 사용할 고유한 외부 출처를 로컬 레지스트리에서 배정합니다. (중복 방지, LLM 호출 없음)
+        """
+        plans = self.authority_links.match_sections(sections, topic)
+        logger.info("외부 출처 배정: " + ", ".join(p["name"] for p in plans if p))
+        return plans
+
+    def _generate_section(self, topic: str, section_title: str, keyword: str, 
+                          internal_links: list = None, external_link_hint: dict = None) -> str:
         
-        [분량 및 형식]
-        - 분량: 공백 포함 500자 내외 (풍부한 내용).
-        - H2 태그에는 '{section_title}'을 그대로 쓸 것.
-        - 금지: '[이미지 설명]', '그림 1' 같은 이미지 관련 텍스트 절대 금지.
-        - 출력: 순수 HTML (마크다운 ``` 사용 금지).
-        """
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.choices[0].message.content
+        # 내부 링크: 오직 검증된 URL만 사용 (404 방지) - 메인 루프에서 1개씩 잘라서 줌
+        internal_link = internal_links[0] if internal_links else None
+        messages = section_messages(topic, section_title, keyword, internal_link, external_link_hint)
+        return self._chat_text(f"section:{section_title}", messages)
 
     def _generate_faq(self, topic: str, keyword: str) -> str:
-        prompt = f"""
-        주제 '{topic}' 관련 자주 묻는 질문(FAQ) 3가지와 답변을 작성하세요.
-        - **최신성 반영**: 2025~2026년 최신 트렌드와 미래 전망을 반영하여 답변할 것.
-        - 형식: HTML <details><summary>질문</summary>답변</details> 구조 사용.
-        - 마지막 태그: <h2>자주 묻는 질문</h2> 으로 시작할 것.
-        - 답변에도 키워드 '{keyword}'를 포함할 것.
-        - 출력: 순수 HTML (마크다운 ``` 사용 금지).
-        """
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.choices[0].message.content
+        return self._chat_text("faq", faq_messages(topic, keyword))
@@ -0,0 +1,200 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple
+from src.config.settings import Config
+from src.utils.logger import get_logger
+
+logger = get_logger("Hedging")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS call_latency (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stage TEXT NOT NULL,
+    model TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_call_latency_stage ON call_latency(stage, model, id);
+"""
+
+class DeadlineExceeded(TimeoutError):
+    """포스트 지연 예산(또는 호출 제한 시간)을 다 써서 호출을 포기했을 때 발생합니다."""
+
+class AttemptCancelled(Exception):
+    """헤지 경쟁에서 진 시도가 취소 신호를 받아 중단했을 때 발생합니다."""
+
+class LatencyTracker:
+    """
+    단계/모델별 최근 호출 지연 시간을 기록하고 p95를 계산합니다.
+    실행(프로세스)마다 새로 쌓지 않도록 CACHE_DIR의 SQLite에 저장해 두고 최근 window개만 사용합니다.
+    기록하는 값은 원래 시도(primary)의 지연 시간입니다. 헤지가 이긴 호출의 경과 시간만 쌓으면
+    느린 꼬리가 표본에서 빠져 p95가 점점 낮아지므로, 진 원래 시도도 끝난 시각(취소됐으면 취소 시각)으로 기록합니다.
+    """
+
+    def __init__(self, db_path: str = None, window: int = None, min_samples: int = None):
+        self.db_path = db_path or os.path.join(Config.CACHE_DIR, "call_latency.sqlite3")
+        self.window = window or Config.HEDGE_WINDOW
+        self.min_samples = min_samples or Config.HEDGE_MIN_SAMPLES
+        self._lock = threading.Lock()
+        self._samples: Dict[Tuple[str, str], deque] = {}
+        self.conn = None
+        try:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.executescript(SCHEMA)
+        except Exception as e:
+            logger.warning(f"지연 시간 기록 DB를 열 수 없음 (메모리에만 기록): {e}")
+            self.conn = None
+
+    def _history(self, stage: str, model: str) -> deque:
+        key = (stage, model)
+        if key not in self._samples:
+            rows = []
+            if self.conn:
+                rows = self.conn.execute(
+                    "SELECT seconds FROM call_latency WHERE stage = ? AND model = ? ORDER BY id DESC LIMIT ?",
+                    (stage, model, self.window)
+                ).fetchall()
+            self._samples[key] = deque((row[0] for row in reversed(rows)), maxlen=self.window)
+        return self._samples[key]
+
+    def record(self, stage: str, model: str, seconds: float):
+        with self._lock:
+            self._history(stage, model).append(seconds)
+            if self.conn:
+                self.conn.execute(
+                    "INSERT INTO call_latency (stage, model, seconds, created_at) VALUES (?, ?, ?, ?)",
+                    (stage, model, seconds, time.time())
+                )
+                # 오래된 기록 정리 (단계/모델별 window의 10배까지만 보관)
+                self.conn.execute(
+                    "DELETE FROM call_latency WHERE stage = ? AND model = ? AND id <= "
+                    "(SELECT id FROM call_latency WHERE stage = ? AND model = ? ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                    (stage, model, stage, model, self.window * 10)
+                )
+                self.conn.commit()
+
+    def p95(self, stage: str, model: str) -> Optional[float]:
+        """최근 기록의 p95 (표본이 min_samples보다 적으면 None)"""
+        with self._lock:
+            samples = sorted(self._history(stage, model))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+def hedged_call(run: Callable, hedge_after: Optional[float], timeout: float,
+                is_valid: Callable[[Any], bool] = None, measure: Callable[[Any], int] = None,
+                on_saved: Callable[[float], None] = None,
+                on_primary_done: Callable[[float], None] = None) -> Tuple[Any, Dict[str, Any]]:
+    """
+    run(cancel, progress)을 실행하고, hedge_after초가 지나도 끝나지 않으면 같은 요청을 하나 더 보내 먼저 온 유효한 응답을 씁니다.
+
+    Args:
+        run: 시도 1회. cancel(threading.Event)이 켜지면 중단해야 하며,
+             progress dict에 'chars'(받은 글자 수), 'first_token'(첫 토큰 시각), 'close'(연결을 끊는 함수)를 남길 수 있습니다.
+        hedge_after: 중복 요청을 보낼 시각(초). None이면 헤지하지 않음
+        timeout: 전체 제한 시간(초). 넘기면 모든 시도를 취소하고 DeadlineExceeded
+        is_valid: 응답이 유효한지 (무효 응답은 다른 시도가 남아 있으면 기다림)
+        measure: 응답 길이(글자 수) - 진 시도의 남은 시간을 추정할 때 사용
+        on_saved: 헤지가 이겼을 때, 원래 시도가 끝났을(또는 취소된) 시점에 절감 시간(초) 추정치를 넘겨 호출
+        on_primary_done: 원래 시도가 끝나면 그 지연 시간(초)을 넘겨 호출 (원래 시도의 스레드에서 호출됨)
+            - 응답을 받았으면 (헤지에 졌거나 제한 시간 뒤에 늦게 끝났어도) 실제로 걸린 시간
+            - 취소돼 중단됐으면 취소 시각까지의 시간 (실제 지연 시간의 하한)
+            - 취소와 무관한 오류로 끝났으면 호출하지 않음
+
+    Returns:
+        (응답, {'hedged', 'winner', 'elapsed'})
+    """
+    is_valid = is_valid or (lambda value: True)
+    started = time.monotonic()
+    results = queue.Queue()
+    attempts: Dict[str, Dict[str, Any]] = {}
+    outcome: Dict[str, Any] = {}
+
+    def cancel(label: str):
+        attempt = attempts[label]
+        attempt.setdefault("cancelled_at", time.monotonic())
+        attempt["cancel"].set()
+        close = attempt["progress"].get("close")
+        if close:
+            try:
+                close()  # 스트리밍 연결을 끊어 첫 토큰 전에 멈춘 요청도 바로 중단
+            except Exception:
+                pass
+
+    def launch(label: str):
+        attempt = {"cancel": threading.Event(), "progress": {"chars": 0, "first_token": None}, "started": time.monotonic()}
+        attempts[label] = attempt
+
+        def target():
+            finished_at = None
+            try:
+                results.put((label, run(attempt["cancel"], attempt["progress"]), None))
+                finished_at = time.monotonic()
+            except BaseException as e:
+                results.put((label, None, e))
+                if attempt["cancel"].is_set():
+                    finished_at = attempt["cancelled_at"]
+            finally:
+                if label == "primary" and outcome.get("winner") == "hedge" and on_saved:
+                    on_saved(_estimate_saved(attempt, outcome))
+                if label == "primary" and on_primary_done and finished_at is not None:
+                    try:
+                        on_primary_done(finished_at - attempt["started"])
+                    except Exception as e:
+                        logger.warning(f"지연 시간 기록 실패: {e}")
+
+        threading.Thread(target=target, daemon=True, name=f"llm-{label}").start()
+
+    launch("primary")
+    pending, last = 1, None
+    while True:
+        elapsed = time.monotonic() - started
+        remaining = timeout - elapsed
+        if remaining <= 0:
+            for label in attempts:
+                cancel(label)
+            raise DeadlineExceeded(f"제한 시간 {timeout:.0f}초 초과")
+        wait = remaining
+        if hedge_after is not None and "hedge" not in attempts:
+            wait = min(wait, max(hedge_after - elapsed, 0))
+        try:
+            label, value, error = results.get(timeout=wait)
+        except queue.Empty:
+            if hedge_after is not None and "hedge" not in attempts and time.monotonic() - started >= hedge_after:
+                launch("hedge")
+                pending += 1
+            continue
+
+        pending -= 1
+        if error is None and (is_valid(value) or pending == 0):
+            outcome.update({
+                "winner": label, "elapsed": time.monotonic() - started, "hedged": "hedge" in attempts,
+                "length": measure(value) if measure and value is not None else 0,
+            })
+            for other in attempts:
+                if other != label:
+                    cancel(other)
+            return value, dict(outcome)
+        last = error
+        if pending == 0:
+            raise last if last is not None else ValueError("유효한 응답 없음")
+
+def _estimate_saved(attempt: Dict[str, Any], outcome: Dict[str, Any]) -> float:
+    """
+    헤지가 이겼을 때 원래 시도가 끝까지 갔다면 걸렸을 시간과의 차이(절감 시간)를 추정합니다.
+    - 취소 전에 토큰을 받고 있었으면 지금까지의 속도로 이긴 응답 길이만큼 받는 시간을 외삽
+    - 그 밖(취소할 수 없는 일괄 호출이 늦게 끝난 경우, 첫 토큰 전에 취소된 경우)은 실제로 끝난 시각 기준 (하한)
+    """
+    progress = attempt["progress"]
+    now = time.monotonic()
+    finished_at = now - attempt["started"]
+    if attempt["cancel"].is_set() and progress["chars"] and progress["first_token"]:
+        rate = progress["chars"] / max(now - progress["first_token"], 1e-3)
+        first_token_at = progress["first_token"] - attempt["started"]
+        finished_at = max(finished_at, first_token_at + outcome["length"] / rate)
+    return max(finished_at - outcome["elapsed"], 0.0)
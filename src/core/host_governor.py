@@ -0,0 +1,132 @@
+import threading
+import time
+from typing import Dict, Any, Optional
+from src.config.settings import Config
+from src.utils.logger import get_logger
+
+logger = get_logger("HostGovernor")
+
+# 호스트가 과부하/요청 제한을 알리는 상태 코드
+THROTTLE_STATUS_CODES = {429, 503}
+
+class HostGovernor:
+    """
+    호스트 단위 요청 조절기입니다. (공유 호스팅/보안 플러그인의 429·503 대응)
+    - 동시 요청 수 상한 (AIMD로 자동 조절: 성공 시 +1/limit, 제한·오류·지연 시 배수 감소)
+    - 초당 요청 수 상한 (요청 시작 간격을 일정하게 유지)
+    - Retry-After 헤더를 받으면 해당 시간 동안 새 요청을 보내지 않음
+    """
+
+    def __init__(self, host: str, max_concurrency: int = None, min_concurrency: int = None,
+                 max_rps: float = None, latency_threshold: float = None):
+        self.host = host
+        self.max_concurrency = max_concurrency or Config.WP_MAX_CONCURRENCY
+        self.min_concurrency = min(min_concurrency or Config.WP_MIN_CONCURRENCY, self.max_concurrency)
+        self.max_rps = Config.WP_MAX_RPS if max_rps is None else max_rps
+        self.latency_threshold = latency_threshold or Config.WP_LATENCY_THRESHOLD
+
+        self.limit = float(self.max_concurrency)
+        self.in_flight = 0
+        self._cond = threading.Condition()
+        self._next_start = 0.0
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.slow = 0
+        self.latency_ewma = None
+
+    def acquire(self):
+        """요청 슬롯을 얻을 때까지 대기합니다. (동시성 상한, Retry-After 차단, 초당 요청 수 순서로 적용)"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    self._cond.wait(self._blocked_until - now)
+                    continue
+                if self.in_flight >= int(self.limit):
+                    self._cond.wait()
+                    continue
+                break
+            self.in_flight += 1
+            start_at = now
+            if self.max_rps:
+                start_at = max(now, self._next_start)
+                self._next_start = start_at + 1.0 / self.max_rps
+        delay = start_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _decrease(self, factor: float, reason: str):
+        """제한 감소는 연속 실패가 한꺼번에 반영되지 않도록 최근 평균 지연시간(최소 1초)마다 한 번만 적용합니다."""
+        now = time.monotonic()
+        window = max(self.latency_ewma or 0.0, 1.0)
+        if now - self._last_decrease < window:
+            return
+        self._last_decrease = now
+        old = self.limit
+        self.limit = max(float(self.min_concurrency), self.limit * factor)
+        if int(old) != int(self.limit):
+            logger.warning(f"[{self.host}] 동시성 축소 {int(old)} -> {int(self.limit)} ({reason})")
+
+    def release(self, status_code: Optional[int], latency: float, retry_after: float = None):
+        """
+        요청 결과를 반영하고 슬롯을 반납합니다.
+
+        Args:
+            status_code (Optional[int]): 응답 상태 코드 (연결 오류 등으로 응답이 없으면 None)
+            latency (float): 요청 소요 시간(초)
+            retry_after (float): 서버가 알려준 재시도 대기 시간(초)
+        """
+        with self._cond:
+            self.in_flight -= 1
+            self.requests += 1
+            self.latency_ewma = latency if self.latency_ewma is None else 0.8 * self.latency_ewma + 0.2 * latency
+
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+                logger.warning(f"[{self.host}] Retry-After {retry_after:.1f}초 동안 요청 중지")
+
+            if status_code in THROTTLE_STATUS_CODES:
+                self.throttled += 1
+                self._decrease(0.5, f"Status {status_code}")
+            elif status_code is None or status_code >= 500:
+                self.errors += 1
+                self._decrease(0.5, f"오류 {status_code or '연결 실패'}")
+            elif latency > self.latency_threshold:
+                self.slow += 1
+                self._decrease(0.8, f"지연 {latency:.1f}초")
+            else:
+                old = self.limit
+                self.limit = min(float(self.max_concurrency), self.limit + 1.0 / self.limit)
+                if int(old) != int(self.limit):
+                    logger.info(f"[{self.host}] 동시성 확대 {int(old)} -> {int(self.limit)}")
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 제한값과 관측 지표를 반환합니다. (캠페인 규모 산정용)"""
+        with self._cond:
+            return {
+                "host": self.host,
+                "concurrency_limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "max_rps": self.max_rps,
+                "blocked_for_s": round(max(0.0, self._blocked_until - time.monotonic()), 1),
+                "latency_ewma_s": round(self.latency_ewma, 3) if self.latency_ewma is not None else None,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "errors": self.errors,
+                "slow": self.slow,
+            }
+
+_governors = {}
+_governors_lock = threading.Lock()
+
+def get_governor(host: str) -> HostGovernor:
+    """호스트별 HostGovernor를 반환합니다. (같은 호스트를 쓰는 모든 클라이언트가 공유)"""
+    with _governors_lock:
+        if host not in _governors:
+            _governors[host] = HostGovernor(host)
+        return _governors[host]
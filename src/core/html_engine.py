@@ -0,0 +1,205 @@
+import re
+from html import unescape
+from typing import Dict, Any, List, Optional
+
+# 본문에서 제거할 이미지 설명/자리표시자 텍스트 (main.py, 캠페인 스크립트에서 쓰던 패턴 통합)
+PLACEHOLDER_PATTERNS = [
+    r"\[이미지 설명.*?\]",
+    r"그림 \d+.*?\n",
+    r"Figure \d+.*?\n",
+    r"\*\*이미지 설명:\*\*.*?\n",
+    r"AI 수익화 로드맵 관련 상세 이미지 \d+",
+]
+FENCE_PATTERN = r"```(?:html)?"
+
+# 본문을 한 번만 훑는 토크나이저: 변환이나 지표에 필요한 토큰만 종류별 그룹으로 나눠 잡고,
+# 그 사이의 텍스트는 C 수준에서 건너뜁니다. (일반 태그 <[^<]+?>는 텍스트 길이 계산을 위해 함께 잡음)
+# 자리표시자는 태그보다 뒤에 두어 태그 속성(alt 등) 안의 문구는 건드리지 않습니다.
+TOKEN_PATTERN = re.compile(
+    # 토큰이 시작될 수 있는 문자가 아니면 대안 8개를 시도하지 않고 바로 다음 위치로 넘어감
+    r"(?=[<`\[그Ff*A])(?:"
+    r"<(?:(?P<a>a\s[^>]*>)"
+    r"|(?P<a_end>/a\s*>)"
+    r"|(?P<h2_end>/h2\s*>)"
+    r"|(?P<img>img\b[^>]*>)"
+    r"|(?P<heading>h([23])(?=[\s>/])[^<]*?>)"
+    r"|(?P<tag>[^<]+?>))"
+    rf"|(?P<fence>{FENCE_PATTERN})"
+    rf"|(?P<placeholder>{'|'.join(PLACEHOLDER_PATTERNS)}))",
+    re.IGNORECASE,
+)
+# 태그 하나의 속성 문자열에만 쓰는 패턴 (짧은 ASCII 검사라 re.ASCII)
+HREF_ATTR_PATTERN = re.compile(r"""(?:^|\s)href\s*=\s*("[^"]*"|'[^']*'|[^\s>"']+)""", re.IGNORECASE | re.ASCII)
+REL_ATTR_PATTERN = re.compile(r"""(?:^|\s)rel\s*=\s*("[^"]*"|'[^']*'|[^\s>"']+)""", re.IGNORECASE | re.ASCII)
+TARGET_BLANK_PATTERN = re.compile(r"""(?:^|\s)target\s*=\s*["']?_blank(?![\w-])""", re.IGNORECASE | re.ASCII)
+
+# <img>에 없으면 추가할 속성
+IMG_DEFAULTS = [
+    (f' {name}="{value}"', re.compile(rf"(?:^|\s){name}\s*=", re.IGNORECASE | re.ASCII))
+    for name, value in (("loading", "lazy"), ("decoding", "async"))
+]
+
+def _attr_value(value: str) -> str:
+    return unescape(value[1:-1] if value[:1] in "\"'" else value)
+
+def _noopener(tag: str) -> str:
+    """target="_blank"인 <a> 태그에 rel="noopener"를 보장합니다. (기존 rel 값은 유지)"""
+    attr_src = tag[2:-1]
+    if "_blank" not in attr_src or not TARGET_BLANK_PATTERN.search(attr_src):
+        return tag
+    rel = REL_ATTR_PATTERN.search(attr_src)
+    if rel is None:
+        return f'<a rel="noopener"{attr_src}>'
+    values = _attr_value(rel.group(1)).split()
+    if "noopener" in (v.lower() for v in values):
+        return tag
+    start, end = rel.span(1)
+    return f'<a{attr_src[:start]}"{" ".join(values + ["noopener"])}"{attr_src[end:]}>'
+
+def _lazy_image(tag: str) -> str:
+    """<img>에 loading/decoding 기본값을 추가합니다. (이미 있는 속성은 유지)"""
+    attr_src = tag[4:-1]
+    extra = "".join(attr for attr, present in IMG_DEFAULTS if not present.search(attr_src))
+    if not extra:
+        return tag
+    body = attr_src.rstrip()
+    if body.endswith("/"):
+        return f"<img{body[:-1].rstrip()}{extra} />"
+    return f"<img{attr_src}{extra}>"
+
+def _scan(html: str, keyword: str, image_fragments: list, failures: Dict[str, Optional[str]],
+          internal_urls: list, cleanup: bool, inject_attributes: bool) -> Dict[str, Any]:
+    """
+    TOKEN_PATTERN으로 본문을 한 번 훑으며 토큰마다 변환(정리 -> 실패 링크 제거 -> 이미지 삽입 -> 속성 주입)을
+    순서대로 적용하고, 같은 순회에서 지표(텍스트 길이, H2/H3/이미지/링크 수)를 모읍니다.
+    바뀌는 토큰이 있을 때만 그 앞까지의 원문을 잘라 붙이므로 변경 없는 구간은 복사하지 않습니다.
+
+    image_fragments: [(변환된 HTML, 지표 dict), ...] - </h2> 뒤마다 하나씩 삽입
+    """
+    out = []
+    copied = 0          # out에 옮긴 원문 위치
+    last = 0            # 직전 토큰 끝 (텍스트 길이 계산용)
+    text_length = 0
+    counts = {"h2_count": 0, "h3_count": 0, "img_count": 0, "internal_links": 0, "external_links": 0}
+    removed_links = []
+    placeholders_removed = 0
+    images = iter(image_fragments)
+    images_inserted = 0
+    unwrapping = False  # 실패 링크의 여는 태그를 지웠으면 다음 </a>도 지움
+
+    for match in TOKEN_PATTERN.finditer(html):
+        start, end = match.span()
+        kind = match.lastgroup
+        text_length += start - last
+        last = end
+        replacement = None
+
+        if kind == "tag":
+            continue
+        if kind == "placeholder" or kind == "fence":
+            if not cleanup:
+                text_length += end - start
+                continue
+            placeholders_removed += 1
+            replacement = ""
+        elif kind == "a":
+            tag = match.group()
+            href = HREF_ATTR_PATTERN.search(tag, 2)
+            url = (_attr_value(href.group(1)) if "&" in href.group(1) else href.group(1).strip("\"'")) if href else ""
+            internal = bool(internal_urls) and any(internal_url in url for internal_url in internal_urls)
+            if failures and not internal and failures.get(url) and url.startswith(("http://", "https://")):
+                removed_links.append((url, failures[url]))
+                unwrapping = True
+                replacement = ""
+            else:
+                if internal:
+                    counts["internal_links"] += 1
+                elif url.startswith(("http://", "https://")):
+                    counts["external_links"] += 1
+                if inject_attributes:
+                    replacement = _noopener(tag)
+                    if replacement is tag:
+                        continue
+                else:
+                    continue
+        elif kind == "a_end":
+            if not unwrapping:
+                continue
+            unwrapping = False
+            replacement = ""
+        elif kind == "img":
+            counts["img_count"] += 1
+            if not inject_attributes:
+                continue
+            tag = match.group()
+            replacement = _lazy_image(tag)
+            if replacement is tag:
+                continue
+        elif kind == "heading":
+            counts["h2_count" if match.group(6) == "2" else "h3_count"] += 1
+            continue
+        elif kind == "h2_end":
+            fragment = next(images, None)
+            if fragment is None:
+                continue
+            image_html, image_stats = fragment
+            images_inserted += 1
+            text_length += image_stats["text_length"]
+            counts["img_count"] += image_stats["img_count"]
+            replacement = match.group() + image_html
+
+        out.append(html[copied:start])
+        out.append(replacement)
+        copied = end
+
+    text_length += len(html) - last
+    if copied:
+        out.append(html[copied:])
+        html = "".join(out)
+    if cleanup:
+        # 앞뒤 공백은 태그가 아니므로 잘라낸 만큼 텍스트 길이에서 뺌
+        stripped = html.strip()
+        text_length -= len(html) - len(stripped)
+        html = stripped
+
+    stats = {
+        "text_length": text_length,
+        **counts,
+        # 원문 그대로 세는 기존 검증 규칙(HTML 전체, 이미지 alt/캡션 포함)과 같은 값
+        "keyword_count": html.count(keyword) if keyword else 0,
+        "keyword": keyword,
+    }
+    stats["keyword_density"] = (
+        round(stats["keyword_count"] * len(keyword) / text_length * 100, 2) if keyword and text_length else 0.0
+    )
+    return {"html": html, "stats": stats, "removed_links": removed_links,
+            "images_inserted": images_inserted, "placeholders_removed": placeholders_removed}
+
+def analyze_html(html: str, keyword: str = None, internal_urls: list = None) -> Dict[str, Any]:
+    """
+    본문을 바꾸지 않고 SEO 지표만 계산합니다. (process_post_html과 같은 토크나이저 순회, 변환 없음)
+    텍스트 길이(태그만 뺀 원문 길이)와 키워드 횟수(HTML 전체, 이미지 alt/캡션 포함)는
+    기존 검증 코드(verify_score_draft, main.py)와 같은 값을 냅니다.
+    """
+    return _scan(html, keyword or "", [], {}, internal_urls or [], cleanup=False, inject_attributes=False)["stats"]
+
+def process_post_html(html: str, keyword: str = None, body_image_htmls: List[str] = None,
+                      link_failures: Dict[str, Optional[str]] = None, internal_urls: list = None,
+                      cleanup: bool = True, inject_attributes: bool = True) -> Dict[str, Any]:
+    """
+    포스트 본문 후처리를 토크나이저 순회 한 번으로 수행하고 최종 HTML과 SEO 지표를 함께 반환합니다.
+    토큰마다 정리(코드 펜스/자리표시자) -> 실패 링크 제거 -> </h2> 뒤 이미지 삽입
+    -> 속성 주입(target="_blank" 링크의 rel="noopener", 이미지 loading/decoding) -> 지표 수집 순으로 적용합니다.
+    삽입할 이미지 HTML은 미리 같은 방식으로 한 번씩 처리해 두고 삽입 시 지표를 더합니다.
+
+    Returns:
+        Dict[str, Any]: {'html': str, 'stats': dict, 'removed_links': [(url, 사유), ...],
+                         'images_inserted': int, 'placeholders_removed': int}
+    """
+    keyword = keyword or ""
+    internal_urls = internal_urls or []
+    fragments = []
+    for image_html in body_image_htmls or []:
+        processed = _scan(image_html, "", [], {}, [], cleanup=False, inject_attributes=inject_attributes)
+        fragments.append((processed["html"], processed["stats"]))
+    return _scan(html, keyword, fragments, link_failures or {}, internal_urls, cleanup, inject_attributes)
@@ -0,0 +1,167 @@
+import re
+import threading
+from typing import Callable, Optional
+
+# 닫힌 외부 링크 태그 (_validate_and_fix_external_links와 같은 패턴)
+LINK_PATTERN = re.compile(r'<a\s+[^>]*href=["\'](http[s]?://[^"\']+)["\'][^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+
+FENCE_HTML = "```html"
+FENCE = "```"
+
+class StreamingHTMLCleaner:
+    """
+    스트리밍 응답의 토큰 조각을 받아 마크다운 코드 펜스(```html, ```)를 즉시 제거하는 정리기입니다.
+    결과는 ContentGenerator._clean_html을 전체 문자열에 적용한 것과 같습니다.
+    <a> 태그가 닫히는 즉시 on_link(url)를 호출해 링크 검증을 생성과 겹쳐 진행할 수 있게 합니다.
+    """
+
+    def __init__(self, on_link: Optional[Callable[[str], None]] = None):
+        self.on_link = on_link
+        self._pending = ""   # 펜스의 앞부분일 수 있어 보류 중인 꼬리
+        self._link_buf = ""  # 아직 닫히지 않은 <a> 태그를 찾기 위한 버퍼
+        self._parts = []
+        self._started = False
+        self.links = []
+
+    def feed(self, delta: str) -> str:
+        """
+        토큰 조각을 추가하고 이번에 확정된 정리된 텍스트를 반환합니다.
+        """
+        text = self._pending + delta
+        # 끝부분이 펜스의 앞부분("`", "```h" 등)이면 다음 조각이 올 때까지 보류
+        hold = 0
+        for n in range(min(len(text), len(FENCE_HTML)), 0, -1):
+            if FENCE_HTML.startswith(text[-n:]):
+                hold = n
+                break
+        cut = len(text) - hold
+        self._pending = text[cut:]
+        return self._emit(text[:cut])
+
+    def _emit(self, text: str) -> str:
+        text = text.replace(FENCE_HTML, "").replace(FENCE, "")
+        if not self._started:
+            text = text.lstrip()
+            self._started = bool(text)
+        if not text:
+            return ""
+        self._parts.append(text)
+        self._scan_links(text)
+        return text
+
+    def _scan_links(self, text: str):
+        self._link_buf += text
+        last_end = 0
+        for match in LINK_PATTERN.finditer(self._link_buf):
+            self.links.append(match.group(1))
+            if self.on_link:
+                self.on_link(match.group(1))
+            last_end = match.end()
+        rest = self._link_buf[last_end:]
+        # 열린 <a 태그가 없으면 태그 시작 '<'가 잘렸을 경우만 대비해 꼬리 일부만 유지
+        open_at = rest.lower().rfind("<a")
+        self._link_buf = rest[open_at:] if open_at >= 0 else rest[-1:]
+
+    def close(self) -> str:
+        """보류 중인 꼬리를 내보내고 정리된 전체 텍스트를 반환합니다."""
+        pending, self._pending = self._pending, ""
+        self._emit(pending)
+        return "".join(self._parts).strip()
+
+# 단일 호출 생성 모드의 파트 구분자 (<<<INTRO>>>, <<<SECTION:3>>>, <<<FAQ>>>, <<<END>>>)
+PART_MARKER_PATTERN = re.compile(r"<<<\s*(INTRO|SECTION:\s*(\d+)|FAQ|END)\s*>>>", re.IGNORECASE)
+PART_MARKER_MAX_LEN = 24
+
+class DelimitedStreamSplitter:
+    """
+    하나의 스트리밍 응답을 구분자 기준으로 서론/섹션/FAQ 파트로 나누는 분할기입니다.
+    다음 구분자가 도착하는 즉시 직전 파트가 완성된 것으로 보고 on_part(part_id, html)를 호출하므로,
+    응답이 끝나기 전에 앞 파트의 검사와 재생성을 시작할 수 있습니다.
+    part_id: 'intro', 'faq', 또는 섹션 번호(0부터 시작하는 int)
+    각 파트는 StreamingHTMLCleaner로 펜스를 제거하고 닫힌 외부 링크를 on_link로 넘깁니다.
+    제한 시간으로 버려진 스트림 스레드가 close() 뒤에도 feed()할 수 있으므로 두 메서드는 잠금으로 직렬화하고,
+    닫힌 뒤의 feed()는 무시합니다.
+    """
+
+    def __init__(self, on_part: Optional[Callable] = None, on_link: Optional[Callable[[str], None]] = None):
+        self.on_part = on_part
+        self.on_link = on_link
+        self.parts = {}
+        self._lock = threading.RLock()
+        self._closed = False
+        self._pending = ""
+        self._current = None   # 현재 파트 id (첫 구분자 전이면 None)
+        self._cleaner = None
+        self._ended = False
+        self._preamble = []    # 첫 구분자 전 텍스트 (구분자가 전혀 없을 때 진단용)
+
+    @staticmethod
+    def _part_id(match):
+        name = match.group(1).upper()
+        if name.startswith("SECTION"):
+            return int(match.group(2)) - 1
+        return {"INTRO": "intro", "FAQ": "faq", "END": None}[name]
+
+    def _write(self, text: str):
+        if not text or self._ended:
+            return
+        if self._cleaner is None:
+            self._preamble.append(text)
+        else:
+            self._cleaner.feed(text)
+
+    def _finish_part(self):
+        if self._cleaner is None:
+            return
+        html = self._cleaner.close()
+        self.parts[self._current] = html
+        if self.on_part:
+            self.on_part(self._current, html)
+        self._cleaner = None
+
+    def feed(self, delta: str):
+        """토큰 조각을 추가하고 완성된 파트가 있으면 on_part를 호출합니다. (close() 뒤에는 무시)"""
+        with self._lock:
+            if not self._closed:
+                self._feed(delta)
+
+    def _feed(self, delta: str):
+        text = self._pending + delta
+        last = 0
+        for match in PART_MARKER_PATTERN.finditer(text):
+            self._write(text[last:match.start()])
+            last = match.end()
+            self._finish_part()
+            part_id = self._part_id(match)
+            if part_id is None:
+                self._ended = True
+                continue
+            self._current = part_id
+            self._cleaner = StreamingHTMLCleaner(on_link=self.on_link)
+        rest = text[last:]
+
+        # 끝부분이 구분자의 앞부분일 수 있으면 다음 조각이 올 때까지 보류
+        hold = len(rest)
+        open_at = rest.rfind("<<<")
+        if open_at >= 0 and len(rest) - open_at <= PART_MARKER_MAX_LEN:
+            hold = open_at
+        elif rest.endswith("<<"):
+            hold = len(rest) - 2
+        elif rest.endswith("<"):
+            hold = len(rest) - 1
+        self._write(rest[:hold])
+        self._pending = rest[hold:]
+
+    def close(self) -> dict:
+        """남은 텍스트로 마지막 파트를 마무리하고 {part_id: html}을 반환합니다. (두 번째 호출부터는 결과만 반환)"""
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                pending, self._pending = self._pending, ""
+                self._write(pending)
+                self._finish_part()
+            return self.parts
+
+    @property
+    def preamble(self) -> str:
+        return "".join(self._preamble).strip()
@@ -0,0 +1,161 @@
+import asyncio
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, Optional
+from src.core.async_wp_client import AsyncWordPressClient
+from src.utils.logger import get_logger
+
+logger = get_logger("ImagePipeline")
+
+class ImagePipeline:
+    """
+    포스트 이미지(썸네일 1 + 본문 N)의 생성 -> WebP 인코딩 -> 업로드를 백그라운드에서 진행합니다.
+    이미지 메타데이터는 개요에만 의존하므로, generate_post의 on_image_metadata 콜백으로 start()를 넘기면
+    서론/섹션/FAQ를 쓰는 동안 이미지 작업이 함께 진행되고, 본문 조립 시점에 join()으로 결과를 합칩니다.
+    업로드는 AsyncWordPressClient로 여러 장을 동시에 보내며, 각 이미지는 생성이 끝나는 즉시 업로드를 시작합니다.
+    (동기 클라이언트의 풀 세션/HostGovernor 공유, 결과는 입력 순서라 썸네일이 항상 첫 장)
+    """
+
+    def __init__(self, image_processor, wp_client):
+        self.image_processor = image_processor
+        self.wp_client = wp_client
+        self.uploader = AsyncWordPressClient(wp_client)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-pipeline")
+        self._future: Optional[Future] = None
+        self._started_at = None
+
+    @property
+    def started(self) -> bool:
+        return self._future is not None
+
+    def start(self, images: list, outline: dict) -> bool:
+        """
+        이미지 작업을 백그라운드로 시작합니다. (이미 시작했거나 이미지가 없으면 무시)
+
+        Args:
+            images (list): [{'type', 'prompt', 'alt', 'caption'}, ...] (첫 장이 썸네일)
+            outline (dict): {'title', 'slug', 'focus_keyword', 'description'} - 파일명/미디어 제목/설명에 사용
+        """
+        if self._future is not None or not images:
+            return False
+        self._started_at = time.perf_counter()
+        logger.info(f"이미지 {len(images)}장 백그라운드 생성/업로드 시작")
+        self._future = self._executor.submit(self._process, list(images), dict(outline))
+        return True
+
+    def join(self, timeout: float = None) -> Dict[str, Any]:
+        """
+        이미지 작업이 끝날 때까지 기다려 결과를 반환합니다. (시작하지 않았거나 실패하면 빈 결과)
+
+        Returns:
+            {'featured_media_id': Optional[int], 'body_images': [{'url', 'alt', 'caption'}, ...], 'media_ids': [int, ...]}
+        """
+        empty = {"featured_media_id": None, "body_images": [], "media_ids": []}
+        if self._future is None:
+            return empty
+        waited = time.perf_counter()
+        try:
+            result = self._future.result(timeout=timeout)
+        except Exception as e:
+            logger.error(f"이미지 파이프라인 실패: {e}")
+            return empty
+        finally:
+            self._executor.shutdown(wait=False)
+        now = time.perf_counter()
+        logger.info(
+            f"이미지 파이프라인 합류: 총 {now - self._started_at:.1f}초 중 조립 단계 대기 {now - waited:.1f}초 "
+            f"(썸네일 {'있음' if result['featured_media_id'] else '없음'} / 본문 {len(result['body_images'])}장)"
+        )
+        return result
+
+    def abandon(self):
+        """본문 생성이 실패했을 때 진행 중인 작업을 마무리하고, 이미 업로드된 미디어 ID를 기록합니다."""
+        if self._future is None:
+            return
+        result = self.join()
+        if result["media_ids"]:
+            logger.warning(f"글에 연결되지 않은 업로드 미디어: {result['media_ids']}")
+
+    def _process(self, images: list, outline: dict) -> Dict[str, Any]:
+        slug = outline.get("slug", "")
+        featured_media_id = None
+        body_images = []
+        media_ids = []
+
+        jobs = []
+        for idx, img_meta in enumerate(images):
+            # 프롬프트 전처리 (접두어 제거)
+            prompt_clean = re.sub(r"^(썸네일용|본문이미지\d+):\s*", "", img_meta.get("prompt", ""))
+            # 파일명 생성 (슬러그 활용 + 인덱스 + WebP)
+            file_suffix = "thumb" if idx == 0 else f"body_{idx}"
+            jobs.append({"prompt": prompt_clean, "file_name": f"{slug}_{file_suffix}.webp"})
+
+        # 생성/인코딩은 이미지끼리 동시에, 업로드는 각 이미지가 끝나는 즉시 시작 (가장 느린 이미지를 기다리지 않음)
+        # 메모리 모드: 인코딩된 WebP를 디스크 왕복 없이 바로 업로드 (로컬 저장은 백그라운드)
+        uploads, upload_results = asyncio.run(self._generate_and_upload(images, jobs, outline))
+
+        for (idx, item), upload_result in zip(uploads, upload_results):
+            if not upload_result:
+                logger.error(f"이미지 {idx} 업로드 실패")
+                continue
+
+            media_ids.append(upload_result["id"])
+            if idx == 0:
+                featured_media_id = upload_result["id"]
+                logger.info(f"썸네일 등록 완료 (ID: {featured_media_id})")
+            else:
+                body_images.append({
+                    "url": upload_result["source_url"],
+                    "alt": item["alt_text"],
+                    "caption": item["caption"]
+                })
+                logger.info(f"본문 이미지 {idx} 업로드 완료")
+
+        return {"featured_media_id": featured_media_id, "body_images": body_images, "media_ids": media_ids}
+
+    def _upload_item(self, idx: int, img_meta: dict, image_file: dict, outline: dict) -> Dict[str, Any]:
+        """생성된 이미지 1장의 업로드 인자를 만듭니다."""
+        title = outline.get("title", "")
+        # 메타데이터 설정 (Smart Metadata 사용)
+        # 썸네일은 제목을, 본문 이미지는 Alt 텍스트 기반으로 제목 설정
+        return {
+            "image_bytes": image_file["data"],
+            "file_name": image_file["file_name"],
+            "mime_type": image_file["mime_type"],
+            "title": title if idx == 0 else f"{outline.get('focus_keyword', '')}_{idx}",
+            "caption": img_meta.get("caption", title),
+            "alt_text": img_meta.get("alt", f"{outline.get('focus_keyword', '')} image"),
+            # 썸네일 설명에만 Rank Math Description 적용
+            "description": outline.get("description", "") if idx == 0 else "",
+        }
+
+    async def _generate_and_upload(self, images: list, jobs: list, outline: dict):
+        """
+        이미지를 동시에 생성하면서, 한 장이 끝날 때마다(완료 순서) 바로 업로드 작업을 시작합니다.
+
+        Returns:
+            ([(입력 순번, 업로드 인자), ...], [업로드 결과, ...]) - 둘 다 입력 순서 (실패한 생성은 제외, 실패한 업로드는 None)
+        """
+        loop = asyncio.get_running_loop()
+        tasks: Dict[int, tuple] = {}
+
+        def start_upload(idx: int, image_file: dict):
+            item = self._upload_item(idx, images[idx], image_file, outline)
+            tasks[idx] = (item, asyncio.ensure_future(self.uploader.upload_image_data(**item)))
+
+        def on_ready(idx: int, image_file: Optional[dict]):
+            # 생성 스레드에서 호출되므로 업로드 시작은 이벤트 루프에 넘김
+            if not image_file:
+                logger.error(f"이미지 {idx} 생성 실패")
+                return
+            loop.call_soon_threadsafe(start_upload, idx, image_file)
+
+        await asyncio.to_thread(self.image_processor.generate_images, jobs, on_ready=on_ready)
+        # 생성 완료 통지보다 먼저 예약된 start_upload는 이미 실행됨 (call_soon_threadsafe 순서 보장)
+        order = sorted(tasks)
+        results = await asyncio.gather(*(tasks[idx][1] for idx in order))
+        if order:
+            success = sum(1 for r in results if r)
+            logger.info(f"이미지 업로드 완료: {success}/{len(order)}장 성공")
+        return [(idx, tasks[idx][0]) for idx in order], list(results)
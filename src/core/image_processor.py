@@ -1,4 +1,8 @@
 import requests
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from io import BytesIO
+from typing import Callable, Dict, Any, List, Optional
 from openai import OpenAI
 from src.config.settings import Config
 from src.utils.logger import get_logger
@@ -10,61 +14,159 @@ class ImageProcessor:
     """
     DALL-E 3를 사용하여 이미지를 생성하고 로컬에 저장하는 클래스입니다.
     """
-    def __init__(self):
+    def __init__(self, persist: bool = None):
         Config.validate()
         self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
         self.output_dir = "generated_images"
+        self.persist = Config.IMAGE_PERSIST if persist is None else persist
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
+        # 로컬 저장은 업로드를 막지 않도록 백그라운드에서 처리
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-writer")
+        self.image_timings = []  # 마지막 generate_images의 이미지별 소요 시간 [{'file_name', 'latency_s', 'ok'}, ...]
 
-    def generate_image(self, prompt: str, file_name: str = "thumbnail.jpg") -> str:
+    def _render_webp(self, prompt: str) -> bytes:
         """
-        DALL-E 3로 이미지를 생성하고 WebP로 최적화하여 저장합니다.
+        DALL-E 3로 이미지를 생성하고, 가로 1200px 이하 WebP(Quality 85)로 인코딩한 바이트를 반환합니다.
         """
-        logger.info(f"이미지 생성 시작: {prompt[:30]}...")
-        
         full_prompt = (
             f"A high-quality, modern, and clean blog illustration about: {prompt}. "
             "ABSOLUTELY NO TEXT, NO LETTERS, NO CALCULATIONS, NO NUMBERS, NO CHARTS WITH DATA VALUES inside the image. "
             "Use 3D isometric or flat vector illustration style, minimalist, abstract, professional, infographic elements without text labels."
         )
 
+        response = self.client.images.generate(
+            model="dall-e-3",
+            prompt=full_prompt,
+            size="1024x1024",
+            quality="standard",
+            n=1,
+        )
+
+        image_url = response.data[0].url
+
+        # 이미지 다운로드
+        img_data = requests.get(image_url, timeout=60).content
+
+        # 이미지 처리 (PILLOW)
+        from PIL import Image
+
+        image = Image.open(BytesIO(img_data))
+
+        # 리사이징 (가로 최대 1200px)
+        if image.width > 1200:
+            ratio = 1200 / image.width
+            new_height = int(image.height * ratio)
+            image = image.resize((1200, new_height), Image.Resampling.LANCZOS)
+
+        # WebP 인코딩 (Quality 85) - 메모리 버퍼에 기록
+        buffer = BytesIO()
+        image.save(buffer, "WEBP", quality=85, optimize=True)
+        return buffer.getvalue()
+
+    def _save(self, data: bytes, save_path: str) -> str:
+        with open(save_path, "wb") as f:
+            f.write(data)
+        logger.info(f"이미지 최적화 저장 완료: {save_path}")
+        return save_path
+
+    def generate_image(self, prompt: str, file_name: str = "thumbnail.jpg") -> str:
+        """
+        DALL-E 3로 이미지를 생성하고 WebP로 최적화하여 저장합니다.
+        """
+        logger.info(f"이미지 생성 시작: {prompt[:30]}...")
+
         try:
-            response = self.client.images.generate(
-                model="dall-e-3",
-                prompt=full_prompt,
-                size="1024x1024",
-                quality="standard",
-                n=1,
-            )
-
-            image_url = response.data[0].url
-            
             # 파일 확장자를 강제로 webp로 변경
             base_name, _ = os.path.splitext(file_name)
             save_path = os.path.join(self.output_dir, f"{base_name}.webp")
-            
-            # 이미지 다운로드
-            img_data = requests.get(image_url).content
-            
-            # 이미지 처리 (PILLOW)
-            from PIL import Image
-            from io import BytesIO
-            
-            image = Image.open(BytesIO(img_data))
-            
-            # 리사이징 (가로 최대 1200px)
-            if image.width > 1200:
-                ratio = 1200 / image.width
-                new_height = int(image.height * ratio)
-                image = image.resize((1200, new_height), Image.Resampling.LANCZOS)
-                
-            # WebP 저장 (Quality 85)
-            image.save(save_path, "WEBP", quality=85, optimize=True)
-            
-            logger.info(f"이미지 최적화 저장 완료: {save_path}")
-            return save_path
+            return self._save(self._render_webp(prompt), save_path)
+
+        except Exception as e:
+            logger.error(f"이미지 생성 실패: {e}")
+            return None
+
+    def generate_image_data(self, prompt: str, file_name: str = "thumbnail.webp", persist: bool = None) -> Optional[Dict[str, Any]]:
+        """
+        이미지를 생성해 인코딩된 WebP 바이트를 메모리로 바로 반환합니다. (디스크 저장/재읽기 없이 업로드 가능)
+        persist가 켜져 있으면 로컬 저장은 백그라운드에서 진행됩니다.
 
+        Returns:
+            Optional[Dict[str, Any]]: {'data': bytes, 'file_name': str, 'mime_type': 'image/webp',
+                                       'saved': Optional[Future[str]]}, 실패 시 None
+        """
+        logger.info(f"이미지 생성 시작 (메모리 모드): {prompt[:30]}...")
+        base_name, _ = os.path.splitext(file_name)
+        webp_name = f"{base_name}.webp"
+
+        try:
+            data = self._render_webp(prompt)
         except Exception as e:
             logger.error(f"이미지 생성 실패: {e}")
             return None
+
+        saved: Optional[Future] = None
+        if self.persist if persist is None else persist:
+            saved = self._writer.submit(self._save, data, os.path.join(self.output_dir, webp_name))
+
+        logger.info(f"이미지 인코딩 완료: {webp_name} ({len(data) // 1024}KB)")
+        return {
+            "data": data,
+            "file_name": webp_name,
+            "mime_type": "image/webp",
+            "saved": saved,
+        }
+
+    def generate_images(self, images: List[Dict[str, Any]], concurrency: int = None,
+                        on_ready: Callable[[int, Optional[Dict[str, Any]]], None] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        여러 이미지를 동시에 생성합니다. (DALL-E 대기/다운로드/인코딩을 이미지끼리 겹쳐 진행)
+
+        Args:
+            images (list): [{'prompt': str, 'file_name': str}, ...]
+            concurrency (int): 동시 생성 수 (기본값: IMAGE_CONCURRENCY)
+            on_ready: on_ready(입력 순번, 결과) - 이미지가 끝나는 순서대로 바로 호출 (업로드를 전체 완료까지 기다리지 않고 시작할 때 사용)
+
+        Returns:
+            list: 입력 순서대로 generate_image_data의 결과 + 'latency_s' (실패한 이미지는 None, 나머지에 영향 없음)
+        """
+        if not images:
+            return []
+        workers = max(1, min(concurrency or Config.IMAGE_CONCURRENCY, len(images)))
+        timings: List[Optional[Dict[str, Any]]] = [None] * len(images)
+
+        def run(idx: int, meta: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            file_name = meta.get("file_name") or f"image_{idx}.webp"
+            started = time.perf_counter()
+            try:
+                result = self.generate_image_data(meta.get("prompt", ""), file_name)
+            except Exception as e:
+                logger.error(f"이미지 생성 실패 ({file_name}): {e}")
+                result = None
+            latency = round(time.perf_counter() - started, 3)
+            timings[idx] = {"file_name": file_name, "latency_s": latency, "ok": result is not None}
+            if result is not None:
+                result["latency_s"] = latency
+            return result
+
+        started = time.perf_counter()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(images)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-gen") as executor:
+            futures = {executor.submit(run, idx, meta): idx for idx, meta in enumerate(images)}
+            for future in as_completed(futures):
+                idx = futures[future]
+                results[idx] = future.result()
+                if on_ready:
+                    try:
+                        on_ready(idx, results[idx])
+                    except Exception as e:
+                        logger.error(f"이미지 완료 콜백 실패 ({idx}번): {e}")
+        self.image_timings = timings
+
+        ok = sum(1 for r in results if r is not None)
+        slowest = max(t["latency_s"] for t in timings)
+        logger.info(
+            f"이미지 {len(images)}장 동시 생성 완료 (동시성 {workers}): 성공 {ok}장, "
+            f"총 {time.perf_counter() - started:.1f}초 / 가장 느린 이미지 {slowest:.1f}초"
+        )
+        return results
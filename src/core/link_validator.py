@@ -0,0 +1,201 @@
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, Iterable, Optional
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from src.config.settings import Config
+from src.utils.logger import get_logger
+
+logger = get_logger("LinkValidator")
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# 일시적인 상태라 결과를 캐시하지 않는 응답 (다음 글에서 다시 확인)
+TRANSIENT_STATUS_CODES = {429}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS link_checks (
+    url TEXT PRIMARY KEY,
+    ok INTEGER NOT NULL,
+    reason TEXT,
+    status INTEGER,
+    checked_at REAL NOT NULL
+);
+"""
+
+class LinkValidator:
+    """
+    외부 링크 검증기입니다.
+    - HEAD 요청을 먼저 보내고, 거부(4xx/5xx)되거나 연결이 끊기면 GET(stream)으로 한 번 더 확인
+    - 여러 URL을 동시에 검사하되 같은 도메인에는 per_host개까지만 동시 요청 (느린 gov.kr 보호)
+    - 결과는 로컬 SQLite에 저장: 정상 링크는 ok_ttl, 실패 링크는 fail_ttl 동안 재검사하지 않음
+    """
+
+    def __init__(self, db_path: str = None, max_workers: int = None, per_host: int = None,
+                 timeout: float = None, ok_ttl_hours: float = None, fail_ttl_hours: float = None):
+        self.db_path = db_path or os.path.join(Config.CACHE_DIR, "link_checks.sqlite3")
+        self.max_workers = max_workers or Config.LINK_CHECK_WORKERS
+        self.per_host = per_host or Config.LINK_CHECK_PER_HOST
+        self.timeout = timeout or Config.LINK_CHECK_TIMEOUT
+        self.ok_ttl = (ok_ttl_hours or Config.LINK_OK_TTL_HOURS) * 3600
+        self.fail_ttl = (fail_ttl_hours or Config.LINK_FAIL_TTL_HOURS) * 3600
+
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self._lock:
+            self.conn.executescript(SCHEMA)
+
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.per_host)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="link-check")
+        self._host_slots = {}
+        self._in_flight: Dict[str, Future] = {}
+
+        self.cache_hits = 0
+        self.probes = 0
+        self.get_fallbacks = 0
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+        with self._lock:
+            self.conn.close()
+
+    def _cached(self, url: str) -> Optional[Dict[str, Any]]:
+        """TTL 안의 저장된 결과를 반환합니다."""
+        with self._lock:
+            row = self.conn.execute("SELECT ok, reason, checked_at FROM link_checks WHERE url = ?", (url,)).fetchone()
+        if not row:
+            return None
+        ttl = self.ok_ttl if row["ok"] else self.fail_ttl
+        if time.time() - row["checked_at"] > ttl:
+            return None
+        return {"ok": bool(row["ok"]), "reason": row["reason"]}
+
+    def _store(self, url: str, reason: Optional[str], status: Optional[int]):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO link_checks (url, ok, reason, status, checked_at) VALUES (?, ?, ?, ?, ?)",
+                (url, 0 if reason else 1, reason, status, time.time())
+            )
+            self.conn.commit()
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_slots[host]
+
+    def _probe(self, url: str) -> Optional[str]:
+        """HEAD -> GET 순서로 접속을 확인하고 결과를 저장합니다. (반환: 실패 사유, 정상이면 None)"""
+        with self._host_slot(url):
+            with self._lock:
+                self.probes += 1
+            status = None
+            try:
+                response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+                status = response.status_code
+            except requests.RequestException:
+                pass
+
+            # HEAD를 막는 서버(405/403 등)나 연결 실패는 GET으로 재확인
+            if status is None or status >= 400:
+                with self._lock:
+                    self.get_fallbacks += 1
+                try:
+                    response = self.session.get(url, timeout=self.timeout, stream=True)
+                    response.close()
+                    status = response.status_code
+                except requests.RequestException as e:
+                    reason = type(e).__name__
+                    self._store(url, reason, None)
+                    return reason
+
+        reason = f"Status {status}" if status >= 400 else None
+        if status not in TRANSIENT_STATUS_CODES:
+            self._store(url, reason, status)
+        return reason
+
+    def submit(self, url: str, refresh: bool = False) -> Future:
+        """
+        URL 검증을 백그라운드로 시작합니다. 캐시에 있으면 즉시 완료된 Future를, 검사 중이면 같은 Future를 반환합니다.
+        refresh=True면 저장된 결과를 무시하고 다시 검사합니다.
+
+        Returns:
+            Future[Optional[str]]: 실패 사유 (정상이면 None)
+        """
+        cached = None if refresh else self._cached(url)
+        if cached is not None:
+            with self._lock:
+                self.cache_hits += 1
+            future = Future()
+            future.set_result(cached["reason"])
+            return future
+
+        with self._lock:
+            future = self._in_flight.get(url)
+            if future is None:
+                future = self._pool.submit(self._probe, url)
+                self._in_flight[url] = future
+                future.add_done_callback(lambda _, u=url: self._forget(u))
+            return future
+
+    def _forget(self, url: str):
+        with self._lock:
+            self._in_flight.pop(url, None)
+
+    def check(self, url: str) -> Optional[str]:
+        """URL 하나를 검증합니다. (반환: 실패 사유, 정상이면 None)"""
+        return self.submit(url).result()
+
+    def validate_many(self, urls: Iterable[str], refresh: bool = False) -> Dict[str, Optional[str]]:
+        """
+        여러 URL을 동시에 검증합니다.
+
+        Returns:
+            Dict[str, Optional[str]]: url -> 실패 사유 (정상이면 None)
+        """
+        futures = {url: self.submit(url, refresh) for url in dict.fromkeys(urls)}
+        results = {}
+        for url, future in futures.items():
+            try:
+                results[url] = future.result()
+            except Exception as e:
+                logger.warning(f"링크 검증 오류 ({url}): {e}")
+                results[url] = type(e).__name__
+        return results
+
+    def purge(self) -> int:
+        """TTL이 지난 결과를 삭제하고 삭제 건수를 반환합니다."""
+        now = time.time()
+        with self._lock:
+            removed = self.conn.execute(
+                "DELETE FROM link_checks WHERE (ok = 1 AND checked_at < ?) OR (ok = 0 AND checked_at < ?)",
+                (now - self.ok_ttl, now - self.fail_ttl)
+            ).rowcount
+            self.conn.commit()
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """검증 캐시 적중/실제 요청 통계를 반환합니다."""
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) AS n FROM link_checks").fetchone()["n"]
+            return {
+                "entries": entries,
+                "cache_hits": self.cache_hits,
+                "probes": self.probes,
+                "get_fallbacks": self.get_fallbacks,
+            }
@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+from openai.types.chat import ChatCompletion
+from src.config.settings import Config
+from src.utils.logger import get_logger
+
+logger = get_logger("LLMCache")
+
+# 캐시 모드: on(읽기+쓰기), refresh(항상 새로 호출하고 결과로 덮어쓰기), off(캐시 미사용)
+CACHE_MODES = ("on", "refresh", "off")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    model TEXT,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses(last_used_at);
+"""
+
+def cache_key(model: str, messages: list, params: Dict[str, Any]) -> str:
+    """모델/메시지/샘플링 파라미터를 정규화한 JSON의 SHA-256 해시를 반환합니다."""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "params": params},
+        sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def completion_from_stream(completion_id: str, model: str, content: str,
+                           finish_reason: Optional[str], usage: Any = None) -> ChatCompletion:
+    """스트리밍으로 받은 조각을 합쳐 캐시에 저장할 수 있는 ChatCompletion으로 만듭니다."""
+    return ChatCompletion.model_validate({
+        "id": completion_id or "stream",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "finish_reason": finish_reason or "stop",
+            "message": {"role": "assistant", "content": content},
+        }],
+        "usage": usage.model_dump() if hasattr(usage, "model_dump") else usage,
+    })
+
+class LLMCache:
+    """
+    chat.completions 응답을 로컬 SQLite에 저장하는 캐시입니다.
+    프롬프트가 바이트 단위로 같은 재실행(실패한 캠페인 복구 등)은 API 호출 없이 저장된 응답을 그대로 재생합니다.
+    - 오래된 항목(max_age_days)은 만료, 전체 크기가 max_mb를 넘으면 가장 오래 안 쓴 항목부터 제거
+    """
+
+    def __init__(self, db_path: str = None, mode: str = None, max_mb: float = None, max_age_days: float = None):
+        self.db_path = db_path or os.path.join(Config.CACHE_DIR, "llm_cache.sqlite3")
+        self.mode = (mode or Config.LLM_CACHE_MODE).lower()
+        if self.mode not in CACHE_MODES:
+            raise ValueError(f"알 수 없는 LLM 캐시 모드: {self.mode} (허용: {', '.join(CACHE_MODES)})")
+        self.max_bytes = int((max_mb or Config.LLM_CACHE_MAX_MB) * 1024 * 1024)
+        self.max_age = (max_age_days or Config.LLM_CACHE_MAX_AGE_DAYS) * 86400
+
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self._lock:
+            self.conn.executescript(SCHEMA)
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.saved_tokens = 0
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def get(self, key: str) -> Optional[ChatCompletion]:
+        """저장된 응답을 반환합니다. (모드가 on이 아니거나 없거나 만료되었으면 None)"""
+        if self.mode != "on":
+            return None
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row and now - row["created_at"] > self.max_age:
+                self.conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self.conn.commit()
+                self.evictions += 1
+                row = None
+            if not row:
+                self.misses += 1
+                return None
+            self.conn.execute("UPDATE llm_responses SET last_used_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+
+        try:
+            response = ChatCompletion.model_validate_json(row["response"])
+        except Exception as e:
+            logger.warning(f"캐시 항목 복원 실패 -> 재호출: {e}")
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+            if response.usage:
+                self.saved_tokens += response.usage.total_tokens or 0
+        return response
+
+    def put(self, key: str, model: str, response: Any):
+        """응답을 저장하고 필요하면 크기 제한에 맞춰 제거합니다. (모드가 off면 무시)"""
+        if self.mode == "off" or not hasattr(response, "model_dump_json"):
+            return
+        data = response.model_dump_json()
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, model, response, size, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, data, len(data), now, now)
+            )
+            self.writes += 1
+            self._evict(now)
+            self.conn.commit()
+
+    def _evict(self, now: float):
+        """만료 항목을 지우고, 전체 크기가 상한을 넘으면 마지막 사용 시각이 오래된 순으로 제거합니다."""
+        expired = self.conn.execute(
+            "DELETE FROM llm_responses WHERE created_at < ?", (now - self.max_age,)
+        ).rowcount
+        self.evictions += expired
+
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) AS total FROM llm_responses").fetchone()["total"]
+        if total <= self.max_bytes:
+            return
+        for row in self.conn.execute(
+            "SELECT key, size FROM llm_responses ORDER BY last_used_at ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM llm_responses WHERE key = ?", (row["key"],))
+            total -= row["size"]
+            self.evictions += 1
+
+    def clear(self) -> int:
+        """캐시를 모두 비우고 삭제된 항목 수를 반환합니다."""
+        with self._lock:
+            removed = self.conn.execute("DELETE FROM llm_responses").rowcount
+            self.conn.commit()
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중률/크기 통계를 반환합니다."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT COUNT(*) AS n, COALESCE(SUM(size), 0) AS total FROM llm_responses"
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "mode": self.mode,
+                "entries": row["n"],
+                "size_mb": round(row["total"] / (1024 * 1024), 2),
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "saved_tokens": self.saved_tokens,
+            }
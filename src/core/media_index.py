@@ -0,0 +1,171 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from src.config.settings import Config
+from src.utils.logger import get_logger
+
+logger = get_logger("MediaIndex")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS media_hashes (
+    digest TEXT PRIMARY KEY,
+    media_id INTEGER NOT NULL,
+    source_url TEXT,
+    size INTEGER,
+    indexed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_media_hashes_media_id ON media_hashes(media_id);
+"""
+
+def content_digest(data: bytes) -> str:
+    """이미지 바이트의 SHA-256 해시(16진수)를 반환합니다."""
+    return hashlib.sha256(data).hexdigest()
+
+class MediaHashIndex:
+    """
+    이미지 내용 해시 -> 미디어 ID/URL 인덱스입니다. (content-addressed 중복 제거)
+    바이트가 완전히 같은 이미지가 이미 미디어 라이브러리에 있으면 업로드하지 않고 기존 첨부파일을 재사용합니다.
+    미디어 목록은 사이트 미러(SiteMirror)에서 읽고, 해시 테이블은 별도 로컬 SQLite 파일에 저장합니다.
+    """
+
+    def __init__(self, client, db_path: str = None):
+        self.client = client
+        self.db_path = db_path or os.path.join(Config.CACHE_DIR, "media_hashes.sqlite3")
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self._lock:
+            self.conn.executescript(SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        # 파일 다운로드 전용 세션: 인증 정보 없음 (CDN/오프로드 스토리지로 WP 자격 증명이 새지 않도록)
+        self._downloads = requests.Session()
+        adapter = HTTPAdapter(pool_connections=Config.MEDIA_BACKFILL_WORKERS, pool_maxsize=Config.MEDIA_BACKFILL_WORKERS)
+        self._downloads.mount("https://", adapter)
+        self._downloads.mount("http://", adapter)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+        self._downloads.close()
+
+    def _media_exists(self, media_id: int) -> bool:
+        """미디어가 아직 사이트에 있는지 확인합니다. (미러 우선, 없으면 단건 조회 1회)"""
+        if self.client.mirror.get_media(media_id):
+            return True
+        try:
+            response = self.client._request(
+                "GET", f"{self.client.base_url}/media/{media_id}", params={"_fields": "id"}
+            )
+            return response.status_code == 200
+        except Exception as e:
+            logger.warning(f"미디어 존재 확인 실패 (ID: {media_id}): {e}")
+            return False
+
+    def lookup(self, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        해시로 기존 미디어를 찾습니다. 삭제된 미디어를 가리키는 항목은 제거하고 미스로 처리합니다.
+
+        Returns:
+            Optional[Dict[str, Any]]: {'id': int, 'source_url': str} 또는 None
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT media_id, source_url FROM media_hashes WHERE digest = ?", (digest,)
+            ).fetchone()
+        if row and not self._media_exists(row["media_id"]):
+            logger.info(f"삭제된 미디어 해시 항목 제거 (ID: {row['media_id']})")
+            with self._lock:
+                self.conn.execute("DELETE FROM media_hashes WHERE digest = ?", (digest,))
+                self.conn.commit()
+            row = None
+
+        with self._lock:
+            if row:
+                self.hits += 1
+                return {"id": row["media_id"], "source_url": row["source_url"]}
+            self.misses += 1
+            return None
+
+    def record(self, digest: str, media_id: int, source_url: str, size: int = None):
+        """업로드(또는 백필)된 미디어의 해시를 기록합니다."""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO media_hashes (digest, media_id, source_url, size, indexed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (digest, media_id, source_url, size, time.strftime("%Y-%m-%dT%H:%M:%S"))
+            )
+            self.conn.commit()
+
+    def _download(self, url: str) -> requests.Response:
+        """
+        미디어 파일을 내려받습니다. 워드프레스와 같은 호스트면 WP 클라이언트(풀 세션/HostGovernor)를,
+        다른 호스트(CDN 등)면 인증 없는 별도 세션을 사용합니다.
+        """
+        if urlparse(url).netloc == urlparse(self.client.root_url).netloc:
+            return self.client._request("GET", url, timeout=Config.MEDIA_DOWNLOAD_TIMEOUT)
+        return self._downloads.get(url, timeout=Config.MEDIA_DOWNLOAD_TIMEOUT)
+
+    def _hash_remote(self, media: Dict[str, Any]) -> bool:
+        """미디어 파일을 내려받아 해시를 기록합니다."""
+        try:
+            response = self._download(media["source_url"])
+            response.raise_for_status()
+            data = response.content
+            self.record(content_digest(data), media["id"], media["source_url"], len(data))
+            return True
+        except Exception as e:
+            logger.warning(f"미디어 해시 백필 실패 (ID: {media['id']}): {e}")
+            return False
+
+    def backfill(self, max_workers: int = None) -> int:
+        """
+        미러의 미디어 중 해시가 없는 항목을 동시에 내려받아 인덱스를 채웁니다.
+
+        Returns:
+            int: 새로 기록된 항목 수
+        """
+        max_workers = max_workers or Config.MEDIA_BACKFILL_WORKERS
+        self.client.mirror.sync(resources=("media",))
+        with self._lock:
+            known = {r["media_id"] for r in self.conn.execute("SELECT media_id FROM media_hashes").fetchall()}
+        targets = [
+            m for m in self.client.mirror.find_media(limit=-1)
+            if m["id"] not in known and m.get("source_url")
+        ]
+        if not targets:
+            logger.info("해시 백필 대상 미디어 없음")
+            return 0
+
+        logger.info(f"미디어 해시 백필 시작: {len(targets)}개 (동시 {max_workers}개)")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            done = sum(executor.map(self._hash_remote, targets))
+        logger.info(f"미디어 해시 백필 완료: {done}/{len(targets)}개")
+        return done
+
+    def rebuild(self, max_workers: int = None) -> int:
+        """해시 인덱스를 비우고 미디어 라이브러리 전체에서 다시 만듭니다."""
+        with self._lock:
+            self.conn.execute("DELETE FROM media_hashes")
+            self.conn.commit()
+        return self.backfill(max_workers)
+
+    def stats(self) -> Dict[str, Any]:
+        """중복 제거 적중률 통계를 반환합니다."""
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) AS n FROM media_hashes").fetchone()["n"]
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
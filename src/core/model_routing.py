@@ -0,0 +1,88 @@
+import json
+import os
+from typing import Dict, Any, List, Optional
+from src.config.settings import Config
+from src.utils.logger import get_logger
+
+logger = get_logger("ModelRouting")
+
+DEFAULT_ROUTING_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "model_routing.json"
+)
+
+# 라우팅 표에 없는 단계나 항목에 쓰는 기본값 (기존 하드코딩 동작과 동일한 모델)
+DEFAULT_ROUTE = {"model": "gpt-4o", "max_tokens": None, "timeout": 120}
+ROUTE_FIELDS = ("model", "max_tokens", "timeout")
+
+def parse_route_overrides(specs: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    CLI 형식의 단계별 덮어쓰기를 dict로 변환합니다.
+    - "section=gpt-4o-mini"        -> 모델만 변경
+    - "faq.max_tokens=800"         -> 특정 항목 변경
+    """
+    overrides: Dict[str, Dict[str, Any]] = {}
+    for spec in specs or []:
+        if "=" not in spec:
+            raise ValueError(f"잘못된 라우팅 지정: '{spec}' (예: section=gpt-4o-mini, faq.max_tokens=800)")
+        target, value = spec.split("=", 1)
+        stage, _, field = target.strip().partition(".")
+        field = field or "model"
+        if field not in ROUTE_FIELDS:
+            raise ValueError(f"알 수 없는 라우팅 항목: '{field}' (허용: {', '.join(ROUTE_FIELDS)})")
+        value = value.strip()
+        if field == "max_tokens":
+            value = int(value)
+        elif field == "timeout":
+            value = float(value)
+        overrides.setdefault(stage, {})[field] = value
+    return overrides
+
+class ModelRouter:
+    """
+    생성 단계(outline/image_metadata/intro/section/faq/single_call)별 모델, max_tokens, 요청 제한 시간을 정하는 라우팅 표입니다.
+    프로필은 src/config/model_routing.json에 정의하고 MODEL_PROFILE로 선택하며, 실행마다 단계별로 덮어쓸 수 있습니다.
+    모델별 단가(pricing_per_1m_tokens)로 예상 비용도 계산합니다.
+    """
+
+    def __init__(self, profile: str = None, overrides: Dict[str, Dict[str, Any]] = None, path: str = None):
+        self.path = path or Config.MODEL_ROUTING_PATH or DEFAULT_ROUTING_PATH
+        self.profile = profile or Config.MODEL_PROFILE
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"모델 라우팅 표 로드 실패 (기본 모델 사용): {e}")
+            data = {}
+
+        self.profiles = data.get("profiles", {})
+        self.pricing = data.get("pricing_per_1m_tokens", {})
+        if self.profiles and self.profile not in self.profiles:
+            raise ValueError(f"알 수 없는 모델 프로필: {self.profile} (허용: {', '.join(self.profiles)})")
+
+        self.routes: Dict[str, Dict[str, Any]] = {}
+        for stage, route in self.profiles.get(self.profile, {}).items():
+            self.routes[stage] = {**DEFAULT_ROUTE, **route}
+        for stage, route in (overrides or {}).items():
+            self.routes[stage] = {**self.routes.get(stage, DEFAULT_ROUTE), **route}
+        if overrides:
+            logger.info(f"모델 라우팅 덮어쓰기: {overrides}")
+
+    def route(self, stage: Optional[str]) -> Dict[str, Any]:
+        """단계의 라우팅을 반환합니다. ('section:제목'은 'section' 라우팅 사용)"""
+        key = (stage or "").split(":", 1)[0]
+        return self.routes.get(key, DEFAULT_ROUTE)
+
+    def estimate_cost(self, model: str, prompt_tokens: int, cached_tokens: int, completion_tokens: int) -> Optional[float]:
+        """토큰 사용량의 예상 비용(USD)을 계산합니다. (단가 정보가 없는 모델이면 None)"""
+        price = self.pricing.get(model)
+        if not price:
+            return None
+        uncached = max(prompt_tokens - cached_tokens, 0)
+        return (
+            uncached * price["input"]
+            + cached_tokens * price.get("cached_input", price["input"])
+            + completion_tokens * price["output"]
+        ) / 1_000_000
+
+    def describe(self) -> str:
+        return ", ".join(f"{stage}={route['model']}" for stage, route in self.routes.items())
@@ -0,0 +1,212 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Any, Callable, Iterable, List, Optional
+from src.config.settings import Config
+from src.utils.logger import get_logger
+
+logger = get_logger("StagePipeline")
+
+class PipelineError(RuntimeError):
+    """필수 단계가 재시도 후에도 실패했을 때 발생합니다."""
+
+    def __init__(self, stage: str, cause: BaseException):
+        super().__init__(f"단계 '{stage}' 실패: {cause}")
+        self.stage = stage
+        self.cause = cause
+
+class Stage:
+    """
+    파이프라인의 한 단계입니다.
+
+    Args:
+        name (str): 단계 이름 (다른 단계의 inputs에서 참조)
+        func (Callable): 입력 단계 결과를 키워드 인자로 받아 결과를 반환하는 함수
+        inputs (Iterable[str]): 선행 단계 이름 목록
+        timeout (float): 시도 1회당 제한 시간(초), None이면 Config.STAGE_TIMEOUT
+        retries (int): 예외로 끝난 시도의 재시도 횟수, None이면 Config.STAGE_RETRIES (시간 초과는 재시도하지 않음)
+        required (bool): False면 최종 실패 시 fallback 값을 결과로 사용하고 계속 진행
+        fallback (Any): 선택 단계의 실패 시 대체 결과
+    """
+
+    def __init__(self, name: str, func: Callable, inputs: Iterable[str] = (), timeout: float = None,
+                 retries: int = None, required: bool = True, fallback: Any = None):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.timeout = timeout or Config.STAGE_TIMEOUT
+        self.retries = Config.STAGE_RETRIES if retries is None else retries
+        self.required = required
+        self.fallback = fallback
+
+class StagePipeline:
+    """
+    선언된 입력 관계(DAG)에 따라 단계를 최대한 병렬로 실행하는 실행기입니다.
+    선행 단계가 모두 끝난 단계는 즉시 스레드 풀에 제출되며, 단계별 제한 시간과 재시도 정책을 적용합니다.
+    실행이 끝나면 report에 단계별 소요 시간과 종단 간 지연을 결정한 임계 경로(critical path)가 남습니다.
+
+    제한 시간을 넘긴 단계는 재시도하지 않고 실패(선택 단계는 대체 값)로 처리합니다.
+    실행 중인 스레드는 강제 종료할 수 없어 다시 제출하면 버려진 시도의 API 호출과 새 호출이 둘 다 과금되기 때문입니다.
+    단계 안의 API 호출은 각자 제한 시간으로 끝나므로, 단계 제한 시간은 호출들의 제한 시간 합보다 조금 길게 잡습니다.
+    (ContentGenerator._stage_timeout 참고)
+    """
+
+    def __init__(self, name: str = "pipeline"):
+        self.name = name
+        self.stages: Dict[str, Stage] = {}
+        self.report: Optional[Dict[str, Any]] = None
+
+    def add(self, name: str, func: Callable, inputs: Iterable[str] = (), **policy) -> "StagePipeline":
+        """단계를 추가합니다. (policy: timeout, retries, required, fallback)"""
+        if name in self.stages:
+            raise ValueError(f"중복된 단계 이름: {name}")
+        self.stages[name] = Stage(name, func, inputs, **policy)
+        return self
+
+    def _validate(self):
+        """입력 참조와 순환 여부를 검사합니다."""
+        for stage in self.stages.values():
+            unknown = [dep for dep in stage.inputs if dep not in self.stages]
+            if unknown:
+                raise ValueError(f"단계 '{stage.name}'의 알 수 없는 입력: {', '.join(unknown)}")
+
+        resolved = set()
+        remaining = dict(self.stages)
+        while remaining:
+            ready = [name for name, stage in remaining.items() if all(dep in resolved for dep in stage.inputs)]
+            if not ready:
+                raise ValueError(f"단계 의존 관계에 순환이 있습니다: {', '.join(remaining)}")
+            for name in ready:
+                resolved.add(name)
+                del remaining[name]
+
+    def run(self) -> Dict[str, Any]:
+        """
+        모든 단계를 실행합니다.
+
+        Returns:
+            Dict[str, Any]: 단계 이름 -> 결과
+
+        Raises:
+            PipelineError: 필수 단계가 재시도 후에도 실패한 경우 (이후 단계는 실행하지 않음)
+        """
+        self._validate()
+        results: Dict[str, Any] = {}
+        timings = {
+            name: {"status": "pending", "attempts": 0, "start": None, "end": None, "error": None}
+            for name in self.stages
+        }
+        running = {}  # future -> (단계 이름, 시도 시작 시각)
+        # 재시도는 이전 시도가 끝난 뒤에만 제출되므로 단계마다 스레드 하나면 충분
+        # (시간 초과로 버려진 시도가 스레드를 점유해도 그 단계는 다시 제출되지 않음)
+        max_workers = len(self.stages) or 1
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{self.name}-stage")
+        run_started = time.perf_counter()
+
+        def submit(name: str):
+            stage = self.stages[name]
+            timing = timings[name]
+            timing["attempts"] += 1
+            timing["status"] = "running"
+            now = time.perf_counter()
+            if timing["start"] is None:
+                timing["start"] = now
+            kwargs = {dep: results[dep] for dep in stage.inputs}
+            running[executor.submit(stage.func, **kwargs)] = (name, now)
+
+        def fail_attempt(name: str, error: BaseException, retry: bool = True):
+            stage = self.stages[name]
+            timing = timings[name]
+            if retry and timing["attempts"] <= stage.retries:
+                logger.warning(f"[{name}] 시도 {timing['attempts']} 실패 -> 재시도: {error}")
+                submit(name)
+                return
+            timing["end"] = time.perf_counter()
+            timing["error"] = str(error)
+            if stage.required:
+                timing["status"] = "failed"
+                raise PipelineError(name, error)
+            timing["status"] = "fallback"
+            logger.warning(f"[{name}] 선택 단계 실패 -> 대체 값 사용: {error}")
+            results[name] = stage.fallback
+
+        try:
+            while len(results) < len(self.stages):
+                for name, stage in self.stages.items():
+                    if timings[name]["status"] == "pending" and all(dep in results for dep in stage.inputs):
+                        submit(name)
+
+                now = time.perf_counter()
+                nearest = min(started + self.stages[name].timeout - now for name, started in running.values())
+                finished, _ = wait(list(running), timeout=max(nearest, 0), return_when=FIRST_COMPLETED)
+
+                for future in finished:
+                    name, _ = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        fail_attempt(name, error)
+                        continue
+                    results[name] = future.result()
+                    timings[name]["end"] = time.perf_counter()
+                    timings[name]["status"] = "done"
+
+                now = time.perf_counter()
+                for future, (name, started) in list(running.items()):
+                    timeout = self.stages[name].timeout
+                    if now - started >= timeout:
+                        running.pop(future)
+                        future.cancel()
+                        fail_attempt(name, TimeoutError(f"{timeout:.0f}초 제한 시간 초과"), retry=False)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.report = self._build_report(timings, run_started)
+            logger.info(self.format_critical_path())
+
+        return results
+
+    def _build_report(self, timings: Dict[str, Dict[str, Any]], run_started: float) -> Dict[str, Any]:
+        """단계별 소요 시간과 임계 경로를 계산합니다. (시각은 실행 시작 기준 초)"""
+        def rel(value):
+            return round(value - run_started, 3) if value is not None else None
+
+        stages = {}
+        for name, timing in timings.items():
+            stage = self.stages[name]
+            ready_at = max((timings[dep]["end"] or run_started for dep in stage.inputs), default=run_started)
+            stages[name] = {
+                "status": timing["status"],
+                "attempts": timing["attempts"],
+                "inputs": list(stage.inputs),
+                "ready_s": rel(ready_at),
+                "start_s": rel(timing["start"]),
+                "end_s": rel(timing["end"]),
+                "duration_s": round(timing["end"] - timing["start"], 3)
+                if timing["start"] is not None and timing["end"] is not None else None,
+                "error": timing["error"],
+            }
+
+        # 가장 늦게 끝난 단계에서 시작해, 그 단계를 가장 늦게 풀어 준 선행 단계를 따라 거슬러 올라감
+        critical_path: List[str] = []
+        finished = {name: t for name, t in timings.items() if t["end"] is not None}
+        current = max(finished, key=lambda n: finished[n]["end"]) if finished else None
+        while current:
+            critical_path.append(current)
+            deps = [dep for dep in self.stages[current].inputs if dep in finished]
+            current = max(deps, key=lambda n: finished[n]["end"]) if deps else None
+        critical_path.reverse()
+
+        return {
+            "name": self.name,
+            "total_s": round(time.perf_counter() - run_started, 3),
+            "critical_path": critical_path,
+            "stages": stages,
+        }
+
+    def format_critical_path(self) -> str:
+        """임계 경로를 한 줄 요약으로 반환합니다. (예: outline(3.1초) -> sections(12.4초) = 15.5초)"""
+        if not self.report:
+            return f"[{self.name}] 실행 기록 없음"
+        steps = " -> ".join(
+            f"{name}({self.report['stages'][name]['duration_s'] or 0:.1f}초)"
+            for name in self.report["critical_path"]
+        )
+        return f"[{self.name}] 임계 경로: {steps or '없음'} = 총 {self.report['total_s']:.1f}초"
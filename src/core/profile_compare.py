@@ -0,0 +1,118 @@
+import time
+from typing import Dict, Any, List
+from src.core.generator import ContentGenerator
+from src.core.html_engine import analyze_html
+from src.utils.logger import get_logger
+
+logger = get_logger("ProfileCompare")
+
+def quality_checks(post: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    verify_score_draft와 같은 기준으로 생성 결과를 점검합니다. (발행 전이므로 이미지는 메타데이터 수로 판단)
+    - 본문 2000자 이상 / H2 4개 이상 / 제목과 본문에 포커스 키워드 / 메타 설명 / 이미지 4장(썸네일 1 + 본문 3)
+    """
+    fk = post.get("rank_math_focus_keyword", "")
+    stats = analyze_html(post.get("content", ""), keyword=fk)
+    checks = {
+        "length": stats["text_length"] >= 2000,
+        "h2": stats["h2_count"] >= 4,
+        "keyword": bool(fk) and fk in post.get("title", "") and stats["keyword_count"] > 0,
+        "description": bool(post.get("rank_math_description")),
+        "images": len(post.get("images", [])) >= 4,
+    }
+    return {"checks": checks, "passed": all(checks.values()), "stats": stats}
+
+def run_profile(topic: str, profile: str = None, internal_links: list = None, cache_mode: str = "off",
+                engine: str = None, label: str = None, model_routes: Dict[str, Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    한 프로필(과 생성 방식)로 포스트를 생성하고 소요 시간, 토큰, 예상 비용, 품질 점검 결과를 반환합니다.
+    model_routes(--model-route 덮어쓰기)는 프로필 위에 그대로 적용됩니다.
+    """
+    generator = ContentGenerator(cache_mode=cache_mode, model_profile=profile, model_routes=model_routes, engine=engine)
+    started = time.perf_counter()
+    post = generator.generate_post(topic, internal_links=internal_links)
+    wall_s = time.perf_counter() - started
+
+    usage = generator.prompt_cache_usage
+    cost = 0.0
+    for entry in usage.values():
+        stage_cost = generator.router.estimate_cost(
+            entry.get("model"), entry["prompt_tokens"], entry["cached_tokens"], entry["completion_tokens"]
+        )
+        if stage_cost is None:
+            cost = None
+            break
+        cost += stage_cost
+
+    return {
+        "label": label or generator.router.profile,
+        "routes": f"{generator.engine} / {generator.router.describe()}",
+        "ok": post is not None,
+        "wall_s": round(wall_s, 2),
+        "critical_path": (generator.last_stage_report or {}).get("critical_path", []),
+        "calls": sum(e["calls"] for e in usage.values()),
+        "prompt_tokens": sum(e["prompt_tokens"] for e in usage.values()),
+        "cached_tokens": sum(e["cached_tokens"] for e in usage.values()),
+        "completion_tokens": sum(e["completion_tokens"] for e in usage.values()),
+        "cost_usd": round(cost, 4) if cost is not None else None,
+        "quality": quality_checks(post) if post else None,
+    }
+
+def compare_profiles(topic: str, profiles: List[str], internal_links: list = None, cache_mode: str = "off",
+                     model_routes: Dict[str, Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    같은 주제를 여러 라우팅 프로필로 차례대로 생성해 결과를 비교합니다.
+    LLM 응답 캐시가 결과를 가리지 않도록 기본적으로 캐시를 끄고 실행합니다.
+    """
+    results = []
+    for profile in profiles:
+        logger.info(f"프로필 비교 실행: [{profile}] '{topic}'")
+        results.append(run_profile(topic, profile, internal_links, cache_mode, model_routes=model_routes))
+    return results
+
+def compare_engines(topic: str, engines: List[str], profile: str = None, internal_links: list = None,
+                    cache_mode: str = "off", model_routes: Dict[str, Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """같은 주제와 라우팅 프로필로 생성 방식(iterative / single_call)별 처리량을 비교합니다."""
+    results = []
+    for engine in engines:
+        logger.info(f"생성 방식 비교 실행: [{engine}] '{topic}'")
+        results.append(run_profile(topic, profile, internal_links, cache_mode, engine=engine, label=engine,
+                                   model_routes=model_routes))
+    return results
+
+def format_comparison(results: List[Dict[str, Any]]) -> str:
+    """비교 결과를 나란히 표로 만듭니다."""
+    def quality_cell(result, key):
+        quality = result["quality"]
+        if not quality:
+            return "-"
+        return "PASS" if quality["checks"][key] else "FAIL"
+
+    def stat_cell(result, key):
+        quality = result["quality"]
+        return str(quality["stats"][key]) if quality else "-"
+
+    rows = [
+        ("생성 성공", lambda r: "O" if r["ok"] else "X"),
+        ("소요 시간(초)", lambda r: f"{r['wall_s']:.2f}"),
+        ("API 호출", lambda r: str(r["calls"])),
+        ("입력 토큰", lambda r: str(r["prompt_tokens"])),
+        ("  캐시 적중", lambda r: str(r["cached_tokens"])),
+        ("출력 토큰", lambda r: str(r["completion_tokens"])),
+        ("예상 비용($)", lambda r: f"{r['cost_usd']:.4f}" if r["cost_usd"] is not None else "-"),
+        ("본문 길이", lambda r: stat_cell(r, "text_length")),
+        ("H2 수", lambda r: stat_cell(r, "h2_count")),
+        ("키워드 밀도(%)", lambda r: stat_cell(r, "keyword_density")),
+        ("길이 2000+", lambda r: quality_cell(r, "length")),
+        ("H2 4+", lambda r: quality_cell(r, "h2")),
+        ("키워드", lambda r: quality_cell(r, "keyword")),
+        ("메타 설명", lambda r: quality_cell(r, "description")),
+        ("이미지 4장", lambda r: quality_cell(r, "images")),
+        ("종합", lambda r: ("PASS" if r["quality"]["passed"] else "FAIL") if r["quality"] else "-"),
+    ]
+    lines = [f"[{r['label']}] {r['routes']}" for r in results]
+    header = f"{'항목':<16}" + "".join(f"{r['label']:<16}" for r in results)
+    lines += ["", header, "-" * len(header)]
+    for label, cell in rows:
+        lines.append(f"{label:<16}" + "".join(f"{cell(r):<16}" for r in results))
+    return "\n".join(lines)
@@ -0,0 +1,262 @@
+from typing import Dict, Any, List, Optional
+
+# ==============================================================================
+# 프롬프트 구성: [공통 원칙 + 단계 규칙 system 블록] + [가변 user 꼬리]
+# OpenAI는 요청 앞부분이 바이트 단위로 같은 프롬프트(1024 토큰 이상)를 자동으로 캐시합니다.
+# system 블록은 모든 단계가 공유하는 공통 원칙(BASE_SYSTEM_PROMPT)을 앞에 두고
+# 그 단계의 고정 규칙만 뒤에 붙이므로, 같은 단계의 호출(섹션 N개 등)은 system 블록 전체를 공유하고
+# 다른 단계끼리도 공통 원칙까지는 같은 접두어가 됩니다. (다른 단계 규칙은 보내지 않음)
+# 주제/키워드/섹션 제목 같은 가변 값은 모두 마지막 user 메시지에만 넣고,
+# system 블록은 어떤 포스트에서도 글자 하나 바뀌지 않도록 유지해야 캐시가 적중합니다.
+# (규칙 문구를 고칠 때 f-string이나 날짜 등 가변 값을 system 블록에 넣지 말 것)
+# ==============================================================================
+MIN_CACHEABLE_PROMPT_TOKENS = 1024
+
+# 모든 단계가 공유하는 앞부분 (단계가 달라도 이 부분까지는 캐시 공유)
+BASE_SYSTEM_PROMPT = """
+당신은 한국어 정책/재테크/생산성 블로그를 운영하는 SEO 전문 에디터입니다.
+독자는 2026년 최신 정부 지원 제도, 금융 상품, 업무 자동화 정보를 검색해서 들어온 20~40대입니다.
+
+[공통 작성 원칙 - SEO PROTOCOL]
+- 언어: 자연스러운 한국어. 번역투, 과장 광고 문구, 근거 없는 단정 금지.
+- 최신성: 2025~2026년 기준 정보와 전망을 반영하고, 확인되지 않은 수치나 날짜는 지어내지 말 것.
+- 핵심 키워드: 요청마다 주어지는 '핵심 키워드'를 검색 의도에 맞게 자연스럽게 사용할 것. 억지 삽입과 반복 나열 금지.
+- 구체성: 모호한 표현 대신 조건, 금액, 기간, 절차, 예시를 제시할 것.
+- 가독성(모바일 최적화): 한 문단은 2~3문장 이내로 짧게 끊고, 핵심 문장은 <strong>으로 강조할 것.
+- 출력 형식은 각 단계의 지시를 정확히 따를 것. HTML을 요청받으면 순수 HTML만 출력하고 마크다운 코드 블록(```) 사용 금지.
+- 이미지 관련 텍스트('[이미지 설명]', '그림 1' 등)는 본문에 절대 쓰지 말 것. (이미지는 별도로 삽입됨)
+""".strip()
+
+OUTLINE_RULES = """
+[단계: 블로그 포스트 개요 (JSON)]
+사용자가 주는 주제에 대한 블로그 포스트 개요를 JSON으로 작성하세요.
+필수 조건:
+1. 'focus_keyword': **가장 중요한 '검색어' 1~2단어만 추출.** (예: "청년미래적금", "청년도약계좌 비교"). **절대로 문장형이나 긴 복합명사 금지.** (3단어 초과 시 감점). 사람들이 구글에 검색할 법한 짧은 명사형.
+2. 'title': **매력적이고 클릭을 유도하는 제목.** 핵심 키워드를 포함하되, 문장형으로 자연스럽게 작성. **반드시 '2026'** 포함. (예: "2026 청년미래적금 vs 청년도약계좌: 금리 비교 및 환승 꿀팁")
+3. 'slug': 주제와 키워드를 반영한 **영문 슬러그** (hyphen-style). **50자 이내로 짧고 간결하게.** (예: youth-future-savings-2026)
+4. 'description': 160자 이내의 메타 디스크립션. **무조건 문장의 맨 첫 단어를 focus_keyword 값(으)로 시작할 것.** (예: "청년미래적금은 2026년...")
+5. 'sections': 본론 H2 소제목 6~8개 리스트.
+6. 'related_keywords': Rank Math SEO 점수를 위한 **연관 키워드(LSI) 8개** 리스트. (예: ["청년 지원금", "2026 적금", "이자 높은 은행", ...])
+""".strip()
+
+IMAGE_METADATA_RULES = """
+[단계: 이미지 메타데이터 (JSON)]
+블로그 포스트의 주제와 섹션 정보를 바탕으로, 본문에 삽입할 4장의 이미지에 대한 메타데이터를 JSON으로 작성하세요.
+
+[필수 요구사항]
+1. **총 4장**의 이미지 정보를 생성하세요. (1번째: type='featured', 나머지 3개: type='body')
+2. **프롬프트(Prompt)**: DALL-E 3가 고품질 이미지를 생성할 수 있도록 영어로 구체적으로 작성하세요. (Modern, High quality, Infographic style 등)
+3. **대체 텍스트(Alt Text)**: 검색 엔진을 위해 핵심 키워드를 반드시 포함하고, 시각 장애인을 위해 이미지를 묘사하세요. (한글)
+4. **캡션(Caption)**: **반드시** 핵심 키워드를 포함하여 **20자 이내**로 간결하게 작성하세요. (예: "AI 수익화의 핵심 전략 그래프")
+
+[출력 구조 (JSON)]
+{
+    "images": [
+        {
+            "type": "featured",
+            "prompt": "eng prompt...",
+            "alt": "한글 대체 텍스트",
+            "caption": "한글 캡션 (간결)"
+        },
+        {
+            "type": "body",
+            "prompt": "eng prompt...",
+            "alt": "한글 대체 텍스트",
+            "caption": "한글 캡션 (간결)"
+        },
+        ... (총 4개 필수)
+    ]
+}
+""".strip()
+
+INTRO_RULES = """
+[단계: 서론 (HTML)]
+사용자가 주는 주제와 핵심 키워드로 블로그 포스트의 서론을 HTML로 작성하세요.
+- 첫 문장은 반드시 핵심 키워드(으)로 시작할 것.
+- 독자의 호기심을 자극하고 문제 의식을 제기할 것.
+- 분량: 300~500자.
+- 문단: 한 문단은 2~3문장을 넘지 않게 <p> 태그로 자주 나눌 것. (모바일 가독성)
+- 출력: 순수 HTML (마크다운 ``` 사용 금지).
+""".strip()
+
+SECTION_RULES = """
+[단계: 본문 섹션 (HTML)]
+사용자가 주는 블로그 포스트 주제의 챕터(섹션 제목) 내용을 상세히 작성하세요.
+
+[기본 규칙]
+- 형식: HTML (H2 태그로 제목 시작, 이후 p, ul/ol, strong 등 사용)
+- 내용: 구체적인 정보, 예시, 데이터 포함. 모호한 표현 금지.
+- **[중요] 핵심 키워드 남용 금지**:
+  - 전체 섹션에서 키워드는 **최대 2~3회**만 자연스럽게 사용하세요. (밀도 2.5% 미만 유지)
+  - 같은 단어 반복 대신 **'이 제도', '동 상품', '본 적금'** 등의 대명사나 **'청년 도약 지원책'** 같은 유의어를 적극 활용하세요.
+  - 문맥에 맞지 않는 억지스러운 키워드 삽입은 절대 금지합니다.
+
+[링크 전략 - 가두리(Walled Garden) 전략]
+1. **외부 링크 (이 섹션 전용)**:
+   - 사용자 메시지의 [외부 링크]에 출처가 주어지면 그 출처로 링크를 1개 거세요.
+   - 형식: <strong><a href="URL" target="_blank">[출처명 바로가기]</a></strong>
+   - URL이 주어진 경우 **절대 변경하거나 하위 경로를 지어내지 말 것**.
+   - 다른 섹션과 중복되지 않는 **고유한 출처**를 사용하세요.
+   - ⚠️ 위키백과 금지! 산만하고 집중을 방해함.
+   - 존재하지 않는 URL 사용 금지! 확실한 URL만 사용할 것.
+
+2. **내부 링크 (이 섹션 전용)**:
+   - 사용자 메시지의 [내부 링크]에 글이 주어지면 **반드시** 1회 삽입하세요. ("없음"이면 내부 링크를 넣지 말 것)
+   - **[매우 중요] 위치 규칙**:
+     - 절대로 섹션의 맨 마지막에 "참고하세요" 식으로 붙이지 마세요.
+     - **반드시** 설명하는 문장의 중간이나 끝에 자연스럽게 녹여내세요.
+     - 예시 (O): "...이때 **<a href='URL' target='_blank'>글 제목</a>**를 활용하면 더 효율적으로..."
+     - 예시 (X): "...입니다. \n\n 관련 글: 글 제목" (이런 식의 하단 배치는 금지!)
+   - 앵커 텍스트는 유동적으로 변형 가능하나 URL은 절대 변경 금지.
+
+[가독성 (Mobile Optimized)]
+- 한 문단은 2~3문장 이내로 짧게 끊어서 작성할 것.
+- 중요한 핵심 문장이나 키워드는 `<strong>` 태그로 **볼드 처리**하여 강조할 것.
+
+[분량 및 형식]
+- 분량: 공백 포함 500자 내외 (풍부한 내용).
+- H2 태그에는 사용자 메시지의 섹션 제목을 그대로 쓸 것.
+- 금지: '[이미지 설명]', '그림 1' 같은 이미지 관련 텍스트 절대 금지.
+- 출력: 순수 HTML (마크다운 ``` 사용 금지).
+""".strip()
+
+FAQ_RULES = """
+[단계: 자주 묻는 질문 (HTML)]
+사용자가 주는 주제 관련 자주 묻는 질문(FAQ) 3가지와 답변을 작성하세요.
+- **최신성 반영**: 2025~2026년 최신 트렌드와 미래 전망을 반영하여 답변할 것.
+- 형식: HTML <details><summary>질문</summary>답변</details> 구조 사용.
+- 마지막 태그: <h2>자주 묻는 질문</h2> 으로 시작할 것.
+- 답변에도 핵심 키워드를 포함할 것.
+- 출력: 순수 HTML (마크다운 ``` 사용 금지).
+""".strip()
+
+# 단일 호출은 세 단계의 출력을 한 번에 만들므로 그 단계 규칙까지 고정 접미어에 포함
+SINGLE_CALL_RULES = "\n\n".join(["""
+[단계: 전체 본문 한 번에 작성 (구분자 HTML)]
+서론, 사용자가 주는 [섹션 목록]의 모든 섹션, FAQ를 한 번의 응답으로 순서대로 작성하세요.
+각 파트는 아래 구분자를 **단독 줄**에 쓰고 바로 다음 줄부터 그 파트의 HTML을 시작합니다. (구분자는 프로그램이 자르는 데 쓰므로 정확히 지킬 것)
+<<<INTRO>>>
+(서론 HTML)
+<<<SECTION:1>>>
+(1번 섹션 HTML - H2로 시작)
+... (섹션 목록의 번호와 순서 그대로, 빠짐없이)
+<<<FAQ>>>
+(FAQ HTML)
+<<<END>>>
+- 구분자 줄에는 구분자만 쓰고, 섹션 제목은 다음 줄의 H2 태그에 쓸 것.
+- 구분자 외의 설명이나 마크다운 코드 블록(```)을 쓰지 말 것.
+- 각 섹션의 외부/내부 링크는 섹션 목록에서 그 섹션에 주어진 것만 사용할 것.
+- 아래 단계별 규칙은 각 파트에 그대로 적용됩니다.
+""".strip(), INTRO_RULES, SECTION_RULES, FAQ_RULES])
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 쓰는 보수적인 토큰 수 추정치입니다. (UTF-8 4바이트당 1토큰, 한국어는 실제보다 적게 나옴)"""
+    return len(text.encode("utf-8")) // 4
+
+def system_prompt(rules: str) -> str:
+    """공통 원칙 뒤에 단계 규칙을 붙인 system 블록입니다. (같은 단계면 호출마다 바이트 단위로 동일)"""
+    return f"{BASE_SYSTEM_PROMPT}\n\n{rules}"
+
+def _messages(rules: str, tail: str) -> List[Dict[str, str]]:
+    """단계별 고정 system 블록과 가변 user 꼬리로 메시지를 만듭니다."""
+    return [
+        {"role": "system", "content": system_prompt(rules)},
+        {"role": "user", "content": tail.strip()},
+    ]
+
+def outline_messages(topic: str) -> List[Dict[str, str]]:
+    return _messages(OUTLINE_RULES, f"주제: {topic}")
+
+def image_metadata_messages(topic: str, keyword: str, sections: list) -> List[Dict[str, str]]:
+    return _messages(IMAGE_METADATA_RULES, f"""
+주제: {topic}
+핵심 키워드: {keyword}
+섹션 목차: {", ".join(sections)}
+""")
+
+def intro_messages(topic: str, keyword: str) -> List[Dict[str, str]]:
+    return _messages(INTRO_RULES, f"""
+주제: {topic}
+핵심 키워드: {keyword}
+""")
+
+def _link_instructions(internal_link: Optional[Dict[str, Any]], external_link_hint: Any):
+    """섹션별 (외부 링크, 내부 링크) 지시문을 만듭니다."""
+    if internal_link:
+        internal = f"- 제목: {internal_link['title']}\n- URL: {internal_link['link']}"
+    else:
+        internal = "없음"
+
+    if isinstance(external_link_hint, dict):
+        external = (
+            f"- 출처: {external_link_hint['name']} (필수)\n"
+            f"- URL: {external_link_hint['url']}\n"
+            f"- 형식: <strong><a href=\"{external_link_hint['url']}\" target=\"_blank\">[{external_link_hint['name']} 바로가기]</a></strong>"
+        )
+    elif external_link_hint:
+        external = (
+            f"- 권장 출처: {external_link_hint}\n"
+            f"- 해당 주제와 관련된 구체적인 페이지를 찾아 링크를 거세요. (예: '{external_link_hint}' 검색 결과 또는 메인 페이지)"
+        )
+    else:
+        external = "없음"
+    return external, internal
+
+def section_messages(topic: str, section_title: str, keyword: str,
+                     internal_link: Optional[Dict[str, Any]] = None, external_link_hint: Any = None) -> List[Dict[str, str]]:
+    """
+    섹션 프롬프트의 가변 꼬리입니다. 링크 지시문은 섹션마다 달라지므로 규칙 블록이 아니라 여기에 둡니다.
+    external_link_hint: 레지스트리 출처 dict({'name', 'url'}) 또는 출처 이름 문자열
+    """
+    external, internal = _link_instructions(internal_link, external_link_hint)
+    return _messages(SECTION_RULES, f"""
+주제: {topic}
+섹션 제목: {section_title}
+핵심 키워드: {keyword}
+
+[외부 링크]
+{external}
+
+[내부 링크]
+{internal}
+""")
+
+def single_call_messages(topic: str, keyword: str, section_jobs: list) -> List[Dict[str, str]]:
+    """
+    서론/전체 섹션/FAQ를 한 번에 생성하는 프롬프트의 가변 꼬리입니다.
+
+    Args:
+        section_jobs (list): [(섹션 제목, 내부 링크 리스트, 외부 링크 힌트), ...] (개요 순서)
+    """
+    blocks = []
+    for idx, (section_title, internal_links, external_link_hint) in enumerate(section_jobs):
+        external, internal = _link_instructions(internal_links[0] if internal_links else None, external_link_hint)
+        blocks.append(f"<<<SECTION:{idx + 1}>>> {section_title}\n[외부 링크]\n{external}\n[내부 링크]\n{internal}")
+    sections = "\n\n".join(blocks)
+    return _messages(SINGLE_CALL_RULES, f"""
+주제: {topic}
+핵심 키워드: {keyword}
+섹션 수: {len(section_jobs)}
+
+[섹션 목록]
+{sections}
+""")
+
+def faq_messages(topic: str, keyword: str) -> List[Dict[str, str]]:
+    return _messages(FAQ_RULES, f"""
+주제: {topic}
+핵심 키워드: {keyword}
+""")
+
+def structured_repair_message(problems: List[str], request: str) -> Dict[str, str]:
+    """
+    구조화 출력 검증에 실패한 부분만 다시 요청하는 user 메시지입니다.
+    원래 메시지와 직전 응답(assistant) 뒤에 붙여 system 블록을 그대로 재사용합니다.
+    """
+    listed = "\n".join(f"- {problem}" for problem in problems)
+    return {"role": "user", "content": f"""
+직전 응답에서 아래 항목이 조건을 지키지 않았습니다.
+{listed}
+
+{request} 위 규칙을 지켜 해당 항목만 JSON으로 다시 작성하세요.
+""".strip()}
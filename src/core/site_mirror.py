@@ -0,0 +1,384 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List
+from src.config.settings import Config
+from src.utils.logger import get_logger
+
+logger = get_logger("SiteMirror")
+
+PER_PAGE = 100
+
+# 리소스별 조회 필드 (_fields 프로젝션으로 필요한 값만 수신)
+POST_FIELDS = "id,slug,status,title,link,date_gmt,modified,modified_gmt,featured_media,categories,tags,meta,content"
+MEDIA_FIELDS = "id,slug,title,source_url,mime_type,alt_text,post,modified,modified_gmt"
+TAG_FIELDS = "id,name,slug,count"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY,
+    slug TEXT,
+    status TEXT,
+    title TEXT,
+    link TEXT,
+    date_gmt TEXT,
+    modified_gmt TEXT,
+    featured_media INTEGER,
+    categories TEXT,
+    tags TEXT,
+    meta TEXT,
+    content TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_posts_slug ON posts(slug);
+CREATE INDEX IF NOT EXISTS idx_posts_status_date ON posts(status, date_gmt);
+CREATE TABLE IF NOT EXISTS media (
+    id INTEGER PRIMARY KEY,
+    slug TEXT,
+    title TEXT,
+    source_url TEXT,
+    mime_type TEXT,
+    alt_text TEXT,
+    post INTEGER,
+    modified_gmt TEXT
+);
+CREATE TABLE IF NOT EXISTS tags (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    slug TEXT,
+    count INTEGER
+);
+CREATE TABLE IF NOT EXISTS post_edit_state (
+    id INTEGER PRIMARY KEY,
+    modified_gmt TEXT,
+    data TEXT
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    resource TEXT PRIMARY KEY,
+    cursor TEXT,
+    synced_at TEXT
+);
+"""
+
+def _rendered(value) -> str:
+    """REST 응답의 {'rendered': ...} 필드를 문자열로 변환합니다."""
+    if isinstance(value, dict):
+        return value.get("rendered", value.get("raw", ""))
+    return value or ""
+
+class SiteMirror:
+    """
+    워드프레스 사이트(포스트/미디어/태그)의 로컬 SQLite 미러입니다.
+    매번 사이트 전체를 내려받는 대신, 마지막 동기화 이후 수정된 항목만(modified_after 커서) 받아서 반영합니다.
+    내부 링크 선택, 발행 검증, 복구 작업은 라이브 사이트 대신 이 미러를 조회합니다.
+    """
+
+    def __init__(self, client, db_path: str = None):
+        self.client = client
+        self.db_path = db_path or os.path.join(Config.CACHE_DIR, "site_mirror.sqlite3")
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self._lock:
+            self.conn.executescript(SCHEMA)
+        self.last_sync_requests = 0
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    # ------------------------------------------------------------------
+    # 동기화
+    # ------------------------------------------------------------------
+    def _get_cursor(self, resource: str) -> Optional[str]:
+        row = self.conn.execute("SELECT cursor FROM sync_state WHERE resource = ?", (resource,)).fetchone()
+        return row["cursor"] if row else None
+
+    def _set_cursor(self, resource: str, cursor: Optional[str]):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO sync_state (resource, cursor, synced_at) VALUES (?, ?, ?)",
+            (resource, cursor, time.strftime("%Y-%m-%dT%H:%M:%S"))
+        )
+
+    def _synced_at(self, resource: str) -> Optional[datetime]:
+        row = self.conn.execute("SELECT synced_at FROM sync_state WHERE resource = ?", (resource,)).fetchone()
+        return datetime.fromisoformat(row["synced_at"]) if row and row["synced_at"] else None
+
+    def _fetch_all(self, path: str, params: dict) -> List[Dict[str, Any]]:
+        """페이지 단위(100개)로 모든 결과를 가져옵니다."""
+        items = []
+        page = 1
+        total_pages = 1
+        while page <= total_pages:
+            query = dict(params, per_page=PER_PAGE, page=page)
+            response = self.client._request("GET", f"{self.client.base_url}/{path}", params=query)
+            self.last_sync_requests += 1
+            response.raise_for_status()
+            total_pages = int(response.headers.get("X-WP-TotalPages", 1) or 1)
+            items.extend(response.json())
+            page += 1
+        return items
+
+    @staticmethod
+    def _modified_params(cursor: Optional[str]) -> dict:
+        """
+        수정 시각 커서 이후 항목만 요청하는 파라미터를 만듭니다.
+        modified_after는 사이트 로컬 시각(modified)과 비교되므로 커서도 modified 값을 사용하며,
+        같은 초에 수정된 항목을 놓치지 않도록 1초 겹치게 조회합니다. (upsert라 중복 반영은 무해)
+        """
+        params = {"orderby": "modified", "order": "asc"}
+        if cursor:
+            overlap = datetime.fromisoformat(cursor) - timedelta(seconds=1)
+            params["modified_after"] = overlap.strftime("%Y-%m-%dT%H:%M:%S")
+        return params
+
+    def sync_posts(self, full: bool = False) -> int:
+        """
+        포스트를 증분 동기화합니다. (모든 상태: 발행/임시저장/예약 등 + 휴지통)
+        status=any는 휴지통을 제외하므로, 휴지통으로 옮겨진 글(이때 수정 시각이 갱신됨)은 따로 조회해 상태를 반영합니다.
+        """
+        with self._lock:
+            cursor = None if full else self._get_cursor("posts")
+            params = self._modified_params(cursor)
+            params["_fields"] = POST_FIELDS
+            posts = self._fetch_all("posts", dict(params, status="any"))
+            posts += self._fetch_all("posts", dict(params, status="trash"))
+            for p in posts:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO posts (id, slug, status, title, link, date_gmt, modified_gmt, "
+                    "featured_media, categories, tags, meta, content) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        p["id"], p.get("slug"), p.get("status"), _rendered(p.get("title")), p.get("link"),
+                        p.get("date_gmt"), p.get("modified_gmt"), p.get("featured_media") or 0,
+                        json.dumps(p.get("categories", [])), json.dumps(p.get("tags", [])),
+                        json.dumps(p.get("meta") or {}, ensure_ascii=False), _rendered(p.get("content"))
+                    )
+                )
+                if p.get("modified") and (cursor is None or p["modified"] > cursor):
+                    cursor = p["modified"]
+            self._set_cursor("posts", cursor)
+            self.conn.commit()
+            return len(posts)
+
+    def sync_media(self, full: bool = False) -> int:
+        """미디어 라이브러리를 증분 동기화합니다."""
+        with self._lock:
+            cursor = None if full else self._get_cursor("media")
+            params = self._modified_params(cursor)
+            params["_fields"] = MEDIA_FIELDS
+            media = self._fetch_all("media", params)
+            for m in media:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO media (id, slug, title, source_url, mime_type, alt_text, post, modified_gmt) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        m["id"], m.get("slug"), _rendered(m.get("title")), m.get("source_url"),
+                        m.get("mime_type"), m.get("alt_text"), m.get("post"), m.get("modified_gmt")
+                    )
+                )
+                if m.get("modified") and (cursor is None or m["modified"] > cursor):
+                    cursor = m["modified"]
+            self._set_cursor("media", cursor)
+            self.conn.commit()
+            return len(media)
+
+    def sync_tags(self, full: bool = False) -> int:
+        """
+        태그를 동기화합니다. 태그에는 수정 시각이 없으므로 ID 내림차순으로 조회하며
+        지난 동기화에서 본 최대 ID(커서)에 도달하면 멈춥니다. (새 태그만 받음)
+        기존 태그의 이름 변경/글 수 변화/삭제는 증분으로 알 수 없으므로 TAG_FULL_REFRESH_HOURS마다
+        (또는 full=True면) 전체를 다시 받아 덮어쓰고 사이트에서 사라진 태그를 지웁니다.
+        """
+        with self._lock:
+            cursor = self._get_cursor("tags")
+            full = full or not cursor  # 첫 동기화는 전체 수집
+            if not full and Config.TAG_FULL_REFRESH_HOURS > 0:
+                last_full = self._synced_at("tags_full")
+                if last_full is None or datetime.now() - last_full >= timedelta(hours=Config.TAG_FULL_REFRESH_HOURS):
+                    logger.info("태그 미러 전체 재수집 주기 도래 -> 전체 동기화")
+                    full = True
+            known_max = 0 if full else int(cursor)
+
+            added = 0
+            seen_max = known_max
+            seen_ids = []
+            page = 1
+            total_pages = 1
+            while page <= total_pages:
+                query = {"per_page": PER_PAGE, "page": page, "orderby": "id", "order": "desc", "_fields": TAG_FIELDS}
+                response = self.client._request("GET", f"{self.client.base_url}/tags", params=query)
+                self.last_sync_requests += 1
+                response.raise_for_status()
+                total_pages = int(response.headers.get("X-WP-TotalPages", 1) or 1)
+                reached_known = False
+                for t in response.json():
+                    if t["id"] <= known_max:
+                        reached_known = True
+                        break
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO tags (id, name, slug, count) VALUES (?, ?, ?, ?)",
+                        (t["id"], t.get("name"), t.get("slug"), t.get("count", 0))
+                    )
+                    seen_max = max(seen_max, t["id"])
+                    seen_ids.append(t["id"])
+                    added += 1
+                if reached_known:
+                    break
+                page += 1
+            if full:
+                # 전체를 끝까지 받았을 때만 사이트에서 사라진 태그를 정리
+                self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS seen_tags (id INTEGER PRIMARY KEY)")
+                self.conn.execute("DELETE FROM seen_tags")
+                self.conn.executemany("INSERT OR IGNORE INTO seen_tags (id) VALUES (?)", [(i,) for i in seen_ids])
+                self.conn.execute("DELETE FROM tags WHERE id NOT IN (SELECT id FROM seen_tags)")
+                self._set_cursor("tags_full", None)
+            # 다음 동기화는 이번에 본 가장 큰 ID 이후만 조회
+            self._set_cursor("tags", str(seen_max))
+            self.conn.commit()
+            return added
+
+    def sync(self, resources: tuple = ("posts", "media", "tags"), full: bool = False) -> Dict[str, int]:
+        """
+        지정한 리소스를 증분 동기화합니다. 변경이 없으면 리소스당 1회(포스트는 휴지통 포함 2회) 요청으로 끝납니다.
+        리소스별 실패는 로그만 남기고 0으로 보고합니다. (실패를 알아야 하는 호출 측은 sync_posts 등을 직접 호출)
+
+        Returns:
+            Dict[str, int]: 리소스별 반영된 항목 수
+        """
+        handlers = {"posts": self.sync_posts, "media": self.sync_media, "tags": self.sync_tags}
+        self.last_sync_requests = 0
+        result = {}
+        for resource in resources:
+            try:
+                result[resource] = handlers[resource](full=full)
+            except Exception as e:
+                logger.error(f"미러 동기화 실패 ({resource}): {e}")
+                result[resource] = 0
+        logger.info(f"미러 동기화 완료: {result} (HTTP 요청 {self.last_sync_requests}회)")
+        return result
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _post_row(row) -> Dict[str, Any]:
+        post = dict(row)
+        post["categories"] = json.loads(post["categories"] or "[]")
+        post["tags"] = json.loads(post["tags"] or "[]")
+        post["meta"] = json.loads(post["meta"] or "{}")
+        return post
+
+    def recent_posts(self, count: int = 5, status: str = "publish") -> list:
+        """
+        최신 포스트 목록을 반환합니다. (WordPressClient.get_recent_posts와 같은 형식)
+
+        Returns:
+            list: [{'id': int, 'title': str, 'link': str}, ...]
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT id, title, link FROM posts WHERE status = ? ORDER BY date_gmt DESC, id DESC LIMIT ?",
+                (status, count)
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def get_post(self, post_id: int) -> Optional[Dict[str, Any]]:
+        """미러에 저장된 포스트 1건을 반환합니다. (title/content는 렌더링된 문자열)"""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM posts WHERE id = ?", (post_id,)).fetchone()
+        return self._post_row(row) if row else None
+
+    def find_post_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        """슬러그로 포스트를 찾습니다. (휴지통 제외, 가장 최근 수정본 우선)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT * FROM posts WHERE slug = ? AND status != 'trash' ORDER BY modified_gmt DESC LIMIT 1",
+                (slug,)
+            ).fetchone()
+        return self._post_row(row) if row else None
+
+    def find_post_by_meta(self, key: str, value: str) -> Optional[Dict[str, Any]]:
+        """메타 값으로 포스트를 찾습니다. (REST에 노출되도록 등록된 메타만 미러에 저장됨)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT * FROM posts WHERE json_extract(meta, ?) = ? AND status != 'trash' "
+                "ORDER BY modified_gmt DESC LIMIT 1",
+                (f'$."{key}"', value)
+            ).fetchone()
+        return self._post_row(row) if row else None
+
+    def set_post_status(self, post_id: int, status: str):
+        """라이브 확인으로 알게 된 포스트 상태(휴지통 이동 등)를 다음 동기화 전에 미리 반영합니다."""
+        with self._lock:
+            self.conn.execute("UPDATE posts SET status = ? WHERE id = ?", (status, post_id))
+            self.conn.commit()
+
+    def forget_post(self, post_id: int):
+        """사이트에서 완전히 삭제된 포스트를 미러와 편집 상태 캐시에서 지웁니다."""
+        with self._lock:
+            self.conn.execute("DELETE FROM posts WHERE id = ?", (post_id,))
+            self.conn.execute("DELETE FROM post_edit_state WHERE id = ?", (post_id,))
+            self.conn.commit()
+
+    def get_edit_state(self, post_id: int) -> Optional[Dict[str, Any]]:
+        """
+        마지막으로 확인한 포스트의 편집 상태(raw title/content 등)를 반환합니다. (최소 변경 수정용 캐시)
+
+        Returns:
+            Optional[Dict[str, Any]]: {'modified_gmt': str, 'data': dict} 또는 None
+        """
+        with self._lock:
+            row = self.conn.execute("SELECT modified_gmt, data FROM post_edit_state WHERE id = ?", (post_id,)).fetchone()
+        if not row:
+            return None
+        return {"modified_gmt": row["modified_gmt"], "data": json.loads(row["data"])}
+
+    def save_edit_state(self, post_id: int, modified_gmt: str, data: Dict[str, Any]):
+        """포스트 편집 상태 캐시를 갱신합니다."""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO post_edit_state (id, modified_gmt, data) VALUES (?, ?, ?)",
+                (post_id, modified_gmt, json.dumps(data, ensure_ascii=False))
+            )
+            self.conn.commit()
+
+    def get_media(self, media_id: int) -> Optional[Dict[str, Any]]:
+        """미러에 저장된 미디어 1건을 반환합니다."""
+        with self._lock:
+            row = self.conn.execute("SELECT * FROM media WHERE id = ?", (media_id,)).fetchone()
+        return dict(row) if row else None
+
+    def find_media(self, file_prefix: str = None, post_id: int = None, limit: int = 100) -> list:
+        """
+        미디어를 조회합니다. file_prefix를 주면 파일명이 해당 접두어(보통 포스트 슬러그)로 시작하는 항목만 찾습니다.
+        limit=-1이면 개수 제한 없이 조회합니다.
+
+        Returns:
+            list: [{'id': int, 'source_url': str, 'alt_text': str, ...}, ...] (ID 오름차순)
+        """
+        query = "SELECT * FROM media WHERE 1 = 1"
+        params = []
+        if file_prefix:
+            query += " AND source_url LIKE ?"
+            params.append(f"%/{file_prefix}%")
+        if post_id is not None:
+            query += " AND post = ?"
+            params.append(post_id)
+        query += " ORDER BY id ASC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self.conn.execute(query, params).fetchall()
+        return [dict(r) for r in rows]
+
+    def tag_names(self, tag_ids: list) -> list:
+        """태그 ID 리스트를 이름 리스트로 변환합니다."""
+        if not tag_ids:
+            return []
+        placeholders = ",".join("?" for _ in tag_ids)
+        with self._lock:
+            rows = self.conn.execute(f"SELECT id, name FROM tags WHERE id IN ({placeholders})", list(tag_ids)).fetchall()
+        names = {r["id"]: r["name"] for r in rows}
+        return [names[i] for i in tag_ids if i in names]
@@ -0,0 +1,134 @@
+import copy
+import json
+import re
+from typing import Annotated, Dict, Any, List, Literal, Tuple, Type
+from pydantic import AfterValidator, BaseModel, Field, ValidationError, create_model
+
+# ==============================================================================
+# 구조화 출력 (JSON Schema strict 모드) 모델
+# 스키마로 형식(키/타입)을 보장받고, 내용 규칙(길이/개수/형식)은 validator로 검사합니다.
+# 규칙을 어긴 필드만 골라 다시 요청할 수 있도록 필드 단위로 검증합니다.
+# ==============================================================================
+
+SLUG_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+
+def _not_empty(value: str) -> str:
+    value = value.strip()
+    if not value:
+        raise ValueError("빈 값")
+    return value
+
+def _focus_keyword(value: str) -> str:
+    value = _not_empty(value)
+    if len(value.split()) > 3:
+        raise ValueError("3단어 초과")
+    return value
+
+def _slug(value: str) -> str:
+    value = value.strip().lower()
+    if not SLUG_PATTERN.match(value) or len(value) > 75:
+        raise ValueError("영문 소문자/숫자/하이픈 75자 이내가 아님")
+    return value
+
+def _strip_items(value: List[str]) -> List[str]:
+    return [v.strip() for v in value if v and v.strip()]
+
+# 개요 본론 소제목 개수 범위
+MIN_SECTIONS = 6
+MAX_SECTIONS = 8
+
+def _sections(value: List[str]) -> List[str]:
+    value = _strip_items(value)
+    if not MIN_SECTIONS <= len(value) <= MAX_SECTIONS:
+        raise ValueError(f"소제목 {len(value)}개 ({MIN_SECTIONS}~{MAX_SECTIONS}개 필요)")
+    return value
+
+# 필드 규칙을 타입에 붙여 두면 일부 필드만 뽑은 모델(subset_model)에도 그대로 적용됨
+NonEmptyStr = Annotated[str, AfterValidator(_not_empty)]
+
+class OutlineModel(BaseModel):
+    focus_keyword: Annotated[str, AfterValidator(_focus_keyword)] = Field(description="검색어 1~2단어 (최대 3단어)")
+    title: NonEmptyStr = Field(description="핵심 키워드와 2026을 포함한 제목")
+    slug: Annotated[str, AfterValidator(_slug)] = Field(description="영문 소문자 hyphen-style 슬러그 (75자 이내)")
+    description: NonEmptyStr = Field(description="focus_keyword로 시작하는 160자 이내 메타 설명")
+    sections: Annotated[List[str], AfterValidator(_sections)] = Field(description="본론 H2 소제목 6~8개")
+    related_keywords: Annotated[List[str], AfterValidator(_strip_items)] = Field(description="연관 키워드(LSI) 8개")
+
+class ImageMetaModel(BaseModel):
+    type: Literal["featured", "body"] = Field(description="첫 장은 featured, 나머지는 body")
+    prompt: NonEmptyStr = Field(description="DALL-E 3용 영어 프롬프트")
+    alt: NonEmptyStr = Field(description="핵심 키워드를 포함한 한글 대체 텍스트")
+    caption: NonEmptyStr = Field(description="핵심 키워드를 포함한 20자 이내 한글 캡션")
+
+class ImageMetadataModel(BaseModel):
+    images: List[ImageMetaModel] = Field(description="이미지 4장 (featured 1 + body 3)")
+
+def strict_json_schema(model_cls: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    pydantic 모델의 JSON Schema를 OpenAI strict 모드 규칙에 맞게 바꿉니다.
+    (모든 속성 required, additionalProperties=false, $ref 인라인, 지원하지 않는 title/default 제거)
+    """
+    schema = model_cls.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def convert(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return convert(copy.deepcopy(defs[node["$ref"].split("/")[-1]]))
+            properties = node.get("properties")
+            node = {k: convert(v) for k, v in node.items() if k not in ("title", "default", "properties")}
+            if properties is not None:
+                # properties의 키는 필드 이름이므로 'title' 같은 필드가 지워지지 않게 값만 변환
+                node["properties"] = {name: convert(prop) for name, prop in properties.items()}
+            if node.get("type") == "object":
+                node["additionalProperties"] = False
+                node["required"] = list(node.get("properties", {}))
+            return node
+        if isinstance(node, list):
+            return [convert(item) for item in node]
+        return node
+
+    return convert(schema)
+
+def response_format_for(model_cls: Type[BaseModel], name: str) -> Dict[str, Any]:
+    """chat.completions의 response_format (json_schema, strict)"""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "strict": True, "schema": strict_json_schema(model_cls)},
+    }
+
+def subset_model(model_cls: Type[BaseModel], fields: List[str]) -> Type[BaseModel]:
+    """일부 필드만 가진 모델을 만듭니다. (실패한 필드만 다시 요청할 때의 스키마/검증용)"""
+    definitions = {name: (info.annotation, info) for name, info in model_cls.model_fields.items() if name in fields}
+    return create_model(f"{model_cls.__name__}Repair", **definitions)
+
+def parse_json(content: str) -> Dict[str, Any]:
+    """응답 본문을 JSON 객체로 파싱합니다. (코드 펜스가 섞여 와도 처리)"""
+    text = (content or "").replace("```json", "").replace("```", "").strip()
+    data = json.loads(text)
+    if not isinstance(data, dict):
+        raise ValueError("JSON 객체가 아님")
+    return data
+
+def validate_fields(model_cls: Type[BaseModel], data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    데이터를 필드 단위로 검증합니다.
+
+    Returns:
+        (통과한 필드 값 dict, 실패한 필드 -> 사유 dict)
+    """
+    try:
+        return model_cls.model_validate(data).model_dump(), {}
+    except ValidationError as e:
+        failed: Dict[str, str] = {}
+        for error in e.errors():
+            field = str(error["loc"][0]) if error["loc"] else "__root__"
+            failed.setdefault(field, error["msg"])
+
+    valid = {}
+    for name in model_cls.model_fields:
+        if name in failed:
+            continue
+        # 통과한 필드는 해당 필드만 가진 모델로 다시 검증해 정규화된 값을 얻음
+        valid.update(subset_model(model_cls, [name]).model_validate({name: data[name]}).model_dump())
+    return valid, failed
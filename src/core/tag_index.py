@@ -0,0 +1,217 @@
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Any, Optional
+from urllib.parse import unquote
+from src.config.settings import Config
+from src.utils.logger import get_logger
+
+logger = get_logger("TagIndex")
+
+PER_PAGE = 100
+
+def normalize_tag_name(name: str) -> str:
+    """대소문자/공백 차이를 무시하기 위한 태그 이름 정규화 키를 만듭니다."""
+    return " ".join(name.split()).lower()
+
+def tag_slug(name: str) -> str:
+    """
+    워드프레스 sanitize_title과 비슷한 규칙으로 슬러그를 만듭니다. (비교용, 디코딩된 형태)
+    예: "AI 수익화" -> "ai-수익화", "K-패스(K-Pass)" -> "k-패스k-pass"
+    """
+    slug = re.sub(r"[^\w\s-]", "", name.strip().lower())
+    slug = re.sub(r"[\s_]+", "-", slug)
+    return re.sub(r"-{2,}", "-", slug).strip("-")
+
+class TagIndex:
+    """
+    사이트의 전체 태그를 로컬에 보관하여, 태그 이름을 네트워크 요청 없이 ID로 변환하는 인덱스입니다.
+    - 최초 1회: /tags?per_page=100 페이지 단위로 전체 로드 후 파일에 저장
+    - 이후: 저장된 인덱스로 로컬 매칭 (대소문자 무시 + 슬러그 비교)
+    - 미등록 이름이 있을 때만 증분 갱신(새로 생긴 태그만 조회) 후, 그래도 없으면 생성
+    """
+
+    def __init__(self, client, path: str = None):
+        self.client = client
+        self.path = path or os.path.join(Config.CACHE_DIR, "tag_index.json")
+        self.tags = {}  # {id: {'id': int, 'name': str, 'slug': str}}
+        self._by_name = {}
+        self._by_slug = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    @property
+    def max_id(self) -> int:
+        return max(self.tags) if self.tags else 0
+
+    def _add(self, tag: Dict[str, Any]):
+        tag = {"id": int(tag["id"]), "name": tag.get("name", ""), "slug": tag.get("slug", "")}
+        self.tags[tag["id"]] = tag
+        self._by_name[normalize_tag_name(tag["name"])] = tag["id"]
+        if tag["slug"]:
+            # 한글 슬러그는 퍼센트 인코딩되어 내려오므로 디코딩해서 비교
+            self._by_slug[unquote(tag["slug"]).lower()] = tag["id"]
+
+    def _reset(self):
+        self.tags = {}
+        self._by_name = {}
+        self._by_slug = {}
+
+    def load(self):
+        """저장된 인덱스를 읽고, 없으면 사이트에서 전체 로드합니다."""
+        with self._lock:
+            if self._loaded:
+                return
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    for tag in data.get("tags", []):
+                        self._add(tag)
+                    self._loaded = True
+                    logger.info(f"태그 인덱스 로드: {len(self.tags)}개 ({self.path})")
+                    return
+                except Exception as e:
+                    logger.warning(f"태그 인덱스 파일 읽기 실패, 전체 로드로 대체: {e}")
+                    self._reset()
+            self.full_reload()
+
+    def save(self):
+        """인덱스를 파일로 저장합니다."""
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({
+                        "synced_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                        "tags": sorted(self.tags.values(), key=lambda t: t["id"])
+                    }, f, ensure_ascii=False, indent=1)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                logger.error(f"태그 인덱스 저장 실패: {e}")
+
+    def _fetch_page(self, page: int, params: dict = None):
+        query = {"per_page": PER_PAGE, "page": page, "_fields": "id,name,slug"}
+        if params:
+            query.update(params)
+        response = self.client._request("GET", f"{self.client.base_url}/tags", params=query)
+        response.raise_for_status()
+        total_pages = int(response.headers.get("X-WP-TotalPages", 1) or 1)
+        return response.json(), total_pages
+
+    def full_reload(self):
+        """사이트의 모든 태그를 페이지 단위(100개)로 다시 받아 인덱스를 재구성합니다."""
+        with self._lock:
+            self._reset()
+            page = 1
+            total_pages = 1
+            while page <= total_pages:
+                tags, total_pages = self._fetch_page(page)
+                for tag in tags:
+                    self._add(tag)
+                page += 1
+            self._loaded = True
+            logger.info(f"태그 전체 로드 완료: {len(self.tags)}개 ({total_pages}페이지)")
+            self.save()
+
+    def refresh(self) -> int:
+        """
+        증분 갱신: ID 내림차순으로 조회하며 이미 알고 있는 ID에 도달하면 멈춥니다.
+        (태그에는 수정 시각 필드가 없으므로 새로 생성된 태그만 반영됩니다. 이름 변경/삭제는 full_reload 사용)
+
+        Returns:
+            int: 새로 추가된 태그 수
+        """
+        with self._lock:
+            known_max = self.max_id
+            added = 0
+            page = 1
+            total_pages = 1
+            while page <= total_pages:
+                tags, total_pages = self._fetch_page(page, {"orderby": "id", "order": "desc"})
+                reached_known = False
+                for tag in tags:
+                    if int(tag["id"]) <= known_max:
+                        reached_known = True
+                        break
+                    self._add(tag)
+                    added += 1
+                if reached_known:
+                    break
+                page += 1
+            if added:
+                logger.info(f"태그 인덱스 증분 갱신: {added}개 추가")
+                self.save()
+            return added
+
+    def lookup(self, name: str) -> Optional[int]:
+        """이름(대소문자 무시) 또는 슬러그로 태그 ID를 찾습니다. 없으면 None."""
+        tag_id = self._by_name.get(normalize_tag_name(name))
+        if tag_id is None:
+            tag_id = self._by_slug.get(tag_slug(name))
+        return tag_id
+
+    def remember(self, tag: Dict[str, Any]):
+        """다른 경로(배치 쓰기 등)로 생성된 태그를 인덱스에 반영합니다. 아직 로드 전이면 무시합니다."""
+        with self._lock:
+            if not self._loaded:
+                return
+            self._add(tag)
+            self.save()
+
+    def _create(self, name: str) -> Optional[int]:
+        """태그를 생성합니다. 이미 존재한다는 응답(term_exists)이면 기존 ID를 사용합니다."""
+        try:
+            response = self.client._request("POST", f"{self.client.base_url}/tags", json={"name": name})
+            if response.status_code == 400:
+                error = response.json()
+                if error.get("code") == "term_exists":
+                    term_id = error.get("data", {}).get("term_id")
+                    if term_id:
+                        self._add({"id": term_id, "name": name, "slug": ""})
+                        return int(term_id)
+            response.raise_for_status()
+            new_tag = response.json()
+            self._add(new_tag)
+            logger.info(f"새 태그 생성: {name} (ID: {new_tag['id']})")
+            return int(new_tag["id"])
+        except Exception as e:
+            logger.error(f"태그 처리 실패 ({name}): {e}")
+            return None
+
+    def get_or_create(self, tag_names: list) -> list:
+        """
+        태그 이름 리스트를 ID 리스트로 변환합니다. (입력 순서 유지, 실패한 이름은 제외)
+        로컬 인덱스에서 먼저 찾고, 미등록 이름이 있을 때만 증분 갱신 → 생성 순으로 네트워크를 사용합니다.
+        """
+        if not tag_names:
+            return []
+
+        with self._lock:
+            self.load()
+
+            missing = [n for n in tag_names if self.lookup(n) is None]
+            if missing:
+                try:
+                    self.refresh()
+                except Exception as e:
+                    logger.warning(f"태그 인덱스 증분 갱신 실패: {e}")
+
+            created = 0
+            tag_ids = []
+            for name in tag_names:
+                tag_id = self.lookup(name)
+                if tag_id is None:
+                    tag_id = self._create(name)
+                    if tag_id is not None:
+                        created += 1
+                if tag_id is not None:
+                    tag_ids.append(tag_id)
+
+            if created:
+                self.save()
+            logger.info(f"태그 변환 완료: {len(tag_ids)}/{len(tag_names)}개 (로컬 {len(tag_names) - len(missing)}개, 신규 생성 {created}개)")
+            return tag_ids
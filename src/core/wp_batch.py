@@ -0,0 +1,182 @@
+from typing import Dict, Any, List
+from src.config.settings import Config
+from src.utils.logger import get_logger
+
+logger = get_logger("WP_Batch")
+
+# batch/v1 라우트가 허용하지 않는 하위 요청에 대한 에러 코드
+BATCH_NOT_ALLOWED = "rest_batch_not_allowed"
+
+# 배치가 처리되지 않았음이 확실한 응답 (상태 코드, 에러 코드) -> 개별 요청으로 전환해도 중복 반영 위험 없음
+BATCH_REJECTED = {
+    (404, "rest_no_route"),  # batch/v1 미지원 (WP 5.6 미만, REST 라우트 차단)
+    (400, BATCH_NOT_ALLOWED),
+    (400, "rest_batch_max_requests"),  # 사이트 필터로 요청당 작업 수가 더 작게 제한된 경우
+}
+
+class BatchWriter:
+    """
+    워드프레스 REST 배치 엔드포인트(/wp-json/batch/v1, WP 5.6+)를 이용한 쓰기 큐입니다.
+    포스트 생성/수정, 태그 생성, 메타 수정을 모아 두었다가 flush() 시 최대 25개씩 한 번에 전송합니다.
+    배치가 처리되지 않았음이 확실한 경우(라우트 미지원, 허용되지 않은 작업, 작업 수 초과)에만 개별 요청으로 전환합니다.
+    5xx/타임아웃/연결 오류처럼 서버 반영 여부를 알 수 없는 실패는 재전송하지 않고 unknown=True로 돌려주므로
+    (생성 작업이 두 번 반영되는 것을 막기 위해) 호출 측에서 사이트 상태를 확인한 뒤 처리해야 합니다.
+
+    각 작업의 결과는 큐에 넣은 순서대로 반환됩니다:
+        {'index': int, 'method': str, 'path': str, 'status': int, 'ok': bool,
+         'id': Optional[int], 'body': dict, 'fallback': bool, 'unknown': bool}
+    """
+
+    def __init__(self, client, batch_size: int = None):
+        self.client = client
+        self.batch_size = min(batch_size or Config.WP_BATCH_SIZE, 25)
+        self.queue = []
+        self.results = []
+        self.http_requests = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        return False
+
+    def _enqueue(self, method: str, path: str, body: dict) -> int:
+        self.queue.append({"method": method, "path": path, "body": body})
+        return len(self.queue) - 1
+
+    def create_post(self, title: str, content: str, status: str = "draft",
+                    categories: list = None, tags: list = None, featured_media_id: int = None,
+                    meta_input: dict = None, slug: str = None) -> int:
+        """포스트 생성을 큐에 넣고 결과 인덱스를 반환합니다. (인자는 WordPressClient.create_post와 동일)"""
+        data = self.client.build_post_data(title, content, status, categories, tags, featured_media_id, meta_input, slug)
+        return self._enqueue("POST", "/wp/v2/posts", data)
+
+    def update_post(self, post_id: int, data: dict) -> int:
+        """포스트 수정을 큐에 넣고 결과 인덱스를 반환합니다."""
+        return self._enqueue("POST", f"/wp/v2/posts/{post_id}", data)
+
+    def update_meta(self, post_id: int, meta: dict) -> int:
+        """포스트 메타(Rank Math 필드 등)만 수정하는 작업을 큐에 넣습니다."""
+        return self._enqueue("POST", f"/wp/v2/posts/{post_id}", {"meta": meta})
+
+    def create_tag(self, name: str) -> int:
+        """태그 생성을 큐에 넣고 결과 인덱스를 반환합니다."""
+        return self._enqueue("POST", "/wp/v2/tags", {"name": name})
+
+    def _result(self, index: int, item: dict, status: int, body: Any, fallback: bool,
+                unknown: bool = False) -> Dict[str, Any]:
+        body = body if isinstance(body, dict) else {"data": body}
+        result_id = body.get("id")
+        # 이미 존재하는 태그는 기존 ID로 성공 처리
+        if body.get("code") == "term_exists":
+            result_id = body.get("data", {}).get("term_id")
+        return {
+            "index": index,
+            "method": item["method"],
+            "path": item["path"],
+            "status": status,
+            "ok": not unknown and (200 <= status < 300 or result_id is not None),
+            "id": result_id,
+            "body": body,
+            "fallback": fallback,
+            "unknown": unknown,
+        }
+
+    def _send_single(self, index: int, item: dict) -> Dict[str, Any]:
+        """배치로 처리할 수 없는 작업을 개별 요청으로 보냅니다."""
+        self.http_requests += 1
+        try:
+            response = self.client._request(item["method"], f"{self.client.root_url}{item['path']}", json=item["body"])
+            try:
+                body = response.json()
+            except ValueError:
+                body = {"raw": response.text}
+            return self._result(index, item, response.status_code, body, fallback=True)
+        except Exception as e:
+            logger.error(f"개별 요청 실패 - 반영 여부 알 수 없음 ({item['method']} {item['path']}): {e}")
+            return self._result(index, item, 0, {"error": str(e)}, fallback=True, unknown=True)
+
+    def _unknown_results(self, start: int, chunk: List[dict], status: int, body: Any) -> List[Dict[str, Any]]:
+        """반영 여부를 알 수 없는 배치의 작업들을 재전송 없이 결과로 남깁니다."""
+        return [self._result(start + i, item, status, body, fallback=False, unknown=True) for i, item in enumerate(chunk)]
+
+    def _send_chunk(self, start: int, chunk: List[dict]) -> List[Dict[str, Any]]:
+        """최대 25개 작업을 batch/v1로 전송하고, 배치에서 거부된 작업만 개별 요청으로 다시 보냅니다."""
+        payload = {
+            "validation": "normal",
+            "requests": [
+                {"method": item["method"], "path": item["path"], "body": item["body"]}
+                for item in chunk
+            ],
+        }
+        self.http_requests += 1
+        # 429(처리 전 거부)만 재시도: 5xx는 하위 작업이 이미 반영됐을 수 있어 재전송하지 않음
+        response = self.client._request("POST", f"{self.client.root_url}/batch/v1", json=payload, retry_statuses={429})
+        try:
+            body = response.json()
+        except ValueError:
+            body = {"raw": response.text}
+        if response.status_code not in (200, 207):
+            code = body.get("code") if isinstance(body, dict) else None
+            if (response.status_code, code) in BATCH_REJECTED:
+                logger.warning(f"배치 거부 (Status {response.status_code}, {code}) -> 개별 요청으로 전환")
+                return [self._send_single(start + i, item) for i, item in enumerate(chunk)]
+            logger.error(
+                f"배치 요청 실패 (Status {response.status_code}) - 반영 여부를 알 수 없어 재전송하지 않음: "
+                f"작업 {start}~{start + len(chunk) - 1}"
+            )
+            return self._unknown_results(start, chunk, response.status_code, body)
+
+        responses = body.get("responses", []) if isinstance(body, dict) else []
+        results = []
+        for i, item in enumerate(chunk):
+            sub = responses[i] if i < len(responses) else {}
+            sub_body = sub.get("body", {})
+            if isinstance(sub_body, dict) and sub_body.get("code") == BATCH_NOT_ALLOWED:
+                results.append(self._send_single(start + i, item))
+            elif not sub:
+                logger.error(f"배치 응답에 작업 {start + i} 결과 없음 - 재전송하지 않음")
+                results.append(self._result(start + i, item, 0, {}, fallback=False, unknown=True))
+            else:
+                results.append(self._result(start + i, item, sub.get("status", 0), sub_body, fallback=False))
+        return results
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """
+        큐에 쌓인 작업을 배치 요청으로 전송합니다.
+
+        Returns:
+            list: 이번 flush에서 처리된 작업별 결과 (큐에 넣은 순서)
+        """
+        if not self.queue:
+            return []
+
+        queue, self.queue = self.queue, []
+        offset = len(self.results)
+        requests_before = self.http_requests
+        flushed = []
+        for start in range(0, len(queue), self.batch_size):
+            chunk = queue[start:start + self.batch_size]
+            try:
+                flushed.extend(self._send_chunk(offset + start, chunk))
+            except Exception as e:
+                # 타임아웃/연결 끊김: 서버가 이미 처리했을 수 있으므로 개별 재전송하지 않음
+                logger.error(f"배치 요청 실패 - 반영 여부를 알 수 없어 재전송하지 않음: {e}")
+                flushed.extend(self._unknown_results(offset + start, chunk, 0, {"error": str(e)}))
+
+        # 배치로 생성된 태그를 로컬 태그 인덱스에 반영
+        for result in flushed:
+            if result["ok"] and result["path"] == "/wp/v2/tags" and result["body"].get("name"):
+                self.client.tag_index.remember(result["body"])
+
+        self.results.extend(flushed)
+        success = sum(1 for r in flushed if r["ok"])
+        fallback = sum(1 for r in flushed if r["fallback"])
+        unknown = sum(1 for r in flushed if r["unknown"])
+        logger.info(
+            f"배치 처리 완료: {success}/{len(flushed)}개 성공 "
+            f"(HTTP 요청 {self.http_requests - requests_before}회, 개별 전환 {fallback}개, 반영 여부 불명 {unknown}개)"
+        )
+        return flushed
@@ -1,28 +1,204 @@
+import mimetypes
+import os
+import random
+import time
 import requests
 import base64
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
 from src.config.settings import Config
+from src.core.host_governor import get_governor
+from src.core.tag_index import TagIndex
+from src.core.wp_batch import BatchWriter
+from src.core.site_mirror import SiteMirror
+from src.core.media_index import MediaHashIndex, content_digest
 from src.utils.logger import get_logger
 
 logger = get_logger("WP_Client")
 
+# 재시도 대상 상태 코드 (요청 제한 / 서버 일시 오류)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 쓰기 요청(POST/DELETE 등)의 기본 재시도 상태 코드
+# 5xx는 서버가 이미 반영한 뒤 실패했을 수 있어 재전송하면 중복 생성/업로드가 생김
+# (요청이 처리되지 않았음이 분명한 429와 Retry-After가 붙은 503만 재시도)
+WRITE_RETRY_STATUS_CODES = {429}
+
+# 상태 코드 재시도를 기본으로 허용하는 메서드 (재전송해도 서버 상태가 바뀌지 않음)
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# 최소 변경 수정(diff) 비교에 사용하는 포스트 필드
+EDIT_STATE_FIELDS = ("id", "link", "title", "content", "excerpt", "slug", "status",
+                     "categories", "tags", "featured_media", "meta", "modified_gmt")
+
+# 이 도구가 만든 멱등 키의 접두어 (다른 도구/사람이 쓴 글과 구분)
+IDEMPOTENCY_KEY_PREFIX = "wpauto"
+
+# 재실행으로 덮어쓰지 않는 게시 상태
+PUBLISHED_STATUSES = ("publish", "future", "private")
+
+def make_idempotency_key(scope: str, topic: str) -> str:
+    """
+    실행 범위(스크립트 이름 등)와 주제로 결정적인 멱등 키를 만듭니다.
+    같은 주제를 다시 실행하면 같은 키가 나오므로 중단 후 재실행 시 같은 초안을 찾아 수정합니다.
+    """
+    normalized = " ".join(topic.split())
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+    return f"{IDEMPOTENCY_KEY_PREFIX}:{scope}:{digest}"
+
+def _post_key(post: Dict[str, Any]) -> Optional[str]:
+    """포스트 메타에 저장된 멱등 키 (메타가 비면 워드프레스는 []를 반환)"""
+    meta = post.get("meta")
+    return meta.get(Config.IDEMPOTENCY_META_KEY) if isinstance(meta, dict) else None
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환합니다.
+    과도하게 긴 값은 Config.WP_RETRY_AFTER_MAX로 제한합니다.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), Config.WP_RETRY_AFTER_MAX)
+
 class WordPressClient:
     """
     워드프레스 REST API와 통신하여 포스트 생성, 미디어 업로드 등을 수행하는 클라이언트입니다.
     """
 
-    def __init__(self):
+    def __init__(self, pool_size: int = None, timeout: float = None, max_retries: int = None):
         Config.validate()
-        self.base_url = f"{Config.WP_URL.rstrip('/')}/wp-json/wp/v2"
+        self.root_url = f"{Config.WP_URL.rstrip('/')}/wp-json"
+        self.base_url = f"{self.root_url}/wp/v2"
         self.auth = (Config.WP_USERNAME, Config.WP_PASSWORD)
         
         # 헤더 설정 (Application Password 인증 시 Basic Auth 사용)
         # requests.auth.HTTPBasicAuth를 사용하므로 직접 헤더에 넣을 필요는 없으나,
         # 디버깅 편의를 위해 자격 증명 확인 로직을 추가할 수 있습니다.
 
-    def upload_image(self, image_path: str, caption: str = "", title: str = "", alt_text: str = "", description: str = "") -> Optional[Dict[str, Any]]:
+        # 커넥션 풀 세션 (keep-alive로 TCP/TLS 핸드셰이크 재사용)
+        self.pool_size = pool_size or Config.WP_POOL_SIZE
+        self.timeout = timeout or Config.WP_TIMEOUT
+        self.max_retries = Config.WP_MAX_RETRIES if max_retries is None else max_retries
+        self._adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        self.retry_count = 0
+        self._tag_index = None
+        self._mirror = None
+        self._media_index = None
+        self.diff_stats = {"updates": 0, "skipped": 0, "bytes_sent": 0, "bytes_saved": 0}
+
+    def close(self):
+        """세션을 닫고 풀에 남은 커넥션을 정리합니다."""
+        self.session.close()
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """지수 백오프 + Full Jitter 대기 시간(초)을 계산합니다."""
+        ceiling = min(Config.WP_BACKOFF_MAX, Config.WP_BACKOFF_BASE * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def _request(self, method: str, url: str, timeout: float = None, retry_statuses: set = None,
+                 **kwargs) -> requests.Response:
+        """
+        풀 세션으로 요청을 보내고, 429/5xx 및 연결 오류 시 백오프 후 재시도합니다.
+        모든 요청은 호스트별 HostGovernor(동시성/초당 요청 수 제한, Retry-After 준수)를 거칩니다.
+        최종 응답은 상태 코드와 무관하게 그대로 반환하므로 호출 측에서 raise_for_status()로 판정합니다.
+        쓰기 요청(GET/HEAD/OPTIONS 외)은 기본적으로 429와 Retry-After가 붙은 503만 재시도합니다.
+        retry_statuses를 넘기면 그 상태 코드만 재시도합니다. (재전송해도 안전한 쓰기는 RETRY_STATUS_CODES로 명시적 허용)
+        """
+        timeout = timeout or self.timeout
+        default_statuses = retry_statuses is None
+        if default_statuses:
+            retry_statuses = RETRY_STATUS_CODES if method in SAFE_METHODS else WRITE_RETRY_STATUS_CODES
+        governor = get_governor(urlparse(url).netloc)
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            response = None
+            governor.acquire()
+            started = time.monotonic()
+            try:
+                response = self.session.request(method, url, timeout=timeout, **kwargs)
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # 읽기 타임아웃된 쓰기 요청은 서버에서 이미 처리됐을 수 있으므로 재시도하지 않음
+                if attempt >= self.max_retries or (isinstance(e, requests.ReadTimeout) and method not in SAFE_METHODS):
+                    raise
+                reason = type(e).__name__
+            finally:
+                # 응답 없이 끝난 경우(연결 오류, 그 밖의 예외, 인터럽트)에도 슬롯을 반드시 반납
+                governor.release(
+                    response.status_code if response is not None else None,
+                    time.monotonic() - started, retry_after
+                )
+
+            if response is not None:
+                retryable = response.status_code in retry_statuses or (
+                    # 점검 모드 등 Retry-After가 붙은 503은 요청을 처리하지 않은 것으로 보고 쓰기도 재시도
+                    default_statuses and response.status_code == 503 and retry_after is not None
+                )
+                if not retryable or attempt >= self.max_retries:
+                    return response
+                reason = f"Status {response.status_code}"
+                response.close()
+
+            # Retry-After가 있으면 그 시간 이상 대기 (HostGovernor도 같은 시간 동안 새 요청을 막음)
+            delay = max(self._backoff_delay(attempt), retry_after or 0)
+            self.retry_count += 1
+            logger.warning(f"일시적 오류 ({reason}): {delay:.1f}초 후 재시도 [{attempt+1}/{self.max_retries}] {method} {url}")
+            time.sleep(delay)
+
+    def get_governor_stats(self) -> Dict[str, Any]:
+        """이 클라이언트가 쓰는 워드프레스 호스트의 현재 동시성/초당 요청 제한과 관측 지표를 반환합니다."""
+        return get_governor(urlparse(self.root_url).netloc).snapshot()
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        """
+        커넥션 재사용 통계를 반환합니다. (keep-alive 동작 확인용)
+
+        Returns:
+            Dict[str, int]: {'requests': 전송 요청 수, 'connections': 새로 연 커넥션 수,
+                             'reused': 재사용된 요청 수, 'retries': 재시도 횟수}
+        """
+        pools = self._adapter.poolmanager.pools
+        connections = 0
+        sent = 0
+        for key in pools.keys():
+            pool = pools[key]
+            connections += pool.num_connections
+            sent += pool.num_requests
+        return {
+            "requests": sent,
+            "connections": connections,
+            "reused": max(sent - connections, 0),
+            "retries": self.retry_count,
+        }
+
+    @property
+    def media_index(self) -> MediaHashIndex:
+        """이미지 내용 해시 -> 미디어 인덱스 (중복 업로드 방지)"""
+        if self._media_index is None:
+            self._media_index = MediaHashIndex(self)
+        return self._media_index
+
+    def upload_image(self, image_path: str, caption: str = "", title: str = "", alt_text: str = "", description: str = "",
+                     dedupe: bool = None) -> Optional[Dict[str, Any]]:
         """
         로컬 이미지를 워드프레스 미디어 라이브러리에 업로드합니다. (메타데이터 풀 지원)
+        바이트가 동일한 이미지가 이미 업로드되어 있으면 업로드하지 않고 기존 미디어를 반환합니다.
         
         Args:
             image_path (str): 업로드할 이미지의 로컬 경로
@@ -30,6 +206,7 @@ class WordPressClient:
             title (str): 이미지 제목 (Title)
             alt_text (str): 대체 텍스트 (Alt Text)
             description (str): 이미지 설명 (Description)
+            dedupe (bool): 내용 해시 중복 검사 여부 (기본값: Config.MEDIA_DEDUPE)
             
         Returns:
             Optional[Dict[str, Any]]: 업로드 성공 시 {'id': int, 'source_url': str}, 실패 시 None
@@ -38,68 +215,95 @@ class WordPressClient:
             logger.warning("이미지 경로가 제공되지 않았습니다.")
             return None
 
-        endpoint = f"{self.base_url}/media"
-        file_name = image_path.split("/")[-1]
-
+        file_name = os.path.basename(image_path)
         try:
             # 이미지 파일 열기
             with open(image_path, "rb") as img_file:
-                files = {
-                    "file": (file_name, img_file, "image/jpeg")
-                }
-                
-                # 메타데이터 구성
-                data = {
-                    "caption": caption,
-                    "title": title if title else file_name,
-                    "alt_text": alt_text if alt_text else title,
-                    "description": description
-                }
-                
-                logger.info(f"이미지 업로드 시도: {file_name}")
-                response = requests.post(
-                    endpoint,
-                    auth=self.auth,
-                    files=files,
-                    data=data
-                )
-                
-                response.raise_for_status()
-                result = response.json()
-                media_info = {
-                    "id": result.get("id"),
-                    "source_url": result.get("source_url")
-                }
-                logger.info(f"이미지 업로드 성공! ID: {media_info['id']}")
-                return media_info
-
+                image_bytes = img_file.read()
         except Exception as e:
             logger.error(f"이미지 업로드 실패: {e}")
-            if 'response' in locals() and response.status_code != 200:
-                logger.error(f"응답 내용: {response.text}")
             return None
 
-    def create_post(self, title: str, content: str, status: str = "draft", 
-                    categories: list = None, tags: list = None, featured_media_id: int = None,
-                    meta_input: dict = None, slug: str = None) -> Optional[str]:
+        return self.upload_image_data(
+            image_bytes, file_name, caption=caption, title=title,
+            alt_text=alt_text, description=description, dedupe=dedupe
+        )
+
+    def upload_image_data(self, image_bytes: bytes, file_name: str, mime_type: str = None,
+                          caption: str = "", title: str = "", alt_text: str = "", description: str = "",
+                          dedupe: bool = None) -> Optional[Dict[str, Any]]:
         """
-        새로운 포스트를 생성합니다. (Rank Math 메타데이터 지원)
-        
+        메모리에 있는 이미지 바이트를 디스크를 거치지 않고 바로 업로드합니다.
+
         Args:
-            title (str): 포스트 제목
-            content (str): 포스트 HTML 내용
-            status (str): 게시 상태 (draft, publish, private 등)
-            categories (list): 카테고리 ID 리스트
-            tags (list): 태그 ID 리스트
-            featured_media_id (int): 썸네일(특성 이미지) ID
-            meta_input (dict): 메타데이터 (Rank Math 필드 포함)
-            slug (str): 영문 슬러그 (URL 고유명)
-            
+            image_bytes (bytes): 인코딩된 이미지 데이터
+            file_name (str): 업로드 파일명 (확장자로 MIME 타입 추정)
+            mime_type (str): MIME 타입 (생략 시 파일명으로 추정, 예: image/webp)
+            caption, title, alt_text, description, dedupe: upload_image와 동일
+
         Returns:
-            Optional[str]: 생성된 포스트의 URL
+            Optional[Dict[str, Any]]: 업로드 성공 시 {'id': int, 'source_url': str}, 실패 시 None
         """
-        endpoint = f"{self.base_url}/posts"
-        
+        if not image_bytes:
+            logger.warning("업로드할 이미지 데이터가 없습니다.")
+            return None
+
+        endpoint = f"{self.base_url}/media"
+        mime_type = mime_type or mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+
+        try:
+            # 동일 이미지가 이미 있으면 기존 미디어 재사용
+            use_dedupe = Config.MEDIA_DEDUPE if dedupe is None else dedupe
+            digest = content_digest(image_bytes) if use_dedupe else None
+            if digest:
+                existing = self.media_index.lookup(digest)
+                if existing:
+                    logger.info(f"동일 이미지 재사용 (업로드 생략): {file_name} -> ID: {existing['id']}")
+                    return existing
+
+            files = {
+                "file": (file_name, image_bytes, mime_type)
+            }
+            
+            # 메타데이터 구성
+            data = {
+                "caption": caption,
+                "title": title if title else file_name,
+                "alt_text": alt_text if alt_text else title,
+                "description": description
+            }
+            
+            logger.info(f"이미지 업로드 시도: {file_name} ({mime_type})")
+            response = self._request(
+                "POST",
+                endpoint,
+                timeout=Config.WP_UPLOAD_TIMEOUT,
+                files=files,
+                data=data
+            )
+            
+            response.raise_for_status()
+            result = response.json()
+            media_info = {
+                "id": result.get("id"),
+                "source_url": result.get("source_url")
+            }
+            if digest:
+                self.media_index.record(digest, media_info["id"], media_info["source_url"], len(image_bytes))
+            logger.info(f"이미지 업로드 성공! ID: {media_info['id']}")
+            return media_info
+
+        except Exception as e:
+            logger.error(f"이미지 업로드 실패: {e}")
+            if 'response' in locals() and response.status_code != 200:
+                logger.error(f"응답 내용: {response.text}")
+            return None
+
+    @staticmethod
+    def build_post_data(title: str, content: str, status: str = "draft",
+                        categories: list = None, tags: list = None, featured_media_id: int = None,
+                        meta_input: dict = None, slug: str = None) -> dict:
+        """create_post 요청 본문을 구성합니다. (배치 쓰기에서도 동일한 형식 사용)"""
         data = {
             "title": title,
             "content": content,
@@ -118,10 +322,34 @@ class WordPressClient:
             data["featured_media"] = featured_media_id
         if meta_input:
             data["meta"] = meta_input
+        return data
+
+    def create_post(self, title: str, content: str, status: str = "draft", 
+                    categories: list = None, tags: list = None, featured_media_id: int = None,
+                    meta_input: dict = None, slug: str = None, retry_statuses: set = None) -> Optional[str]:
+        """
+        새로운 포스트를 생성합니다. (Rank Math 메타데이터 지원)
+        
+        Args:
+            title (str): 포스트 제목
+            content (str): 포스트 HTML 내용
+            status (str): 게시 상태 (draft, publish, private 등)
+            categories (list): 카테고리 ID 리스트
+            tags (list): 태그 ID 리스트
+            featured_media_id (int): 썸네일(특성 이미지) ID
+            meta_input (dict): 메타데이터 (Rank Math 필드 포함)
+            slug (str): 영문 슬러그 (URL 고유명)
+            retry_statuses (set): 재시도할 상태 코드 (기본값: 429와 Retry-After가 붙은 503만, _request 참고)
+            
+        Returns:
+            Optional[str]: 생성된 포스트의 URL
+        """
+        endpoint = f"{self.base_url}/posts"
+        data = self.build_post_data(title, content, status, categories, tags, featured_media_id, meta_input, slug)
 
         try:
             logger.info(f"포스트 생성 시도: {title}")
-            response = requests.post(endpoint, auth=self.auth, json=data)
+            response = self._request("POST", endpoint, json=data, retry_statuses=retry_statuses)
             response.raise_for_status()
             
             result = response.json()
@@ -135,13 +363,158 @@ class WordPressClient:
                 logger.error(f"응답 내용: {response.text}")
             return None
 
+    def _verify_post(self, post_id: int) -> Optional[Dict[str, Any]]:
+        """
+        미러에서 찾은 포스트가 사이트에 아직 살아 있는지 단건 조회(요청 1회)로 확인합니다.
+        휴지통으로 옮겨졌거나 삭제됐으면 미러에 반영하고 None을 반환합니다. (그 밖의 오류는 예외)
+        """
+        response = self._request(
+            "GET", f"{self.base_url}/posts/{post_id}",
+            params={"context": "edit", "_fields": "id,link,status"}
+        )
+        if response.status_code in (404, 410):
+            logger.info(f"미러의 포스트가 사이트에서 삭제됨 (ID: {post_id}) -> 미러에서 제거")
+            self.mirror.forget_post(post_id)
+            return None
+        response.raise_for_status()
+        post = response.json()
+        if post.get("status") == "trash":
+            logger.info(f"미러의 포스트가 휴지통에 있음 (ID: {post_id}) -> 기존 글로 보지 않음")
+            self.mirror.set_post_status(post_id, "trash")
+            return None
+        return {"id": post["id"], "link": post["link"], "status": post["status"]}
+
+    def find_existing_post(self, slug: str = None, idempotency_key: str = None) -> Optional[Dict[str, Any]]:
+        """
+        슬러그 또는 멱등 키로 이미 생성된 포스트를 찾습니다. (재실행/복구 시 중복 생성 방지)
+        1) 로컬 미러 조회 후 단건 조회로 생존 확인 -> 2) slug= 라이브 조회 -> 3) 키가 있으면 미러 증분 동기화 후 재조회
+        키가 있으면 그 키를 가진 글을 우선하고, 없을 때만 슬러그만 겹친 글(idempotency_key가 다름)을 반환합니다.
+        휴지통/삭제된 글은 기존 글로 보지 않으며, 조회·동기화 실패는 예외로 올려 호출 측이 생성을 중단하게 합니다.
+
+        Returns:
+            Optional[Dict[str, Any]]: {'id': int, 'link': str, 'status': str, 'idempotency_key': str 또는 None} 또는 None
+        """
+        if not slug and not idempotency_key:
+            return None
+
+        def from_mirror():
+            post = None
+            if idempotency_key:
+                post = self.mirror.find_post_by_meta(Config.IDEMPOTENCY_META_KEY, idempotency_key)
+            if not post and slug:
+                post = self.mirror.find_post_by_slug(slug)
+            return post
+
+        post = from_mirror()
+        if post:
+            live = self._verify_post(post["id"])
+            # 키가 있으면 슬러그만 겹친 글로 바로 끝내지 않고 키를 가진 글을 계속 찾음
+            if live and (not idempotency_key or _post_key(post) == idempotency_key):
+                return dict(live, idempotency_key=_post_key(post))
+
+        slug_match = None
+        if slug:
+            # status=any는 휴지통을 제외 (휴지통 글의 슬러그는 __trashed가 붙어 새 글과 겹치지 않음)
+            response = self._request(
+                "GET", f"{self.base_url}/posts",
+                params={"slug": slug, "status": "any", "_fields": "id,link,status,meta"}
+            )
+            response.raise_for_status()
+            found = response.json()
+            if found:
+                # 같은 슬러그가 여러 개면 이 키를 가진 글을 우선
+                match = next((p for p in found if idempotency_key and _post_key(p) == idempotency_key), found[0])
+                slug_match = {"id": match["id"], "link": match["link"], "status": match["status"],
+                              "idempotency_key": _post_key(match)}
+                if not idempotency_key or slug_match["idempotency_key"] == idempotency_key:
+                    return slug_match
+            if not idempotency_key:
+                return None
+
+        # 멱등 키는 REST로 검색할 수 없으므로 미러를 최신으로 맞춘 뒤 조회 (동기화 실패 시 예외 -> 생성 중단)
+        # 슬러그만 겹친 다른 글이 있어도, 키를 가진 글이 다른 슬러그로 이미 있는지 먼저 확인
+        self.mirror.sync_posts()
+        post = from_mirror()
+        if post:
+            return {"id": post["id"], "link": post["link"], "status": post["status"],
+                    "idempotency_key": _post_key(post)}
+        return slug_match
+
+    def upsert_post(self, title: str, content: str, status: str = "draft",
+                    categories: list = None, tags: list = None, featured_media_id: int = None,
+                    meta_input: dict = None, slug: str = None, idempotency_key: str = None) -> Optional[str]:
+        """
+        멱등 포스트 생성: 같은 멱등 키를 가진 포스트가 이미 있으면 새로 만들지 않고 그 포스트를 수정합니다.
+        생성 직후 기록 전에 실행이 중단되어도 재실행 시 중복 초안이 생기지 않습니다.
+        - 슬러그만 겹치고 이 키가 없는 글(사람이 쓴 글, 다른 주제의 글)은 건드리지 않고 새 초안을 만듭니다.
+          (슬러그 중복은 워드프레스가 -2 등을 붙여 해결)
+        - 이 키를 가진 글이 이미 발행(예약/비공개 포함)됐으면 덮어쓰지 않고 None을 반환합니다.
+        - 수정 요청은 5xx도 재시도하고, 생성 요청이 실패하면 키로 반영 여부를 확인한 뒤에만 다시 생성합니다.
+
+        Args:
+            create_post와 동일 +
+            idempotency_key (str): 클라이언트 지정 키 (make_idempotency_key, 포스트 메타 Config.IDEMPOTENCY_META_KEY에 저장)
+
+        Returns:
+            Optional[str]: 생성(또는 수정)된 포스트의 URL, 발행된 글 보호로 거부했거나 실패하면 None
+        """
+        if idempotency_key:
+            meta_input = dict(meta_input or {}, **{Config.IDEMPOTENCY_META_KEY: idempotency_key})
+
+        try:
+            existing = self.find_existing_post(slug=slug, idempotency_key=idempotency_key)
+        except Exception as e:
+            logger.error(f"기존 포스트 조회 실패 (중복 생성 위험으로 중단): {e}")
+            return None
+
+        if existing and (not idempotency_key or existing["idempotency_key"] != idempotency_key):
+            logger.warning(
+                f"슬러그 '{slug}'의 기존 포스트(ID: {existing['id']})는 이 실행의 멱등 키가 없어 수정하지 않습니다. "
+                f"-> 새 초안으로 생성"
+            )
+            existing = None
+
+        if not existing:
+            link = self.create_post(
+                title, content, status=status, categories=categories, tags=tags,
+                featured_media_id=featured_media_id, meta_input=meta_input, slug=slug
+            )
+            if link or not idempotency_key:
+                return link
+            # 생성 요청은 5xx를 재전송하지 않으므로(중복 생성 위험), 서버에 이미 반영됐는지 키로 확인한 뒤에만 다시 생성
+            try:
+                existing = self.find_existing_post(idempotency_key=idempotency_key)
+            except Exception as e:
+                logger.error(f"생성 실패 후 기존 포스트 재조회 실패 (중복 생성 위험으로 중단): {e}")
+                return None
+            if not existing:
+                logger.warning("포스트 생성 실패, 서버에 반영된 글 없음 -> 한 번 더 생성합니다.")
+                return self.create_post(
+                    title, content, status=status, categories=categories, tags=tags,
+                    featured_media_id=featured_media_id, meta_input=meta_input, slug=slug
+                )
+            logger.info(f"생성 요청은 실패로 끝났지만 서버에 반영됨 (ID: {existing['id']}) -> 그 글을 수정합니다.")
+
+        if existing["status"] in PUBLISHED_STATUSES:
+            logger.warning(
+                f"같은 멱등 키의 포스트가 이미 발행됨 (ID: {existing['id']}, 상태: {existing['status']}) "
+                f"-> 덮어쓰지 않습니다: {existing['link']}"
+            )
+            return None
+
+        logger.info(f"이미 생성된 포스트 발견 (ID: {existing['id']}) -> 새로 만들지 않고 수정합니다.")
+        data = self.build_post_data(title, content, status, categories, tags, featured_media_id, meta_input, slug)
+        # 같은 내용의 수정은 재전송해도 결과가 같으므로 5xx 재시도를 명시적으로 허용
+        result = self.update_post(existing["id"], data, diff=True, retry_statuses=RETRY_STATUS_CODES)
+        return result.get("link", existing["link"]) if result else None
+
     def get_user_info(self):
         """
         연결 테스트 용: 현재 사용자 정보를 가져옵니다.
         """
         endpoint = f"{self.base_url}/users/me"
         try:
-            response = requests.get(endpoint, auth=self.auth)
+            response = self._request("GET", endpoint)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -154,23 +527,35 @@ class WordPressClient:
         """
         endpoint = f"{self.base_url}/posts/{post_id}"
         try:
-            response = requests.get(endpoint, auth=self.auth)
+            response = self._request("GET", endpoint)
             response.raise_for_status()
             return response.json()
         except Exception as e:
             logger.error(f"포스트 조회 실패 ({post_id}): {e}")
             return None
 
-    def get_recent_posts(self, count: int = 5) -> list:
+    @property
+    def mirror(self) -> SiteMirror:
+        """사이트 로컬 SQLite 미러 (포스트/미디어/태그 증분 동기화)"""
+        if self._mirror is None:
+            self._mirror = SiteMirror(self)
+        return self._mirror
+
+    def get_recent_posts(self, count: int = 5, use_mirror: bool = False) -> list:
         """
         최신 포스트 목록을 가져옵니다. (내부 링크용)
         
         Args:
             count (int): 가져올 포스트 개수
+            use_mirror (bool): True면 로컬 미러를 증분 동기화한 뒤 미러에서 조회
             
         Returns:
             list: [{'id': int, 'title': str, 'link': str}, ...]
         """
+        if use_mirror:
+            self.mirror.sync(resources=("posts",))
+            return self.mirror.recent_posts(count)
+
         endpoint = f"{self.base_url}/posts"
         params = {
             "per_page": count,
@@ -179,7 +564,7 @@ class WordPressClient:
         }
         
         try:
-            response = requests.get(endpoint, auth=self.auth, params=params)
+            response = self._request("GET", endpoint, params=params)
             response.raise_for_status()
             posts = response.json()
             
@@ -196,10 +581,17 @@ class WordPressClient:
             logger.error(f"최신 포스트 조회 실패: {e}")
             return []
 
+    @property
+    def tag_index(self) -> TagIndex:
+        """사이트 태그 로컬 인덱스 (최초 사용 시 로드)"""
+        if self._tag_index is None:
+            self._tag_index = TagIndex(self)
+        return self._tag_index
+
     def get_or_create_tags(self, tag_names: list) -> list:
         """
         태그 이름 리스트를 받아 ID 리스트로 반환합니다.
-        없는 태그는 생성합니다.
+        없는 태그는 생성합니다. (로컬 태그 인덱스로 매칭하여 이름별 검색 요청을 생략)
         
         Args:
             tag_names (list): 태그 이름 문자열 리스트
@@ -209,65 +601,143 @@ class WordPressClient:
         """
         if not tag_names:
             return []
-            
-        tag_ids = []
-        for name in tag_names:
-            try:
-                # 1. 태그 조회
-                slug = name.strip().replace(" ", "-").lower() # 간단한 슬러그 변환
-                search_endpoint = f"{self.base_url}/tags?search={name}"
-                response = requests.get(search_endpoint, auth=self.auth)
+
+        try:
+            return self.tag_index.get_or_create(tag_names)
+        except Exception as e:
+            logger.error(f"태그 인덱스 사용 실패: {e}")
+            return []
+
+    def batch(self, batch_size: int = None) -> BatchWriter:
+        """
+        배치 쓰기 모드를 시작합니다. (/wp-json/batch/v1, 요청당 최대 25개 작업)
+
+        사용 예:
+            with wp_client.batch() as batch:
+                batch.update_meta(101, {"rank_math_focus_keyword": "청년도약계좌"})
+                batch.create_tag("AI 수익화")
+            results = batch.results
+        """
+        return BatchWriter(self, batch_size)
+
+    @staticmethod
+    def _edit_state(post: Dict[str, Any]) -> Dict[str, Any]:
+        """REST 응답(context=edit)에서 비교용 편집 상태를 추출합니다. (title/content/excerpt는 raw 값)"""
+        state = {}
+        for key in EDIT_STATE_FIELDS:
+            if key not in post:
+                continue
+            value = post[key]
+            if isinstance(value, dict) and key in ("title", "content", "excerpt"):
+                value = value.get("raw", value.get("rendered", ""))
+            state[key] = value
+        return state
+
+    def _save_edit_state(self, post_id: int, post: Dict[str, Any]):
+        """편집 상태 캐시를 갱신합니다. 캐시 저장 실패는 수정 결과에 영향을 주지 않도록 로그만 남깁니다."""
+        try:
+            self.mirror.save_edit_state(post_id, post.get("modified_gmt"), self._edit_state(post))
+        except Exception as e:
+            logger.warning(f"편집 상태 캐시 저장 실패 ({post_id}): {e}")
+
+    def _get_edit_state(self, post_id: int) -> Dict[str, Any]:
+        """
+        포스트의 현재 편집 상태를 반환합니다.
+        캐시가 있으면 modified_gmt만 조회(요청 1회, 본문 없음)해 캐시 시각과 같을 때만 캐시를 쓰고,
+        미러가 더 새로운 수정을 알고 있거나 시각이 다르면(다른 편집자/플러그인의 수정) context=edit로 전체 조회합니다.
+        """
+        cached = self.mirror.get_edit_state(post_id)
+        if cached and cached["modified_gmt"]:
+            mirrored = self.mirror.get_post(post_id)
+            if not mirrored or (mirrored["modified_gmt"] or "") <= cached["modified_gmt"]:
+                response = self._request(
+                    "GET", f"{self.base_url}/posts/{post_id}",
+                    params={"context": "edit", "_fields": "modified_gmt"}
+                )
                 response.raise_for_status()
-                existing_tags = response.json()
-                
-                found = False
-                for tag in existing_tags:
-                    if tag['name'].lower() == name.lower():
-                        tag_ids.append(tag['id'])
-                        found = True
-                        break
-                
-                if found:
-                    continue
-
-                # 2. 태그 생성 (없을 경우)
-                create_endpoint = f"{self.base_url}/tags"
-                data = {"name": name}
-                create_response = requests.post(create_endpoint, auth=self.auth, json=data)
-                create_response.raise_for_status()
-                new_tag = create_response.json()
-                tag_ids.append(new_tag['id'])
-                logger.info(f"새 태그 생성: {name} (ID: {new_tag['id']})")
+                if response.json().get("modified_gmt") == cached["modified_gmt"]:
+                    return cached["data"]
+                logger.info(f"편집 상태 캐시가 오래됨 ({post_id}) -> 전체 조회")
 
-            except Exception as e:
-                logger.error(f"태그 처리 실패 ({name}): {e}")
-                
-        return tag_ids
+        response = self._request(
+            "GET", f"{self.base_url}/posts/{post_id}",
+            params={"context": "edit", "_fields": ",".join(EDIT_STATE_FIELDS)}
+        )
+        response.raise_for_status()
+        post = response.json()
+        self._save_edit_state(post_id, post)
+        return self._edit_state(post)
+
+    @staticmethod
+    def _diff_post_data(current: Dict[str, Any], desired: Dict[str, Any]) -> Dict[str, Any]:
+        """원하는 상태 중 현재와 다른 필드만 남깁니다. (meta는 키 단위, 카테고리/태그는 순서 무시)"""
+        changed = {}
+        for key, value in desired.items():
+            if key == "meta":
+                current_meta = current.get("meta") or {}
+                meta_changes = {k: v for k, v in (value or {}).items() if current_meta.get(k) != v}
+                if meta_changes:
+                    changed["meta"] = meta_changes
+            elif key in ("categories", "tags"):
+                if sorted(value or []) != sorted(current.get(key) or []):
+                    changed[key] = value
+            elif key == "featured_media":
+                if int(value or 0) != int(current.get(key) or 0):
+                    changed[key] = value
+            elif current.get(key) != value:
+                changed[key] = value
+        return changed
 
-    def update_post(self, post_id: int, data: dict) -> Optional[Dict[str, Any]]:
+    def get_diff_stats(self) -> Dict[str, int]:
+        """최소 변경 수정 통계 (전송/생략 건수, 전송 바이트, 절약 바이트)를 반환합니다."""
+        return dict(self.diff_stats)
+
+    def update_post(self, post_id: int, data: dict, diff: bool = False,
+                    retry_statuses: set = None) -> Optional[Dict[str, Any]]:
         """
         기존 포스트를 수정합니다.
         
         Args:
             post_id (int): 수정할 포스트 ID
             data (dict): 수정할 데이터 (title, content, slug, status 등)
+            diff (bool): True면 캐시된 현재 상태와 비교해 바뀐 필드만 전송하고, 바뀐 게 없으면 요청을 생략
+            retry_statuses (set): 재시도할 상태 코드 (create_post와 동일)
             
         Returns:
-            Optional[Dict[str, Any]]: 수정된 포스트 정보
+            Optional[Dict[str, Any]]: 수정된 포스트 정보 (변경 없음으로 생략 시 캐시된 편집 상태)
         """
         endpoint = f"{self.base_url}/posts/{post_id}"
+        full_size = len(json.dumps(data, ensure_ascii=False).encode("utf-8"))
         
         try:
+            if diff:
+                current = self._get_edit_state(post_id)
+                changed = self._diff_post_data(current, data)
+                if not changed:
+                    self.diff_stats["skipped"] += 1
+                    self.diff_stats["bytes_saved"] += full_size
+                    logger.info(f"포스트 수정 생략 ({post_id}): 변경 사항 없음 ({full_size:,}B 절약)")
+                    return current
+                sent_size = len(json.dumps(changed, ensure_ascii=False).encode("utf-8"))
+                self.diff_stats["bytes_saved"] += full_size - sent_size
+                logger.info(f"변경 필드만 전송 ({post_id}): {list(changed.keys())} ({sent_size:,}B / 전체 {full_size:,}B)")
+                data = changed
+
             logger.info(f"포스트 수정 시도 ({post_id}): {data.keys()}")
-            response = requests.post(endpoint, auth=self.auth, json=data)
+            response = self._request("POST", endpoint, json=data, retry_statuses=retry_statuses)
             response.raise_for_status()
             
             result = response.json()
-            logger.info(f"포스트 수정 성공! Link: {result.get('link')}")
-            return result
-
         except Exception as e:
             logger.error(f"포스트 수정 실패 ({post_id}): {e}")
             if 'response' in locals() and response.status_code != 200:
                 logger.error(f"응답 내용: {response.text}")
             return None
+
+        self.diff_stats["updates"] += 1
+        self.diff_stats["bytes_sent"] += len(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        if diff:
+            # 수정 응답은 context=edit이므로 그대로 편집 상태 캐시로 사용 (diff 수정에서만 캐시 관리)
+            self._save_edit_state(post_id, result)
+        logger.info(f"포스트 수정 성공! Link: {result.get('link')}")
+        return result
@@ -1,9 +1,13 @@
 import sys
 import argparse
-import re
-from src.core.wp_client import WordPressClient
+from src.config.settings import Config
+from src.core.wp_client import WordPressClient, make_idempotency_key
 from src.core.generator import ContentGenerator
+from src.core.html_engine import process_post_html
+from src.core.image_pipeline import ImagePipeline
 from src.core.image_processor import ImageProcessor
+from src.core.model_routing import parse_route_overrides
+from src.core.profile_compare import compare_engines, compare_profiles, format_comparison
 from src.utils.logger import get_logger
 
 logger = get_logger("Main")
@@ -20,6 +24,20 @@ logger = get_logger("Main")
 def main():
     parser = argparse.ArgumentParser(description="WordPress Automation System v1.0")
     parser.add_argument("topic", type=str, nargs='?', help="블로그 포스트 주제")
+    parser.add_argument("--llm-cache", choices=["on", "refresh", "off"], default=None,
+                        help="AI 응답 캐시 모드 (기본값: LLM_CACHE_MODE 환경 변수)")
+    parser.add_argument("--model-profile", default=None,
+                        help="단계별 모델 라우팅 프로필 (기본값: MODEL_PROFILE 환경 변수)")
+    parser.add_argument("--model-route", action="append", default=[], metavar="STAGE[.FIELD]=VALUE",
+                        help="이번 실행만 단계 라우팅 덮어쓰기 (예: section=gpt-4o-mini, faq.max_tokens=800)")
+    parser.add_argument("--compare-profiles", nargs=2, metavar=("PROFILE_A", "PROFILE_B"),
+                        help="같은 주제를 두 프로필로 생성해 시간/토큰/품질을 비교 (발행하지 않음)")
+    parser.add_argument("--engine", choices=["iterative", "single_call"], default=None,
+                        help="본문 생성 방식 (기본값: GENERATION_ENGINE 환경 변수)")
+    parser.add_argument("--compare-engines", action="store_true",
+                        help="같은 주제를 iterative / single_call 방식으로 생성해 처리량을 비교 (발행하지 않음)")
+    parser.add_argument("--no-speculative-images", action="store_true",
+                        help="본문 생성이 끝난 뒤에 이미지를 생성 (기본값: SPECULATIVE_IMAGES 환경 변수)")
     args = parser.parse_args()
 
     topic = args.topic
@@ -30,6 +48,24 @@ def main():
         logger.error("주제가 입력되지 않았습니다. 종료합니다.")
         return
 
+    # 라우팅 덮어쓰기는 비교 실행에도 적용되므로 분기 전에 먼저 검증
+    try:
+        model_routes = parse_route_overrides(args.model_route)
+    except ValueError as e:
+        logger.error(str(e))
+        return
+
+    if args.compare_profiles:
+        results = compare_profiles(topic, list(args.compare_profiles), cache_mode=args.llm_cache or "off",
+                                   model_routes=model_routes)
+        print(format_comparison(results))
+        return
+    if args.compare_engines:
+        results = compare_engines(topic, ["iterative", "single_call"], profile=args.model_profile,
+                                  cache_mode=args.llm_cache or "off", model_routes=model_routes)
+        print(format_comparison(results))
+        return
+
     logger.info("========================================")
     logger.info(f"작업 시작: '{topic}'")
     logger.info("========================================")
@@ -37,7 +73,8 @@ def main():
     # 1. 모듈 초기화
     try:
         wp_client = WordPressClient()
-        generator = ContentGenerator()
+        generator = ContentGenerator(cache_mode=args.llm_cache, model_profile=args.model_profile,
+                                     model_routes=model_routes, engine=args.engine)
         image_processor = ImageProcessor()
     except Exception as e:
         logger.critical(f"초기화 실패 (환경 변수를 확인해주세요): {e}")
@@ -46,12 +83,19 @@ def main():
     # 2. 콘텐츠 생성
     logger.info("1단계: AI 콘텐츠 생성 중... (Rank Math 100점 전략)")
     
-    # 내부 링크용 최신 글 조회
-    internal_links = wp_client.get_recent_posts(count=5)
+    # 내부 링크용 최신 글 조회 (로컬 미러 증분 동기화 후 조회)
+    internal_links = wp_client.get_recent_posts(count=5, use_mirror=True)
     logger.info(f"내부 링크 타겟 조회 완료: {len(internal_links)}개")
     
-    post_data = generator.generate_post(topic, internal_links=internal_links)
+    # 이미지 파이프라인: 이미지 메타데이터가 나오는 즉시 본문 생성과 겹쳐 이미지 생성/업로드 시작
+    image_pipeline = ImagePipeline(image_processor, wp_client)
+    speculative = Config.SPECULATIVE_IMAGES and not args.no_speculative_images
+    post_data = generator.generate_post(
+        topic, internal_links=internal_links,
+        on_image_metadata=image_pipeline.start if speculative else None
+    )
     if not post_data:
+        image_pipeline.abandon()
         logger.error("콘텐츠 생성 실패. 종료합니다.")
         return
 
@@ -98,92 +142,37 @@ def main():
         logger.warning(f"⚠️ 경고: 이미지 수량이 부족합니다 ({len(images_data)}장). 4장 이상 권장.")
         # 부족분 추가 생성 로직 (Advanced): 일단 경고만 로그
 
-    featured_media_id = None
-    body_image_urls = []
-
-    logger.info(f"2단계: 이미지 {len(images_data)}장 생성 및 업로드 중...")
-    
-    for idx, img_meta in enumerate(images_data):
-        prompt_raw = img_meta.get("prompt", "")
-        # 프롬프트 전처리 (접두어 제거)
-        prompt_clean = re.sub(r"^(썸네일용|본문이미지\d+):\s*", "", prompt_raw)
-        
-        # 파일명 생성 (슬러그 활용 + 인덱스 + WebP)
-        file_suffix = "thumb" if idx == 0 else f"body_{idx}"
-        file_name = f"{slug}_{file_suffix}.webp"
-        
-        logger.info(f"[{idx+1}/{len(images_data)}] 이미지 생성: {prompt_clean[:30]}...")
-        image_path = image_processor.generate_image(prompt_clean, file_name)
-        
-        if image_path:
-            # 메타데이터 설정 (Smart Metadata 사용)
-            # 썸네일은 제목을, 본문 이미지는 Alt 텍스트 기반으로 제목 설정
-            img_title = title if idx == 0 else f"{focus_keyword}_{idx}"
-            img_alt = img_meta.get("alt", f"{focus_keyword} image")
-            img_caption = img_meta.get("caption", title)
-            # 썸네일 설명에만 Rank Math Description 적용
-            img_desc = post_data.get("rank_math_description", "") if idx == 0 else ""
-
-            upload_result = wp_client.upload_image(
-                image_path, 
-                title=img_title,
-                caption=img_caption, 
-                alt_text=img_alt,
-                description=img_desc
-            )
-
-            if upload_result:
-                if idx == 0:
-                    featured_media_id = upload_result['id']
-                    logger.info(f"썸네일 등록 완료 (ID: {featured_media_id})")
-                else:
-                    body_image_urls.append({
-                        "url": upload_result['source_url'],
-                        "alt": img_alt,
-                        "caption": img_caption
-                    })
-                    logger.info(f"본문 이미지 {idx} 업로드 완료")
-            else:
-                logger.error(f"이미지 {idx} 업로드 실패")
-        else:
-            logger.error(f"이미지 {idx} 생성 실패")
-
-    # 5. 본문 이미지 삽입 (H2 태그 후)
-    if body_image_urls:
-        logger.info("3단계: 본문에 이미지 삽입 중...")
-        
-        # 불필요한 이미지 설명 텍스트 제거 (이중 안전장치)
-        cleanup_patterns = [
-            r"\[이미지 설명.*?\]",
-            r"그림 \d+.*?\n",
-            r"Figure \d+.*?\n",
-            r"\*\*이미지 설명:\*\*.*?\n",
-            r"AI 수익화 로드맵 관련 상세 이미지 \d+",  # 사용자가 제보한 특정 패턴
-        ]
-        for pattern in cleanup_patterns:
-            content = re.sub(pattern, "", content, flags=re.IGNORECASE)
-
-        # H2 태그 찾기
-        h2_split = re.split(r'(</h2>)', content)
-        
-        new_content = ""
-        img_idx = 0
-        
-        for part in h2_split:
-            new_content += part
-            if part == "</h2>" and img_idx < len(body_image_urls):
-                # 이미지 태그 생성 (Rank Math가 좋아하는 figure 태그 사용 권장하지만 간단히 img로 처리)
-                img_info = body_image_urls[img_idx]
-                img_html = (
-                    f'\n<figure class="wp-block-image size-large">'
-                    f'<img src="{img_info["url"]}" alt="{img_info["alt"]}" class="wp-image-body-{img_idx+1}"/>'
-                    f'<figcaption>{img_info["caption"]}</figcaption>'
-                    f'</figure>\n'
-                )
-                new_content += img_html
-                img_idx += 1
-        
-        content = new_content
+    if image_pipeline.started:
+        logger.info(f"2단계: 본문 생성 중 시작한 이미지 {len(images_data)}장의 생성/업로드 합류 대기...")
+    else:
+        logger.info(f"2단계: 이미지 {len(images_data)}장 생성 및 업로드 중...")
+        image_pipeline.start(images_data, {
+            "title": title,
+            "slug": slug,
+            "focus_keyword": focus_keyword,
+            "description": post_data.get("rank_math_description", ""),
+        })
+    image_result = image_pipeline.join()
+    featured_media_id = image_result["featured_media_id"]
+    body_image_urls = image_result["body_images"]
+
+    # 5. 본문 후처리 (토크나이저 순회 한 번으로 자리표시자 정리 + H2 뒤 이미지 삽입 + 속성 주입 + SEO 지표 수집)
+    logger.info("3단계: 본문 후처리(이미지 삽입/정리) 중...")
+    body_image_htmls = [
+        # 이미지 태그 생성 (Rank Math가 좋아하는 figure 태그 사용)
+        f'\n<figure class="wp-block-image size-large">'
+        f'<img src="{img_info["url"]}" alt="{img_info["alt"]}" class="wp-image-body-{img_idx+1}"/>'
+        f'<figcaption>{img_info["caption"]}</figcaption>'
+        f'</figure>\n'
+        for img_idx, img_info in enumerate(body_image_urls)
+    ]
+    processed = process_post_html(content, keyword=focus_keyword, body_image_htmls=body_image_htmls)
+    content = processed["html"]
+    seo_stats = processed["stats"]
+    logger.info(
+        f"본문 지표: {seo_stats['text_length']}자 / H2 {seo_stats['h2_count']}개 / 이미지 {seo_stats['img_count']}개 / "
+        f"키워드 '{focus_keyword}' {seo_stats['keyword_count']}회 (밀도 {seo_stats['keyword_density']}%)"
+    )
 
     # 6. 포스트 발행
     logger.info("4단계: 워드프레스 포스팅 및 SEO 적용 중...")
@@ -209,7 +198,9 @@ def main():
     if "rank_math_description" in post_data:
         meta_input["rank_math_description"] = post_data["rank_math_description"]
 
-    post_link = wp_client.create_post(
+    # 멱등 발행: 같은 주제로 이 도구가 만든 초안이 있으면(중단 후 재실행 등) 중복 생성 대신 수정
+    # (슬러그만 겹친 다른 글은 덮어쓰지 않고, 이미 발행된 글은 수정하지 않음)
+    post_link = wp_client.upsert_post(
         title=title,
         content=content,
         status="draft", 
@@ -217,7 +208,8 @@ def main():
         tags=tag_ids,
         featured_media_id=featured_media_id,
         meta_input=meta_input,
-        slug=post_data.get("slug")  # 영문 슬러그 명시 전달
+        slug=post_data.get("slug"),  # 영문 슬러그 명시 전달
+        idempotency_key=make_idempotency_key("main", topic)
     )
 
     if post_link:
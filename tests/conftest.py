@@ -0,0 +1,64 @@
+import os
+import tempfile
+
+# src.config.settings는 임포트 시점에 환경 변수를 읽으므로 테스트 기본값을 먼저 채워 둡니다.
+os.environ.update({
+    "OPENAI_API_KEY": "test-key",
+    "WP_URL": "http://127.0.0.1:9",
+    "WP_USERNAME": "tester",
+    "WP_PASSWORD": "app-password",
+    "CACHE_DIR": tempfile.mkdtemp(prefix="wpauto-test-cache-"),
+    "BATCH_DIR": tempfile.mkdtemp(prefix="wpauto-test-batch-"),
+    "WP_BACKOFF_BASE": "0.01",
+    "WP_BACKOFF_MAX": "0.05",
+    "WP_MAX_RPS": "0",
+    "LOG_LEVEL": "WARNING",
+})
+
+import pytest
+
+from src.config.settings import Config
+from src.core import host_governor
+from tests.fake_wordpress import FakeWordPress
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    """테스트마다 캐시 디렉터리와 호스트별 HostGovernor를 새로 씁니다."""
+    monkeypatch.setattr(Config, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(Config, "BATCH_DIR", str(tmp_path / "batch_jobs"))
+    monkeypatch.setattr(host_governor, "_governors", {})
+
+@pytest.fixture
+def fake_wp(monkeypatch):
+    server = FakeWordPress().start()
+    monkeypatch.setattr(Config, "WP_URL", server.url)
+    yield server
+    server.stop()
+
+@pytest.fixture
+def wp_client(fake_wp):
+    from src.core.wp_client import WordPressClient
+    client = WordPressClient()
+    yield client
+    client.close()
+
+@pytest.fixture
+def make_generator(monkeypatch):
+    """FakeOpenAI 응답기로 ContentGenerator를 만듭니다. (외부 출처 재검증 같은 실제 네트워크 접근은 끔)"""
+    from src.core.generator import ContentGenerator
+    from tests.fake_openai import FakeOpenAI
+    monkeypatch.setattr(Config, "AUTHORITY_REVALIDATE_HOURS", 1e9)
+    created = []
+
+    def make(responder, **kwargs):
+        kwargs.setdefault("cache_mode", "off")
+        kwargs.setdefault("stream", False)
+        generator = ContentGenerator(**kwargs)
+        generator.client = FakeOpenAI(responder)
+        created.append(generator)
+        return generator
+
+    yield make
+    for generator in created:
+        generator.link_validator.close()
+        generator.llm_cache.close()
@@ -0,0 +1,87 @@
+"""
+테스트용 OpenAI 클라이언트 대역입니다.
+ContentGenerator.client 자리에 넣으면 chat.completions.create 호출을 기록하고,
+responder(kwargs)가 돌려준 문자열로 실제 SDK와 같은 타입의 응답(일괄/스트리밍)을 만듭니다.
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+def usage(prompt_tokens=100, completion_tokens=50, cached_tokens=0):
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "prompt_tokens_details": {"cached_tokens": cached_tokens},
+    }
+
+class FakeOpenAI:
+    """
+    responder(kwargs)는 다음 중 하나를 반환합니다.
+    - str: 응답 본문 (finish_reason='stop')
+    - (str, finish_reason)
+    - dict: {'content', 'finish_reason', 'usage', 'chunks'(스트리밍 조각 목록), 'delay'(조각 사이 대기)}
+    예외를 던지면 create 호출이 그 예외로 실패합니다.
+    """
+
+    def __init__(self, responder):
+        self.responder = responder
+        self.calls = []
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        with self._lock:
+            self.calls.append(kwargs)
+        reply = self.responder(kwargs)
+        if isinstance(reply, str):
+            reply = {"content": reply}
+        elif isinstance(reply, tuple):
+            reply = {"content": reply[0], "finish_reason": reply[1]}
+        content = reply.get("content", "")
+        finish_reason = reply.get("finish_reason", "stop")
+        reply_usage = reply.get("usage", usage())
+        if kwargs.get("stream"):
+            chunks = reply.get("chunks") or [content]
+            return FakeStream(chunks, finish_reason, reply_usage, reply.get("delay", 0))
+        return ChatCompletion.model_validate({
+            "id": "chatcmpl-test", "object": "chat.completion", "created": int(time.time()),
+            "model": kwargs["model"],
+            "choices": [{"index": 0, "finish_reason": finish_reason,
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": reply_usage,
+        })
+
+    def messages(self, index=-1):
+        return self.calls[index]["messages"]
+
+class FakeStream:
+    """스트리밍 응답: 조각마다 delay초씩 쉬며 ChatCompletionChunk를 내보냅니다."""
+
+    def __init__(self, chunks, finish_reason, reply_usage, delay=0):
+        self.chunks = chunks
+        self.finish_reason = finish_reason
+        self.usage = reply_usage
+        self.delay = delay
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def _chunk(self, choices, reply_usage=None):
+        return ChatCompletionChunk.model_validate({
+            "id": "chatcmpl-stream", "object": "chat.completion.chunk", "created": int(time.time()),
+            "model": "test", "choices": choices, "usage": reply_usage,
+        })
+
+    def __iter__(self):
+        for text in self.chunks:
+            if self.closed:
+                return
+            if self.delay:
+                time.sleep(self.delay)
+            yield self._chunk([{"index": 0, "delta": {"content": text}, "finish_reason": None}])
+        yield self._chunk([{"index": 0, "delta": {}, "finish_reason": self.finish_reason}])
+        yield self._chunk([], self.usage)
@@ -0,0 +1,325 @@
+"""
+테스트용 로컬 워드프레스 REST 서버입니다. (실제 사이트 대신 127.0.0.1에서 실행)
+
+WordPressClient가 쓰는 범위만 흉내 냅니다.
+- /wp-json/wp/v2/posts, /tags, /media (목록/단건/생성/수정/휴지통), /users/me
+- /wp-json/batch/v1 (batch_mode로 미지원/거부/서버 오류/타임아웃 재현)
+- /wp-content/uploads/... 업로드 파일 제공 (CDN 역할 인스턴스로도 사용)
+- fail_next()로 다음 요청에 임의 상태 코드/지연을 끼워 넣을 수 있음
+"""
+import itertools
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, quote
+
+BATCH_ALLOWED = ("/wp/v2/posts", "/wp/v2/tags")
+
+class FakeWordPress:
+    def __init__(self):
+        self.posts = {}
+        self.tags = {}
+        self.media = {}
+        self.files = {}
+        self.log = []
+        self.failures = []
+        self.batch_mode = "ok"  # ok / no_route / not_allowed / max_requests / error / timeout
+        self.batch_max = 25
+        self.batch_delay = 1.0
+        self._ids = itertools.count(100)
+        self._clock = datetime(2026, 1, 1)
+        self._lock = threading.RLock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.url).netloc
+
+    def start(self) -> "FakeWordPress":
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    # ------------------------------------------------------------------
+    # 테스트 조작용
+    # ------------------------------------------------------------------
+    def fail_next(self, status: int = None, body: dict = None, headers: dict = None,
+                  delay: float = 0.0, path: str = None, method: str = None):
+        """
+        다음 요청(path를 주면 그 경로로 시작하는, method를 주면 그 메서드의 다음 요청)의 응답을 바꿉니다.
+        status가 None이면 정상 처리한 뒤 delay초 늦게 응답합니다. (쓰기는 반영됐지만 응답이 늦는 상황)
+        """
+        with self._lock:
+            self.failures.append({"status": status, "body": body, "headers": headers or {}, "delay": delay, "path": path,
+                                  "method": method})
+
+    def requests(self, method: str = None, path: str = None) -> list:
+        """기록된 요청 중 조건에 맞는 것만 반환합니다. [(method, path, query, headers, raw_body), ...]"""
+        return [
+            entry for entry in self.log
+            if (method is None or entry[0] == method) and (path is None or entry[1].startswith(path))
+        ]
+
+    def tick(self) -> str:
+        """가짜 시계를 1초 진행하고 현재 시각 문자열을 반환합니다. (수정 시각이 항상 증가하도록)"""
+        with self._lock:
+            self._clock += timedelta(seconds=1)
+            return self._clock.strftime("%Y-%m-%dT%H:%M:%S")
+
+    def add_post(self, **fields) -> dict:
+        """서버에 포스트를 직접 만들어 둡니다. (다른 작성자가 만든 글 등)"""
+        with self._lock:
+            post = self._new_post()
+            self._apply_post(post, fields)
+            return post
+
+    def add_file(self, path: str, data: bytes) -> str:
+        """업로드 파일을 등록하고 URL을 반환합니다."""
+        self.files[path] = data
+        return f"{self.url}{path}"
+
+    # ------------------------------------------------------------------
+    # 리소스 처리
+    # ------------------------------------------------------------------
+    def _new_post(self) -> dict:
+        post_id = next(self._ids)
+        now = self.tick()
+        post = {
+            "id": post_id, "slug": "", "status": "draft", "link": f"{self.url}/?p={post_id}",
+            "title": {"raw": "", "rendered": ""}, "content": {"raw": "", "rendered": ""},
+            "excerpt": {"raw": "", "rendered": ""}, "categories": [], "tags": [], "featured_media": 0,
+            "meta": {}, "date_gmt": now, "modified": now, "modified_gmt": now,
+        }
+        self.posts[post_id] = post
+        return post
+
+    def _apply_post(self, post: dict, body: dict):
+        for key, value in body.items():
+            if key in ("title", "content", "excerpt"):
+                post[key] = {"raw": value, "rendered": value}
+            elif key == "meta":
+                post["meta"].update(value)
+            else:
+                post[key] = value
+        post["modified"] = post["modified_gmt"] = self.tick()
+
+    @staticmethod
+    def _fields(obj: dict, query: dict) -> dict:
+        fields = query.get("_fields", [None])[0]
+        if not fields:
+            return obj
+        return {k: obj[k] for k in fields.split(",") if k in obj}
+
+    def _list(self, kind: str, store: dict, query: dict):
+        items = sorted(store.values(), key=lambda o: o["id"])
+        if "search" in query:
+            items = [o for o in items if query["search"][0].lower() in o.get("name", "").lower()]
+        if "slug" in query:
+            items = [o for o in items if o.get("slug") in query["slug"][0].split(",")]
+        if "modified_after" in query:
+            items = [o for o in items if o.get("modified", "") > query["modified_after"][0]]
+        if kind == "posts":
+            # 실제 워드프레스처럼 status=any는 휴지통을 제외
+            statuses = query.get("status", ["publish"])[0].split(",")
+            if "any" in statuses:
+                items = [o for o in items if o["status"] != "trash"]
+            else:
+                items = [o for o in items if o["status"] in statuses]
+        if query.get("orderby", [""])[0] == "modified":
+            items.sort(key=lambda o: (o.get("modified"), o["id"]))
+        if query.get("order", [""])[0] == "desc":
+            items.reverse()
+        per_page = int(query.get("per_page", ["10"])[0])
+        page = int(query.get("page", ["1"])[0])
+        total = len(items)
+        pages = max(1, -(-total // per_page))
+        if page > pages and total:
+            return 400, {"code": "rest_post_invalid_page_number"}, {}
+        chunk = items[(page - 1) * per_page: page * per_page]
+        return 200, [self._fields(o, query) for o in chunk], {"X-WP-Total": str(total), "X-WP-TotalPages": str(pages)}
+
+    def _upload(self, headers, raw: bytes):
+        content_type = headers.get("Content-Type", "")
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + raw
+        )
+        fields, file_name, data, mime_type = {}, "upload.bin", b"", "application/octet-stream"
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            if part.get_filename():
+                file_name = part.get_filename()
+                data = part.get_payload(decode=True)
+                mime_type = part.get_content_type()
+            else:
+                fields[name] = part.get_payload(decode=True).decode("utf-8")
+        media_id = next(self._ids)
+        now = self.tick()
+        source_url = self.add_file(f"/wp-content/uploads/{quote(file_name)}", data)
+        media = {
+            "id": media_id, "slug": file_name.rsplit(".", 1)[0], "source_url": source_url,
+            "mime_type": mime_type, "title": {"rendered": fields.get("title", file_name)},
+            "alt_text": fields.get("alt_text", ""), "post": None, "modified": now, "modified_gmt": now,
+        }
+        self.media[media_id] = media
+        return 201, media, {}
+
+    def route(self, method: str, path: str, query: dict, body, headers=None, raw: bytes = b""):
+        if path == "/batch/v1" and method == "POST":
+            return self._batch(body)
+        if path == "/wp/v2/users/me":
+            return 200, {"id": 1, "name": "admin"}, {}
+        match = re.match(r"/wp/v2/(posts|tags|media)(?:/(\d+))?$", path)
+        if not match:
+            return 404, {"code": "rest_no_route", "data": {"status": 404}}, {}
+        kind, object_id = match.group(1), match.group(2)
+        store = getattr(self, kind)
+        with self._lock:
+            if method == "GET" and object_id:
+                obj = store.get(int(object_id))
+                if not obj:
+                    return 404, {"code": "rest_post_invalid_id", "data": {"status": 404}}, {}
+                return 200, self._fields(obj, query), {}
+            if method == "GET":
+                return self._list(kind, store, query)
+            if method == "POST" and kind == "media":
+                return self._upload(headers, raw)
+            if method == "POST" and kind == "tags" and not object_id:
+                name = body["name"]
+                for tag in store.values():
+                    if tag["name"].lower() == name.lower():
+                        return 400, {"code": "term_exists", "message": "이미 존재",
+                                     "data": {"status": 400, "term_id": tag["id"]}}, {}
+                tag_id = next(self._ids)
+                tag = {"id": tag_id, "name": name, "slug": quote(name.strip().lower().replace(" ", "-")).lower(), "count": 0}
+                store[tag_id] = tag
+                return 201, tag, {}
+            if method == "POST" and kind == "posts":
+                if object_id:
+                    post = store.get(int(object_id))
+                    if not post:
+                        return 404, {"code": "rest_post_invalid_id", "data": {"status": 404}}, {}
+                else:
+                    post = self._new_post()
+                self._apply_post(post, body)
+                return (200 if object_id else 201), post, {}
+            if method == "DELETE" and kind == "posts" and object_id:
+                post = store.get(int(object_id))
+                if not post:
+                    return 404, {"code": "rest_post_invalid_id", "data": {"status": 404}}, {}
+                if query.get("force", [""])[0] == "true":
+                    del store[post["id"]]
+                    return 200, {"deleted": True, "previous": post}, {}
+                # 실제 워드프레스처럼 휴지통으로 옮기면 슬러그에 __trashed가 붙고 수정 시각이 갱신됨
+                self._apply_post(post, {"status": "trash", "slug": f"{post['slug']}__trashed"})
+                return 200, post, {}
+        return 405, {"code": "rest_no_route"}, {}
+
+    def _batch(self, body: dict):
+        mode = self.batch_mode
+        if mode == "no_route":
+            return 404, {"code": "rest_no_route", "message": "No route", "data": {"status": 404}}, {}
+        if mode == "not_allowed":
+            return 400, {"code": "rest_batch_not_allowed", "data": {"status": 400}}, {}
+        if mode == "max_requests" or len(body["requests"]) > self.batch_max:
+            return 400, {"code": "rest_batch_max_requests", "data": {"status": 400}}, {}
+        responses = []
+        for request in body["requests"]:
+            target = urlparse(request["path"])
+            if not target.path.startswith(BATCH_ALLOWED):
+                responses.append({"status": 400, "headers": {},
+                                  "body": {"code": "rest_batch_not_allowed", "data": {"status": 400}}})
+                continue
+            status, result, _ = self.route(request.get("method", "POST"), target.path,
+                                           parse_qs(target.query), request.get("body", {}))
+            responses.append({"status": status, "headers": {}, "body": result})
+        if mode == "error":
+            # 하위 작업은 이미 반영된 뒤 게이트웨이 오류로 응답이 유실되는 상황
+            return 502, {"code": "bad_gateway"}, {}
+        if mode == "timeout":
+            time.sleep(self.batch_delay)
+        return 207, {"responses": responses}, {}
+
+    # ------------------------------------------------------------------
+    # HTTP 핸들러
+    # ------------------------------------------------------------------
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body, headers: dict = None, raw: bytes = None, content_type: str = None):
+                data = raw if raw is not None else json.dumps(body).encode("utf-8")
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", content_type or "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    for key, value in (headers or {}).items():
+                        self.send_header(key, value)
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def _handle(self, method: str):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                length = int(self.headers.get("Content-Length", 0) or 0)
+                raw = self.rfile.read(length) if length else b""
+                fake.log.append((method, parsed.path, query, dict(self.headers), raw))
+
+                failure = None
+                with fake._lock:
+                    for i, candidate in enumerate(fake.failures):
+                        if ((candidate["path"] is None or parsed.path.startswith(candidate["path"]))
+                                and candidate["method"] in (None, method)):
+                            failure = fake.failures.pop(i)
+                            break
+                if failure and failure["status"] is not None:
+                    time.sleep(failure["delay"])
+                    return self._send(failure["status"], failure["body"] or {"code": "fake_failure"}, failure["headers"])
+
+                if parsed.path.startswith("/wp-content/"):
+                    data = fake.files.get(parsed.path)
+                    if data is None:
+                        return self._send(404, {"code": "not_found"})
+                    return self._send(200, None, raw=data, content_type="application/octet-stream")
+
+                body = None
+                if "json" in self.headers.get("Content-Type", ""):
+                    body = json.loads(raw or b"{}")
+                status, result, headers = fake.route(
+                    method, parsed.path.replace("/wp-json", "", 1), query, body, self.headers, raw
+                )
+                if failure:
+                    time.sleep(failure["delay"])
+                self._send(status, result, headers)
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+            def do_DELETE(self):
+                self._handle("DELETE")
+
+        return Handler
@@ -0,0 +1,34 @@
+import asyncio
+import inspect
+
+from src.core.async_wp_client import AsyncWordPressClient
+from src.core.wp_client import WordPressClient
+
+def test_wrapper_signatures_match_sync_client():
+    for name in ("upload_image", "upload_image_data", "create_post", "upsert_post",
+                 "update_post", "get_post", "get_recent_posts", "get_or_create_tags"):
+        sync_params = list(inspect.signature(getattr(WordPressClient, name)).parameters)
+        async_params = list(inspect.signature(getattr(AsyncWordPressClient, name)).parameters)
+        assert async_params == sync_params, name
+
+def test_upload_images_keeps_input_order(fake_wp, wp_client):
+    uploader = AsyncWordPressClient(wp_client, max_concurrency=3)
+    images = [
+        {"image_bytes": f"image-{i}".encode(), "file_name": f"img_{i}.webp", "title": f"이미지 {i}"}
+        for i in range(5)
+    ]
+
+    results = asyncio.run(uploader.upload_images(images))
+
+    assert [fake_wp.media[r["id"]]["slug"] for r in results] == [f"img_{i}" for i in range(5)]
+    assert len(fake_wp.requests("POST", "/wp-json/wp/v2/media")) == 5
+
+def test_update_post_passes_diff_through(fake_wp, wp_client):
+    post = fake_wp.add_post(title="제목", content="<p>본문</p>", status="draft")
+    uploader = AsyncWordPressClient(wp_client)
+
+    result = asyncio.run(uploader.update_post(post["id"], {"title": "제목", "content": "<p>본문</p>"}, diff=True))
+
+    assert result["title"] == "제목"
+    assert fake_wp.requests("POST", f"/wp-json/wp/v2/posts/{post['id']}") == []
+    assert wp_client.get_diff_stats()["skipped"] == 1
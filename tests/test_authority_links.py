@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from src.config.settings import Config
+from src.core.authority_links import AuthorityLinkRegistry
+
+REGISTRY = {
+    "government": [
+        {"name": "정부24", "url": "https://gov.test", "keywords": ["민원", "보조금"]},
+    ],
+    "welfare": [
+        {"name": "복지로", "url": "https://welfare.test", "keywords": ["복지", "부모급여", "아동수당"]},
+    ],
+    "tax": [
+        {"name": "국세청", "url": "https://tax.test", "keywords": ["세금", "근로장려금"]},
+        {"name": "홈택스", "url": "https://hometax.test", "keywords": ["신고", "근로장려금 신청"]},
+    ],
+}
+
+class StubValidator:
+    """validate_many 결과를 미리 정해 둔 검증기 (refresh 인자도 기록)"""
+
+    def __init__(self, failed=()):
+        self.failed = set(failed)
+        self.calls = []
+
+    def validate_many(self, urls, refresh=False):
+        self.calls.append((list(urls), refresh))
+        return {url: ("Status 404" if url in self.failed else None) for url in urls}
+
+@pytest.fixture
+def registry(tmp_path):
+    path = tmp_path / "authority_links.json"
+    path.write_text(json.dumps(REGISTRY, ensure_ascii=False), encoding="utf-8")
+    return AuthorityLinkRegistry(path=str(path), status_path=str(tmp_path / "status.json"))
+
+def test_longer_keyword_wins(registry):
+    assert registry.match("근로장려금 신청 방법")["name"] == "홈택스"
+    assert registry.match("부모급여 인상")["name"] == "복지로"
+    assert registry.match("날씨 이야기") is None
+
+def test_sections_get_distinct_sources_with_fallback(registry):
+    plans = registry.match_sections(["부모급여 신청", "아동수당 기준", "여행 팁"], topic="육아 복지")
+
+    assert plans[0]["name"] == "복지로"
+    # 같은 출처는 한 번만 쓰고, 맞는 출처가 없으면 범용(정부) 출처를 배정
+    assert plans[1]["name"] == "정부24"
+    assert len({plan["url"] for plan in plans}) == 3
+
+def test_failed_source_is_skipped_after_revalidation(registry):
+    result = registry.revalidate(StubValidator(failed={"https://welfare.test"}))
+
+    assert result == {"checked": 4, "failed": ["https://welfare.test"]}
+    assert registry.match("부모급여") is None
+    assert registry.match_sections(["부모급여"])[0]["name"] == "정부24"
+
+def test_revalidation_result_is_persisted(registry):
+    registry.revalidate(StubValidator(failed={"https://tax.test"}))
+
+    reloaded = AuthorityLinkRegistry(path=registry.path, status_path=registry.status_path)
+    assert not reloaded.is_available({"url": "https://tax.test"})
+    assert reloaded.is_available({"url": "https://gov.test"})
+    assert not reloaded.needs_revalidation()
+
+def test_all_failures_are_treated_as_network_problem(registry):
+    everything = {entry["url"] for entry in registry.entries}
+
+    registry.revalidate(StubValidator(failed=everything))
+
+    assert registry.status["revalidated_at"] == 0
+    assert all(registry.is_available(entry) for entry in registry.entries)
+
+def test_background_revalidation_runs_only_when_stale(registry, monkeypatch):
+    validator = StubValidator()
+    thread = registry.revalidate_in_background(validator)
+    thread.join(5)
+    assert len(validator.calls) == 1
+    assert validator.calls[0][1] is True  # 저장된 검사 결과를 무시하고 다시 확인
+
+    assert registry.revalidate_in_background(validator) is None
+    monkeypatch.setattr(Config, "AUTHORITY_REVALIDATE_HOURS", 0)
+    registry.revalidate_in_background(validator).join(5)
+    assert len(validator.calls) == 2
+
+def test_shipped_registry_loads_with_unique_urls():
+    registry = AuthorityLinkRegistry(status_path="/nonexistent/status.json")
+    urls = [entry["url"] for entry in registry.entries]
+    assert urls
+    assert len(urls) == len(set(urls))
+    assert any(entry["category"] == "government" for entry in registry.entries)
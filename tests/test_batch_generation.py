@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from src.config.settings import Config
+from src.core.batch_generation import BatchCampaign, LocalBatchBackend, fake_batch_response
+
+@pytest.fixture
+def campaign(make_generator, tmp_path):
+    campaign = BatchCampaign("test", generator=make_generator(lambda kwargs: ""), root=str(tmp_path))
+    campaign.add_topics(["청년도약계좌", "근로장려금"])
+    return campaign
+
+def _run(campaign, backend, limit=10):
+    for _ in range(limit):
+        summary = campaign.step(backend)
+        if summary["finished"]:
+            return summary
+    raise AssertionError(f"{limit}회 안에 끝나지 않음: {summary}")
+
+def test_campaign_runs_outline_then_body_round_to_completion(campaign):
+    summary = _run(campaign, LocalBatchBackend(campaign.dir))
+
+    assert summary["statuses"] == {"done": 2}
+    assert summary["rounds"] == 2
+    assert [r["requests"] for r in campaign.state["rounds"]] == [2, 2 * (3 + 6)]
+    with open(campaign.state["topics"][0]["post_path"], encoding="utf-8") as f:
+        post = json.load(f)
+    assert post["topic"] == "청년도약계좌"
+    assert post["content"].count("<h2>") >= 6
+
+def test_request_failing_once_is_resubmitted_next_round(campaign):
+    failed_once = set()
+
+    def responder(custom_id, body):
+        if custom_id == "t000:intro" and custom_id not in failed_once:
+            failed_once.add(custom_id)
+            return None
+        return fake_batch_response(custom_id, body)
+
+    summary = _run(campaign, LocalBatchBackend(campaign.dir, responder))
+
+    assert summary["statuses"] == {"done": 2}
+    assert summary["rounds"] == 3
+    assert campaign.state["rounds"][2]["requests"] == 1
+    assert campaign.state["topics"][0]["attempts"]["t000:intro"] == 2
+
+def test_request_failing_past_retry_limit_fails_only_its_topic(campaign, monkeypatch):
+    monkeypatch.setattr(Config, "BATCH_MAX_RETRIES", 1)
+
+    def responder(custom_id, body):
+        return None if custom_id == "t001:faq" else fake_batch_response(custom_id, body)
+
+    summary = _run(campaign, LocalBatchBackend(campaign.dir, responder))
+
+    assert summary["statuses"] == {"done": 1, "failed": 1}
+    assert summary["rounds"] == 3
+    failed = campaign.state["topics"][1]
+    assert failed["status"] == "failed"
+    assert "t001:faq" in failed["error"]
+    assert failed["post_path"] is None
+
+def test_state_survives_reload_between_steps(campaign, tmp_path):
+    backend = LocalBatchBackend(campaign.dir)
+    campaign.step(backend)
+
+    reloaded = BatchCampaign("test", generator=campaign.generator, root=str(tmp_path))
+    summary = _run(reloaded, backend)
+
+    assert summary["statuses"] == {"done": 2}
@@ -0,0 +1,62 @@
+import re
+import threading
+import time
+
+import pytest
+
+def _section_title(kwargs):
+    return re.search(r"섹션 제목: (.+)", kwargs["messages"][-1]["content"]).group(1).strip()
+
+class SectionResponder:
+    """앞 섹션일수록 늦게 끝나도록 응답하고 동시에 진행 중인 호출 수의 최댓값을 기록합니다."""
+
+    def __init__(self, titles, fail=None):
+        self.titles = titles
+        self.fail = fail
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, kwargs):
+        title = _section_title(kwargs)
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.05 * (len(self.titles) - self.titles.index(title)))
+            if title == self.fail:
+                raise RuntimeError("API 오류")
+            return f"<h2>{title}</h2><p>{title} 본문</p>"
+        finally:
+            with self.lock:
+                self.active -= 1
+
+def _jobs(titles):
+    return [(title, [], None) for title in titles]
+
+def test_sections_run_concurrently_and_keep_outline_order(make_generator):
+    titles = [f"섹션 {i}" for i in range(6)]
+    responder = SectionResponder(titles)
+    generator = make_generator(responder, section_concurrency=3)
+
+    results = generator._generate_sections("주제", "키워드", _jobs(titles))
+
+    assert [re.search(r"<h2>(.+?)</h2>", html).group(1) for html in results] == titles
+    assert responder.peak == 3
+
+def test_single_worker_runs_sections_one_at_a_time(make_generator):
+    titles = ["하나", "둘", "셋"]
+    responder = SectionResponder(titles)
+    generator = make_generator(responder, section_concurrency=1)
+
+    results = generator._generate_sections("주제", "키워드", _jobs(titles))
+
+    assert len(results) == 3
+    assert responder.peak == 1
+
+def test_failed_section_fails_the_stage(make_generator):
+    titles = ["하나", "둘", "셋"]
+    generator = make_generator(SectionResponder(titles, fail="하나"), section_concurrency=2)
+
+    with pytest.raises(RuntimeError):
+        generator._generate_sections("주제", "키워드", _jobs(titles))
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+
+from src.core.hedging import AttemptCancelled, DeadlineExceeded, LatencyTracker, hedged_call
+
+class PrimaryLatency:
+    """on_primary_done으로 받은 값을 기록하고 기록될 때까지 기다릴 수 있게 합니다."""
+
+    def __init__(self):
+        self.values = []
+        self.done = threading.Event()
+
+    def __call__(self, seconds):
+        self.values.append(seconds)
+        self.done.set()
+
+    def wait(self):
+        assert self.done.wait(2), "원래 시도의 지연 시간이 기록되지 않음"
+        return self.values[0]
+
+def _attempts(primary, hedge):
+    calls = []
+
+    def run(cancel, progress):
+        calls.append(cancel)
+        return (primary if len(calls) == 1 else hedge)(cancel, progress)
+    return run
+
+def _sleep(seconds, value, cancellable=False):
+    def attempt(cancel, progress):
+        if cancellable:
+            if cancel.wait(seconds):
+                raise AttemptCancelled("test")
+        else:
+            time.sleep(seconds)
+        return value
+    return attempt
+
+def test_fast_primary_records_its_own_latency():
+    latency = PrimaryLatency()
+
+    value, info = hedged_call(_sleep(0.05, "primary"), None, 2, on_primary_done=latency)
+
+    assert value == "primary" and not info["hedged"]
+    assert 0.04 <= latency.wait() < 0.5
+
+def test_slow_primary_that_loses_hedge_is_recorded_when_it_finishes():
+    latency = PrimaryLatency()
+
+    value, info = hedged_call(_attempts(_sleep(0.4, "primary"), _sleep(0.02, "hedge")), 0.1, 2,
+                              on_primary_done=latency)
+
+    assert value == "hedge" and info["winner"] == "hedge"
+    assert info["elapsed"] < 0.3
+    assert latency.wait() >= 0.38  # 이긴 쪽의 경과 시간이 아니라 원래 시도가 실제로 걸린 시간
+
+def test_cancelled_primary_is_censored_at_cancel_point():
+    latency = PrimaryLatency()
+
+    value, info = hedged_call(_attempts(_sleep(5, "primary", cancellable=True), _sleep(0.05, "hedge")), 0.1, 2,
+                              on_primary_done=latency)
+
+    assert value == "hedge"
+    assert info["elapsed"] - 0.05 <= latency.wait() <= info["elapsed"] + 0.05
+
+def test_primary_abandoned_at_deadline_is_still_recorded():
+    latency = PrimaryLatency()
+
+    with pytest.raises(DeadlineExceeded):
+        hedged_call(_sleep(5, "primary", cancellable=True), None, 0.2, on_primary_done=latency)
+
+    assert 0.18 <= latency.wait() < 0.5
+
+def test_primary_error_is_not_recorded():
+    latency = PrimaryLatency()
+
+    def fail(cancel, progress):
+        raise RuntimeError("API 오류")
+
+    with pytest.raises(RuntimeError):
+        hedged_call(fail, None, 2, on_primary_done=latency)
+
+    assert not latency.done.wait(0.1)
+
+def test_generator_records_primary_latency_even_after_deadline(make_generator, tmp_path):
+    slow = threading.Event()
+
+    def responder(kwargs):
+        if slow.is_set():
+            time.sleep(0.4)
+        return "<p>본문</p>"
+
+    generator = make_generator(responder, model_routes={"intro": {"timeout": 0.2}})
+    generator.latency = LatencyTracker(db_path=str(tmp_path / "latency.sqlite3"), window=10, min_samples=1)
+    model = generator.router.route("intro")["model"]
+
+    generator._chat([{"role": "user", "content": "빠름"}], stage="intro")
+    slow.set()
+    with pytest.raises(DeadlineExceeded):
+        generator._chat([{"role": "user", "content": "느림"}], stage="intro")
+    time.sleep(0.4)  # 버려진 일괄 호출이 끝나 지연 시간이 기록될 때까지
+
+    samples = sorted(generator.latency._history("intro", model))
+    assert len(samples) == 2
+    assert samples[0] < 0.1 and samples[1] >= 0.38
+    assert generator.latency.p95("intro", model) >= 0.38
@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from src.core.host_governor import HostGovernor, get_governor
+
+def test_throttle_halves_limit_and_success_grows_it_back():
+    governor = HostGovernor("example.test", max_concurrency=8, min_concurrency=1, max_rps=0)
+
+    governor.acquire()
+    governor.release(429, 0.1)
+    assert int(governor.limit) == 4
+    assert governor.throttled == 1
+
+    for _ in range(20):
+        governor.acquire()
+        governor.release(200, 0.1)
+    assert 4 < governor.limit <= 8
+
+def test_decrease_is_applied_once_per_window():
+    governor = HostGovernor("example.test", max_concurrency=8, max_rps=0)
+    for _ in range(3):
+        governor.acquire()
+        governor.release(503, 0.1)
+    assert int(governor.limit) == 4
+
+def test_limit_never_drops_below_minimum():
+    governor = HostGovernor("example.test", max_concurrency=4, min_concurrency=2, max_rps=0)
+    governor._decrease(0.1, "테스트")
+    assert governor.limit == 2
+
+def test_concurrency_limit_blocks_extra_requests():
+    governor = HostGovernor("example.test", max_concurrency=2, max_rps=0)
+    governor.acquire()
+    governor.acquire()
+    acquired = threading.Event()
+
+    def third():
+        governor.acquire()
+        acquired.set()
+
+    threading.Thread(target=third, daemon=True).start()
+    assert not acquired.wait(0.2)
+    governor.release(200, 0.01)
+    assert acquired.wait(2)
+
+def test_retry_after_blocks_new_requests():
+    governor = HostGovernor("example.test", max_concurrency=4, max_rps=0)
+    governor.acquire()
+    governor.release(429, 0.01, retry_after=0.3)
+
+    started = time.monotonic()
+    governor.acquire()
+    assert time.monotonic() - started >= 0.25
+    governor.release(200, 0.01)
+
+def test_rps_limit_spaces_request_starts():
+    governor = HostGovernor("example.test", max_concurrency=4, max_rps=20)
+    started = time.monotonic()
+    for _ in range(4):
+        governor.acquire()
+        governor.release(200, 0.001)
+    assert time.monotonic() - started >= 0.14
+
+def test_governor_is_shared_per_host():
+    assert get_governor("a.test") is get_governor("a.test")
+    assert get_governor("a.test") is not get_governor("b.test")
+
+def test_client_reports_throttling_to_governor(fake_wp, wp_client):
+    fake_wp.fail_next(429, headers={"Retry-After": "0.2"})
+
+    assert wp_client.get_user_info()["id"] == 1
+
+    stats = wp_client.get_governor_stats()
+    assert stats["throttled"] == 1
+    assert stats["requests"] == 2
+    assert stats["in_flight"] == 0
+
+@pytest.mark.parametrize("error", [
+    requests.exceptions.ChunkedEncodingError("연결 중간 끊김"),
+    requests.exceptions.ContentDecodingError("gzip 오류"),
+    requests.exceptions.TooManyRedirects("리다이렉트 반복"),
+    requests.exceptions.InvalidURL("잘못된 URL"),
+    KeyboardInterrupt(),
+])
+def test_slot_is_released_when_request_raises_unexpected_error(wp_client, monkeypatch, error):
+    def fail(*args, **kwargs):
+        raise error
+    monkeypatch.setattr(wp_client.session, "request", fail)
+
+    with pytest.raises(type(error)):
+        wp_client._request("GET", f"{wp_client.base_url}/users/me")
+
+    stats = wp_client.get_governor_stats()
+    assert stats["in_flight"] == 0
+    assert stats["errors"] == 1
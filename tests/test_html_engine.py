@@ -0,0 +1,92 @@
+from bench_html_engine import KEYWORD, build_sample, legacy_chain
+from src.core.html_engine import analyze_html, process_post_html
+
+def _run(sample):
+    return process_post_html(sample["html"], keyword=KEYWORD, body_image_htmls=sample["images"],
+                             link_failures=sample["failures"], internal_urls=sample["internal_urls"])
+
+def test_stats_match_legacy_regex_chain():
+    sample = build_sample(8)
+    legacy = legacy_chain(sample["html"], sample["failures"], sample["images"], sample["internal_urls"])
+
+    stats = _run(sample)["stats"]
+
+    assert (stats["h2_count"], stats["img_count"], stats["keyword_count"], stats["text_length"]) == (9, 3, 23, 1403)
+    for key in ("h2_count", "keyword_count", "text_length"):
+        assert stats[key] == legacy["stats"][key]
+    assert stats["internal_links"] == 8
+    assert stats["external_links"] == 8
+
+def test_failed_links_are_unwrapped_in_document_order():
+    sample = build_sample(3)
+
+    result = _run(sample)
+
+    assert result["removed_links"] == [(f"https://example.go.kr/missing/{i}", "Status 404") for i in range(3)]
+    assert "example.go.kr" not in result["html"]
+    assert "[없는 페이지]" in result["html"]
+    assert result["html"].count('href="https://www.gov.kr/portal/service/') == 3
+    assert result["html"].count("href='https://smart-work-solution.com/post-") == 3
+
+def test_internal_link_is_kept_even_if_reported_failed():
+    html = '<p><a href="https://smart-work-solution.com/a">내부</a> <a href="https://ext.test/x?a=1&amp;b=2">외부</a></p>'
+    failures = {"https://smart-work-solution.com/a": "Status 404", "https://ext.test/x?a=1&b=2": "Timeout"}
+
+    result = process_post_html(html, link_failures=failures, internal_urls=["https://smart-work-solution.com"])
+
+    assert result["html"] == '<p><a href="https://smart-work-solution.com/a">내부</a> 외부</p>'
+    assert result["removed_links"] == [("https://ext.test/x?a=1&b=2", "Timeout")]
+
+def test_cleanup_removes_fences_and_placeholders():
+    html = "```html\n<p>본문 [이미지 설명: 차트]</p>\n그림 1 예시\n**이미지 설명:** 사진\n<p>끝</p>\n```"
+
+    result = process_post_html(html)
+
+    assert result["html"] == "<p>본문 </p>\n<p>끝</p>"
+    assert result["placeholders_removed"] == 5
+
+def test_images_are_inserted_after_h2_with_lazy_attributes():
+    html = "<h2>하나</h2><p>a</p><h2>둘</h2><p>b</p><h2>셋</h2>"
+    images = ['<img src="1.webp"/>', '<img src="2.webp" loading="eager">']
+
+    result = process_post_html(html, body_image_htmls=images)
+
+    assert result["images_inserted"] == 2
+    assert result["html"] == (
+        '<h2>하나</h2><img src="1.webp" loading="lazy" decoding="async" />'
+        '<p>a</p><h2>둘</h2><img src="2.webp" loading="eager" decoding="async">'
+        "<p>b</p><h2>셋</h2>"
+    )
+
+def test_without_injection_html_is_left_untouched():
+    html = '<p><img src="a.webp"><a href="https://ok.test" target="_blank">링크</a></p>'
+
+    result = process_post_html(html, link_failures={"https://ok.test": None}, cleanup=False, inject_attributes=False)
+
+    assert result["html"] == html
+
+def test_analyze_counts_keyword_density():
+    stats = analyze_html("<h2>키워드</h2><h3>소제목</h3><p>키워드 본문</p>", keyword="키워드")
+
+    assert stats["keyword_count"] == 2
+    assert stats["text_length"] == len("키워드소제목키워드 본문")
+    assert (stats["h2_count"], stats["h3_count"]) == (1, 1)
+    assert stats["keyword_density"] == round(2 * 3 / stats["text_length"] * 100, 2)
+
+def test_blank_target_links_get_noopener():
+    html = (
+        '<a href="https://a.test" target="_blank">a</a>'
+        '<a href="https://b.test" target=_blank rel="nofollow">b</a>'
+        '<a href="https://c.test" target="_blank" rel="noopener">c</a>'
+        '<a href="https://d.test">d</a>'
+    )
+
+    result = process_post_html(html)
+
+    assert result["html"] == (
+        '<a rel="noopener" href="https://a.test" target="_blank">a</a>'
+        '<a href="https://b.test" target=_blank rel="nofollow noopener">b</a>'
+        '<a href="https://c.test" target="_blank" rel="noopener">c</a>'
+        '<a href="https://d.test">d</a>'
+    )
+    assert result["stats"]["external_links"] == 4
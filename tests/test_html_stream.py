@@ -0,0 +1,91 @@
+import pytest
+
+from src.core.html_stream import DelimitedStreamSplitter, StreamingHTMLCleaner
+
+RESPONSE = (
+    "```html\n<h2>정부 지원금</h2>\n<p>자세한 내용은 "
+    "<a href=\"https://www.gov.kr/portal/main\" target=\"_blank\">정부24</a>에서 확인하세요.</p>\n"
+    "<p>참고: <a href='https://www.fss.or.kr'>금융감독원</a></p>\n```"
+)
+
+def _clean(text):
+    return text.replace("```html", "").replace("```", "").strip()
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(RESPONSE)])
+def test_cleaner_matches_whole_string_cleanup_for_any_chunking(size):
+    links = []
+    cleaner = StreamingHTMLCleaner(on_link=links.append)
+    for chunk in _chunks(RESPONSE, size):
+        cleaner.feed(chunk)
+
+    assert cleaner.close() == _clean(RESPONSE)
+    assert links == ["https://www.gov.kr/portal/main", "https://www.fss.or.kr"]
+
+def test_link_is_reported_as_soon_as_tag_closes():
+    links = []
+    cleaner = StreamingHTMLCleaner(on_link=links.append)
+    cleaner.feed("<p><a href=\"https://example.com\">예")
+    assert links == []
+    cleaner.feed("시</a> 이후 텍스트")
+    assert links == ["https://example.com"]
+
+def test_backticks_that_are_not_a_fence_are_kept():
+    cleaner = StreamingHTMLCleaner()
+    for chunk in ["<code>`x`", "</code>"]:
+        cleaner.feed(chunk)
+    assert cleaner.close() == "<code>`x`</code>"
+
+SINGLE_CALL = (
+    "<<<INTRO>>>\n<p>서론</p>\n"
+    "<<<SECTION:1>>>\n```html\n<h2>첫 섹션</h2><p><a href=\"https://www.gov.kr\">정부24</a></p>\n```\n"
+    "<<<SECTION:2>>>\n<h2>둘째 섹션</h2>\n"
+    "<<<FAQ>>>\n<details><summary>Q</summary>A</details>\n"
+    "<<<END>>>\n끝난 뒤 잡담"
+)
+
+@pytest.mark.parametrize("size", [1, 2, 5, 13, len(SINGLE_CALL)])
+def test_splitter_reports_each_part_when_the_next_marker_arrives(size):
+    seen = []
+    links = []
+    splitter = DelimitedStreamSplitter(on_part=lambda part, html: seen.append((part, html)), on_link=links.append)
+    for chunk in _chunks(SINGLE_CALL, size):
+        splitter.feed(chunk)
+    parts = splitter.close()
+
+    assert seen == [
+        ("intro", "<p>서론</p>"),
+        (0, "<h2>첫 섹션</h2><p><a href=\"https://www.gov.kr\">정부24</a></p>"),
+        (1, "<h2>둘째 섹션</h2>"),
+        ("faq", "<details><summary>Q</summary>A</details>"),
+    ]
+    assert parts == dict(seen)
+    assert links == ["https://www.gov.kr"]
+
+def test_splitter_finishes_last_part_on_close_without_end_marker():
+    seen = []
+    splitter = DelimitedStreamSplitter(on_part=lambda part, html: seen.append(part))
+    splitter.feed("<<<INTRO>>> 서론 <<<section: 1>>> 섹션")
+    assert seen == ["intro"]
+
+    assert splitter.close() == {"intro": "서론", 0: "섹션"}
+    assert seen == ["intro", 0]
+
+def test_splitter_keeps_text_without_markers_as_preamble():
+    splitter = DelimitedStreamSplitter()
+    splitter.feed("구분자 없이 온 응답 << 본문")
+    assert splitter.close() == {}
+    assert splitter.preamble == "구분자 없이 온 응답 << 본문"
+
+def test_splitter_ignores_feed_after_close():
+    seen = []
+    splitter = DelimitedStreamSplitter(on_part=lambda part, html: seen.append(part))
+    splitter.feed("<<<INTRO>>>\n<p>서론</p>\n<<<SECTION:1>>>\n<h2>하나</h2>")
+
+    assert splitter.close() == {"intro": "<p>서론</p>", 0: "<h2>하나</h2>"}
+    splitter.feed("<p>늦게 온 조각</p>\n<<<FAQ>>>\n<details></details>")
+
+    assert splitter.close() == {"intro": "<p>서론</p>", 0: "<h2>하나</h2>"}
+    assert seen == ["intro", 0]
@@ -0,0 +1,155 @@
+import threading
+
+import pytest
+
+from src.core.image_pipeline import ImagePipeline
+from src.core.image_processor import ImageProcessor
+
+OUTLINE = {"title": "2026 청년도약계좌 총정리", "slug": "youth-leap", "focus_keyword": "청년도약계좌",
+           "description": "청년도약계좌 가입 조건 정리"}
+
+def _images(count=4):
+    return [{"type": "featured" if i == 0 else "body", "prompt": f"썸네일용: prompt {i}" if i == 0 else f"prompt {i}",
+             "alt": f"청년도약계좌 이미지 {i}", "caption": f"청년도약계좌 캡션 {i}"} for i in range(count)]
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    processor = ImageProcessor(persist=False)
+    monkeypatch.setattr(processor, "_render_webp", lambda prompt: f"webp:{prompt}".encode())
+    return processor
+
+@pytest.fixture
+def pipeline(processor, fake_wp, wp_client):
+    return ImagePipeline(processor, wp_client)
+
+def test_join_before_start_returns_empty_result(pipeline):
+    assert not pipeline.started
+    assert pipeline.join() == {"featured_media_id": None, "body_images": [], "media_ids": []}
+
+def test_start_ignores_empty_images_and_second_start(pipeline, fake_wp):
+    assert pipeline.start([], OUTLINE) is False
+    assert pipeline.start(_images(), OUTLINE) is True
+    assert pipeline.start(_images(), OUTLINE) is False
+
+    assert len(pipeline.join()["media_ids"]) == 4
+    assert len(fake_wp.requests("POST", "/wp-json/wp/v2/media")) == 4
+
+def test_images_are_generated_uploaded_and_joined(pipeline, fake_wp):
+    pipeline.start(_images(), OUTLINE)
+
+    result = pipeline.join(timeout=10)
+
+    featured = fake_wp.media[result["featured_media_id"]]
+    assert featured["slug"] == "youth-leap_thumb"
+    assert result["media_ids"][0] == result["featured_media_id"]
+    assert [image["alt"] for image in result["body_images"]] == [f"청년도약계좌 이미지 {i}" for i in (1, 2, 3)]
+    assert [image["caption"] for image in result["body_images"]] == [f"청년도약계좌 캡션 {i}" for i in (1, 2, 3)]
+    assert [image["url"] for image in result["body_images"]] == [
+        fake_wp.media[media_id]["source_url"] for media_id in result["media_ids"][1:]
+    ]
+    assert sorted(m["slug"] for m in fake_wp.media.values()) == [
+        "youth-leap_body_1", "youth-leap_body_2", "youth-leap_body_3", "youth-leap_thumb"
+    ]
+
+def test_failed_image_is_skipped_without_affecting_others(pipeline, processor, monkeypatch):
+    def render(prompt):
+        if prompt == "prompt 2":
+            raise RuntimeError("content policy")
+        return f"webp:{prompt}".encode()
+    monkeypatch.setattr(processor, "_render_webp", render)
+
+    pipeline.start(_images(), OUTLINE)
+    result = pipeline.join(timeout=10)
+
+    assert result["featured_media_id"] is not None
+    assert [image["alt"] for image in result["body_images"]] == ["청년도약계좌 이미지 1", "청년도약계좌 이미지 3"]
+    assert len(result["media_ids"]) == 3
+
+def test_failed_thumbnail_leaves_no_featured_media(pipeline, processor, monkeypatch):
+    def render(prompt):
+        if prompt == "prompt 0":
+            raise RuntimeError("content policy")
+        return f"webp:{prompt}".encode()
+    monkeypatch.setattr(processor, "_render_webp", render)
+
+    pipeline.start(_images(), OUTLINE)
+    result = pipeline.join(timeout=10)
+
+    assert result["featured_media_id"] is None
+    assert len(result["body_images"]) == 3
+
+def test_join_timeout_returns_empty_result(pipeline, processor, monkeypatch):
+    release = threading.Event()
+
+    def render(prompt):
+        release.wait(5)
+        return b"webp"
+    monkeypatch.setattr(processor, "_render_webp", render)
+
+    pipeline.start(_images(), OUTLINE)
+    assert pipeline.join(timeout=0.1) == {"featured_media_id": None, "body_images": [], "media_ids": []}
+    release.set()
+
+def test_processing_exception_is_logged_and_empty(pipeline, processor, monkeypatch):
+    def explode(jobs, **kwargs):
+        raise RuntimeError("인코더 오류")
+    monkeypatch.setattr(processor, "generate_images", explode)
+
+    pipeline.start(_images(), OUTLINE)
+
+    assert pipeline.join() == {"featured_media_id": None, "body_images": [], "media_ids": []}
+
+def test_abandon_waits_for_uploads_and_reports_orphans(pipeline, fake_wp, caplog):
+    pipeline.abandon()  # 시작 전에는 아무 일도 하지 않음
+    pipeline.start(_images(), OUTLINE)
+
+    pipeline.abandon()
+
+    assert len(fake_wp.media) == 4
+    assert "글에 연결되지 않은 업로드 미디어" in caplog.text
+
+def test_uploads_start_as_each_image_finishes(pipeline, processor, fake_wp, monkeypatch):
+    uploaded_before_thumb = []
+
+    def render(prompt):
+        if prompt == "prompt 0":
+            # 썸네일은 본문 이미지 3장이 모두 업로드된 뒤에야 끝남
+            for _ in range(500):
+                if len(fake_wp.media) == 3:
+                    break
+                threading.Event().wait(0.01)
+            uploaded_before_thumb.append(len(fake_wp.media))
+        return f"webp:{prompt}".encode()
+    monkeypatch.setattr(processor, "_render_webp", render)
+
+    pipeline.start(_images(), OUTLINE)
+    result = pipeline.join(timeout=10)
+
+    assert uploaded_before_thumb == [3]
+    assert result["featured_media_id"] == result["media_ids"][0] == max(fake_wp.media)
+    assert [image["alt"] for image in result["body_images"]] == [f"청년도약계좌 이미지 {i}" for i in (1, 2, 3)]
+
+def test_uploads_share_the_async_client_concurrency_limit(pipeline, wp_client, monkeypatch):
+    lock = threading.Lock()
+    active, peak = [0], [0]
+    upload = wp_client.upload_image_data
+
+    def tracked(*args, **kwargs):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        threading.Event().wait(0.05)
+        try:
+            return upload(*args, **kwargs)
+        finally:
+            with lock:
+                active[0] -= 1
+    monkeypatch.setattr(wp_client, "upload_image_data", tracked)
+    pipeline.uploader.max_concurrency = 2
+
+    pipeline.start(_images(), OUTLINE)
+
+    assert len(pipeline.join(timeout=10)["media_ids"]) == 4
+    assert peak[0] <= 2
+    assert pipeline.uploader.client is wp_client
@@ -0,0 +1,67 @@
+import os
+import time
+
+import pytest
+
+from src.core.image_processor import ImageProcessor
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    processor = ImageProcessor(persist=False)
+    monkeypatch.setattr(processor, "_render_webp", lambda prompt: f"webp:{prompt}".encode())
+    return processor
+
+def test_generate_image_data_returns_bytes_without_touching_disk(processor):
+    result = processor.generate_image_data("고양이", "cat.png")
+
+    assert result["data"] == "webp:고양이".encode()
+    assert result["file_name"] == "cat.webp"
+    assert result["mime_type"] == "image/webp"
+    assert result["saved"] is None
+    assert os.listdir(processor.output_dir) == []
+
+def test_persist_writes_copy_in_background(processor):
+    result = processor.generate_image_data("강아지", "dog.webp", persist=True)
+
+    saved_path = result["saved"].result(timeout=5)
+    with open(saved_path, "rb") as f:
+        assert f.read() == result["data"]
+
+def test_render_failure_returns_none(processor, monkeypatch):
+    def fail(prompt):
+        raise RuntimeError("content policy")
+    monkeypatch.setattr(processor, "_render_webp", fail)
+
+    assert processor.generate_image_data("실패", "fail.webp") is None
+
+def test_in_memory_image_uploads_as_is(fake_wp, wp_client, processor):
+    image = processor.generate_image_data("업로드", "upload.webp")
+
+    result = wp_client.upload_image_data(image["data"], image["file_name"], mime_type=image["mime_type"])
+
+    assert fake_wp.files["/wp-content/uploads/upload.webp"] == image["data"]
+    assert fake_wp.media[result["id"]]["mime_type"] == "image/webp"
+
+def test_generate_images_reports_in_completion_order_and_returns_input_order(processor, monkeypatch):
+    def render(prompt):
+        time.sleep({"느림": 0.3, "보통": 0.15, "빠름": 0.0}[prompt])
+        return f"webp:{prompt}".encode()
+    monkeypatch.setattr(processor, "_render_webp", render)
+    ready = []
+
+    results = processor.generate_images(
+        [{"prompt": p, "file_name": f"{p}.webp"} for p in ("느림", "보통", "빠름")], concurrency=3,
+        on_ready=lambda idx, result: ready.append(idx)
+    )
+
+    assert ready == [2, 1, 0]
+    assert [r["data"] for r in results] == [b"webp:" + p.encode() for p in ("느림", "보통", "빠름")]
+
+def test_failing_ready_callback_does_not_lose_results(processor):
+    def explode(idx, result):
+        raise RuntimeError("콜백 오류")
+
+    results = processor.generate_images([{"prompt": "a", "file_name": "a.webp"}], on_ready=explode)
+
+    assert results[0]["data"] == b"webp:a"
@@ -0,0 +1,147 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from src.core.link_validator import LinkValidator
+
+class LinkServer:
+    """
+    외부 사이트 역할을 하는 로컬 서버입니다.
+    /ok 200, /head-blocked HEAD 405·GET 200, /missing 404, /throttled 429, /slow 0.2초 후 200
+    """
+
+    def __init__(self):
+        self.log = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def hits(self, path, method=None):
+        return [entry for entry in self.log if entry[1] == path and (method is None or entry[0] == method)]
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _respond(self):
+                with server._lock:
+                    server.log.append((self.command, self.path))
+                    server.active += 1
+                    server.peak = max(server.peak, server.active)
+                path = self.path.split("?", 1)[0]
+                try:
+                    status = {"/ok": 200, "/missing": 404, "/throttled": 429, "/slow": 200}.get(path, 404)
+                    if path == "/head-blocked":
+                        status = 405 if self.command == "HEAD" else 200
+                    if path == "/slow":
+                        time.sleep(0.2)
+                    self.send_response(status)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+            do_HEAD = _respond
+            do_GET = _respond
+
+        return Handler
+
+@pytest.fixture
+def site():
+    server = LinkServer()
+    yield server
+    server.stop()
+
+@pytest.fixture
+def validator(tmp_path):
+    validator = LinkValidator(db_path=str(tmp_path / "links.sqlite3"), max_workers=8, per_host=2, timeout=2)
+    yield validator
+    validator.close()
+
+def test_reachable_link_is_cached(site, validator):
+    assert validator.check(f"{site.url}/ok") is None
+    assert validator.check(f"{site.url}/ok") is None
+
+    assert len(site.hits("/ok")) == 1
+    assert validator.stats()["cache_hits"] == 1
+
+def test_head_rejection_falls_back_to_get(site, validator):
+    assert validator.check(f"{site.url}/head-blocked") is None
+    assert [method for method, _ in site.hits("/head-blocked")] == ["HEAD", "GET"]
+    assert validator.stats()["get_fallbacks"] == 1
+
+def test_broken_link_failure_is_cached(site, validator):
+    assert validator.check(f"{site.url}/missing") == "Status 404"
+    assert validator.check(f"{site.url}/missing") == "Status 404"
+    assert len(site.hits("/missing", "HEAD")) == 1
+
+def test_throttled_response_is_not_cached(site, validator):
+    assert validator.check(f"{site.url}/throttled") == "Status 429"
+    validator.check(f"{site.url}/throttled")
+    assert len(site.hits("/throttled", "HEAD")) == 2
+
+def test_unreachable_host_reports_connection_error(validator):
+    assert validator.check("http://127.0.0.1:9/nothing") == "ConnectionError"
+
+def test_refresh_ignores_stored_result(site, validator):
+    validator.check(f"{site.url}/ok")
+    validator.validate_many([f"{site.url}/ok"], refresh=True)
+    assert len(site.hits("/ok")) == 2
+
+def test_concurrent_checks_of_same_url_share_one_probe(site, validator):
+    url = f"{site.url}/slow"
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: validator.check(url), range(4)))
+
+    assert results == [None] * 4
+    assert len(site.hits("/slow")) == 1
+
+def test_per_host_limit_caps_parallel_requests(site, validator):
+    urls = [f"{site.url}/slow?{i}" for i in range(6)]
+    site_paths = {f"/slow?{i}" for i in range(6)}
+
+    results = validator.validate_many(urls)
+
+    assert set(results.values()) == {None}
+    assert {path for _, path in site.log} == site_paths
+    assert site.peak == 2
+
+def test_expired_entries_are_purged(site, validator):
+    validator.check(f"{site.url}/ok")
+    validator.conn.execute("UPDATE link_checks SET checked_at = 0")
+    assert validator.purge() == 1
+    assert validator.stats()["entries"] == 0
+
+def test_generator_unlinks_only_broken_external_links(site, make_generator):
+    generator = make_generator(lambda kwargs: "")
+    html = (
+        f'<p><a href="{site.url}/ok">정상 링크</a></p>'
+        f'<p><a href="{site.url}/missing">깨진 링크</a></p>'
+        f'<p><a href="https://blog.example/internal">내부 링크</a></p>'
+    )
+
+    fixed = generator._validate_and_fix_external_links(html, ["https://blog.example/internal"])
+
+    assert f'href="{site.url}/ok"' in fixed
+    assert "/missing" not in fixed
+    assert "깨진 링크" in fixed
+    assert 'href="https://blog.example/internal"' in fixed
+    assert site.hits("/ok") and site.hits("/missing")
@@ -0,0 +1,103 @@
+import time
+
+import pytest
+
+from src.core.llm_cache import LLMCache, cache_key, completion_from_stream
+
+def _response(content, tokens=10):
+    return completion_from_stream("chatcmpl-1", "gpt-test", content, "stop",
+                                  {"prompt_tokens": tokens, "completion_tokens": tokens, "total_tokens": tokens * 2})
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "llm_cache.sqlite3")
+
+def test_key_changes_with_any_prompt_difference():
+    messages = [{"role": "user", "content": "안녕"}]
+    assert cache_key("m", messages, {"temperature": 0.7}) == cache_key("m", list(messages), {"temperature": 0.7})
+    assert cache_key("m", messages, {"temperature": 0.7}) != cache_key("m", messages, {"temperature": 0.8})
+    assert cache_key("m", messages, {}) != cache_key("m", [{"role": "user", "content": "안녕!"}], {})
+
+def test_stored_response_is_replayed(cache_path):
+    cache = LLMCache(db_path=cache_path, mode="on")
+    cache.put("k", "gpt-test", _response("본문"))
+
+    replayed = cache.get("k")
+
+    assert replayed.choices[0].message.content == "본문"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["saved_tokens"] == 20
+
+def test_refresh_mode_ignores_stored_response_but_overwrites_it(cache_path):
+    LLMCache(db_path=cache_path, mode="on").put("k", "gpt-test", _response("이전"))
+
+    refresh = LLMCache(db_path=cache_path, mode="refresh")
+    assert refresh.get("k") is None
+    refresh.put("k", "gpt-test", _response("새 응답"))
+
+    assert LLMCache(db_path=cache_path, mode="on").get("k").choices[0].message.content == "새 응답"
+
+def test_off_mode_neither_reads_nor_writes(cache_path):
+    cache = LLMCache(db_path=cache_path, mode="off")
+    cache.put("k", "gpt-test", _response("본문"))
+    assert LLMCache(db_path=cache_path, mode="on").get("k") is None
+
+def test_unknown_mode_is_rejected(cache_path):
+    with pytest.raises(ValueError):
+        LLMCache(db_path=cache_path, mode="sometimes")
+
+def test_expired_entry_is_evicted_on_read(cache_path):
+    cache = LLMCache(db_path=cache_path, mode="on", max_age_days=1)
+    cache.put("k", "gpt-test", _response("본문"))
+    cache.conn.execute("UPDATE llm_responses SET created_at = ?", (time.time() - 2 * 86400,))
+
+    assert cache.get("k") is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 0
+
+def test_size_limit_evicts_least_recently_used(cache_path):
+    size = len(_response("x" * 1000).model_dump_json())
+    cache = LLMCache(db_path=cache_path, mode="on", max_mb=(size * 2.5) / (1024 * 1024))
+    cache.put("a", "gpt-test", _response("a" * 1000))
+    cache.put("b", "gpt-test", _response("b" * 1000))
+    cache.conn.execute("UPDATE llm_responses SET last_used_at = last_used_at - 10 WHERE key = 'b'")
+    assert cache.get("a") is not None  # a를 최근 사용으로 갱신
+
+    cache.put("c", "gpt-test", _response("c" * 1000))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+def test_generator_replays_identical_prompt_without_api_call(make_generator):
+    generator = make_generator(lambda kwargs: "<p>응답</p>", cache_mode="on")
+    messages = [{"role": "user", "content": "같은 프롬프트"}]
+
+    first = generator._chat(messages, stage="intro")
+    second = generator._chat(messages, stage="intro")
+
+    assert second.choices[0].message.content == first.choices[0].message.content
+    assert len(generator.client.calls) == 1
+    assert generator.llm_cache.stats()["hits"] == 1
+
+def test_generator_does_not_cache_truncated_response(make_generator):
+    generator = make_generator(lambda kwargs: ("<p>잘린 응", "length"), cache_mode="on")
+    messages = [{"role": "user", "content": "긴 프롬프트"}]
+
+    generator._chat(messages, stage="intro")
+    generator._chat(messages, stage="intro")
+
+    assert len(generator.client.calls) == 2
+    assert generator.llm_cache.stats()["entries"] == 0
+
+def test_streamed_response_is_cached_and_replayed(make_generator):
+    generator = make_generator(lambda kwargs: {"chunks": ["<p>스트", "리밍</p>"]}, cache_mode="on", stream=True)
+    messages = [{"role": "user", "content": "스트리밍 프롬프트"}]
+
+    first = generator._chat_text("intro", messages)
+    second = generator._chat_text("intro", messages)
+
+    assert first == second
+    assert len(generator.client.calls) == 1
+    assert generator.stream_timings[-1]["cached"] is True
@@ -0,0 +1,56 @@
+from src.core import host_governor
+from src.core.media_index import content_digest
+from tests.fake_wordpress import FakeWordPress
+
+def _add_media(fake_wp, source_url):
+    media_id = next(fake_wp._ids)
+    now = fake_wp.tick()
+    fake_wp.media[media_id] = {
+        "id": media_id, "slug": f"m{media_id}", "source_url": source_url, "mime_type": "image/webp",
+        "title": {"rendered": ""}, "alt_text": "", "post": None, "modified": now, "modified_gmt": now,
+    }
+    return media_id
+
+def test_identical_bytes_reuse_existing_media(fake_wp, wp_client):
+    first = wp_client.upload_image_data(b"same-image", "a.webp")
+    second = wp_client.upload_image_data(b"same-image", "b.webp")
+
+    assert second == first
+    assert len(fake_wp.requests("POST", "/wp-json/wp/v2/media")) == 1
+    assert wp_client.media_index.stats()["hits"] == 1
+
+def test_deleted_media_entry_is_dropped_and_reuploaded(fake_wp, wp_client):
+    first = wp_client.upload_image_data(b"image", "a.webp")
+    del fake_wp.media[first["id"]]
+
+    second = wp_client.upload_image_data(b"image", "a.webp")
+
+    assert second["id"] != first["id"]
+    assert len(fake_wp.requests("POST", "/wp-json/wp/v2/media")) == 2
+
+def test_backfill_downloads_cdn_files_without_credentials(fake_wp, wp_client):
+    cdn = FakeWordPress().start()
+    try:
+        cdn_id = _add_media(fake_wp, cdn.add_file("/wp-content/uploads/cdn.webp", b"cdn-bytes"))
+        local_id = _add_media(fake_wp, fake_wp.add_file("/wp-content/uploads/local.webp", b"local-bytes"))
+
+        assert wp_client.media_index.backfill(max_workers=2) == 2
+
+        cdn_requests = cdn.requests("GET", "/wp-content/uploads/cdn.webp")
+        assert len(cdn_requests) == 1
+        assert "Authorization" not in cdn_requests[0][3]
+        # 외부 호스트는 워드프레스 HostGovernor 슬롯을 쓰지 않음
+        assert cdn.host not in host_governor._governors
+        local_requests = fake_wp.requests("GET", "/wp-content/uploads/local.webp")
+        assert "Authorization" in local_requests[0][3]
+    finally:
+        cdn.stop()
+
+    assert wp_client.media_index.lookup(content_digest(b"cdn-bytes"))["id"] == cdn_id
+    assert wp_client.media_index.lookup(content_digest(b"local-bytes"))["id"] == local_id
+
+def test_backfill_skips_failed_downloads(fake_wp, wp_client):
+    _add_media(fake_wp, f"{fake_wp.url}/wp-content/uploads/missing.webp")
+
+    assert wp_client.media_index.backfill() == 0
+    assert wp_client.media_index.stats()["entries"] == 0
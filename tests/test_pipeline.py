@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+
+from src.config.settings import Config
+from src.core.pipeline import PipelineError, StagePipeline
+
+def test_independent_stages_run_in_parallel_after_their_inputs():
+    both_running = threading.Barrier(2, timeout=2)
+
+    def meet(name):
+        # 서로 기다리는 두 단계가 동시에 실행되지 않으면 Barrier가 시간 초과로 실패
+        both_running.wait()
+        return name
+
+    pipeline = StagePipeline("test")
+    pipeline.add("outline", lambda: {"sections": ["a", "b"]})
+    pipeline.add("intro", lambda outline: meet("intro"), inputs=("outline",))
+    pipeline.add("faq", lambda outline: meet("faq"), inputs=("outline",))
+    pipeline.add("post", lambda intro, faq: f"{intro}+{faq}", inputs=("intro", "faq"))
+
+    results = pipeline.run()
+
+    assert results["post"] == "intro+faq"
+    report = pipeline.report
+    assert report["critical_path"][0] == "outline"
+    assert report["critical_path"][-1] == "post"
+    assert all(stage["status"] == "done" for stage in report["stages"].values())
+
+def test_failed_attempt_is_retried():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("일시 오류")
+        return "ok"
+
+    pipeline = StagePipeline("test").add("stage", flaky, retries=1)
+
+    assert pipeline.run() == {"stage": "ok"}
+    assert pipeline.report["stages"]["stage"]["attempts"] == 2
+
+def test_optional_stage_falls_back_and_pipeline_continues():
+    def broken():
+        raise RuntimeError("이미지 메타 실패")
+
+    pipeline = StagePipeline("test")
+    pipeline.add("images", broken, retries=0, required=False, fallback=[])
+    pipeline.add("post", lambda images: len(images), inputs=("images",))
+
+    assert pipeline.run() == {"images": [], "post": 0}
+    assert pipeline.report["stages"]["images"]["status"] == "fallback"
+
+def test_required_stage_failure_stops_dependents():
+    ran = []
+
+    def broken():
+        raise ValueError("개요 실패")
+
+    pipeline = StagePipeline("test")
+    pipeline.add("outline", broken, retries=0)
+    pipeline.add("body", lambda outline: ran.append(outline), inputs=("outline",))
+
+    with pytest.raises(PipelineError) as excinfo:
+        pipeline.run()
+    assert excinfo.value.stage == "outline"
+    assert isinstance(excinfo.value.cause, ValueError)
+    assert ran == []
+    assert pipeline.report["stages"]["body"]["status"] == "pending"
+
+def test_timed_out_attempt_is_not_resubmitted():
+    release = threading.Event()
+    attempts = []
+
+    def slow():
+        attempts.append(1)
+        release.wait(5)
+        return "late"
+
+    # 버려진 시도의 스레드는 계속 실행되므로 다시 제출하면 같은 호출이 두 번 과금됨
+    pipeline = StagePipeline("test").add("stage", slow, timeout=0.2, retries=1, required=False, fallback="none")
+    started = time.monotonic()
+    try:
+        assert pipeline.run() == {"stage": "none"}
+    finally:
+        release.set()
+    assert time.monotonic() - started < 2
+    assert attempts == [1]
+    assert pipeline.report["stages"]["stage"]["attempts"] == 1
+
+def test_stage_timeout_follows_routed_call_timeouts(make_generator, monkeypatch):
+    monkeypatch.setattr(Config, "STAGE_TIMEOUT_MARGIN", 5)
+    generator = make_generator(lambda kwargs: "", model_routes={"outline": {"timeout": 30}, "section": {"timeout": 40}})
+
+    assert generator._stage_timeout("outline", 2) == 65
+    assert generator._stage_timeout("section:소제목") == 45
+
+@pytest.mark.parametrize("build, message", [
+    (lambda p: p.add("a", lambda b: b, inputs=("b",)).add("b", lambda a: a, inputs=("a",)), "순환"),
+    (lambda p: p.add("a", lambda x: x, inputs=("x",)), "알 수 없는 입력"),
+])
+def test_invalid_graph_is_rejected(build, message):
+    pipeline = StagePipeline("test")
+    build(pipeline)
+    with pytest.raises(ValueError, match=message):
+        pipeline.run()
+
+def test_duplicate_stage_name_is_rejected():
+    pipeline = StagePipeline("test").add("a", lambda: 1)
+    with pytest.raises(ValueError):
+        pipeline.add("a", lambda: 2)
@@ -0,0 +1,43 @@
+import sys
+
+from src import main as main_module
+from src.core import profile_compare
+from src.core.generator import ContentGenerator
+
+def test_model_routes_apply_to_every_compared_run(make_generator, monkeypatch):
+    built = []
+
+    def build(**kwargs):
+        built.append(make_generator(lambda k: "", **kwargs))
+        return built[-1]
+
+    monkeypatch.setattr(profile_compare, "ContentGenerator", build)
+    monkeypatch.setattr(ContentGenerator, "generate_post", lambda self, topic, internal_links=None: None)
+    routes = {"section": {"model": "gpt-route-test"}}
+
+    engines = profile_compare.compare_engines("주제", ["iterative", "single_call"], model_routes=routes)
+    profiles = profile_compare.compare_profiles("주제", ["fast"], model_routes=routes)
+
+    assert len(built) == 3
+    assert all(g.router.route("section")["model"] == "gpt-route-test" for g in built)
+    assert [r["label"] for r in engines] == ["iterative", "single_call"]
+    assert all("section=gpt-route-test" in r["routes"] and not r["ok"] for r in engines + profiles)
+
+def _run_main(monkeypatch, *argv):
+    calls = []
+    monkeypatch.setattr(sys, "argv", ["main.py", "주제", *argv])
+    monkeypatch.setattr(main_module, "compare_profiles", lambda *a, **kw: calls.append(("profiles", a, kw)) or [])
+    monkeypatch.setattr(main_module, "compare_engines", lambda *a, **kw: calls.append(("engines", a, kw)) or [])
+    monkeypatch.setattr(main_module, "format_comparison", lambda results: "")
+    main_module.main()
+    return calls
+
+def test_cli_passes_route_overrides_to_comparisons(monkeypatch):
+    calls = _run_main(monkeypatch, "--compare-profiles", "fast", "quality", "--model-route", "faq.max_tokens=800")
+    calls += _run_main(monkeypatch, "--compare-engines", "--model-route", "section=gpt-4o-mini")
+
+    assert calls[0][2]["model_routes"] == {"faq": {"max_tokens": 800}}
+    assert calls[1][2]["model_routes"] == {"section": {"model": "gpt-4o-mini"}}
+
+def test_cli_rejects_bad_route_before_comparing(monkeypatch):
+    assert _run_main(monkeypatch, "--compare-engines", "--model-route", "section.color=red") == []
@@ -0,0 +1,49 @@
+import re
+
+from src.core.prompts import (
+    BASE_SYSTEM_PROMPT, MIN_CACHEABLE_PROMPT_TOKENS, estimate_tokens, faq_messages, image_metadata_messages,
+    intro_messages, outline_messages, section_messages, single_call_messages
+)
+from tests.fake_openai import usage
+
+def _all_stage_messages():
+    return [
+        outline_messages("주제"),
+        image_metadata_messages("주제", "키워드", ["하나", "둘"]),
+        intro_messages("주제", "키워드"),
+        section_messages("주제", "하나", "키워드", {"title": "글", "link": "https://a.test/1"}, "정부24"),
+        faq_messages("주제", "키워드"),
+        single_call_messages("주제", "키워드", [("하나", [], None)]),
+    ]
+
+def test_every_stage_appends_its_rules_to_the_shared_base():
+    systems = [messages[0]["content"] for messages in _all_stage_messages()]
+
+    assert all(system.startswith(BASE_SYSTEM_PROMPT + "\n\n") for system in systems)
+    assert [re.findall(r"^\[단계: (.+?)\]$", system, re.M) for system in systems] == [
+        ["블로그 포스트 개요 (JSON)"],
+        ["이미지 메타데이터 (JSON)"],
+        ["서론 (HTML)"],
+        ["본문 섹션 (HTML)"],
+        ["자주 묻는 질문 (HTML)"],
+        ["전체 본문 한 번에 작성 (구분자 HTML)", "서론 (HTML)", "본문 섹션 (HTML)", "자주 묻는 질문 (HTML)"],
+    ]
+    assert estimate_tokens(systems[-1]) >= MIN_CACHEABLE_PROMPT_TOKENS
+
+def test_system_block_is_stable_and_variables_stay_in_user_tail():
+    first = section_messages("주제", "하나", "키워드", {"title": "글", "link": "https://a.test/1"}, "정부24")
+    second = section_messages("다른 주제", "둘", "다른 키워드")
+
+    assert first[0] == second[0]
+    assert "다른 주제" not in second[0]["content"]
+    assert second[1]["content"].startswith("주제: 다른 주제\n섹션 제목: 둘")
+
+def test_cached_tokens_are_recorded_per_stage(make_generator):
+    generator = make_generator(lambda kwargs: {"content": "<p>본문</p>", "usage": usage(2048, 100, cached_tokens=1920)})
+
+    generator._chat(section_messages("주제", "하나", "키워드"), stage="section:하나")
+    generator._chat(section_messages("주제", "둘", "키워드"), stage="section:둘")
+
+    entry = generator.prompt_cache_usage["section"]
+    assert (entry["calls"], entry["prompt_tokens"], entry["cached_tokens"]) == (2, 4096, 3840)
+    assert generator.client.messages(0)[0] == generator.client.messages(1)[0]
@@ -0,0 +1,91 @@
+import re
+import threading
+import time
+
+KEYWORD = "청년도약계좌"
+INTRO = f"<p>{KEYWORD}은 " + "청년의 자산 형성을 돕는 정책 금융 상품입니다. " * 8 + "</p>"
+
+def _section(title):
+    return f"<h2>{title}</h2><p>" + "가입 조건과 납입 한도, 정부 기여금 구조를 차례대로 정리합니다. " * 10 + "</p>"
+
+FAQ = f"<h2>자주 묻는 질문</h2><details><summary>Q</summary>{KEYWORD} 답변</details>"
+
+def _stage(kwargs):
+    return re.search(r"^\[단계: (.+?)\]$", kwargs["messages"][0]["content"], re.M).group(1)
+
+def _title(kwargs):
+    return re.search(r"섹션 제목: (.+)", kwargs["messages"][-1]["content"]).group(1).strip()
+
+class Responder:
+    """단일 호출은 chunks를 delay초 간격으로 흘리고, 개별 재생성 요청에는 단계별 HTML로 답합니다."""
+
+    def __init__(self, chunks, delay=0.0):
+        self.chunks = chunks
+        self.delay = delay
+        self.regenerated = []
+        self.lock = threading.Lock()
+
+    def __call__(self, kwargs):
+        stage = _stage(kwargs)
+        if stage.startswith("전체 본문"):
+            return {"chunks": self.chunks, "delay": self.delay}
+        with self.lock:
+            self.regenerated.append(stage)
+        if stage.startswith("서론"):
+            return INTRO
+        if stage.startswith("본문 섹션"):
+            return _section(_title(kwargs) + " (재생성)")
+        return FAQ
+
+JOBS = [("하나", [], None), ("둘", [], None)]
+
+def test_parts_from_stream_are_used_and_failures_regenerated(make_generator):
+    chunks = [f"<<<INTRO>>>\n{INTRO}\n<<<SECTION:1>>>\n{_section('하나')}\n",
+              "<<<SECTION:2>>>\n<h2>둘</h2><p>짧음</p>\n", f"<<<FAQ>>>\n{FAQ}\n<<<END>>>"]
+    responder = Responder(chunks)
+    generator = make_generator(responder, engine="single_call")
+
+    body = generator._generate_body_single_call("주제", KEYWORD, JOBS)
+
+    assert body["intro"] == INTRO
+    assert body["sections"] == [_section("하나"), _section("둘 (재생성)")]
+    assert body["faq"] == FAQ
+    assert responder.regenerated == ["본문 섹션 (HTML)"]
+
+def test_parts_missing_from_response_are_generated_individually(make_generator):
+    responder = Responder([f"<<<INTRO>>>\n{INTRO}\n<<<END>>>"])
+    generator = make_generator(responder, engine="single_call")
+
+    body = generator._generate_body_single_call("주제", KEYWORD, JOBS)
+
+    assert body["sections"] == [_section("하나 (재생성)"), _section("둘 (재생성)")]
+    assert body["faq"] == FAQ
+    assert sorted(responder.regenerated) == ["본문 섹션 (HTML)", "본문 섹션 (HTML)", "자주 묻는 질문 (HTML)"]
+
+def test_abandoned_stream_cannot_change_result_after_deadline(make_generator):
+    chunks = [f"<<<INTRO>>>\n{INTRO}\n", f"<<<SECTION:1>>>\n{_section('하나')}\n", "<<<SECTION:2>>>\n",
+              f"{_section('둘')}\n", f"<<<FAQ>>>\n{FAQ}\n<<<END>>>"]
+    responder = Responder(chunks, delay=0.1)
+    generator = make_generator(responder, engine="single_call", model_routes={"single_call": {"timeout": 0.45}})
+    check = generator._check_single_call_part
+    checked = []
+
+    def slow_check(part, html, keyword):
+        # 섹션 1 검사 도중 제한 시간이 지나도록 스트림 스레드를 붙잡아 둠
+        if part == 0:
+            time.sleep(0.6)
+        checked.append(part)
+        return check(part, html, keyword)
+
+    generator._check_single_call_part = slow_check
+
+    body = generator._generate_body_single_call("주제", KEYWORD, JOBS)
+    calls_at_return = len(generator.client.calls)
+    time.sleep(0.5)  # 버려진 스트림 스레드가 남은 조각을 처리할 시간
+
+    assert body["intro"] == INTRO
+    assert body["sections"] == [_section("하나"), _section("둘 (재생성)")]
+    assert body["faq"] == FAQ
+    assert sorted(responder.regenerated) == ["본문 섹션 (HTML)", "자주 묻는 질문 (HTML)"]
+    assert len(generator.client.calls) == calls_at_return
+    assert checked == ["intro", 0, 1]
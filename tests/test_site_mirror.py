@@ -0,0 +1,99 @@
+from src.config.settings import Config
+
+def _publish(fake_wp, count, prefix="post"):
+    return [
+        fake_wp.add_post(title=f"{prefix} {i}", slug=f"{prefix}-{i}", status="publish")
+        for i in range(count)
+    ]
+
+def test_first_sync_pages_through_everything(fake_wp, wp_client):
+    _publish(fake_wp, 230)
+
+    result = wp_client.mirror.sync(resources=("posts",))
+
+    assert result == {"posts": 230}
+    assert wp_client.mirror.last_sync_requests == 4  # status=any 3페이지 + 휴지통 1회
+
+def test_incremental_sync_fetches_only_changed_posts(fake_wp, wp_client):
+    posts = _publish(fake_wp, 5)
+    mirror = wp_client.mirror
+    mirror.sync(resources=("posts",))
+
+    assert mirror.sync(resources=("posts",))["posts"] <= 1  # 1초 겹침 조회만
+    fake_wp.route("POST", f"/wp/v2/posts/{posts[2]['id']}", {}, {"title": "수정된 제목"})
+    new_post = fake_wp.add_post(title="새 글", slug="new", status="publish")
+
+    mirror.sync(resources=("posts",))
+
+    query = fake_wp.requests("GET", "/wp-json/wp/v2/posts")[-1][2]
+    assert "modified_after" in query
+    assert mirror.get_post(posts[2]["id"])["title"] == "수정된 제목"
+    assert mirror.get_post(new_post["id"])["slug"] == "new"
+    assert mirror.last_sync_requests == 2
+
+def test_trashed_posts_are_picked_up_by_incremental_sync(fake_wp, wp_client):
+    post = fake_wp.add_post(title="지울 글", slug="to-trash", status="publish")
+    mirror = wp_client.mirror
+    mirror.sync(resources=("posts",))
+    assert mirror.find_post_by_slug("to-trash")["id"] == post["id"]
+
+    fake_wp.route("DELETE", f"/wp/v2/posts/{post['id']}", {}, None)
+    mirror.sync(resources=("posts",))
+
+    assert mirror.get_post(post["id"])["status"] == "trash"
+    assert mirror.find_post_by_slug("to-trash") is None
+
+def test_recent_posts_and_slug_lookup_come_from_mirror(fake_wp, wp_client):
+    _publish(fake_wp, 3)
+    fake_wp.add_post(title="초안", slug="draft-post", status="draft")
+    wp_client.mirror.sync(resources=("posts",))
+    requests_before = len(fake_wp.log)
+
+    recent = wp_client.mirror.recent_posts(count=2)
+
+    assert [p["title"] for p in recent] == ["post 2", "post 1"]
+    assert wp_client.mirror.find_post_by_slug("draft-post")["status"] == "draft"
+    assert len(fake_wp.log) == requests_before
+
+def test_tag_sync_stops_at_known_ids(fake_wp, wp_client):
+    for i in range(3):
+        fake_wp.route("POST", "/wp/v2/tags", {}, {"name": f"태그 {i}"})
+    mirror = wp_client.mirror
+    assert mirror.sync_tags() == 3
+
+    fake_wp.route("POST", "/wp/v2/tags", {}, {"name": "새 태그"})
+    assert mirror.sync_tags() == 1
+    assert mirror.tag_names(sorted(fake_wp.tags)) == ["태그 0", "태그 1", "태그 2", "새 태그"]
+    # 커서는 이번에 본 최대 ID로 전진 -> 변경이 없으면 아무것도 다시 받지 않음
+    assert mirror._get_cursor("tags") == str(max(fake_wp.tags))
+    assert mirror.sync_tags() == 0
+
+def test_tag_full_refresh_picks_up_renames_and_deletions(fake_wp, wp_client, monkeypatch):
+    for i in range(3):
+        fake_wp.route("POST", "/wp/v2/tags", {}, {"name": f"태그 {i}"})
+    mirror = wp_client.mirror
+    mirror.sync_tags()
+    first, second, third = sorted(fake_wp.tags)
+    fake_wp.tags[first]["name"] = "바뀐 이름"
+    del fake_wp.tags[third]
+
+    assert mirror.sync_tags() == 0  # 주기 전에는 증분만 (새 태그 없음)
+    monkeypatch.setattr(Config, "TAG_FULL_REFRESH_HOURS", 1e-9)
+
+    assert mirror.sync_tags() == 2
+    assert mirror.tag_names([first, second, third]) == ["바뀐 이름", "태그 1"]
+
+def test_media_sync_and_prefix_lookup(fake_wp, wp_client):
+    wp_client.upload_image_data(b"thumb", "my-post_thumb.webp", dedupe=False)
+    wp_client.upload_image_data(b"other", "other_thumb.webp", dedupe=False)
+
+    wp_client.mirror.sync(resources=("media",))
+
+    found = wp_client.mirror.find_media(file_prefix="my-post")
+    assert [m["slug"] for m in found] == ["my-post_thumb"]
+
+def test_sync_failure_is_logged_and_reported_as_zero(fake_wp, wp_client):
+    for _ in range(wp_client.max_retries + 1):
+        fake_wp.fail_next(500, path="/wp-json/wp/v2/posts")
+
+    assert wp_client.mirror.sync(resources=("posts",)) == {"posts": 0}
@@ -0,0 +1,126 @@
+import json
+
+import pytest
+
+from src.config.settings import Config
+from src.core.structured_output import (
+    ImageMetadataModel, OutlineModel, parse_json, response_format_for, strict_json_schema, subset_model, validate_fields
+)
+
+def _outline(sections):
+    return {
+        "focus_keyword": "청년도약계좌",
+        "title": "2026 청년도약계좌 총정리",
+        "slug": "youth-leap-account-2026",
+        "description": "청년도약계좌 가입 조건을 정리했습니다.",
+        "sections": sections,
+        "related_keywords": ["청년 적금"] * 8,
+    }
+
+@pytest.mark.parametrize("count", [6, 7, 8])
+def test_outline_accepts_six_to_eight_sections(count):
+    valid, failed = validate_fields(OutlineModel, _outline([f"소제목 {i}" for i in range(count)]))
+
+    assert failed == {}
+    assert len(valid["sections"]) == count
+
+@pytest.mark.parametrize("sections", [[f"소제목 {i}" for i in range(5)], [f"소제목 {i}" for i in range(9)],
+                                      [f"소제목 {i}" for i in range(5)] + ["  ", ""]])
+def test_outline_rejects_section_count_outside_six_to_eight(sections):
+    valid, failed = validate_fields(OutlineModel, _outline(sections))
+
+    assert list(failed) == ["sections"]
+    assert "6~8개" in failed["sections"]
+    assert valid["slug"] == "youth-leap-account-2026"
+
+def test_strict_schema_requires_every_field_and_forbids_extras():
+    schema = strict_json_schema(ImageMetadataModel)
+
+    assert "$defs" not in schema and "$ref" not in json.dumps(schema)
+    item = schema["properties"]["images"]["items"]
+    for node in (schema, item):
+        assert node["additionalProperties"] is False
+        assert node["required"] == list(node["properties"])
+    assert "title" in strict_json_schema(OutlineModel)["properties"]
+    assert response_format_for(OutlineModel, "outline")["json_schema"]["strict"] is True
+
+def test_subset_model_keeps_field_rules():
+    repair = subset_model(OutlineModel, ["slug", "sections"])
+
+    assert list(repair.model_fields) == ["slug", "sections"]
+    valid, failed = validate_fields(repair, {"slug": "Bad Slug", "sections": [f"소제목 {i}" for i in range(6)]})
+    assert list(failed) == ["slug"]
+    assert len(valid["sections"]) == 6
+
+def test_parse_json_strips_fences_and_rejects_non_objects():
+    assert parse_json('```json\n{"a": 1}\n```') == {"a": 1}
+    with pytest.raises(ValueError):
+        parse_json("[1, 2]")
+    with pytest.raises(ValueError):
+        parse_json("JSON 아님")
+
+class StructuredResponder:
+    """호출 순서대로 replies를 돌려주고, 받은 response_format 스키마를 기록합니다."""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.schemas = []
+
+    def __call__(self, kwargs):
+        self.schemas.append(kwargs["response_format"]["json_schema"]["schema"])
+        reply = self.replies.pop(0)
+        return reply if isinstance(reply, str) else json.dumps(reply, ensure_ascii=False)
+
+def test_outline_repair_requests_only_failed_fields(make_generator):
+    responder = StructuredResponder({**_outline([f"소제목 {i}" for i in range(6)]), "slug": "청년 도약"},
+                                    {"slug": "youth-leap-2026"})
+    generator = make_generator(responder)
+
+    outline = generator._generate_outline("청년도약계좌")
+
+    assert outline["slug"] == "youth-leap-2026"
+    assert outline["title"] == "2026 청년도약계좌 총정리"
+    assert list(responder.schemas[1]["properties"]) == ["slug"]
+    repair_messages = generator.client.messages(1)
+    assert [m["role"] for m in repair_messages] == ["system", "user", "assistant", "user"]
+    assert "slug" in repair_messages[-1]["content"]
+    assert generator.structured_usage["outline"]["repairs"] == 1
+    assert generator.structured_usage["outline"]["fallbacks"] == 0
+
+def test_outline_falls_back_to_defaults_when_repair_also_fails(make_generator, monkeypatch):
+    monkeypatch.setattr(Config, "STRUCTURED_REPAIR_RETRIES", 1)
+    responder = StructuredResponder("JSON 아님", {"focus_keyword": "", "title": "", "slug": "x", "description": "",
+                                                 "sections": [], "related_keywords": []})
+    generator = make_generator(responder)
+
+    outline = generator._generate_outline("청년도약계좌")
+
+    assert outline["sections"] == ["서론", "주요 내용", "결론"]
+    assert outline["slug"] == "x"
+    assert outline["description"].startswith("청년도약계좌")
+    usage = generator.structured_usage["outline"]
+    assert (usage["parse_failures"], usage["repairs"], usage["fallbacks"]) == (1, 1, 4)
+
+def _image(kind="body", caption="청년도약계좌 그래프"):
+    return {"type": kind, "prompt": "modern infographic", "alt": "청년도약계좌 설명 이미지", "caption": caption}
+
+def test_image_metadata_repair_asks_only_for_missing_images(make_generator):
+    responder = StructuredResponder({"images": [_image("featured"), _image(caption=""), _image()]},
+                                    {"images": [_image(), _image()]})
+    generator = make_generator(responder)
+
+    images = generator._generate_image_metadata("주제", "제목", ["하나"], "청년도약계좌")
+
+    assert [image["type"] for image in images] == ["featured", "body", "body", "body"]
+    assert "이미지 2장만" in generator.client.messages(1)[-1]["content"]
+    assert "caption" in generator.client.messages(1)[-1]["content"]
+
+def test_image_metadata_keyword_is_enforced(make_generator):
+    responder = StructuredResponder({"images": [{**_image(), "alt": "<b>그래프</b>", "caption": "캡션"}] * 4})
+    generator = make_generator(responder)
+
+    images = generator._generate_image_metadata("주제", "제목", ["하나"], "청년도약계좌")
+
+    assert images[0]["type"] == "featured"
+    assert images[1]["alt"] == "청년도약계좌: b그래프/b"
+    assert images[1]["caption"] == "청년도약계좌 - 캡션"
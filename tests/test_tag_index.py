@@ -0,0 +1,51 @@
+from src.core.tag_index import TagIndex, normalize_tag_name, tag_slug
+from src.core.wp_client import WordPressClient
+
+def _seed_tags(fake_wp, names):
+    for name in names:
+        fake_wp.route("POST", "/wp/v2/tags", {}, {"name": name})
+
+def test_tag_name_normalization():
+    assert normalize_tag_name("  AI   수익화 ") == "ai 수익화"
+    assert tag_slug("AI 수익화") == "ai-수익화"
+    assert tag_slug("K-패스(K-Pass)") == "k-패스k-pass"
+
+def test_existing_tags_resolve_locally_without_search_requests(fake_wp, wp_client):
+    _seed_tags(fake_wp, [f"태그{i}" for i in range(150)] + ["AI 수익화"])
+
+    ids = wp_client.get_or_create_tags(["ai 수익화", "태그3", "태그149"])
+
+    assert [wp_client.tag_index.tags[i]["name"] for i in ids] == ["AI 수익화", "태그3", "태그149"]
+    # 전체 로드 2페이지 외에는 요청 없음 (이름별 search 요청 없음)
+    assert len(fake_wp.requests("GET", "/wp-json/wp/v2/tags")) == 2
+    assert fake_wp.requests("POST", "/wp-json/wp/v2/tags") == []
+
+def test_missing_tag_is_refreshed_then_created(fake_wp, wp_client):
+    _seed_tags(fake_wp, ["기존"])
+    wp_client.get_or_create_tags(["기존"])
+    _seed_tags(fake_wp, ["다른 작성자 태그"])
+
+    ids = wp_client.get_or_create_tags(["다른 작성자 태그", "새 태그"])
+
+    assert len(ids) == 2
+    created = fake_wp.requests("POST", "/wp-json/wp/v2/tags")
+    assert len(created) == 1  # 증분 갱신으로 찾은 태그는 생성하지 않음
+    assert fake_wp.tags[ids[1]]["name"] == "새 태그"
+
+def test_term_exists_response_reuses_existing_id(fake_wp, wp_client):
+    index = wp_client.tag_index
+    index.load()
+    _seed_tags(fake_wp, ["경쟁 태그"])
+    existing_id = next(t["id"] for t in fake_wp.tags.values() if t["name"] == "경쟁 태그")
+
+    assert index._create("경쟁 태그") == existing_id
+    assert index.lookup("경쟁 태그") == existing_id
+
+def test_saved_index_is_reused_by_new_client(fake_wp, wp_client):
+    _seed_tags(fake_wp, ["저장 태그"])
+    wp_client.get_or_create_tags(["저장 태그"])
+    requests_before = len(fake_wp.log)
+
+    fresh = TagIndex(WordPressClient())
+    assert fresh.get_or_create(["저장 태그"]) == wp_client.get_or_create_tags(["저장 태그"])
+    assert len(fake_wp.log) == requests_before
@@ -0,0 +1,74 @@
+import json
+
+def _sent(fake_wp, post_id):
+    return [json.loads(entry[4]) for entry in fake_wp.requests("POST", f"/wp-json/wp/v2/posts/{post_id}")]
+
+def _fetches(fake_wp, post_id, fields):
+    return [e for e in fake_wp.requests("GET", f"/wp-json/wp/v2/posts/{post_id}") if e[2].get("_fields") == [fields]]
+
+def _new_post(fake_wp):
+    return fake_wp.add_post(title="제목", content="<p>본문</p>", status="draft",
+                            tags=[3, 1], meta={"rank_math_focus_keyword": "키워드"})
+
+def test_only_changed_fields_are_sent(fake_wp, wp_client):
+    post = _new_post(fake_wp)
+
+    wp_client.update_post(post["id"], {
+        "title": "제목", "content": "<p>새 본문</p>", "tags": [1, 3],
+        "meta": {"rank_math_focus_keyword": "키워드", "rank_math_description": "설명"},
+    }, diff=True)
+
+    assert _sent(fake_wp, post["id"]) == [{"content": "<p>새 본문</p>", "meta": {"rank_math_description": "설명"}}]
+    stats = wp_client.get_diff_stats()
+    assert stats["updates"] == 1 and stats["bytes_saved"] > 0
+
+def test_unchanged_update_is_skipped_with_cheap_freshness_check(fake_wp, wp_client):
+    post = _new_post(fake_wp)
+    wp_client.update_post(post["id"], {"content": "<p>새 본문</p>"}, diff=True)
+
+    result = wp_client.update_post(post["id"], {"title": "제목", "content": "<p>새 본문</p>"}, diff=True)
+
+    assert result["content"] == "<p>새 본문</p>"
+    assert len(_sent(fake_wp, post["id"])) == 1
+    assert len(_fetches(fake_wp, post["id"], "modified_gmt")) == 1
+    assert wp_client.get_diff_stats()["skipped"] == 1
+
+def test_edit_made_elsewhere_invalidates_cache(fake_wp, wp_client):
+    post = _new_post(fake_wp)
+    wp_client.update_post(post["id"], {"title": "우리 제목"}, diff=True)
+    # 미러가 모르는 사이 다른 편집자가 제목을 바꿈 (미러 동기화 이력 없음)
+    fake_wp.route("POST", f"/wp/v2/posts/{post['id']}", {}, {"title": "편집자 제목"})
+
+    wp_client.update_post(post["id"], {"title": "우리 제목"}, diff=True)
+
+    assert fake_wp.posts[post["id"]]["title"]["raw"] == "우리 제목"
+    assert _sent(fake_wp, post["id"])[-1] == {"title": "우리 제목"}
+
+def test_mirror_newer_than_cache_skips_straight_to_full_fetch(fake_wp, wp_client):
+    post = _new_post(fake_wp)
+    wp_client.update_post(post["id"], {"title": "우리 제목"}, diff=True)
+    fake_wp.route("POST", f"/wp/v2/posts/{post['id']}", {}, {"title": "편집자 제목"})
+    wp_client.mirror.sync(resources=("posts",))
+
+    wp_client.update_post(post["id"], {"title": "우리 제목"}, diff=True)
+
+    assert _fetches(fake_wp, post["id"], "modified_gmt") == []
+    assert fake_wp.posts[post["id"]]["title"]["raw"] == "우리 제목"
+
+def test_cache_write_failure_does_not_fail_update(fake_wp, wp_client, monkeypatch):
+    post = _new_post(fake_wp)
+
+    def broken(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(wp_client.mirror, "save_edit_state", broken)
+
+    result = wp_client.update_post(post["id"], {"content": "<p>새 본문</p>"}, diff=True)
+
+    assert result["id"] == post["id"]
+    assert fake_wp.posts[post["id"]]["content"]["raw"] == "<p>새 본문</p>"
+
+def test_plain_update_does_not_touch_edit_state_cache(fake_wp, wp_client):
+    post = _new_post(fake_wp)
+
+    assert wp_client.update_post(post["id"], {"title": "새 제목"})["title"]["raw"] == "새 제목"
+    assert wp_client.mirror.get_edit_state(post["id"]) is None
@@ -0,0 +1,108 @@
+from src.config.settings import Config
+from src.core.wp_client import make_idempotency_key
+
+KEY = make_idempotency_key("test", "주제")
+
+def _upsert(client, content="<p>본문</p>", **kwargs):
+    kwargs.setdefault("slug", "my-post")
+    kwargs.setdefault("idempotency_key", KEY)
+    return client.upsert_post("제목", content, **kwargs)
+
+def test_rerun_with_same_key_updates_instead_of_duplicating(fake_wp, wp_client):
+    first = _upsert(wp_client)
+    second = _upsert(wp_client, content="<p>수정본</p>")
+
+    assert first == second
+    assert len(fake_wp.posts) == 1
+    assert next(iter(fake_wp.posts.values()))["content"]["raw"] == "<p>수정본</p>"
+
+def test_idempotency_key_finds_post_created_before_crash(fake_wp, wp_client):
+    # 생성 요청은 반영됐지만 결과를 기록하기 전에 중단된 상황 (슬러그는 바뀜)
+    fake_wp.add_post(title="제목", slug="old-slug", status="draft",
+                     meta={Config.IDEMPOTENCY_META_KEY: "run-1"})
+
+    _upsert(wp_client, slug=None, idempotency_key="run-1")
+
+    assert len(fake_wp.posts) == 1
+    assert len(fake_wp.requests("POST", "/wp-json/wp/v2/posts")) == 1  # 수정 1회
+
+def test_idempotency_key_with_new_slug_still_checks_mirror(fake_wp, wp_client):
+    fake_wp.add_post(title="제목", slug="old-slug", status="draft",
+                     meta={Config.IDEMPOTENCY_META_KEY: "run-1"})
+
+    _upsert(wp_client, slug="new-slug", idempotency_key="run-1")
+
+    assert len(fake_wp.posts) == 1
+    assert next(iter(fake_wp.posts.values()))["slug"] == "new-slug"
+
+def test_sync_failure_aborts_instead_of_creating_duplicate(fake_wp, wp_client):
+    fake_wp.add_post(title="제목", slug="old-slug", status="draft",
+                     meta={Config.IDEMPOTENCY_META_KEY: "run-1"})
+    for _ in range(wp_client.max_retries + 1):
+        fake_wp.fail_next(503, path="/wp-json/wp/v2/posts")
+
+    assert _upsert(wp_client, slug=None, idempotency_key="run-1") is None
+    assert len(fake_wp.posts) == 1
+    assert fake_wp.requests("POST", "/wp-json/wp/v2/posts") == []
+
+def test_trashed_post_is_not_reused(fake_wp, wp_client):
+    _upsert(wp_client)
+    post_id = next(iter(fake_wp.posts))
+    wp_client.mirror.sync(resources=("posts",))
+    fake_wp.route("DELETE", f"/wp/v2/posts/{post_id}", {}, None)
+
+    _upsert(wp_client)
+
+    assert len(fake_wp.posts) == 2
+    assert fake_wp.posts[post_id]["status"] == "trash"
+    assert wp_client.mirror.get_post(post_id)["status"] == "trash"
+
+def test_permanently_deleted_mirror_hit_is_forgotten(fake_wp, wp_client):
+    _upsert(wp_client)
+    post_id = next(iter(fake_wp.posts))
+    wp_client.mirror.sync(resources=("posts",))
+    del fake_wp.posts[post_id]
+
+    _upsert(wp_client)
+
+    assert len(fake_wp.posts) == 1
+    assert wp_client.mirror.get_post(post_id) is None
+
+def test_key_is_deterministic_per_scope_and_topic():
+    assert make_idempotency_key("test", " 주제 ") == KEY
+    assert make_idempotency_key("other", "주제") != KEY
+    assert KEY.startswith("wpauto:test:")
+
+def test_slug_collision_with_foreign_post_creates_new_draft(fake_wp, wp_client):
+    foreign = fake_wp.add_post(title="사람이 쓴 글", slug="my-post", status="publish", content="<p>원본</p>")
+
+    link = _upsert(wp_client, content="<p>새 글</p>")
+
+    assert len(fake_wp.posts) == 2
+    assert fake_wp.posts[foreign["id"]]["content"]["raw"] == "<p>원본</p>"
+    assert link != foreign["link"]
+
+def test_foreign_slug_match_does_not_hide_own_post_with_other_slug(fake_wp, wp_client):
+    fake_wp.add_post(title="다른 글", slug="my-post", status="draft")
+    own = fake_wp.add_post(title="제목", slug="old-slug", status="draft", meta={Config.IDEMPOTENCY_META_KEY: KEY})
+
+    _upsert(wp_client, content="<p>수정본</p>")
+
+    assert len(fake_wp.posts) == 2
+    assert fake_wp.posts[own["id"]]["content"]["raw"] == "<p>수정본</p>"
+
+def test_published_post_with_own_key_is_not_overwritten(fake_wp, wp_client):
+    fake_wp.add_post(title="제목", slug="my-post", status="publish", content="<p>본문</p>",
+                     meta={Config.IDEMPOTENCY_META_KEY: KEY})
+
+    assert _upsert(wp_client, content="<p>수정본</p>") is None
+    post = next(iter(fake_wp.posts.values()))
+    assert (post["status"], post["content"]["raw"]) == ("publish", "<p>본문</p>")
+    assert fake_wp.requests("POST", "/wp-json/wp/v2/posts") == []
+
+def test_failed_create_is_retried_only_after_key_lookup(fake_wp, wp_client):
+    fake_wp.fail_next(500, path="/wp-json/wp/v2/posts", method="POST")
+
+    assert _upsert(wp_client)
+    assert len(fake_wp.posts) == 1
+    assert len(fake_wp.requests("POST", "/wp-json/wp/v2/posts")) == 2
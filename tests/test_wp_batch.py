@@ -0,0 +1,85 @@
+import pytest
+
+from src.core.wp_client import WordPressClient
+
+def _queue_posts(batch, count):
+    return [batch.create_post(f"글 {i}", f"<p>본문 {i}</p>", slug=f"post-{i}") for i in range(count)]
+
+def test_operations_are_sent_in_batches_of_25(fake_wp, wp_client):
+    with wp_client.batch() as batch:
+        _queue_posts(batch, 28)
+        batch.create_tag("배치 태그")
+
+    assert len(fake_wp.requests("POST", "/wp-json/batch/v1")) == 2
+    assert fake_wp.requests("POST", "/wp-json/wp/v2/posts") == []
+    assert [r["index"] for r in batch.results] == list(range(29))
+    assert all(r["ok"] and not r["fallback"] and not r["unknown"] for r in batch.results)
+    assert len(fake_wp.posts) == 28
+    assert batch.http_requests == 2
+
+def test_existing_tag_in_batch_counts_as_success(fake_wp, wp_client):
+    fake_wp.route("POST", "/wp/v2/tags", {}, {"name": "기존 태그"})
+    existing_id = next(iter(fake_wp.tags))
+
+    with wp_client.batch() as batch:
+        batch.create_tag("기존 태그")
+
+    assert batch.results[0]["ok"]
+    assert batch.results[0]["id"] == existing_id
+
+@pytest.mark.parametrize("mode", ["no_route", "not_allowed", "max_requests"])
+def test_definitive_batch_rejection_falls_back_to_single_requests(fake_wp, wp_client, mode):
+    fake_wp.batch_mode = mode
+
+    with wp_client.batch() as batch:
+        _queue_posts(batch, 3)
+
+    assert len(fake_wp.requests("POST", "/wp-json/batch/v1")) == 1
+    assert len(fake_wp.requests("POST", "/wp-json/wp/v2/posts")) == 3
+    assert all(r["ok"] and r["fallback"] for r in batch.results)
+    assert len(fake_wp.posts) == 3
+
+def test_sub_request_not_allowed_in_batch_is_sent_alone(fake_wp, wp_client):
+    with wp_client.batch() as batch:
+        batch.create_post("글", "<p>본문</p>")
+        # batch/v1이 허용하지 않는 라우트 (미디어)
+        batch._enqueue("POST", "/wp/v2/media/1", {"alt_text": "대체 텍스트"})
+
+    assert batch.results[0]["ok"] and not batch.results[0]["fallback"]
+    assert batch.results[1]["fallback"]
+    assert len(fake_wp.requests("POST", "/wp-json/wp/v2/media/1")) == 1
+
+def test_gateway_error_is_reported_without_replaying(fake_wp, wp_client):
+    fake_wp.batch_mode = "error"
+
+    with wp_client.batch() as batch:
+        _queue_posts(batch, 3)
+
+    # 서버는 이미 3개를 만들었으므로 재전송하면 중복 글이 생김
+    assert len(fake_wp.requests("POST", "/wp-json/batch/v1")) == 1
+    assert fake_wp.requests("POST", "/wp-json/wp/v2/posts") == []
+    assert len(fake_wp.posts) == 3
+    assert all(r["unknown"] and not r["ok"] and r["status"] == 502 for r in batch.results)
+
+def test_read_timeout_is_reported_without_replaying(fake_wp):
+    client = WordPressClient(timeout=0.3)
+    fake_wp.batch_mode = "timeout"
+    fake_wp.batch_delay = 1.0
+
+    with client.batch() as batch:
+        _queue_posts(batch, 2)
+
+    assert len(fake_wp.requests("POST", "/wp-json/batch/v1")) == 1
+    assert fake_wp.requests("POST", "/wp-json/wp/v2/posts") == []
+    assert len(fake_wp.posts) == 2
+    assert all(r["unknown"] and r["status"] == 0 for r in batch.results)
+
+def test_rate_limited_batch_is_retried(fake_wp, wp_client):
+    fake_wp.fail_next(429, path="/wp-json/batch/v1")
+
+    with wp_client.batch() as batch:
+        _queue_posts(batch, 2)
+
+    assert len(fake_wp.requests("POST", "/wp-json/batch/v1")) == 2
+    assert all(r["ok"] for r in batch.results)
+    assert len(fake_wp.posts) == 2
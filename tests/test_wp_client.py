@@ -0,0 +1,87 @@
+import pytest
+import requests
+
+from src.config.settings import Config
+from src.core.wp_client import RETRY_STATUS_CODES, WordPressClient, parse_retry_after
+
+def test_parse_retry_after_seconds_and_cap(monkeypatch):
+    monkeypatch.setattr(Config, "WP_RETRY_AFTER_MAX", 10)
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("3600") == 10
+    assert parse_retry_after("-5") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+
+def test_requests_reuse_pooled_connection(wp_client):
+    for _ in range(5):
+        assert wp_client.get_user_info()["id"] == 1
+
+    stats = wp_client.get_connection_stats()
+    assert stats["requests"] == 5
+    assert stats["connections"] == 1
+    assert stats["reused"] == 4
+
+def test_retries_throttled_response_then_succeeds(fake_wp, wp_client):
+    fake_wp.fail_next(503, headers={"Retry-After": "0"})
+    fake_wp.fail_next(429)
+
+    assert wp_client.get_user_info()["id"] == 1
+    assert wp_client.retry_count == 2
+    assert len(fake_wp.requests("GET", "/wp-json/wp/v2/users/me")) == 3
+
+def test_gives_up_after_max_retries(fake_wp):
+    client = WordPressClient(max_retries=1)
+    for _ in range(3):
+        fake_wp.fail_next(500)
+
+    assert client.get_user_info() is None
+    assert len(fake_wp.requests("GET")) == 2
+
+def test_write_read_timeout_is_not_retried(fake_wp):
+    client = WordPressClient(timeout=0.3)
+    fake_wp.fail_next(delay=1.0, path="/wp-json/wp/v2/posts")
+
+    assert client.create_post("제목", "<p>본문</p>") is None
+    # 서버는 이미 글을 만들었으므로 재시도로 중복 생성하지 않아야 함
+    assert len(fake_wp.requests("POST", "/wp-json/wp/v2/posts")) == 1
+    assert len(fake_wp.posts) == 1
+
+def test_get_read_timeout_is_retried(fake_wp):
+    client = WordPressClient(timeout=0.3)
+    fake_wp.fail_next(delay=1.0, path="/wp-json/wp/v2/users/me")
+
+    assert client.get_user_info()["id"] == 1
+    assert client.retry_count == 1
+
+def test_connection_error_raises_after_retries(monkeypatch):
+    monkeypatch.setattr(Config, "WP_URL", "http://127.0.0.1:1")
+    client = WordPressClient(max_retries=1)
+    with pytest.raises(requests.ConnectionError):
+        client._request("GET", f"{client.base_url}/users/me")
+    assert client.retry_count == 1
+
+def test_post_server_error_is_not_resent(fake_wp, wp_client):
+    fake_wp.fail_next(500, path="/wp-json/wp/v2/posts")
+
+    assert wp_client.create_post("제목", "<p>본문</p>") is None
+    assert len(fake_wp.requests("POST", "/wp-json/wp/v2/posts")) == 1
+
+def test_post_is_retried_on_throttle_and_unavailable_with_retry_after(fake_wp, wp_client):
+    fake_wp.fail_next(429, path="/wp-json/wp/v2/posts")
+    fake_wp.fail_next(503, headers={"Retry-After": "0"}, path="/wp-json/wp/v2/posts")
+
+    assert wp_client.create_post("제목", "<p>본문</p>")
+    assert len(fake_wp.requests("POST", "/wp-json/wp/v2/posts")) == 3
+
+def test_post_unavailable_without_retry_after_is_not_resent(fake_wp, wp_client):
+    fake_wp.fail_next(503, path="/wp-json/wp/v2/posts")
+
+    assert wp_client.create_post("제목", "<p>본문</p>") is None
+    assert len(fake_wp.requests("POST", "/wp-json/wp/v2/posts")) == 1
+
+def test_write_caller_can_opt_in_to_server_error_retries(fake_wp, wp_client):
+    post = fake_wp.add_post(title="제목", content="<p>본문</p>")
+    fake_wp.fail_next(502, path=f"/wp-json/wp/v2/posts/{post['id']}")
+
+    assert wp_client.update_post(post["id"], {"content": "<p>수정</p>"}, retry_statuses=RETRY_STATUS_CODES)
+    assert len(fake_wp.requests("POST", f"/wp-json/wp/v2/posts/{post['id']}")) == 2